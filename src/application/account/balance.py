@@ -0,0 +1,180 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import threading
+from itertools import accumulate, repeat
+from typing import Iterator
+
+from src.application.account.observer import AccountObserver
+from src.application.account.repository import AccountRepository, AccountNotFound
+from src.application.transaction.observer import TransactionObserver
+from src.application.transaction.repository import TransactionRepository
+from src.domain.account import Account, AccountId
+from src.domain.transaction import Transaction, TransactionId
+from src.shared.application.repository import EntityNotFound
+from src.shared.domain.money import Money
+
+# Day numbers are the date ordinals, from 1 for the first day of year 1
+_LAST_DAY = datetime.date.max.toordinal()
+
+
+class _DailyTotals:
+    """
+    Fenwick tree over every possible day, stored sparsely: adding to a day and summing every day up to a given one
+    are both O(log n) in the number of possible days, while only the nodes covering days with transactions are kept,
+    so that memory does not depend on how far apart the transactions are. The plain daily totals are kept alongside
+    for the day by day running totals.
+    """
+
+    def __init__(self) -> None:
+        self._amounts: dict[int, int] = {}
+        self._tree: dict[int, int] = {}
+
+    def add(self, day: int, amount: int) -> None:
+        # Nodes back to zero are dropped, so that removed transactions do not leave their days behind
+        for totals, keys in ((self._amounts, (day,)), (self._tree, self._nodes(day))):
+            for key in keys:
+                if total := totals.get(key, 0) + amount:
+                    totals[key] = total
+                else:
+                    totals.pop(key, None)
+
+    def total_until(self, day: int) -> int:
+        index = min(day, _LAST_DAY)
+        total = 0
+        while index > 0:
+            total += self._tree.get(index, 0)
+            index -= index & -index
+        return total
+
+    def running_totals(self, day: int, days: int) -> list[int]:
+        """
+        Totals until `day` and each of the `days - 1` following days.
+        """
+        changes: Iterator[int] = map(self._amounts.get, range(day + 1, day + days), repeat(0))
+        return list(accumulate(changes, initial=self.total_until(day)))
+
+    @staticmethod
+    def _nodes(day: int) -> Iterator[int]:
+        index = day
+        while index <= _LAST_DAY:
+            yield index
+            index += index & -index
+
+
+class _Ledger:
+    def __init__(self) -> None:
+        self._entries: dict[TransactionId, tuple[int, int]] = {}
+        self._totals = _DailyTotals()
+
+    def add(self, transaction: Transaction) -> None:
+        self.remove(transaction.id)
+        day = transaction.date.toordinal()
+        self._entries[transaction.id] = day, transaction.amount.minor_units
+        self._totals.add(day, transaction.amount.minor_units)
+
+    def remove(self, transaction_id: TransactionId) -> None:
+        entry = self._entries.pop(transaction_id, None)
+        if entry is not None:
+            day, amount = entry
+            self._totals.add(day, -amount)
+
+    def total_until(self, date: datetime.date) -> int:
+        return self._totals.total_until(date.toordinal())
+
+    def running_totals(self, start: datetime.date, days: int) -> list[int]:
+        return self._totals.running_totals(start.toordinal(), days)
+
+
+class AccountBalanceCalculator(TransactionObserver, AccountObserver):
+    """
+    Keeps per account the running sums of its transactions by date, loaded from the repository on first use and
+    then maintained from the transaction use cases notifications, until the account is deleted. The sums are exact
+    counts of minor units: the use cases only store transactions in the currency of their account reference balance.
+    """
+
+    def __init__(self, account_repository: AccountRepository, transaction_repository: TransactionRepository) -> None:
+        self._account_repository = account_repository
+        self._transaction_repository = transaction_repository
+        self._ledgers: dict[AccountId, _Ledger] = {}
+        self._lock = threading.Lock()
+
+    def balance(self, account_id: AccountId, at: datetime.date) -> Money:
+        """
+        :param account_id:
+        :param at: the transactions dated this day are included
+        :raises AccountNotFound
+        """
+        try:
+            account = self._account_repository.retrieve(account_id)
+        except EntityNotFound as e:
+            raise AccountNotFound(account_id=account_id) from e
+
+        with self._lock:
+            total = self._ledger(account_id).total_until(at)
+        return account.reference_balance + Money(total, account.reference_balance.currency)
+
+    def balances(self, account_id: AccountId, start: datetime.date, days: int) -> list[Money]:
+        """
+        :param account_id:
+        :param start:
+        :param days:
+        :return: the balance at the end of `start` and of each of the `days - 1` following days
+        :raises AccountNotFound
+        """
+        try:
+            account = self._account_repository.retrieve(account_id)
+        except EntityNotFound as e:
+            raise AccountNotFound(account_id=account_id) from e
+
+        if days <= 0:
+            return []
+        with self._lock:
+            totals = self._ledger(account_id).running_totals(start, days)
+        reference_balance = account.reference_balance
+        return [Money(reference_balance.minor_units + total, reference_balance.currency) for total in totals]
+
+    def on_transaction_added(self, transaction: Transaction) -> None:
+        with self._lock:
+            ledger = self._ledgers.get(transaction.account_id)
+            if ledger is not None:
+                ledger.add(transaction)
+
+    def on_transaction_removed(self, transaction: Transaction) -> None:
+        with self._lock:
+            ledger = self._ledgers.get(transaction.account_id)
+            if ledger is not None:
+                ledger.remove(transaction.id)
+
+    def on_account_added(self, account: Account) -> None:
+        pass
+
+    def on_account_removed(self, account: Account) -> None:
+        # An update is notified as a removal too: the ledger is only dropped once the account is deleted
+        try:
+            self._account_repository.retrieve(account.id)
+        except EntityNotFound:
+            with self._lock:
+                self._ledgers.pop(account.id, None)
+
+    def _ledger(self, account_id: AccountId) -> _Ledger:
+        ledger = self._ledgers.get(account_id)
+        if ledger is None:
+            ledger = self._ledgers[account_id] = _Ledger()
+            for transaction in self._transaction_repository.list_by_account(account_id):
+                ledger.add(transaction)
+        return ledger
@@ -0,0 +1,147 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from abc import ABC, abstractmethod
+
+from src.application.account.repository import AccountRepository
+from src.application.account.tombstone import AccountTombstoneRepository
+from src.application.reccurring_transaction.repository import RecurringTransactionRepository
+from src.application.transaction.fingerprint import TransactionFingerprintIndex
+from src.application.transaction.repository import TransactionRepository
+from src.domain.account import AccountId
+from src.shared.application.unit_of_work import UnitOfWork
+
+
+class AccountTransactionReclaimer:
+    """
+    Deletes the transactions of tombstoned accounts by batches of `batch_size`, each in its own unit of work so that
+    other changes get through between batches, then the fingerprints of their imported statement entries the same way,
+    and drops the tombstone along with the last batch.
+    """
+
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        tombstone_repository: AccountTombstoneRepository,
+        unit_of_work: UnitOfWork,
+        batch_size: int = 10_000,
+        fingerprint_index: TransactionFingerprintIndex | None = None,
+    ) -> None:
+        self._transaction_repository = transaction_repository
+        self._tombstone_repository = tombstone_repository
+        self._unit_of_work = unit_of_work
+        self._batch_size = batch_size
+        self._fingerprint_index = fingerprint_index
+
+    def pending(self) -> list[AccountId]:
+        """
+        :return: the tombstoned accounts, such as the ones left by a stop before their reclamation ended
+        """
+        return self._tombstone_repository.list_account_ids()
+
+    def reclaim(self, account_id: AccountId) -> int:
+        """
+        :param account_id: an account not tombstoned is left as is
+        :return: the number of transactions deleted
+        """
+        reclaimed = 0
+        transactions_left = True
+        while True:
+            with self._unit_of_work.atomic():
+                # Checked at every batch: the tombstone may come from a unit of work which was then undone
+                if not self._tombstone_repository.exists(account_id):
+                    return reclaimed
+                deleted = 0
+                if transactions_left:
+                    deleted = self._transaction_repository.delete_by_account(account_id, self._batch_size)
+                    reclaimed += deleted
+                    transactions_left = deleted == self._batch_size
+                # The fingerprints fill the rest of the batch once the transactions are all deleted
+                if not transactions_left and self._fingerprint_index is not None:
+                    deleted += self._fingerprint_index.delete_by_account(account_id, self._batch_size - deleted)
+                done = deleted < self._batch_size
+                if done:
+                    self._tombstone_repository.delete(account_id)
+            if done:
+                return reclaimed
+
+
+class AccountReclamationScheduler(ABC):
+    @abstractmethod
+    def schedule(self, account_id: AccountId) -> None:
+        """
+        Have the transactions of the tombstoned account reclaimed later, such as in the background.
+        :param account_id:
+        """
+
+
+class AccountCascade:
+    """
+    Deletes accounts along with their recurring transactions and transactions, found through the account index of
+    their repositories, in one unit of work.
+
+    With a tombstone repository and a reclamation scheduler, the transactions are left to the scheduler instead: the
+    account is tombstoned in the unit of work deleting it, so deleting takes the same time whatever the number of its
+    transactions.
+
+    :param account_repository:
+    :param transaction_repository:
+    :param recurring_transaction_repository:
+    :param unit_of_work: shared by the repositories
+    :param tombstone_repository:
+    :param reclamation_scheduler:
+    :param fingerprint_index: the fingerprints of the statement entries imported into the account are deleted along with
+    its transactions
+    """
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        recurring_transaction_repository: RecurringTransactionRepository,
+        unit_of_work: UnitOfWork,
+        tombstone_repository: AccountTombstoneRepository | None = None,
+        reclamation_scheduler: AccountReclamationScheduler | None = None,
+        fingerprint_index: TransactionFingerprintIndex | None = None,
+    ) -> None:
+        self._account_repository = account_repository
+        self._transaction_repository = transaction_repository
+        self._recurring_transaction_repository = recurring_transaction_repository
+        self._unit_of_work = unit_of_work
+        self._tombstone_repository = tombstone_repository
+        self._reclamation_scheduler = reclamation_scheduler
+        self._fingerprint_index = fingerprint_index
+
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        return self._unit_of_work
+
+    def delete(self, account_id: AccountId) -> None:
+        """
+        :param account_id:
+        :raises EntityNotFound
+        """
+        with self._unit_of_work.atomic():
+            self._account_repository.delete(account_id)
+            self._recurring_transaction_repository.delete_by_account(account_id)
+            if self._tombstone_repository is None or self._reclamation_scheduler is None:
+                self._transaction_repository.delete_by_account(account_id)
+                if self._fingerprint_index is not None:
+                    self._fingerprint_index.delete_by_account(account_id)
+                return
+            self._tombstone_repository.add(account_id)
+
+        self._reclamation_scheduler.schedule(account_id)
@@ -15,25 +15,34 @@
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
 from dataclasses import dataclass
+from typing import Sequence
 
+from src.application.account.observer import AccountObserver
 from src.application.account.repository import AccountRepository, AccountAlreadyExists
 from src.domain.account import Account, AccountName, AccountId
 from src.domain.user import UserId
 from src.shared.application.id import IdFactory
 from src.shared.application.repository import EntityAlreadyExists
+from src.shared.domain.money import Money
 
 
 @dataclass(frozen=True)
 class AccountCreationRequest:
     user_id: UserId
     name: AccountName
-    reference_balance: float
+    reference_balance: Money
 
 
 class AccountCreator:
-    def __init__(self, repository: AccountRepository, id_factory: IdFactory[AccountId]) -> None:
+    def __init__(
+        self,
+        repository: AccountRepository,
+        id_factory: IdFactory[AccountId],
+        observers: Sequence[AccountObserver] = (),
+    ) -> None:
         self._repository = repository
         self._id_factory = id_factory
+        self._observers = observers
 
     def create(self, request: AccountCreationRequest) -> None:
         account = Account(
@@ -47,3 +56,6 @@ class AccountCreator:
             self._repository.add(account)
         except EntityAlreadyExists as e:
             raise AccountAlreadyExists(account_id=account.id) from e
+
+        for observer in self._observers:
+            observer.on_account_added(account)
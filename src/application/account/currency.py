@@ -0,0 +1,51 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from src.application.account.repository import AccountRepository, AccountNotFound
+from src.domain.account import AccountId
+from src.shared.application.repository import EntityNotFound
+from src.shared.domain.money import CurrencyMismatch, Money
+
+
+class AccountCurrencyInUse(ValueError):
+    def __init__(self, account_id: AccountId) -> None:
+        super().__init__(f"The currency of account `{account_id}` cannot change while it has transactions")
+        self._account_id = account_id
+
+    @property
+    def account_id(self) -> AccountId:
+        return self._account_id
+
+
+def account_currency(repository: AccountRepository, account_id: AccountId) -> str:
+    """
+    Currency of the account reference balance, which every amount of the account must be in: balances and forecasts
+    add them up as plain minor units.
+    :raises AccountNotFound
+    """
+    try:
+        return repository.retrieve(account_id).reference_balance.currency
+    except EntityNotFound as e:
+        raise AccountNotFound(account_id=account_id) from e
+
+
+def check_account_currency(repository: AccountRepository, account_id: AccountId, amount: Money) -> None:
+    """
+    :raises AccountNotFound, CurrencyMismatch
+    """
+    currency = account_currency(repository, account_id)
+    if amount.currency != currency:
+        raise CurrencyMismatch(currency, amount.currency)
@@ -0,0 +1,328 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import heapq
+import threading
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Iterable
+
+from src.application.account.observer import AccountObserver
+from src.application.account.repository import AccountRepository, AccountNotFound
+from src.application.reccurring_transaction.observer import RecurringTransactionObserver
+from src.application.reccurring_transaction.repository import RecurringTransactionRepository
+from src.application.transaction.observer import TransactionObserver
+from src.application.transaction.repository import TransactionRepository
+from src.domain.account import Account, AccountId, AccountName
+from src.domain.occurrence import occurrence_days
+from src.domain.recurring_transaction import (
+    RecurringTransaction,
+    RecurringTransactionId,
+    RecurringTransactionName,
+)
+from src.domain.transaction import Transaction, TransactionId
+from src.domain.user import UserId
+from src.shared.application.repository import EntityNotFound
+from src.shared.domain.money import Money
+
+
+@dataclass(frozen=True)
+class MonthlyTotals:
+    """
+    :param month: first day of the month
+    :param income: sum of the positive amounts
+    :param expense: sum of the negative amounts
+    """
+
+    month: datetime.date
+    income: Money
+    expense: Money
+
+
+@dataclass(frozen=True)
+class DashboardTransaction:
+    id: TransactionId
+    date: datetime.date
+    label: str
+    amount: Money
+
+
+@dataclass(frozen=True)
+class DashboardOccurrence:
+    date: datetime.date
+    recurring_transaction_id: RecurringTransactionId
+    name: RecurringTransactionName
+    amount: Money
+
+
+@dataclass(frozen=True)
+class AccountDashboard:
+    """
+    :param balance: reference balance plus the transactions dated up to `at`
+    :param monthly_totals: every month with a transaction, in chronological order
+    :param last_transactions: the transactions dated up to `at`, most recent first
+    :param next_occurrences: the recurring transaction occurrences after `at`, soonest first
+    """
+
+    id: AccountId
+    user_id: UserId
+    name: AccountName
+    at: datetime.date
+    balance: Money
+    monthly_totals: tuple[MonthlyTotals, ...]
+    last_transactions: tuple[DashboardTransaction, ...]
+    next_occurrences: tuple[DashboardOccurrence, ...]
+
+
+class _View:
+    """
+    Denormalised state of an account, changed incrementally: its transactions sorted by date, the sum of their amounts
+    and their monthly income and expense. The dashboard is built from it on the first read after a change.
+    """
+
+    def __init__(self, account: Account) -> None:
+        self.account: Account | None = account
+        self.transactions: dict[str, Transaction] = {}
+        self.keys: list[tuple[int, str]] = []
+        self.total = 0
+        self.months: dict[int, list[int]] = {}
+        self.recurring_transactions: dict[RecurringTransactionId, RecurringTransaction] = {}
+        self.dashboard: AccountDashboard | None = None
+
+    def add(self, transaction: Transaction) -> None:
+        self.remove(transaction.id)
+        key = transaction.date.toordinal(), str(transaction.id)
+        self.transactions[key[1]] = transaction
+        insort(self.keys, key)
+        self._count(transaction, 1)
+
+    def remove(self, transaction_id: TransactionId) -> None:
+        transaction = self.transactions.pop(str(transaction_id), None)
+        if transaction is not None:
+            del self.keys[bisect_left(self.keys, (transaction.date.toordinal(), str(transaction_id)))]
+            self._count(transaction, -1)
+
+    def _count(self, transaction: Transaction, sign: int) -> None:
+        amount = transaction.amount.minor_units
+        self.total += amount * sign
+        month_index = transaction.date.year * 12 + transaction.date.month - 1
+        # Income, expense and number of transactions of the month
+        month = self.months.setdefault(month_index, [0, 0, 0])
+        month[0 if amount >= 0 else 1] += amount * sign
+        month[2] += sign
+        if not month[2]:
+            del self.months[month_index]
+        self.dashboard = None
+
+
+class AccountDashboardProjection(AccountObserver, TransactionObserver, RecurringTransactionObserver):
+    """
+    Read model of the account dashboards, loaded from the repositories on first use and then maintained from the
+    account, transaction and recurring transaction use cases notifications, so that reading a dashboard is a lookup.
+    The dashboard depends on the current day, and is built again on the first read of a new day.
+
+    :param account_repository:
+    :param transaction_repository:
+    :param recurring_transaction_repository:
+    :param last_transactions: number of transactions of a dashboard
+    :param next_occurrences: number of recurring transaction occurrences of a dashboard
+    :param today:
+    """
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        recurring_transaction_repository: RecurringTransactionRepository,
+        last_transactions: int = 10,
+        next_occurrences: int = 10,
+        today: Callable[[], datetime.date] = datetime.date.today,
+    ) -> None:
+        self._account_repository = account_repository
+        self._transaction_repository = transaction_repository
+        self._recurring_transaction_repository = recurring_transaction_repository
+        self._last_transactions = last_transactions
+        self._next_occurrences = next_occurrences
+        self._today = today
+        self._views: dict[AccountId, _View] = {}
+        self._lock = threading.Lock()
+
+    def dashboard(self, account_id: AccountId) -> AccountDashboard:
+        """
+        :param account_id:
+        :raises AccountNotFound
+        """
+        today = self._today()
+        with self._lock:
+            view = self._views.get(account_id)
+            dashboard = view.dashboard if view is not None else None
+            if dashboard is not None and dashboard.at == today:
+                return dashboard
+            if view is None:
+                view = self._views[account_id] = self._load(self._retrieve(account_id))
+            if view.account is None:
+                del self._views[account_id]
+                raise AccountNotFound(account_id=account_id)
+            view.dashboard = self._build(view, view.account, today)
+            return view.dashboard
+
+    def rebuild(self, account_ids: Iterable[AccountId] | None = None) -> None:
+        """
+        Load again from the repositories the dashboards of the given accounts, or of every account loaded so far.
+        :param account_ids:
+        """
+        with self._lock:
+            for account_id in list(self._views if account_ids is None else account_ids):
+                try:
+                    self._views[account_id] = self._load(self._retrieve(account_id))
+                except AccountNotFound:
+                    self._views.pop(account_id, None)
+
+    def check(self, account_ids: Iterable[AccountId] | None = None) -> list[AccountId]:
+        """
+        Compare the dashboards of the given accounts, or of every account loaded so far, with dashboards loaded from
+        the repositories.
+        :param account_ids:
+        :return: the accounts whose dashboard differs, to be rebuilt
+        """
+        today = self._today()
+        inconsistent = []
+        with self._lock:
+            for account_id in list(self._views if account_ids is None else account_ids):
+                view = self._views.get(account_id)
+                if view is None:
+                    continue
+                try:
+                    account = self._retrieve(account_id)
+                except AccountNotFound:
+                    if view.account is not None:
+                        inconsistent.append(account_id)
+                    continue
+                if view.account is None or self._build(view, view.account, today) != self._build(
+                    self._load(account), account, today
+                ):
+                    inconsistent.append(account_id)
+        return inconsistent
+
+    def on_account_added(self, account: Account) -> None:
+        with self._lock:
+            view = self._views.get(account.id)
+            if view is not None:
+                view.account = account
+                view.dashboard = None
+
+    def on_account_removed(self, account: Account) -> None:
+        # The view is kept for the addition that follows an update, and dropped on the next read otherwise
+        with self._lock:
+            view = self._views.get(account.id)
+            if view is not None:
+                view.account = None
+                view.dashboard = None
+
+    def on_transaction_added(self, transaction: Transaction) -> None:
+        with self._lock:
+            view = self._views.get(transaction.account_id)
+            if view is not None:
+                view.add(transaction)
+
+    def on_transaction_removed(self, transaction: Transaction) -> None:
+        with self._lock:
+            view = self._views.get(transaction.account_id)
+            if view is not None:
+                view.remove(transaction.id)
+
+    def on_recurring_transaction_added(self, recurring_transaction: RecurringTransaction) -> None:
+        with self._lock:
+            view = self._views.get(recurring_transaction.account_id)
+            if view is not None:
+                view.recurring_transactions[recurring_transaction.id] = recurring_transaction
+                view.dashboard = None
+
+    def on_recurring_transaction_removed(self, recurring_transaction: RecurringTransaction) -> None:
+        with self._lock:
+            view = self._views.get(recurring_transaction.account_id)
+            if view is not None:
+                view.recurring_transactions.pop(recurring_transaction.id, None)
+                view.dashboard = None
+
+    def _retrieve(self, account_id: AccountId) -> Account:
+        try:
+            return self._account_repository.retrieve(account_id)
+        except EntityNotFound as e:
+            raise AccountNotFound(account_id=account_id) from e
+
+    def _load(self, account: Account) -> _View:
+        view = _View(account)
+        for transaction in self._transaction_repository.list_by_account(account.id):
+            view.add(transaction)
+        for recurring_transaction in self._recurring_transaction_repository.list_by_account(account.id):
+            view.recurring_transactions[recurring_transaction.id] = recurring_transaction
+        return view
+
+    def _build(self, view: _View, account: Account, today: datetime.date) -> AccountDashboard:
+        currency = account.reference_balance.currency
+        # Transactions dated after today are left out of the balance and of the last transactions
+        past = bisect_left(view.keys, (today.toordinal() + 1,))
+        future_total = sum(view.transactions[id_].amount.minor_units for _, id_ in view.keys[past:])
+        last_transactions = tuple(
+            DashboardTransaction(transaction.id, transaction.date, transaction.label, transaction.amount)
+            for transaction in (
+                view.transactions[id_] for _, id_ in reversed(view.keys[max(past - self._last_transactions, 0) : past])
+            )
+        )
+        monthly_totals = tuple(
+            MonthlyTotals(
+                datetime.date(month // 12, month % 12 + 1, 1), Money(income, currency), Money(expense, currency)
+            )
+            for month, (income, expense, _) in sorted(view.months.items())
+        )
+        return AccountDashboard(
+            id=account.id,
+            user_id=account.user_id,
+            name=account.name,
+            at=today,
+            balance=account.reference_balance + Money(view.total - future_total, currency),
+            monthly_totals=monthly_totals,
+            last_transactions=last_transactions,
+            next_occurrences=self._occurrences(view, today),
+        )
+
+    def _occurrences(self, view: _View, today: datetime.date) -> tuple[DashboardOccurrence, ...]:
+        # Even yearly occurrences are all found within one year per occurrence
+        start = today + datetime.timedelta(days=1)
+        end = today + datetime.timedelta(days=366 * self._next_occurrences)
+        occurrences = heapq.merge(
+            *(
+                (
+                    (day, str(recurring_transaction.id), recurring_transaction)
+                    for day in islice(
+                        occurrence_days(recurring_transaction.frequency, start, end), self._next_occurrences
+                    )
+                )
+                for recurring_transaction in view.recurring_transactions.values()
+            )
+        )
+        return tuple(
+            DashboardOccurrence(
+                datetime.date.fromordinal(day),
+                recurring_transaction.id,
+                recurring_transaction.name,
+                recurring_transaction.amount,
+            )
+            for day, _, recurring_transaction in islice(occurrences, self._next_occurrences)
+        )
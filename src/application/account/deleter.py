@@ -14,10 +14,15 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+from contextlib import nullcontext
 from dataclasses import dataclass
+from typing import ContextManager, Sequence
 
+from src.application.account.cascade import AccountCascade
+from src.application.account.observer import AccountObserver
 from src.application.account.repository import AccountRepository, AccountNotFound
-from src.domain.account import AccountId
+from src.domain.account import Account, AccountId
+from src.domain.user import UserId
 from src.shared.application.repository import EntityNotFound
 
 
@@ -27,11 +32,57 @@ class AccountDeletionRequest:
 
 
 class AccountDeleter:
-    def __init__(self, repository: AccountRepository) -> None:
+    """
+    :param repository:
+    :param observers:
+    :param cascade: deletes the transactions and recurring transactions of the deleted accounts, which are kept
+    otherwise
+    """
+
+    def __init__(
+        self,
+        repository: AccountRepository,
+        observers: Sequence[AccountObserver] = (),
+        cascade: AccountCascade | None = None,
+    ) -> None:
         self._repository = repository
+        self._observers = observers
+        self._cascade = cascade
 
     def delete(self, request: AccountDeletionRequest) -> None:
         try:
-            self._repository.delete(request.id)
+            account = self._repository.retrieve(request.id)
+            self._delete(request.id)
         except EntityNotFound as e:
             raise AccountNotFound(account_id=request.id) from e
+
+        for observer in self._observers:
+            observer.on_account_removed(account)
+
+    def delete_user_accounts(self, user_id: UserId) -> None:
+        """
+        Delete every account of the user at once, found through the user index of the repository.
+        :param user_id:
+        """
+        deleted: list[Account] = []
+        with self._atomic():
+            for account in list(self._repository.list_by_user(user_id)):
+                try:
+                    self._delete(account.id)
+                except EntityNotFound:
+                    # Deleted meanwhile
+                    continue
+                deleted.append(account)
+
+        for account in deleted:
+            for observer in self._observers:
+                observer.on_account_removed(account)
+
+    def _delete(self, account_id: AccountId) -> None:
+        if self._cascade is None:
+            self._repository.delete(account_id)
+        else:
+            self._cascade.delete(account_id)
+
+    def _atomic(self) -> ContextManager[None]:
+        return nullcontext() if self._cascade is None else self._cascade.unit_of_work.atomic()
@@ -0,0 +1,132 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import threading
+from dataclasses import dataclass
+from itertools import accumulate
+
+from src.application.account.balance import AccountBalanceCalculator
+from src.application.account.observer import AccountObserver
+from src.application.reccurring_transaction.observer import RecurringTransactionObserver
+from src.application.reccurring_transaction.repository import RecurringTransactionRepository
+from src.application.transaction.observer import TransactionObserver
+from src.domain.account import Account, AccountId
+from src.domain.occurrence import occurrence_days
+from src.domain.recurring_transaction import RecurringTransaction
+from src.domain.transaction import Transaction
+from src.shared.domain.money import Money
+
+
+@dataclass(frozen=True)
+class AccountForecast:
+    """
+    `balances[i]` is the projected balance at the end of the day `start + i days`.
+    """
+
+    start: datetime.date
+    balances: tuple[Money, ...]
+
+
+class AccountBalanceForecaster(TransactionObserver, RecurringTransactionObserver, AccountObserver):
+    """
+    Projects the balance of an account from its recorded transactions, including the future ones, and the occurrences
+    of its recurring transactions. Forecasts are cached per account until one of its transactions or recurring
+    transactions changes.
+    """
+
+    def __init__(
+        self,
+        balance_calculator: AccountBalanceCalculator,
+        recurring_transaction_repository: RecurringTransactionRepository,
+    ) -> None:
+        self._balance_calculator = balance_calculator
+        self._recurring_transaction_repository = recurring_transaction_repository
+        self._versions: dict[AccountId, int] = {}
+        self._cache: dict[AccountId, tuple[tuple, AccountForecast]] = {}
+        self._lock = threading.Lock()
+
+    def forecast(self, account_id: AccountId, start: datetime.date, days: int) -> AccountForecast:
+        """
+        :param account_id:
+        :param start: first forecast day, whose balance is the current one
+        :param days: number of forecast days
+        :raises AccountNotFound
+        """
+        initial_balance = self._balance_calculator.balance(account_id, start)
+        with self._lock:
+            key = (self._versions.get(account_id, 0), start, days, initial_balance)
+            cached = self._cache.get(account_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        forecast = AccountForecast(start=start, balances=self._project(account_id, start, days))
+        with self._lock:
+            if self._versions.get(account_id, 0) == key[0]:
+                self._cache[account_id] = key, forecast
+        return forecast
+
+    def on_transaction_added(self, transaction: Transaction) -> None:
+        self._invalidate(transaction.account_id)
+
+    def on_transaction_removed(self, transaction: Transaction) -> None:
+        self._invalidate(transaction.account_id)
+
+    def on_recurring_transaction_added(self, recurring_transaction: RecurringTransaction) -> None:
+        self._invalidate(recurring_transaction.account_id)
+
+    def on_recurring_transaction_removed(self, recurring_transaction: RecurringTransaction) -> None:
+        self._invalidate(recurring_transaction.account_id)
+
+    def on_account_added(self, account: Account) -> None:
+        pass
+
+    def on_account_removed(self, account: Account) -> None:
+        # The reference balance is part of the cache key: only a deleted account needs forgetting, which is harmless
+        # after an update
+        with self._lock:
+            self._versions.pop(account.id, None)
+            self._cache.pop(account.id, None)
+
+    def _invalidate(self, account_id: AccountId) -> None:
+        with self._lock:
+            self._versions[account_id] = self._versions.get(account_id, 0) + 1
+            self._cache.pop(account_id, None)
+
+    def _project(self, account_id: AccountId, start: datetime.date, days: int) -> tuple[Money, ...]:
+        balances = self._balance_calculator.balances(account_id, start, days)
+        if not balances:
+            return ()
+        first_day, end = start.toordinal(), start + datetime.timedelta(days=days - 1)
+
+        # Day to day changes of the balance, and changes of a constant daily flow for the uninterrupted daily runs
+        changes = [0] * days
+        flow_changes = [0] * (days + 1)
+        for recurring_transaction in self._recurring_transaction_repository.list_by_account(account_id):
+            amount = recurring_transaction.amount.minor_units
+            occurrences = occurrence_days(recurring_transaction.frequency, start + datetime.timedelta(days=1), end)
+            if isinstance(occurrences, range) and occurrences.step == 1:
+                if occurrences:
+                    flow_changes[occurrences[0] - first_day] += amount
+                    flow_changes[occurrences[-1] - first_day + 1] -= amount
+                continue
+            for day in occurrences:
+                changes[day - first_day] += amount
+
+        flows = accumulate(flow_changes[:days])
+        recurring_totals = accumulate(change + flow for change, flow in zip(changes, flows))
+        currency = balances[0].currency
+        return tuple(Money(balance.minor_units + total, currency) for balance, total in zip(balances, recurring_totals))
@@ -17,9 +17,10 @@
 from dataclasses import dataclass
 
 from src.application.account.repository import AccountRepository, AccountNotFound
-from src.domain.account import AccountId, AccountName
+from src.domain.account import Account, AccountId, AccountName
 from src.domain.user import UserId
 from src.shared.application.repository import EntityNotFound
+from src.shared.domain.money import Money
 
 
 @dataclass(frozen=True)
@@ -27,7 +28,7 @@ class AccountRetrievalResponse:
     id: AccountId
     user_id: UserId
     name: AccountName
-    reference_balance: float
+    reference_balance: Money
 
 
 class AccountReader:
@@ -40,6 +41,13 @@ class AccountReader:
         except EntityNotFound as e:
             raise AccountNotFound(account_id=account_id) from e
 
+        return self._response(account)
+
+    def list_by_user(self, user_id: UserId) -> list[AccountRetrievalResponse]:
+        return [self._response(account) for account in self._repository.list_by_user(user_id)]
+
+    @staticmethod
+    def _response(account: Account) -> AccountRetrievalResponse:
         return AccountRetrievalResponse(
             id=account.id, user_id=account.user_id, name=account.name, reference_balance=account.reference_balance
         )
@@ -15,8 +15,10 @@
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from src.domain.account import Account, AccountId
+from src.domain.user import UserId
 from src.shared.application.repository import EntityAlreadyExists, EntityNotFound
 
 
@@ -70,3 +72,9 @@ class AccountRepository(ABC):
         :param account:
         :raises AccountNotFound
         """
+
+    @abstractmethod
+    def list_by_user(self, user_id: UserId) -> Iterator[Account]:
+        """
+        :param user_id:
+        """
@@ -0,0 +1,47 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from abc import ABC, abstractmethod
+
+from src.domain.account import AccountId
+
+
+class AccountTombstoneRepository(ABC):
+    """
+    Deleted accounts whose transactions are still to be reclaimed.
+    """
+
+    @abstractmethod
+    def add(self, account_id: AccountId) -> None:
+        """
+        :param account_id: an account already tombstoned is ignored
+        """
+
+    @abstractmethod
+    def exists(self, account_id: AccountId) -> bool:
+        """
+        :param account_id:
+        """
+
+    @abstractmethod
+    def delete(self, account_id: AccountId) -> None:
+        """
+        :param account_id: an account not tombstoned is ignored
+        """
+
+    @abstractmethod
+    def list_account_ids(self) -> list[AccountId]:
+        pass
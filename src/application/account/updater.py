@@ -14,31 +14,72 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+import copy
 from dataclasses import dataclass
+from typing import Sequence
 
+from src.application.account.currency import AccountCurrencyInUse
+from src.application.account.observer import AccountObserver
 from src.application.account.repository import AccountRepository, AccountNotFound
+from src.application.reccurring_transaction.repository import RecurringTransactionRepository
+from src.application.transaction.repository import TransactionRepository
 from src.domain.account import AccountName, AccountId
 from src.shared.application.repository import EntityNotFound
+from src.shared.domain.money import Money
 
 
 @dataclass(frozen=True)
 class AccountUpdateRequest:
     id: AccountId
     name: AccountName
-    reference_balance: float
+    reference_balance: Money
 
 
 class AccountUpdater:
-    def __init__(self, repository: AccountRepository) -> None:
+    """
+    :param repository:
+    :param observers:
+    :param transaction_repository: when given along with `recurring_transaction_repository`, the currency of an account
+    cannot change while it has transactions or recurring transactions, whose amounts are in that currency
+    :param recurring_transaction_repository:
+    """
+
+    def __init__(
+        self,
+        repository: AccountRepository,
+        observers: Sequence[AccountObserver] = (),
+        transaction_repository: TransactionRepository | None = None,
+        recurring_transaction_repository: RecurringTransactionRepository | None = None,
+    ) -> None:
         self._repository = repository
+        self._observers = observers
+        self._transaction_repository = transaction_repository
+        self._recurring_transaction_repository = recurring_transaction_repository
 
     def update(self, request: AccountUpdateRequest) -> None:
+        """
+        :raises AccountNotFound, AccountCurrencyInUse
+        """
         try:
             account = self._repository.retrieve(request.id)
         except EntityNotFound as e:
             raise AccountNotFound(account_id=request.id) from e
+        if request.reference_balance.currency != account.reference_balance.currency and self._has_amounts(request.id):
+            raise AccountCurrencyInUse(account_id=request.id)
+        previous = copy.copy(account)
 
         account.rename(request.name)
         account.modify_reference_balance(request.reference_balance)
 
         self._repository.update(account)
+
+        for observer in self._observers:
+            observer.on_account_removed(previous)
+            observer.on_account_added(account)
+
+    def _has_amounts(self, account_id: AccountId) -> bool:
+        if self._transaction_repository is None or self._recurring_transaction_repository is None:
+            return False
+        transactions = self._transaction_repository.list_by_account(account_id, limit=1)
+        recurring_transactions = self._recurring_transaction_repository.list_by_account(account_id)
+        return next(transactions, None) is not None or next(recurring_transactions, None) is not None
@@ -15,7 +15,11 @@
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
 from dataclasses import dataclass
+from typing import Sequence
 
+from src.application.account.currency import check_account_currency
+from src.application.account.repository import AccountRepository
+from src.application.reccurring_transaction.observer import RecurringTransactionObserver
 from src.application.reccurring_transaction.repository import (
     RecurringTransactionAlreadyExists,
     RecurringTransactionRepository,
@@ -28,6 +32,7 @@ from src.domain.recurring_transaction import (
     RecurringTransaction,
 )
 from src.shared.application.repository import EntityAlreadyExists
+from src.shared.domain.money import Money
 
 
 @dataclass(frozen=True)
@@ -35,15 +40,34 @@ class RecurringTransactionCreationRequest:
     id: RecurringTransactionId
     account_id: AccountId
     name: RecurringTransactionName
-    amount: float
+    amount: Money
     frequency: RecurringFrequency
 
 
 class RecurringTransactionCreator:
-    def __init__(self, repository: RecurringTransactionRepository) -> None:
+    """
+    :param repository:
+    :param observers:
+    :param account_repository: when given, amounts in another currency than the one of their account are rejected
+    """
+
+    def __init__(
+        self,
+        repository: RecurringTransactionRepository,
+        observers: Sequence[RecurringTransactionObserver] = (),
+        account_repository: AccountRepository | None = None,
+    ) -> None:
         self._repository = repository
+        self._observers = observers
+        self._account_repository = account_repository
 
     def create(self, request: RecurringTransactionCreationRequest) -> None:
+        """
+        :raises RecurringTransactionAlreadyExists, AccountNotFound, CurrencyMismatch
+        """
+        if self._account_repository is not None:
+            check_account_currency(self._account_repository, request.account_id, request.amount)
+
         recurring_transaction = RecurringTransaction(
             id_=request.id,
             account_id=request.account_id,
@@ -56,3 +80,6 @@ class RecurringTransactionCreator:
             self._repository.add(recurring_transaction)
         except EntityAlreadyExists as e:
             raise RecurringTransactionAlreadyExists(recurring_transaction_id=request.id) from e
+
+        for observer in self._observers:
+            observer.on_recurring_transaction_added(recurring_transaction)
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
+from typing import Sequence
 
+from src.application.reccurring_transaction.observer import RecurringTransactionObserver
 from src.application.reccurring_transaction.repository import (
     RecurringTransactionRepository,
     RecurringTransactionNotFound,
@@ -14,11 +16,18 @@ class RecurringTransactionDeletionRequest:
 
 
 class RecurringTransactionDeleter:
-    def __init__(self, repository: RecurringTransactionRepository) -> None:
+    def __init__(
+        self, repository: RecurringTransactionRepository, observers: Sequence[RecurringTransactionObserver] = ()
+    ) -> None:
         self._repository = repository
+        self._observers = observers
 
     def delete(self, request: RecurringTransactionDeletionRequest) -> None:
         try:
+            recurring_transaction = self._repository.retrieve(request.id)
             self._repository.delete(request.id)
         except EntityNotFound as e:
             raise RecurringTransactionNotFound(recurring_transaction_id=request.id) from e
+
+        for observer in self._observers:
+            observer.on_recurring_transaction_removed(recurring_transaction)
@@ -0,0 +1,34 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from abc import ABC, abstractmethod
+
+from src.domain.recurring_transaction import RecurringTransaction
+
+
+class RecurringTransactionObserver(ABC):
+    """
+    Notified by the recurring transaction use cases once a change is stored. An update is notified as the removal of
+    the previous state followed by the addition of the new one.
+    """
+
+    @abstractmethod
+    def on_recurring_transaction_added(self, recurring_transaction: RecurringTransaction) -> None:
+        pass
+
+    @abstractmethod
+    def on_recurring_transaction_removed(self, recurring_transaction: RecurringTransaction) -> None:
+        pass
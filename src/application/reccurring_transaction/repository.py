@@ -15,8 +15,9 @@
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
 from abc import ABC, abstractmethod
-from typing import Generic
+from typing import Generic, Iterator
 
+from src.domain.account import AccountId
 from src.domain.recurring_transaction import RecurringTransaction, RecurringTransactionId
 from src.shared.application.repository import EntityAlreadyExists, EntityNotFound
 
@@ -71,3 +72,17 @@ class RecurringTransactionRepository(ABC):
         :param recurring_transaction:
         :raises EntityNotFound
         """
+
+    @abstractmethod
+    def delete_by_account(self, account_id: AccountId) -> int:
+        """
+        Delete the recurring transactions of the account at once, found through the account index.
+        :param account_id:
+        :return: the number of recurring transactions deleted
+        """
+
+    @abstractmethod
+    def list_by_account(self, account_id: AccountId) -> Iterator[RecurringTransaction]:
+        """
+        :param account_id:
+        """
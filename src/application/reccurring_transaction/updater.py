@@ -1,5 +1,10 @@
+import copy
 from dataclasses import dataclass
+from typing import Sequence
 
+from src.application.account.currency import check_account_currency
+from src.application.account.repository import AccountRepository
+from src.application.reccurring_transaction.observer import RecurringTransactionObserver
 from src.application.reccurring_transaction.repository import (
     RecurringTransactionRepository,
     RecurringTransactionNotFound,
@@ -11,6 +16,7 @@ from src.domain.recurring_transaction import (
     RecurringFrequency,
 )
 from src.shared.application.repository import EntityNotFound
+from src.shared.domain.money import Money
 
 
 @dataclass(frozen=True)
@@ -18,22 +24,45 @@ class RecurringTransactionUpdateRequest:
     id: RecurringTransactionId
     account_id: AccountId
     name: RecurringTransactionName
-    amount: float
+    amount: Money
     frequency: RecurringFrequency
 
 
 class RecurringTransactionUpdater:
-    def __init__(self, repository: RecurringTransactionRepository) -> None:
+    """
+    :param repository:
+    :param observers:
+    :param account_repository: when given, amounts in another currency than the one of their account are rejected
+    """
+
+    def __init__(
+        self,
+        repository: RecurringTransactionRepository,
+        observers: Sequence[RecurringTransactionObserver] = (),
+        account_repository: AccountRepository | None = None,
+    ) -> None:
         self._repository = repository
+        self._observers = observers
+        self._account_repository = account_repository
 
     def update(self, request: RecurringTransactionUpdateRequest) -> None:
+        """
+        :raises RecurringTransactionNotFound, AccountNotFound, CurrencyMismatch
+        """
         try:
             recurring_transaction = self._repository.retrieve(request.id)
         except EntityNotFound as e:
             raise RecurringTransactionNotFound(recurring_transaction_id=request.id) from e
+        if self._account_repository is not None:
+            check_account_currency(self._account_repository, recurring_transaction.account_id, request.amount)
+        previous = copy.copy(recurring_transaction)
 
         recurring_transaction.rename(request.name)
         recurring_transaction.modify_amount(request.amount)
         recurring_transaction.modify_frequency(request.frequency)
 
         self._repository.update(recurring_transaction)
+
+        for observer in self._observers:
+            observer.on_recurring_transaction_removed(previous)
+            observer.on_recurring_transaction_added(recurring_transaction)
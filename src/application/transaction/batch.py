@@ -0,0 +1,125 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dataclasses import dataclass
+from typing import Sequence
+
+from src.application.account.currency import account_currency
+from src.application.account.repository import AccountRepository
+from src.application.transaction.creator import TransactionCreationRequest
+from src.application.transaction.deleter import TransactionDeletionRequest
+from src.application.transaction.observer import TransactionObserver
+from src.application.transaction.repository import (
+    TransactionRepository,
+    TransactionAlreadyExists,
+    TransactionNotFound,
+    TransactionOperation,
+    TransactionAddition,
+    TransactionReplacement,
+    TransactionRemoval,
+)
+from src.application.transaction.updater import TransactionUpdateRequest
+from src.domain.account import AccountId
+from src.domain.transaction import Transaction
+from src.shared.domain.money import CurrencyMismatch
+
+TransactionBatchOperation = TransactionCreationRequest | TransactionUpdateRequest | TransactionDeletionRequest
+TransactionBatchError = TransactionAlreadyExists | TransactionNotFound | CurrencyMismatch
+
+
+@dataclass(frozen=True)
+class TransactionBatchRequest:
+    account_id: AccountId
+    operations: Sequence[TransactionBatchOperation]
+
+
+class TransactionBatchProcessor:
+    """
+    Creates, updates and deletes transactions of an account at once, whatever the account given in the operations.
+    Every operation is validated on its own: the failure of one of them, e.g. the update of a transaction that does
+    not exist in the account, does not prevent the others.
+
+    :param repository:
+    :param observers:
+    :param account_repository: when given, operations whose amount is in another currency than the one of the account
+    are rejected
+    """
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        observers: Sequence[TransactionObserver] = (),
+        account_repository: AccountRepository | None = None,
+    ) -> None:
+        self._repository = repository
+        self._observers = observers
+        self._account_repository = account_repository
+
+    def process(self, request: TransactionBatchRequest) -> list[TransactionBatchError | None]:
+        """
+        :param request:
+        :return: the error of every operation, None when it is applied, in the order of the operations
+        :raises AccountNotFound
+        """
+        errors: list[TransactionBatchError | None] = [None] * len(request.operations)
+        if self._account_repository is not None:
+            currency = account_currency(self._account_repository, request.account_id)
+            for index, requested in enumerate(request.operations):
+                if not isinstance(requested, TransactionDeletionRequest) and requested.amount.currency != currency:
+                    errors[index] = CurrencyMismatch(currency, requested.amount.currency)
+
+        applied = [index for index, error in enumerate(errors) if error is None]
+        operations = [self._operation(request.account_id, request.operations[index]) for index in applied]
+        results = self._repository.apply_batch(request.account_id, operations)
+
+        for index, operation, result in zip(applied, operations, results):
+            errors[index] = result.error
+            if result.error is not None:
+                continue
+            for observer in self._observers:
+                if result.previous is not None:
+                    observer.on_transaction_removed(result.previous)
+                if not isinstance(operation, TransactionRemoval):
+                    observer.on_transaction_added(operation.transaction)
+
+        return errors
+
+    @staticmethod
+    def _operation(account_id: AccountId, operation: TransactionBatchOperation) -> TransactionOperation:
+        match operation:
+            case TransactionCreationRequest():
+                return TransactionAddition(
+                    Transaction(
+                        id_=operation.id,
+                        account_id=account_id,
+                        date=operation.date,
+                        label=operation.label,
+                        amount=operation.amount,
+                    )
+                )
+            case TransactionUpdateRequest():
+                return TransactionReplacement(
+                    Transaction(
+                        id_=operation.id,
+                        account_id=account_id,
+                        date=operation.date,
+                        label=operation.label,
+                        amount=operation.amount,
+                    )
+                )
+            case TransactionDeletionRequest():
+                return TransactionRemoval(operation.id)
+        raise ValueError(f"Unsupported operation `{operation}`")
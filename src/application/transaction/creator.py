@@ -1,10 +1,15 @@
 import datetime
 from dataclasses import dataclass
+from typing import Sequence
 
+from src.application.account.currency import check_account_currency
+from src.application.account.repository import AccountRepository
+from src.application.transaction.observer import TransactionObserver
 from src.application.transaction.repository import TransactionRepository, TransactionAlreadyExists
 from src.domain.transaction import AccountId, Transaction
 from src.domain.transaction import TransactionId
 from src.shared.application.repository import EntityAlreadyExists
+from src.shared.domain.money import Money
 
 
 @dataclass(frozen=True)
@@ -13,14 +18,34 @@ class TransactionCreationRequest:
     account_id: AccountId
     date: datetime.date
     label: str
-    amount: float
+    amount: Money
 
 
 class TransactionCreator:
-    def __init__(self, repository: TransactionRepository) -> None:
+    """
+    :param repository:
+    :param observers:
+    :param account_repository: when given, amounts in another currency than the one of their account are rejected
+    """
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        observers: Sequence[TransactionObserver] = (),
+        account_repository: AccountRepository | None = None,
+    ) -> None:
         self._repository = repository
+        self._observers = observers
+        self._account_repository = account_repository
 
     def create(self, request: TransactionCreationRequest) -> None:
+        """
+        :raises TransactionAlreadyExists, AccountNotFound, CurrencyMismatch, AmountOutOfBounds
+        """
+        request.amount.check_bounds()
+        if self._account_repository is not None:
+            check_account_currency(self._account_repository, request.account_id, request.amount)
+
         transaction = Transaction(
             id_=request.id, account_id=request.account_id, date=request.date, label=request.label, amount=request.amount
         )
@@ -29,3 +54,6 @@ class TransactionCreator:
             self._repository.add(transaction)
         except EntityAlreadyExists as e:
             raise TransactionAlreadyExists(transaction_id=request.id) from e
+
+        for observer in self._observers:
+            observer.on_transaction_added(transaction)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from typing import Sequence
 
 
+from src.application.transaction.observer import TransactionObserver
 from src.application.transaction.repository import TransactionRepository, TransactionNotFound
 from src.domain.account import AccountId
 from src.domain.transaction import TransactionId
@@ -13,11 +15,16 @@ class TransactionDeletionRequest:
 
 
 class TransactionDeleter:
-    def __init__(self, repository: TransactionRepository) -> None:
+    def __init__(self, repository: TransactionRepository, observers: Sequence[TransactionObserver] = ()) -> None:
         self._repository = repository
+        self._observers = observers
 
     def delete(self, request: TransactionDeletionRequest) -> None:
         try:
+            transaction = self._repository.retrieve(request.id)
             self._repository.delete(request.id)
         except EntityNotFound as e:
             raise TransactionNotFound(transaction_id=request.id) from e
+
+        for observer in self._observers:
+            observer.on_transaction_removed(transaction)
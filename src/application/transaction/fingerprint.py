@@ -0,0 +1,70 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Collection, Iterable
+
+from src.application.transaction.statement import StatementEntry
+from src.domain.account import AccountId
+
+Fingerprint = bytes
+
+
+def fingerprint(account_id: AccountId, entry: StatementEntry, occurrence: int = 0) -> Fingerprint:
+    """
+    Identifies a statement entry among the entries imported into an account: by the bank reference when there is one,
+    otherwise by its date, amount and label with whitespaces collapsed and case ignored.
+    :param account_id:
+    :param entry:
+    :param occurrence: rank of the entry among the identical entries of its statement, so that several identical
+    entries in a statement are kept apart while importing the statement again still matches them
+    """
+    if entry.reference is not None:
+        key = f"{account_id}\x1freference\x1f{entry.reference}"
+    else:
+        label = " ".join(entry.label.split()).casefold()
+        key = f"{account_id}\x1f{entry.date.isoformat()}\x1f{entry.amount.to_decimal():f}\x1f{label}\x1f{occurrence}"
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
+class TransactionFingerprintIndex(ABC):
+    """
+    Fingerprints of the statement entries already imported.
+    """
+
+    @abstractmethod
+    def add_many(self, account_id: AccountId, fingerprints: Iterable[Fingerprint]) -> None:
+        """
+        :param account_id: account the statement entries were imported into
+        :param fingerprints: fingerprints already in the index are ignored
+        """
+
+    @abstractmethod
+    def known(self, fingerprints: Collection[Fingerprint]) -> set[Fingerprint]:
+        """
+        :param fingerprints:
+        :return: the given fingerprints that are in the index
+        """
+
+    @abstractmethod
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        """
+        Delete the fingerprints of the statement entries imported into the account.
+        :param account_id:
+        :param limit: maximum number of fingerprints to delete
+        :return: the number of fingerprints deleted
+        """
@@ -0,0 +1,137 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import islice
+from typing import BinaryIO, Sequence
+
+from src.application.account.currency import account_currency
+from src.application.account.repository import AccountRepository
+from src.application.transaction.fingerprint import Fingerprint, TransactionFingerprintIndex, fingerprint
+from src.application.transaction.observer import TransactionObserver
+from src.application.transaction.repository import TransactionRepository
+from src.domain.account import AccountId
+from src.domain.transaction import Transaction, TransactionId
+from src.application.transaction.statement import StatementReader, StatementEntry
+from src.shared.application.id import IdFactory
+from src.shared.application.unit_of_work import UnitOfWork
+from src.shared.domain.money import CurrencyMismatch
+
+
+@dataclass(frozen=True)
+class TransactionImportRequest:
+    account_id: AccountId
+    statement: BinaryIO
+
+
+@dataclass(frozen=True)
+class TransactionImportReport:
+    inserted: int
+    skipped: int
+
+
+class TransactionImporter:
+    """
+    Imports a bank statement into an account. Entries are read lazily and stored by batches of `batch_size`
+    transactions, each batch being added at once, so that at most one batch of entries and transactions is held at a
+    time. Entries already imported, from this statement or an overlapping one, are recognized by their fingerprint and
+    skipped along with the invalid ones.
+
+    Identical entries may be far apart in a statement whose entries are not ordered, so the repeats of the entries
+    without a bank reference are counted over the whole statement: memory use still grows with the number of distinct
+    such entries, by one fingerprint each, but not with the size of their labels.
+
+    :param account_repository: when given, a statement in another currency than the one of the account is rejected
+    :param unit_of_work: when shared with the repository and the fingerprint index, the transactions of a batch are
+    stored along with their fingerprints at once, so that an import failing halfway can be run again
+    """
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        id_factory: IdFactory[TransactionId],
+        statement_reader: StatementReader,
+        fingerprint_index: TransactionFingerprintIndex,
+        observers: Sequence[TransactionObserver] = (),
+        batch_size: int = 1000,
+        account_repository: AccountRepository | None = None,
+        unit_of_work: UnitOfWork | None = None,
+    ) -> None:
+        self._repository = repository
+        self._id_factory = id_factory
+        self._statement_reader = statement_reader
+        self._fingerprint_index = fingerprint_index
+        self._observers = observers
+        self._batch_size = batch_size
+        self._account_repository = account_repository
+        self._unit_of_work = unit_of_work
+
+    def import_statement(self, request: TransactionImportRequest) -> TransactionImportReport:
+        """
+        :param request:
+        :raises TransactionAlreadyExists, AccountNotFound
+        :raises CurrencyMismatch: an entry is not in the currency of the account, the batches before it are imported
+        """
+        currency = None
+        if self._account_repository is not None:
+            currency = account_currency(self._account_repository, request.account_id)
+        inserted = skipped = 0
+        occurrences: Counter[Fingerprint] = Counter()
+        entries = self._statement_reader.read(request.statement)
+        while batch := list(islice(entries, self._batch_size)):
+            fingerprinted: dict[Fingerprint, StatementEntry] = {}
+            for entry in batch:
+                if not isinstance(entry, StatementEntry):
+                    continue
+                if currency is not None and entry.amount.currency != currency:
+                    raise CurrencyMismatch(currency, entry.amount.currency)
+                entry_fingerprint = fingerprint(request.account_id, entry)
+                if entry.reference is None:
+                    occurrence = occurrences[entry_fingerprint]
+                    occurrences[entry_fingerprint] += 1
+                    if occurrence:
+                        entry_fingerprint = fingerprint(request.account_id, entry, occurrence)
+                fingerprinted.setdefault(entry_fingerprint, entry)
+            with nullcontext() if self._unit_of_work is None else self._unit_of_work.atomic():
+                for known_fingerprint in self._fingerprint_index.known(fingerprinted.keys()):
+                    del fingerprinted[known_fingerprint]
+
+                transactions = [
+                    Transaction(
+                        id_=self._id_factory.generate_id(),
+                        account_id=request.account_id,
+                        date=entry.date,
+                        label=entry.label,
+                        amount=entry.amount,
+                    )
+                    for entry in fingerprinted.values()
+                ]
+                skipped += len(batch) - len(transactions)
+                if not transactions:
+                    continue
+
+                self._repository.add_many(transactions)
+                self._fingerprint_index.add_many(request.account_id, fingerprinted.keys())
+
+            inserted += len(transactions)
+
+            for transaction in transactions:
+                for observer in self._observers:
+                    observer.on_transaction_added(transaction)
+
+        return TransactionImportReport(inserted=inserted, skipped=skipped)
@@ -1,5 +1,9 @@
+import datetime
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Sequence
 
+from src.domain.account import AccountId
 from src.domain.transaction import Transaction, TransactionId
 from src.shared.application.repository import EntityAlreadyExists, EntityNotFound
 
@@ -24,6 +28,49 @@ class TransactionNotFound(EntityNotFound):
         return self._transaction_id
 
 
+@dataclass(frozen=True)
+class TransactionCursor:
+    """
+    Position in an account listing, which is ordered by date then by transaction id.
+    """
+
+    date: datetime.date
+    transaction_id: TransactionId
+
+    @classmethod
+    def after(cls, transaction: Transaction) -> "TransactionCursor":
+        return cls(date=transaction.date, transaction_id=transaction.id)
+
+
+@dataclass(frozen=True)
+class TransactionAddition:
+    transaction: Transaction
+
+
+@dataclass(frozen=True)
+class TransactionReplacement:
+    transaction: Transaction
+
+
+@dataclass(frozen=True)
+class TransactionRemoval:
+    transaction_id: TransactionId
+
+
+TransactionOperation = TransactionAddition | TransactionReplacement | TransactionRemoval
+
+
+@dataclass(frozen=True)
+class TransactionOperationResult:
+    """
+    :param previous: the transaction replaced or removed by the operation
+    :param error: why the operation was not applied
+    """
+
+    previous: Transaction | None = None
+    error: TransactionAlreadyExists | TransactionNotFound | None = None
+
+
 class TransactionRepository(ABC):
     @abstractmethod
     def add(self, transaction: Transaction) -> None:
@@ -33,6 +80,14 @@ class TransactionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def add_many(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Add every transaction at once: when one of them already exists, none is added.
+        :param transactions:
+        :raises TransactionAlreadyExists
+        """
+
     @abstractmethod
     def retrieve(self, id_: TransactionId) -> Transaction:
         """
@@ -54,3 +109,43 @@ class TransactionRepository(ABC):
         :param transaction:
         :raises EntityNotFound
         """
+
+    @abstractmethod
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        """
+        Delete the transactions of the account at once, found through the account index.
+        :param account_id:
+        :param limit: maximum number of transactions to delete
+        :return: the number of transactions deleted
+        """
+
+    @abstractmethod
+    def apply_batch(
+        self, account_id: AccountId, operations: Sequence[TransactionOperation]
+    ) -> list[TransactionOperationResult]:
+        """
+        Apply the operations in order and at once. Only the transactions of the account can be replaced or removed:
+        an operation that cannot be applied is reported in its result and does not prevent the others.
+        :param account_id:
+        :param operations:
+        :return: the result of every operation, in the same order
+        """
+
+    @abstractmethod
+    def list_by_account(
+        self,
+        account_id: AccountId,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+        limit: int | None = None,
+        cursor: TransactionCursor | None = None,
+    ) -> Iterator[Transaction]:
+        """
+        Lazily iterate over the account transactions dated between `date_from` and `date_to` (both included),
+        ordered by date then by id, starting right after `cursor` when given.
+        :param account_id:
+        :param date_from:
+        :param date_to:
+        :param limit: maximum number of transactions to iterate over
+        :param cursor:
+        """
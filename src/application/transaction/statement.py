@@ -0,0 +1,48 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator
+
+from src.shared.domain.money import Money
+
+
+@dataclass(frozen=True)
+class StatementEntry:
+    """
+    :param reference: identifier given to the entry by the bank, if any
+    """
+
+    date: datetime.date
+    label: str
+    amount: Money
+    reference: str | None = None
+
+
+@dataclass(frozen=True)
+class InvalidStatementEntry:
+    reason: str
+
+
+class StatementReader(ABC):
+    @abstractmethod
+    def read(self, statement: BinaryIO) -> Iterator[StatementEntry | InvalidStatementEntry]:
+        """
+        Lazily iterate over the statement entries, in the statement order.
+        :param statement:
+        """
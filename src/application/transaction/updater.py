@@ -1,10 +1,16 @@
+import copy
 from dataclasses import dataclass
 import datetime
+from typing import Sequence
 
+from src.application.account.currency import check_account_currency
+from src.application.account.repository import AccountRepository
+from src.application.transaction.observer import TransactionObserver
 from src.application.transaction.repository import TransactionRepository, TransactionNotFound
 from src.domain.account import AccountId
 from src.domain.transaction import TransactionId
 from src.shared.application.repository import EntityNotFound
+from src.shared.domain.money import Money
 
 
 @dataclass(frozen=True)
@@ -13,21 +19,45 @@ class TransactionUpdateRequest:
     account_id: AccountId
     date: datetime.date
     label: str
-    amount: float
+    amount: Money
 
 
 class TransactionUpdater:
-    def __init__(self, repository: TransactionRepository) -> None:
+    """
+    :param repository:
+    :param observers:
+    :param account_repository: when given, amounts in another currency than the one of their account are rejected
+    """
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        observers: Sequence[TransactionObserver] = (),
+        account_repository: AccountRepository | None = None,
+    ) -> None:
         self._repository = repository
+        self._observers = observers
+        self._account_repository = account_repository
 
     def update(self, request: TransactionUpdateRequest) -> None:
+        """
+        :raises TransactionNotFound, AccountNotFound, CurrencyMismatch, AmountOutOfBounds
+        """
+        request.amount.check_bounds()
         try:
             transaction = self._repository.retrieve(request.id)
         except EntityNotFound as e:
             raise TransactionNotFound(transaction_id=request.id) from e
+        if self._account_repository is not None:
+            check_account_currency(self._account_repository, transaction.account_id, request.amount)
+        previous = copy.copy(transaction)
 
         transaction.rectify_amount(request.amount)
         transaction.rectify_date(request.date)
         transaction.modify_label(request.label)
 
         self._repository.update(transaction)
+
+        for observer in self._observers:
+            observer.on_transaction_removed(previous)
+            observer.on_transaction_added(transaction)
@@ -16,7 +16,7 @@
 #   */
 from dataclasses import dataclass
 
-from src.application.user.repository import UserRepository, UserAlreadyExists
+from src.application.user.repository import UserRepository, UserAlreadyExists, UserEmailAddressAlreadyUsed
 from src.domain.user import UserName, User, UserId
 from src.shared.application.id import IdFactory
 from src.shared.application.repository import EntityAlreadyExists
@@ -34,10 +34,18 @@ class UserCreator:
         self._id_factory = id_factory
         self._repository = repository
 
-    def create(self, request: UserCreationRequest) -> None:
+    def create(self, request: UserCreationRequest) -> UserId:
+        """
+        :param request:
+        :return: the id of the user
+        :raises UserAlreadyExists, UserEmailAddressAlreadyUsed
+        """
         user = User(id_=self._id_factory.generate_id(), email_address=request.email_address, username=request.username)
 
         try:
             self._repository.add(user)
+        except UserEmailAddressAlreadyUsed:
+            raise
         except EntityAlreadyExists as e:
             raise UserAlreadyExists(user_id=user.id) from e
+        return user.id
@@ -14,11 +14,14 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+from contextlib import nullcontext
 from dataclasses import dataclass
 
+from src.application.account.deleter import AccountDeleter
 from src.application.user.repository import UserRepository, UserNotFound
 from src.domain.user import UserId
 from src.shared.application.repository import EntityNotFound
+from src.shared.application.unit_of_work import UnitOfWork
 
 
 @dataclass(frozen=True)
@@ -27,11 +30,28 @@ class UserDeletionRequest:
 
 
 class UserDeleter:
-    def __init__(self, repository: UserRepository) -> None:
+    """
+    :param repository:
+    :param account_deleter: deletes the accounts of the deleted users, which are kept otherwise
+    :param unit_of_work: when shared with the account deleter, a user is deleted along with its accounts at once
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        account_deleter: AccountDeleter | None = None,
+        unit_of_work: UnitOfWork | None = None,
+    ) -> None:
         self._repository = repository
+        self._account_deleter = account_deleter
+        self._unit_of_work = unit_of_work
 
     def delete(self, request: UserDeletionRequest) -> None:
-        try:
-            self._repository.delete(request.id)
-        except EntityNotFound as e:
-            raise UserNotFound(user_id=request.id) from e
+        with nullcontext() if self._unit_of_work is None else self._unit_of_work.atomic():
+            try:
+                self._repository.delete(request.id)
+            except EntityNotFound as e:
+                raise UserNotFound(user_id=request.id) from e
+
+            if self._account_deleter is not None:
+                self._account_deleter.delete_user_accounts(request.id)
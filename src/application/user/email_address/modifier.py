@@ -33,6 +33,10 @@ class UserEmailAddressModifier:
         self._repository = repository
 
     def modify(self, request: UserEmailAddressModificationRequest) -> None:
+        """
+        :param request:
+        :raises UserNotFound, UserEmailAddressAlreadyUsed when another user has the email address
+        """
         try:
             user = self._repository.retrieve(request.user_id)
             user.change_email_address(request.email_address)
@@ -16,8 +16,8 @@
 #   */
 from dataclasses import dataclass
 
-from src.application.user.repository import UserRepository, UserNotFound
-from src.domain.user import UserName, UserId
+from src.application.user.repository import UserRepository, UserNotFound, UserEmailAddressNotFound
+from src.domain.user import User, UserName, UserId
 from src.shared.application.repository import EntityNotFound
 from src.shared.domain.email import EmailAddress
 
@@ -38,6 +38,17 @@ class UserReader:
             user = self._repository.retrieve(user_id)
         except EntityNotFound as e:
             raise UserNotFound(user_id=user_id) from e
+        return self._response(user)
+
+    def retrieve_by_email_address(self, email_address: EmailAddress) -> UserRetrievalResponse:
+        try:
+            user = self._repository.retrieve_by_email_address(email_address)
+        except EntityNotFound as e:
+            raise UserEmailAddressNotFound(email_address=email_address) from e
+        return self._response(user)
+
+    @staticmethod
+    def _response(user: User) -> UserRetrievalResponse:
         return UserRetrievalResponse(
             id=user.id,
             username=user.username,
@@ -18,6 +18,7 @@ from abc import ABC, abstractmethod
 
 from src.domain.user import User, UserId
 from src.shared.application.repository import EntityAlreadyExists, EntityNotFound
+from src.shared.domain.email import EmailAddress
 
 
 class UserAlreadyExists(EntityAlreadyExists):
@@ -40,12 +41,32 @@ class UserNotFound(EntityNotFound):
         return self._user_id
 
 
+class UserEmailAddressNotFound(EntityNotFound):
+    def __init__(self, email_address: EmailAddress) -> None:
+        super().__init__(f"No user with email address `{email_address}`")
+        self._email_address = email_address
+
+    @property
+    def email_address(self) -> EmailAddress:
+        return self._email_address
+
+
+class UserEmailAddressAlreadyUsed(EntityAlreadyExists):
+    def __init__(self, email_address: EmailAddress) -> None:
+        super().__init__(f"Email address `{email_address}` is already used")
+        self._email_address = email_address
+
+    @property
+    def email_address(self) -> EmailAddress:
+        return self._email_address
+
+
 class UserRepository(ABC):
     @abstractmethod
     def add(self, user: User) -> None:
         """
         :param user:
-        :raises EntityAlreadyExists
+        :raises EntityAlreadyExists, UserEmailAddressAlreadyUsed when another user has the email address
         """
         pass
 
@@ -58,11 +79,20 @@ class UserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def retrieve_by_email_address(self, email_address: EmailAddress) -> User:
+        """
+        :param email_address:
+        :return: User
+        :raises EntityNotFound
+        """
+        pass
+
     @abstractmethod
     def update(self, user: User) -> None:
         """
         :param user:
-        :raises EntityNotFound
+        :raises EntityNotFound, UserEmailAddressAlreadyUsed when another user has the email address
         """
         pass
 
@@ -16,10 +16,34 @@
 #   */
 from abc import ABC, abstractmethod
 
+from src.application.user.repository import UserRepository, UserEmailAddressAlreadyUsed
+from src.shared.application.repository import EntityNotFound
 from src.shared.domain.email import EmailAddress
 
 
 class EmailAddressChecker(ABC):
     @abstractmethod
     def check(self, email_address: EmailAddress) -> None:
+        """
+        :raises: ValueError when the address cannot be validated
+        """
         pass
+
+
+class UnusedEmailAddressChecker(EmailAddressChecker):
+    """
+    Rejects the addresses of registered users, so that no validation email is sent for them.
+    """
+
+    def __init__(self, repository: UserRepository) -> None:
+        self._repository = repository
+
+    def check(self, email_address: EmailAddress) -> None:
+        """
+        :raises: UserEmailAddressAlreadyUsed
+        """
+        try:
+            self._repository.retrieve_by_email_address(email_address)
+        except EntityNotFound:
+            return
+        raise UserEmailAddressAlreadyUsed(email_address=email_address)
@@ -32,7 +32,16 @@ class ValidationEmailSender(ABC):
     @abstractmethod
     def check_validation_token(self, email_address: EmailAddress, token: str) -> None:
         """
-        Check if the token is valid for the email address
+        Check if the token is valid for the email address, without using it up
+        :raises: InvalidToken
+        """
+        pass
+
+    @abstractmethod
+    def use_validation_token(self, email_address: EmailAddress, token: str) -> None:
+        """
+        Check the token like `check_validation_token`, then have it rejected from now on. To be called once the change
+        the token validates is made, so that a change failing meanwhile leaves the token usable.
         :raises: InvalidToken
         """
         pass
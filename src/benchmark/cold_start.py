@@ -0,0 +1,102 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Cold start of the snapshot transaction repository: mapping a snapshot of every transaction, then serving reads and a
+first write, which copies the mapped buffers.
+
+    python -m src.benchmark.cold_start --transactions 10000000
+"""
+import argparse
+import datetime
+import tempfile
+import time
+import uuid
+from typing import Callable, Iterator, TypeVar
+
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUID, AccountUUIDFactory
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.snapshot.transaction import SnapshotTransactionRepository
+from src.infrastructure.transaction.id import TransactionUUID
+from src.shared.domain.money import Money
+from src.benchmark.timer import measure
+
+_ACCOUNTS = 1000
+_CHUNK = 10_000
+
+T = TypeVar("T")
+
+
+def _open(directory: str) -> SnapshotTransactionRepository:
+    # The log never triggers a compaction: the snapshot is written once the transactions are loaded
+    return SnapshotTransactionRepository(
+        directory,
+        uuid_bytes,
+        TransactionUUID.from_bytes,
+        uuid_bytes,
+        AccountUUID.from_bytes,
+        compaction_log_size=2**62,
+    )
+
+
+def _transactions(start: int, stop: int, account_ids: list) -> Iterator[Transaction]:
+    for index in range(start, stop):
+        yield Transaction(
+            TransactionUUID.trusted(str(uuid.UUID(int=index))),
+            account_ids[index % _ACCOUNTS],
+            datetime.date(2014, 1, 1) + datetime.timedelta(days=index // 3000),
+            f"label {index % 100}",
+            Money(index % 100_000 - 50_000),
+        )
+
+
+def _timed(label: str, action: Callable[[], T]) -> T:
+    start = time.perf_counter()
+    result = action()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:>12.1f} ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=10_000_000)
+    arguments = parser.parse_args()
+
+    account_ids = [AccountUUIDFactory().generate_id() for _ in range(_ACCOUNTS)]
+    with tempfile.TemporaryDirectory() as directory:
+        repository = _open(directory)
+
+        def load() -> None:
+            for start in range(0, arguments.transactions, _CHUNK):
+                repository.add_many(_transactions(start, min(start + _CHUNK, arguments.transactions), account_ids))
+
+        measure("load through the log", arguments.transactions, load)
+        measure("write the snapshot", arguments.transactions, repository.write_snapshot)
+        repository.close()
+        del repository
+
+        started = _timed("cold start", lambda: _open(directory))
+        first, second = (TransactionUUID.trusted(str(uuid.UUID(int=index))) for index in (1, 2))
+        _timed("first retrieve", lambda: started.retrieve(first))
+        _timed("first listing page", lambda: list(started.list_by_account(account_ids[0], limit=100)))
+        _timed("first write", lambda: started.delete(first))
+        _timed("second write", lambda: started.delete(second))
+        started.close()
+
+
+if __name__ == "__main__":
+    main()
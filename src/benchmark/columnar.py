@@ -0,0 +1,122 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Memory footprint and aggregate query time of the columnar transaction store, against the object store.
+
+    python -m src.benchmark.columnar --transactions 10000000 --objects 1000000
+"""
+import argparse
+import datetime
+import gc
+import os
+import uuid
+from typing import Callable, Iterator
+
+from src.application.transaction.repository import TransactionRepository
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.in_memory.columnar_transaction import ColumnarTransactionRepository
+from src.infrastructure.in_memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.transaction.id import TransactionUUID
+from src.shared.domain.money import Money
+from src.benchmark.timer import measure
+
+_ACCOUNTS = 1000
+_FIRST_DATE = datetime.date(2014, 1, 1)
+_DAYS = 3650
+_CHUNK = 10_000
+
+
+def _resident_bytes() -> int:
+    gc.collect()
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _transactions(start: int, stop: int, count: int, account_ids: list) -> Iterator[Transaction]:
+    # Ids grow with the dates so that every account receives its rows in listing order
+    for index in range(start, stop):
+        yield Transaction(
+            TransactionUUID.trusted(str(uuid.UUID(int=index))),
+            account_ids[index % _ACCOUNTS],
+            _FIRST_DATE + datetime.timedelta(days=index * _DAYS // count),
+            f"label {index % 100}",
+            Money(index % 100_000 - 50_000),
+        )
+
+
+def _load(label: str, count: int, account_ids: list, repository: Callable[[], TransactionRepository]):
+    before = _resident_bytes()
+    loaded = repository()
+
+    def load() -> None:
+        # Loaded by chunks, so that the pending transactions of a batch do not weigh in the footprint
+        for start in range(0, count, _CHUNK):
+            loaded.add_many(_transactions(start, min(start + _CHUNK, count), count, account_ids))
+
+    measure(f"{label} load", count, load)
+    print(f"{label + ' bytes per transaction':<40} {(_resident_bytes() - before) / count:>12.1f}")
+    return loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=10_000_000)
+    parser.add_argument("--objects", type=int, default=1_000_000)
+    arguments = parser.parse_args()
+
+    account_ids = [AccountUUIDFactory().generate_id() for _ in range(_ACCOUNTS)]
+    year_from, year_to = datetime.date(2018, 1, 1), datetime.date(2018, 12, 31)
+
+    objects = _load("objects", arguments.objects, account_ids, InMemoryTransactionRepository)
+    measure(
+        "objects one account year sum",
+        arguments.objects // _ACCOUNTS // 10,
+        lambda: sum(
+            transaction.amount.minor_units
+            for transaction in objects.list_by_account(account_ids[0], date_from=year_from, date_to=year_to)
+        ),
+    )
+    measure(
+        "objects all accounts sum",
+        arguments.objects,
+        lambda: [
+            sum(transaction.amount.minor_units for transaction in objects.list_by_account(id_)) for id_ in account_ids
+        ],
+    )
+    del objects
+
+    columnar = _load(
+        "columnar",
+        arguments.transactions,
+        account_ids,
+        lambda: ColumnarTransactionRepository(uuid_bytes, TransactionUUID.from_bytes),
+    )
+    measure(
+        "columnar one account year sum",
+        arguments.transactions // _ACCOUNTS // 10,
+        lambda: columnar.sum_by_account(account_ids[0], date_from=year_from, date_to=year_to),
+    )
+    measure("columnar all accounts sum", arguments.transactions, columnar.sums_by_account)
+    for index in range(0, arguments.transactions, 10):
+        columnar.delete(TransactionUUID.trusted(str(uuid.UUID(int=index))))
+    measure("columnar compaction", arguments.transactions, columnar.compact)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Latency of the account and user routes with singleton-scoped services versus services rebuilt on every request.
+
+    python -m src.benchmark.container --requests 5000
+"""
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from dependency_injector.providers import BaseSingleton, Factory
+
+from src.domain.account import Account, AccountName
+from src.domain.user import User, UserName
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.asgi import authorization, call
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.fastapi import create_app
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.email import EmailAddress
+from src.shared.domain.money import Money
+from src.benchmark.timer import report_latencies
+
+
+def _rebuild_on_every_request(container: SqliteContainer) -> None:
+    for name, provider in container.providers.items():
+        if name != "database" and isinstance(provider, BaseSingleton):
+            provider.override(Factory(provider.provides, *provider.args, **provider.kwargs))
+
+
+async def _run(container: SqliteContainer, requests: int, label: str) -> None:
+    app = create_app(container)
+    user = User(UserUUIDFactory().generate_id(), EmailAddress("john@example.com"), UserName("john_doe"))
+    account = Account(AccountUUIDFactory().generate_id(), user.id, AccountName("account_name"), Money(0))
+    container.user_repository().add(user)
+    container.account_repository().add(account)
+    headers = authorization(container.session_token_issuer().issue(user.id))
+
+    routes: list[tuple[str, str, str, Any]] = [
+        (
+            "POST /account/creation",
+            "POST",
+            "/account/creation",
+            {"user_id": str(user.id), "name": "other", "reference_balance": 1},
+        ),
+        ("GET /account/{id}", "GET", f"/account/{account.id}", None),
+        ("PUT /account/{id}", "PUT", f"/account/{account.id}", {"name": "renamed", "reference_balance": 2}),
+        ("GET /user/{id}", "GET", f"/user/{user.id}", None),
+        ("PUT /user/{id}", "PUT", f"/user/{user.id}", {"username": "jane_doe"}),
+    ]
+    for route, method, path, body in routes:
+        latencies = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            status, _ = await call(app, method, path, body, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            assert status < 400, f"{route} answered {status}"
+        report_latencies(f"[{label}] {route}", latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5_000)
+    arguments = parser.parse_args()
+
+    for label, scoped in (("per request", True), ("singleton", False)):
+        container = SqliteContainer()
+        container.config.database_path.from_value(":memory:")
+        # Tokens signed by one instance of the issuer must check with the next one
+        container.config.session_secret.from_value("benchmark")
+        if scoped:
+            _rebuild_on_every_request(container)
+        asyncio.run(_run(container, arguments.requests, label))
+        container.unwire()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Throughput of the email outbox, then latency of email address validation requests sent at a steady rate, with the
+validation email sent by SMTP within the request, queued in the outbox and sent by the background worker, and not
+sent at all, then the time the worker takes to drain the outbox.
+
+    python -m src.benchmark.email_outbox --rate 1000 --seconds 3 --handshake 20 --per-email 0.5
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from typing import Sequence
+
+from dependency_injector.providers import Object
+
+from src.infrastructure.asgi import call
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.email.mailer import DeliveryOutcome, Mailer
+from src.infrastructure.email.transport import EmailMessage, EmailTransport
+from src.infrastructure.fastapi import create_app
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.email_outbox import SqliteEmailOutbox
+from src.shared.domain.email import EmailAddress
+from src.benchmark.timer import measure, report_latencies
+
+
+def _message(index: int) -> EmailMessage:
+    return EmailMessage(EmailAddress(f"user{index}@example.com"), "Validate your email address", "token")
+
+
+def _enqueue(outbox: SqliteEmailOutbox, count: int) -> None:
+    for index in range(count):
+        outbox.deliver(_message(index))
+
+
+class _SlowMailer(Mailer):
+    """
+    Stands for an SMTP server: opening a connection costs a handshake, then every email costs a round trip.
+    """
+
+    handshake = 0.0
+    per_email = 0.0
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self._lock = threading.Lock()
+
+    def send(self, messages: Sequence[EmailMessage]) -> list[DeliveryOutcome]:
+        time.sleep(self.handshake + self.per_email * len(messages))
+        with self._lock:
+            self.sent += len(messages)
+        return [DeliveryOutcome.DELIVERED] * len(messages)
+
+
+class _DirectTransport(EmailTransport):
+    """
+    Sends every email on its own connection, within the request.
+    """
+
+    def __init__(self, mailer: Mailer) -> None:
+        self._mailer = mailer
+
+    def deliver(self, message: EmailMessage) -> None:
+        self._mailer.send([message])
+
+
+class _NullTransport(EmailTransport):
+    def deliver(self, message: EmailMessage) -> None:
+        pass
+
+
+async def _load(label: str, transport: EmailTransport | None, rate: int, seconds: float, database_path: str) -> None:
+    container = SqliteContainer()
+    container.config.database_path.from_value(database_path)
+    mailer = _SlowMailer()
+    container.email_mailer.override(Object(mailer))
+    if transport is not None:
+        container.validation_email_sender.add_kwargs(transport=transport)
+    app = create_app(container)
+
+    latencies: list[float] = []
+    start = time.perf_counter()
+
+    async def client(index: int) -> None:
+        await asyncio.sleep(start + index / rate - time.perf_counter())
+        begin = time.perf_counter()
+        status, _ = await call(
+            app, "POST", "/user/email_address/validation", {"email_address": f"user{index}@example.com"}
+        )
+        assert status == 200, status
+        latencies.append(time.perf_counter() - begin)
+
+    count = int(rate * seconds)
+    await asyncio.gather(*(client(index) for index in range(count)))
+    report_latencies(label, latencies)
+
+    if transport is None:
+        outbox = container.email_outbox()
+        while outbox.next_attempt_at() is not None:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        print(f"{'outbox drained after':<40} {elapsed:>10.3f} s {mailer.sent:>12,} emails")
+    container.shutdown_resources()
+    container.unwire()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=1000, help="requests per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--handshake", type=float, default=20.0, help="milliseconds to open an SMTP connection")
+    parser.add_argument("--per-email", type=float, default=0.5, help="milliseconds to send one email")
+    arguments = parser.parse_args()
+
+    _SlowMailer.handshake = arguments.handshake / 1000
+    _SlowMailer.per_email = arguments.per_email / 1000
+    with tempfile.TemporaryDirectory() as directory:
+        database = SqliteDatabase(os.path.join(directory, "enqueues.sqlite3"))
+        outbox = SqliteEmailOutbox(database)
+        count = int(arguments.rate * arguments.seconds)
+        measure("outbox enqueues", count, lambda: _enqueue(outbox, count))
+        database.close()
+
+        variants: dict[str, EmailTransport | None] = {
+            "no email": _NullTransport(),
+            "outbox": None,
+            "SMTP within the request": _DirectTransport(_SlowMailer()),
+        }
+        for index, (label, transport) in enumerate(variants.items()):
+            database_path = os.path.join(directory, f"{index}.sqlite3")
+            asyncio.run(_load(label, transport, arguments.rate, arguments.seconds, database_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Sustained write throughput of the event log with group commit, against an fsync per event, then of event-sourced
+transaction updates made by concurrent request threads.
+
+    python -m src.benchmark.event_log --events 200000 --writers 64
+"""
+import argparse
+import datetime
+import tempfile
+import threading
+from typing import Callable
+
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.event_sourcing.log import SegmentedEventLog
+from src.infrastructure.event_sourcing.store import EventStore
+from src.infrastructure.event_sourcing.transaction import EventSourcedTransactionRepository
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.shared.domain.money import Money
+from src.benchmark.timer import measure
+
+# A pickled amount rectification is about this size
+_PAYLOAD = bytes(160)
+
+
+def _concurrently(writers: int, count: int, write: Callable[[int], None]) -> Callable[[], None]:
+    def run() -> None:
+        threads = [
+            threading.Thread(target=lambda: [write(index) for index in range(writer, count, writers)])
+            for writer in range(writers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--writers", type=int, default=64)
+    parser.add_argument("--fsync-events", type=int, default=2_000)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = SegmentedEventLog(f"{directory}/fsync")
+
+        def fsync_per_event() -> None:
+            for _ in range(arguments.fsync_events):
+                log.sync(log.append([_PAYLOAD]))
+
+        measure("fsync per event", arguments.fsync_events, fsync_per_event)
+        log.close()
+
+        log = SegmentedEventLog(f"{directory}/group")
+        write = _concurrently(arguments.writers, arguments.events, lambda _: log.sync(log.append([_PAYLOAD])))
+        measure(f"group commit, {arguments.writers} writers", arguments.events, write)
+        log.close()
+
+        store = EventStore(f"{directory}/store")
+        repository = EventSourcedTransactionRepository(store)
+        store.open()
+        account_id = AccountUUIDFactory().generate_id()
+        id_factory = TransactionUUIDFactory()
+        transactions = [
+            Transaction(id_factory.generate_id(), account_id, datetime.date(2023, 1, 1), "label", Money(0))
+            for _ in range(arguments.writers)
+        ]
+        repository.add_many(transactions)
+
+        def rectify(index: int) -> None:
+            transaction = repository.retrieve(transactions[index % arguments.writers].id)
+            transaction.rectify_amount(Money(index + 1))
+            repository.update(transaction)
+
+        write = _concurrently(arguments.writers, arguments.events, rectify)
+        measure(f"transaction updates, {arguments.writers} writers", arguments.events, write)
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Latency of 500 concurrent account reads, with the blocking use case run on the event loop, as the routes used to do,
+and on the bounded thread pool.
+
+    python -m src.benchmark.event_loop --connections 500 --storage-latency 2
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable, ParamSpec, TypeVar
+
+from dependency_injector.providers import Object
+
+from src.domain.account import Account, AccountId, AccountName
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.asgi import authorization, call
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.fastapi import create_app
+from src.infrastructure.sqlite.account import SqliteAccountRepository
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.money import Money
+from src.benchmark.timer import report_latencies
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class _InlineCallRunner(BlockingCallRunner):
+    async def run(self, function: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        return function(*args, **kwargs)
+
+
+class _SlowAccountRepository(SqliteAccountRepository):
+    """
+    Stands for a storage whose reads wait on a disk or a network, during which the GIL is released.
+    """
+
+    latency = 0.0
+
+    def retrieve(self, id_: AccountId) -> Account:
+        time.sleep(self.latency)
+        return super().retrieve(id_)
+
+
+async def _load(label: str, runner: BlockingCallRunner, connections: int, rounds: int) -> None:
+    container = SqliteContainer()
+    container.config.database_path.from_value(":memory:")
+    container.account_repository.override(_SlowAccountRepository(container.database()))
+    container.blocking_call_runner.override(Object(runner))
+    app = create_app(container)
+    account = Account(
+        AccountUUIDFactory().generate_id(), UserUUIDFactory().generate_id(), AccountName("bench"), Money(0)
+    )
+    container.account_repository().add(account)
+    path = f"/account/{account.id}"
+    headers = authorization(container.session_token_issuer().issue(account.user_id))
+
+    async def client(latencies: list[float]) -> None:
+        begin = time.perf_counter()
+        status, _ = await call(app, "GET", path, headers=headers)
+        assert status == 200, status
+        latencies.append(time.perf_counter() - begin)
+
+    latencies: list[float] = []
+    for _ in range(rounds):
+        await asyncio.gather(*(client(latencies) for _ in range(connections)))
+    report_latencies(label, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--storage-latency", type=float, default=2.0, help="milliseconds per account read")
+    parser.add_argument("--workers", type=int, default=32)
+    arguments = parser.parse_args()
+
+    _SlowAccountRepository.latency = arguments.storage_latency / 1000
+    runners = {
+        "blocking call on the event loop": _InlineCallRunner(1),
+        f"blocking call on {arguments.workers} threads": BlockingCallRunner(arguments.workers),
+    }
+    for label, runner in runners.items():
+        asyncio.run(_load(label, runner, arguments.connections, arguments.rounds))
+        runner.shutdown()
+
+
+if __name__ == "__main__":
+    main()
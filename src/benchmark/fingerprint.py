@@ -0,0 +1,93 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Duplicate detection of a statement against the fingerprints of the already imported history.
+
+    python -m src.benchmark.fingerprint --history 1000000 --statement 50000
+"""
+import argparse
+import datetime
+import os
+import random
+import tempfile
+
+from src.application.transaction.fingerprint import fingerprint, TransactionFingerprintIndex
+from src.application.transaction.statement import StatementEntry
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.in_memory.fingerprint import InMemoryTransactionFingerprintIndex
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.fingerprint import SqliteTransactionFingerprintIndex
+from src.shared.domain.money import Money
+from src.benchmark.timer import measure
+
+
+def _entry(index: int) -> StatementEntry:
+    date = datetime.date(2013, 1, 1) + datetime.timedelta(days=index % 3650)
+    return StatementEntry(date, f"PAYEE {index % 1000}", Money(index * 37 % 50000), None if index % 2 else str(index))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--history", type=int, default=1_000_000)
+    parser.add_argument("--statement", type=int, default=50_000)
+    parser.add_argument("--naive-entries", type=int, default=20, help="entries compared with the whole history")
+    arguments = parser.parse_args()
+
+    account_id = AccountUUIDFactory().generate_id()
+    history = [_entry(index) for index in range(arguments.history)]
+    # Half of the statement overlaps the end of the history
+    first = arguments.history - arguments.statement // 2
+    statement = [_entry(index) for index in range(first, first + arguments.statement)]
+
+    statement_fingerprints: list = []
+    measure(
+        "fingerprint statement entries",
+        len(statement),
+        lambda: statement_fingerprints.extend(fingerprint(account_id, entry) for entry in statement),
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = SqliteDatabase(os.path.join(directory, "benchmark.sqlite3"))
+        indexes: list[tuple[str, TransactionFingerprintIndex]] = [
+            ("in memory", InMemoryTransactionFingerprintIndex()),
+            ("sqlite", SqliteTransactionFingerprintIndex(database)),
+        ]
+        for name, index in indexes:
+            measure(
+                f"{name} index history",
+                len(history),
+                lambda: index.add_many(account_id, (fingerprint(account_id, entry) for entry in history)),
+            )
+            known: set = set()
+            measure(
+                f"{name} known (statement entries)",
+                len(statement),
+                lambda: known.update(index.known(statement_fingerprints)),
+            )
+            print(f"{len(known):,} already imported entries")
+        database.close()
+
+    sample = statement[: arguments.naive_entries]
+    measure(
+        "naive comparison (statement entries)",
+        len(sample),
+        lambda: [any(entry == imported for imported in history) for entry in sample],
+    )
+
+
+if __name__ == "__main__":
+    main()
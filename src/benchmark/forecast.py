@@ -0,0 +1,122 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Latency of balance forecasts, recomputed after every change and served from the cache.
+
+    python -m src.benchmark.forecast --rules 50 --years 5
+"""
+import argparse
+import datetime
+import random
+import time
+
+from src.application.account.balance import AccountBalanceCalculator
+from src.application.account.forecast import AccountBalanceForecaster
+from src.domain.account import Account, AccountName
+from src.domain.recurring_transaction import (
+    DailyFrequency,
+    WeeklyFrequency,
+    MonthlyFrequency,
+    YearlyFrequency,
+    Day,
+    RecurringFrequency,
+    RecurringTransaction,
+    RecurringTransactionName,
+)
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.in_memory.recurring_transaction import InMemoryRecurringTransactionRepository
+from src.infrastructure.in_memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.recurring_transaction.id import RecurringTransactionUUIDFactory
+from src.infrastructure.sqlite.account import SqliteAccountRepository
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.money import Money
+from src.benchmark.timer import report_latencies
+
+
+def _random_frequency() -> RecurringFrequency:
+    match random.randrange(4):
+        case 0:
+            return DailyFrequency()
+        case 1:
+            return WeeklyFrequency(Day(random.randrange(7)))
+        case 2:
+            return MonthlyFrequency(random.randint(1, 31))
+        case _:
+            return YearlyFrequency(random.randint(1, 31), random.randint(1, 12))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rules", type=int, default=50)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--transactions", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=200)
+    arguments = parser.parse_args()
+
+    account_repository = SqliteAccountRepository(SqliteDatabase(":memory:"))
+    transaction_repository = InMemoryTransactionRepository()
+    recurring_transaction_repository = InMemoryRecurringTransactionRepository()
+    account = Account(
+        AccountUUIDFactory().generate_id(), UserUUIDFactory().generate_id(), AccountName("bench"), Money(0)
+    )
+    account_repository.add(account)
+
+    start = datetime.date.today()
+    days = arguments.years * 365
+    transaction_id_factory = TransactionUUIDFactory()
+    for _ in range(arguments.transactions):
+        date = start + datetime.timedelta(days=random.randint(-days, days))
+        transaction_repository.add(
+            Transaction(
+                transaction_id_factory.generate_id(), account.id, date, "label", Money(random.randint(-10000, 10000))
+            )
+        )
+    recurring_transaction_id_factory = RecurringTransactionUUIDFactory()
+    recurring_transactions = [
+        RecurringTransaction(
+            recurring_transaction_id_factory.generate_id(),
+            account.id,
+            RecurringTransactionName("rule"),
+            Money(random.randint(-10000, 10000)),
+            _random_frequency(),
+        )
+        for _ in range(arguments.rules)
+    ]
+    for recurring_transaction in recurring_transactions:
+        recurring_transaction_repository.add(recurring_transaction)
+
+    forecaster = AccountBalanceForecaster(
+        AccountBalanceCalculator(account_repository, transaction_repository),
+        recurring_transaction_repository,
+    )
+
+    for label, invalidate in (("forecast after a change", True), ("cached forecast", False)):
+        latencies = []
+        for _ in range(arguments.requests):
+            if invalidate:
+                forecaster.on_recurring_transaction_added(recurring_transactions[0])
+            begin = time.perf_counter()
+            forecaster.forecast(account.id, start, days)
+            latencies.append(time.perf_counter() - begin)
+        report_latencies(label, latencies)
+
+
+if __name__ == "__main__":
+    main()
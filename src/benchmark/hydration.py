@@ -0,0 +1,71 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Cost of rebuilding accounts and transactions from storage rows, validated and trusted.
+
+    python -m src.benchmark.hydration --transactions 1000000
+"""
+import argparse
+import datetime
+import uuid
+
+from src.domain.account import Account, AccountName
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.transaction.id import TransactionUUID
+from src.infrastructure.user.id import UserUUID
+from src.shared.domain.money import Money
+from src.benchmark.timer import measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    arguments = parser.parse_args()
+
+    account_rows = [(str(uuid.uuid4()), str(uuid.uuid4()), f"account_{index}", 0, "EUR") for index in range(1000)]
+    transaction_rows = [
+        (str(uuid.uuid4()), account_rows[index % 1000], datetime.date(2024, 1, 1), "label", 1250, "EUR")
+        for index in range(arguments.transactions)
+    ]
+
+    def validated() -> None:
+        for id_, account_row, date, label, amount, currency in transaction_rows:
+            account = Account(
+                AccountUUID(account_row[0]),
+                UserUUID(account_row[1]),
+                AccountName(account_row[2]),
+                Money(account_row[3], account_row[4]),
+            )
+            Transaction(TransactionUUID(id_), account.id, date, label, Money(amount, currency))
+
+    def trusted() -> None:
+        for id_, account_row, date, label, amount, currency in transaction_rows:
+            account = Account(
+                AccountUUID.trusted(account_row[0]),
+                UserUUID.trusted(account_row[1]),
+                AccountName.trusted(account_row[2]),
+                Money(account_row[3], account_row[4]),
+            )
+            Transaction(TransactionUUID.trusted(id_), account.id, date, label, Money(amount, currency))
+
+    measure("validated hydration", len(transaction_rows), validated)
+    measure("trusted hydration", len(transaction_rows), trusted)
+
+
+if __name__ == "__main__":
+    main()
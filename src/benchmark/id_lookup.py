@@ -0,0 +1,49 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Dict lookups keyed by ids, with the stored ids themselves and with ids rebuilt from their string form as routes and
+repositories do.
+
+    python -m src.benchmark.id_lookup --ids 100000 --lookups 1000000
+"""
+import argparse
+import random
+
+from src.infrastructure.account.id import AccountUUID, AccountUUIDFactory
+from src.benchmark.timer import measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ids", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=1_000_000)
+    arguments = parser.parse_args()
+
+    id_factory = AccountUUIDFactory()
+    ids = [id_factory.generate_id() for _ in range(arguments.ids)]
+    by_id = {id_: index for index, id_ in enumerate(ids)}
+    stored = random.choices(ids, k=arguments.lookups)
+    strings = [str(id_) for id_ in stored]
+    rebuilt = [AccountUUID(string) for string in strings]
+
+    measure("lookup with stored ids", len(stored), lambda: [by_id[id_] for id_ in stored])
+    measure("lookup with rebuilt ids", len(rebuilt), lambda: [by_id[id_] for id_ in rebuilt])
+    measure("rebuild id and lookup", len(strings), lambda: [by_id[AccountUUID(string)] for string in strings])
+
+
+if __name__ == "__main__":
+    main()
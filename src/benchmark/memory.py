@@ -0,0 +1,67 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Memory held by each Transaction, its TransactionUUID and AccountUUID included, and the cost of hashing ids.
+
+    python -m src.benchmark.memory --transactions 1000000
+"""
+import argparse
+import datetime
+import gc
+import tracemalloc
+import uuid
+
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.transaction.id import TransactionUUID
+from src.shared.domain.money import Money
+from src.benchmark.timer import measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    arguments = parser.parse_args()
+
+    # Ids, dates and labels are built beforehand: only the domain objects are measured.
+    raw_ids = [str(uuid.uuid4()) for _ in range(arguments.transactions)]
+    account_ids = [AccountUUID(str(uuid.uuid4())) for _ in range(10)]
+    dates = [datetime.date(2024, 1, 1) + datetime.timedelta(days=day) for day in range(365)]
+    amount = Money(1250)
+    gc.collect()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    transactions = [
+        Transaction(TransactionUUID(raw_id), account_ids[index % 10], dates[index % 365], "label", amount)
+        for index, raw_id in enumerate(raw_ids)
+    ]
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(transactions)
+    print(f"{'bytes per transaction':<40} {(after - before) / count:>12.1f}")
+    print(f"{'peak MiB':<40} {(peak - before) / 2**20:>12.1f}")
+
+    ids = [transaction.id for transaction in transactions]
+    by_id = {transaction.id: transaction for transaction in transactions}
+    measure("hash ids", count, lambda: [hash(id_) for id_ in ids])
+    measure("look transactions up by id", count, lambda: [by_id[id_] for id_ in ids])
+
+
+if __name__ == "__main__":
+    main()
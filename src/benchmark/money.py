@@ -0,0 +1,52 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Summing amounts as floats, as decimals and as integer minor units, and the drift of the float sum.
+
+    python -m src.benchmark.money --amounts 1000000
+"""
+import argparse
+import random
+from decimal import Decimal
+
+from src.shared.domain.money import Money, minor_units_array
+from src.benchmark.timer import measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--amounts", type=int, default=1_000_000)
+    arguments = parser.parse_args()
+
+    random.seed(0)
+    cents = [random.randint(-50000, 50000) for _ in range(arguments.amounts)]
+    floats = [cent / 100 for cent in cents]
+    decimals = [Decimal(cent).scaleb(-2) for cent in cents]
+    amounts = [Money(cent) for cent in cents]
+    packed = minor_units_array(amounts)
+    measure("float sum", len(floats), lambda: sum(floats))
+    measure("decimal sum", len(decimals), lambda: sum(decimals, Decimal(0)))
+    measure("money sum", len(amounts), lambda: Money.sum(amounts))
+    measure("packed minor units sum", len(packed), lambda: sum(packed))
+
+    exact = sum(decimals, Decimal(0))
+    float_sum = sum(floats)
+    print(f"exact {exact}, money {Money.sum(amounts)}, float {float_sum!r}, drift {Decimal(float_sum) - exact:.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Expansion of recurring transactions into occurrence dates, compared with a naive `datetime` loop.
+
+    python -m src.benchmark.occurrence --rules 10000 --years 30
+"""
+import argparse
+import calendar
+import datetime
+import random
+
+from src.domain.occurrence import expand
+from src.domain.recurring_transaction import (
+    DailyFrequency,
+    WeeklyFrequency,
+    MonthlyFrequency,
+    YearlyFrequency,
+    Day,
+    RecurringFrequency,
+    RecurringTransaction,
+    RecurringTransactionName,
+)
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.recurring_transaction.id import RecurringTransactionUUIDFactory
+from src.shared.domain.money import Money
+from src.benchmark.timer import measure
+
+
+def _random_frequency() -> RecurringFrequency:
+    match random.randrange(4):
+        case 0:
+            return DailyFrequency()
+        case 1:
+            return WeeklyFrequency(Day(random.randrange(7)))
+        case 2:
+            return MonthlyFrequency(random.randint(1, 31))
+        case _:
+            return YearlyFrequency(random.randint(1, 31), random.randint(1, 12))
+
+
+def _naive_dates(frequency: RecurringFrequency, start: datetime.date, end: datetime.date) -> list[datetime.date]:
+    dates = []
+    date = start
+    while date <= end:
+        match frequency:
+            case DailyFrequency():
+                matches = True
+            case WeeklyFrequency(day=day):
+                matches = date.weekday() == day
+            case MonthlyFrequency(day=day):
+                matches = date.day == min(day, calendar.monthrange(date.year, date.month)[1])
+            case YearlyFrequency(day=day, month=month):
+                matches = date.month == month and date.day == min(day, calendar.monthrange(date.year, month)[1])
+        if matches:
+            dates.append(date)
+        date += datetime.timedelta(days=1)
+    return dates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rules", type=int, default=10_000)
+    parser.add_argument("--years", type=int, default=30)
+    parser.add_argument("--naive-rules", type=int, default=200, help="rules expanded by the naive loop")
+    arguments = parser.parse_args()
+
+    id_factory = RecurringTransactionUUIDFactory()
+    account_id = AccountUUIDFactory().generate_id()
+    recurring_transactions = [
+        RecurringTransaction(
+            id_factory.generate_id(),
+            account_id,
+            RecurringTransactionName("rule"),
+            Money(-100),
+            _random_frequency(),
+        )
+        for _ in range(arguments.rules)
+    ]
+    start = datetime.date(2024, 1, 1)
+    end = datetime.date(2024 + arguments.years, 1, 1) - datetime.timedelta(days=1)
+
+    expanded: list = []
+    measure(
+        "occurrence engine (rules)",
+        arguments.rules,
+        lambda: expanded.extend(expand(recurring_transactions, start, end)),
+    )
+    print(f"{sum(len(days) for _, days in expanded):,} occurrences")
+
+    naive_rules = recurring_transactions[: arguments.naive_rules]
+    measure(
+        "naive datetime loop (rules)",
+        len(naive_rules),
+        lambda: [_naive_dates(recurring_transaction.frequency, start, end) for recurring_transaction in naive_rules],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Import of a synthetic OFX statement into SQLite, by batches compared with one `TransactionCreator.create` per entry.
+
+    python -m src.benchmark.ofx_import --lines 200000
+"""
+import argparse
+import datetime
+import os
+import random
+import tempfile
+import tracemalloc
+
+from src.application.account.balance import AccountBalanceCalculator
+from src.application.transaction.creator import TransactionCreator, TransactionCreationRequest
+from src.application.transaction.importer import TransactionImporter, TransactionImportRequest
+from src.application.transaction.statement import StatementEntry
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.sqlite.account import SqliteAccountRepository
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.fingerprint import SqliteTransactionFingerprintIndex
+from src.infrastructure.sqlite.transaction import SqliteTransactionRepository
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.infrastructure.transaction.ofx import OfxStatementReader
+from src.benchmark.timer import measure
+
+_HEADER = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+ENCODING:USASCII
+CHARSET:1252
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS><CURDEF>EUR<BANKTRANLIST>
+"""
+_FOOTER = """</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+_TRANSACTION_LINES = 8
+
+
+def _write_statement(path: str, lines: int) -> int:
+    start = datetime.date(2013, 1, 1)
+    transactions = lines // _TRANSACTION_LINES
+    with open(path, "w", encoding="cp1252") as statement:
+        statement.write(_HEADER)
+        for index in range(transactions):
+            date = start + datetime.timedelta(days=random.randrange(3650))
+            statement.write(
+                "<STMTTRN>\n"
+                "<TRNTYPE>DEBIT\n"
+                f"<DTPOSTED>{date:%Y%m%d}120000[-5:EST]\n"
+                f"<TRNAMT>{random.uniform(-500, 500):.2f}\n"
+                f"<FITID>{index:012}\n"
+                f"<NAME>PAYEE {random.randrange(1000)}\n"
+                "<MEMO>CARD 1234\n"
+                "</STMTTRN>\n"
+            )
+        statement.write(_FOOTER)
+    return transactions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=200_000)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "statement.ofx")
+        transactions = _write_statement(path, arguments.lines)
+        print(f"{os.path.getsize(path) / 2**20:.1f} MiB statement, {transactions:,} transactions")
+
+        database = SqliteDatabase(os.path.join(directory, "benchmark.sqlite3"))
+        account_repository = SqliteAccountRepository(database)
+        transaction_repository = SqliteTransactionRepository(database)
+        observers = [AccountBalanceCalculator(account_repository, transaction_repository)]
+        account_id = AccountUUIDFactory().generate_id()
+        importer = TransactionImporter(
+            repository=transaction_repository,
+            id_factory=TransactionUUIDFactory(),
+            statement_reader=OfxStatementReader(),
+            fingerprint_index=SqliteTransactionFingerprintIndex(database),
+            observers=observers,
+        )
+
+        def import_statement() -> None:
+            with open(path, "rb") as statement:
+                print(importer.import_statement(TransactionImportRequest(account_id=account_id, statement=statement)))
+
+        def create_one_by_one() -> None:
+            creator = TransactionCreator(repository=transaction_repository, observers=observers)
+            id_factory = TransactionUUIDFactory()
+            with open(path, "rb") as statement:
+                for entry in OfxStatementReader().read(statement):
+                    assert isinstance(entry, StatementEntry)
+                    creator.create(
+                        TransactionCreationRequest(
+                            id=id_factory.generate_id(),
+                            account_id=account_id,
+                            date=entry.date,
+                            label=entry.label,
+                            amount=entry.amount,
+                        )
+                    )
+
+        measure("importer (transactions)", transactions, import_statement)
+        measure("importer, already imported (transactions)", transactions, import_statement)
+        measure("creator one by one (transactions)", transactions, create_one_by_one)
+
+        # Another account, so that the entries are not skipped as already imported
+        account_id = AccountUUIDFactory().generate_id()
+        tracemalloc.start()
+        import_statement()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"importer peak traced memory: {peak / 2**20:.1f} MiB")
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Sign-ups per second of the scrypt password vault as the number of hashing processes grows, up to the number of CPUs,
+against hashing on the event loop thread.
+
+    python -m src.benchmark.password_vault --sign-ups 200
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+
+from src.infrastructure.blocking import blocking_call_runner, BlockingCallRunner
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.user.id import UserUUIDFactory
+from src.infrastructure.user.password.scrypt import ScryptUserPasswordVault
+from src.benchmark.timer import measure
+
+
+async def _sign_up(vault: ScryptUserPasswordVault, runner: BlockingCallRunner, count: int) -> None:
+    async def sign_up() -> None:
+        password_hash = await vault.hash("Secret1@")
+        await runner.run(vault.store, UserUUIDFactory().generate_id(), password_hash)
+
+    await asyncio.gather(*(sign_up() for _ in range(count)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sign-ups", type=int, default=200)
+    arguments = parser.parse_args()
+    cpus = os.cpu_count() or 1
+
+    measure(
+        "on the event loop thread",
+        arguments.sign_ups,
+        lambda: [hashlib.scrypt(b"Secret1@", salt=bytes(16), n=2**14, r=8, p=1) for _ in range(arguments.sign_ups)],
+    )
+
+    database = SqliteDatabase(":memory:")
+    for runner in blocking_call_runner(max_workers=4):
+        workers = 1
+        while True:
+            vault = ScryptUserPasswordVault(database, runner, max_workers=workers, max_pending=arguments.sign_ups)
+            # Processes are started on demand: the first round only starts them
+            asyncio.run(_sign_up(vault, runner, workers))
+            measure(
+                f"{workers} hashing processes",
+                arguments.sign_ups,
+                lambda: asyncio.run(_sign_up(vault, runner, arguments.sign_ups)),
+            )
+            vault.shutdown()
+            if workers >= cpus:
+                break
+            workers = min(workers * 2, cpus)
+    database.close()
+
+
+if __name__ == "__main__":
+    main()
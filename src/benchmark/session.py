@@ -0,0 +1,87 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Overhead of authenticating a request with a session token, with many revoked tokens still in the denylist, against
+checking the password on every request, and the latency of a whole user route for scale.
+
+    python -m src.benchmark.session --requests 5000 --revoked 100000
+"""
+import argparse
+import asyncio
+import hashlib
+import time
+
+from dependency_injector.providers import Object
+
+from src.domain.user import User, UserName
+from src.infrastructure.asgi import authorization, call
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.fastapi import create_app
+from src.infrastructure.user.id import UserUUID, UserUUIDFactory
+from src.infrastructure.user.session.denylist import SessionDenylist
+from src.infrastructure.user.session.token import SessionTokenIssuer
+from src.shared.domain.email import EmailAddress
+from src.benchmark.timer import measure, report_latencies
+
+
+async def _route_latencies(issuer: SessionTokenIssuer, requests: int) -> None:
+    container = SqliteContainer()
+    container.config.database_path.from_value(":memory:")
+    container.session_token_issuer.override(Object(issuer))
+    app = create_app(container)
+    user = User(UserUUIDFactory().generate_id(), EmailAddress("john@example.com"), UserName("john_doe"))
+    container.user_repository().add(user)
+    headers = authorization(issuer.issue(user.id))
+
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        status, _ = await call(app, "GET", f"/user/{user.id}", headers=headers)
+        latencies.append(time.perf_counter() - start)
+        assert status == 200, status
+    report_latencies("GET /user/{id} with a session token", latencies)
+    container.unwire()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--revoked", type=int, default=100_000, help="revoked tokens still in the denylist")
+    parser.add_argument("--password-checks", type=int, default=20)
+    arguments = parser.parse_args()
+
+    issuer = SessionTokenIssuer(UserUUID.trusted, SessionDenylist())
+    user_id = UserUUIDFactory().generate_id()
+    for _ in range(arguments.revoked):
+        issuer.revoke(issuer.verify(issuer.issue(user_id)))
+    token = issuer.issue(user_id)
+    measure(
+        "session token check", arguments.requests, lambda: [issuer.verify(token) for _ in range(arguments.requests)]
+    )
+    measure(
+        "password check",
+        arguments.password_checks,
+        lambda: [
+            hashlib.scrypt(b"Secret1@", salt=bytes(16), n=2**14, r=8, p=1) for _ in range(arguments.password_checks)
+        ],
+    )
+
+    asyncio.run(_route_latencies(issuer, arguments.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Throughput of the SQLite transaction repository.
+
+    python -m src.benchmark.sqlite_repository --transactions 1000000
+"""
+import argparse
+import datetime
+import os
+import random
+import tempfile
+
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.transaction import SqliteTransactionRepository
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.shared.domain.money import Money
+from src.benchmark.timer import measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--sample", type=int, default=100_000, help="operations measured for retrieve/update/delete")
+    arguments = parser.parse_args()
+
+    account_id_factory, transaction_id_factory = AccountUUIDFactory(), TransactionUUIDFactory()
+    account_ids = [account_id_factory.generate_id() for _ in range(arguments.accounts)]
+    start = datetime.date(2013, 1, 1)
+    transactions = [
+        Transaction(
+            transaction_id_factory.generate_id(),
+            random.choice(account_ids),
+            start + datetime.timedelta(days=random.randrange(3650)),
+            f"label {index}",
+            Money(random.randint(-50000, 50000)),
+        )
+        for index in range(arguments.transactions)
+    ]
+    sample = random.sample(transactions, min(arguments.sample, len(transactions)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = SqliteDatabase(os.path.join(directory, "benchmark.sqlite3"))
+        repository = SqliteTransactionRepository(database)
+
+        def add() -> None:
+            for transaction in transactions:
+                repository.add(transaction)
+
+        def retrieve() -> None:
+            for transaction in sample:
+                repository.retrieve(transaction.id)
+
+        def update() -> None:
+            for transaction in sample:
+                transaction.rectify_amount(transaction.amount + Money(100))
+                repository.update(transaction)
+
+        def delete() -> None:
+            for transaction in sample:
+                repository.delete(transaction.id)
+
+        measure("add", len(transactions), add)
+        measure("retrieve", len(sample), retrieve)
+        measure("update", len(sample), update)
+        measure("delete", len(sample), delete)
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
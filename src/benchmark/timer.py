@@ -0,0 +1,40 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import time
+from typing import Callable
+
+
+def measure(label: str, count: int, action: Callable[[], object]) -> float:
+    """
+    Run `action` once, print the throughput of the `count` operations it performs and return the elapsed seconds.
+    """
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {count:>12,} ops {elapsed:>10.3f} s {count / elapsed:>14,.0f} ops/s")
+    return elapsed
+
+
+def report_latencies(label: str, latencies: list[float]) -> None:
+    """
+    Print the mean, median and 99th percentile of `latencies`, given in seconds.
+    """
+    ordered = sorted(latencies)
+    mean = sum(ordered) / len(ordered)
+    median = ordered[len(ordered) // 2]
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<40} mean {mean * 1e6:>10.1f} µs  p50 {median * 1e6:>10.1f} µs  p99 {p99 * 1e6:>10.1f} µs")
@@ -0,0 +1,81 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Synchronisation of offline edits: one batch request compared with one request per operation.
+
+    python -m src.benchmark.transaction_batch --operations 10000
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from src.domain.account import Account, AccountName
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.asgi import authorization, call
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.fastapi import create_app
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.money import Money
+
+
+def _operations(count: int) -> list[dict]:
+    id_factory = TransactionUUIDFactory()
+    creations = [
+        {"operation": "create", "id": str(id_factory.generate_id()), "date": "2023-01-01", "label": "x", "amount": 1.0}
+        for _ in range(count // 2)
+    ]
+    updates = [{**creation, "operation": "update", "amount": 2.0} for creation in creations[: count // 4]]
+    deletions = [{"operation": "delete", "id": creation["id"]} for creation in creations[count // 4 :]]
+    return creations + updates + deletions
+
+
+async def _run(operations: list[dict]) -> None:
+    for label, batch_size in (("one batch request", len(operations)), ("one request per operation", 1)):
+        container = SqliteContainer()
+        container.config.database_path.from_value(":memory:")
+        app = create_app(container)
+        account = Account(
+            AccountUUIDFactory().generate_id(), UserUUIDFactory().generate_id(), AccountName("bench"), Money(0)
+        )
+        container.account_repository().add(account)
+        path = f"/account/{account.id}/transactions:batch"
+        headers = authorization(container.session_token_issuer().issue(account.user_id))
+
+        start = time.perf_counter()
+        for index in range(0, len(operations), batch_size):
+            status, body = await call(
+                app, "POST", path, {"operations": operations[index : index + batch_size]}, headers=headers
+            )
+            assert status == 200, body
+            assert all(result["status"] == "applied" for result in json.loads(body)["results"])
+        elapsed = time.perf_counter() - start
+        print(f"{label:<40} {len(operations):>12,} ops {elapsed:>10.3f} s {len(operations) / elapsed:>14,.0f} ops/s")
+        container.unwire()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--operations", type=int, default=10_000)
+    arguments = parser.parse_args()
+
+    asyncio.run(_run(_operations(arguments.operations)))
+
+
+if __name__ == "__main__":
+    main()
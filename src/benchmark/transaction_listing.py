@@ -0,0 +1,107 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Latency of one-month range queries on an account history, through the account index versus a full scan.
+
+    python -m src.benchmark.transaction_listing --transactions 1000000
+"""
+import argparse
+import datetime
+import os
+import random
+import tempfile
+import time
+
+from src.application.transaction.repository import TransactionRepository
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.in_memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.transaction import SqliteTransactionRepository
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.shared.domain.money import Money
+from src.benchmark.timer import report_latencies
+
+_START = datetime.date(2013, 1, 1)
+
+
+def _query_windows(queries: int) -> list[tuple[datetime.date, datetime.date]]:
+    windows = []
+    for _ in range(queries):
+        date_from = _START + datetime.timedelta(days=random.randrange(3650 - 31))
+        windows.append((date_from, date_from + datetime.timedelta(days=30)))
+    return windows
+
+
+def _bench(label: str, repository: TransactionRepository, account_ids: list, windows: list) -> None:
+    latencies = []
+    for date_from, date_to in windows:
+        start = time.perf_counter()
+        list(repository.list_by_account(random.choice(account_ids), date_from=date_from, date_to=date_to))
+        latencies.append(time.perf_counter() - start)
+    report_latencies(label, latencies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=1_000_000)
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=200)
+    arguments = parser.parse_args()
+
+    account_id_factory, transaction_id_factory = AccountUUIDFactory(), TransactionUUIDFactory()
+    account_ids = [account_id_factory.generate_id() for _ in range(arguments.accounts)]
+    transactions = [
+        Transaction(
+            transaction_id_factory.generate_id(),
+            random.choice(account_ids),
+            _START + datetime.timedelta(days=random.randrange(3650)),
+            f"label {index}",
+            Money(random.randint(-50000, 50000)),
+        )
+        for index in range(arguments.transactions)
+    ]
+    windows = _query_windows(arguments.queries)
+
+    latencies = []
+    for date_from, date_to in windows:
+        account_id = random.choice(account_ids)
+        start = time.perf_counter()
+        sorted(
+            (t for t in transactions if t.account_id == account_id and date_from <= t.date <= date_to),
+            key=lambda t: (t.date, str(t.id)),
+        )
+        latencies.append(time.perf_counter() - start)
+    report_latencies("full scan", latencies)
+
+    in_memory_repository = InMemoryTransactionRepository()
+    for transaction in transactions:
+        in_memory_repository.add(transaction)
+    _bench("in memory account index", in_memory_repository, account_ids, windows)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = SqliteDatabase(os.path.join(directory, "benchmark.sqlite3"))
+        sqlite_repository = SqliteTransactionRepository(database)
+        with database.transaction():
+            for transaction in transactions:
+                sqlite_repository.add(transaction)
+        _bench("sqlite (account_id, date) index", sqlite_repository, account_ids, windows)
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
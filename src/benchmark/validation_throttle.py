@@ -0,0 +1,119 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Emails sent by the email address validation throttle under a storm of requests, against the bound set by the address
+limits. Requests are spread over a few addresses and many clients, and arrive in ticks at the given rate on a
+simulated clock, so the offered load does not depend on how fast this machine can go.
+
+    python -m src.benchmark.validation_throttle --rate 10000 --seconds 30 --addresses 20 --clients 5000
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from src.application.user.subscription.email_address.checker import UnusedEmailAddressChecker
+from src.application.user.subscription.email_address.validator import EmailAddressValidator
+from src.application.user.subscription.emailer import ValidationEmailSender
+from src.infrastructure.blocking import blocking_call_runner
+from src.infrastructure.in_memory.user import InMemoryUserRepository
+from src.infrastructure.rate_limit import TokenBucketLimiter
+from src.infrastructure.user.validation.throttle import EmailAddressValidationThrottle, TooManyValidationRequests
+from src.shared.domain.email import EmailAddress
+
+ADDRESS_BURST = 3
+ADDRESS_RATE = 1 / 60
+CLIENT_BURST = 10
+CLIENT_RATE = 1.0
+TICK = 0.01
+
+
+class _SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingSender(ValidationEmailSender):
+    def __init__(self) -> None:
+        self.sent = 0
+
+    def send(self, email_address: EmailAddress) -> None:
+        self.sent += 1
+
+    def check_validation_token(self, email_address: EmailAddress, token: str) -> None:
+        pass
+
+    def use_validation_token(self, email_address: EmailAddress, token: str) -> None:
+        pass
+
+
+async def _storm(arguments: argparse.Namespace) -> None:
+    clock = _SimulatedClock()
+    sender = _CountingSender()
+    addresses = [EmailAddress(f"user{index}@example.com") for index in range(arguments.addresses)]
+    clients = [f"10.{index // 65536}.{index // 256 % 256}.{index % 256}" for index in range(arguments.clients)]
+    outcomes = {"sent or joined": 0, "limited": 0}
+
+    async def query(throttle: EmailAddressValidationThrottle) -> None:
+        try:
+            await throttle.query(random.choice(addresses), random.choice(clients))
+            outcomes["sent or joined"] += 1
+        except TooManyValidationRequests:
+            outcomes["limited"] += 1
+
+    for runner in blocking_call_runner(max_workers=4):
+        throttle = EmailAddressValidationThrottle(
+            EmailAddressValidator(UnusedEmailAddressChecker(InMemoryUserRepository()), sender),
+            runner,
+            address_limiter=TokenBucketLimiter(ADDRESS_RATE, ADDRESS_BURST, clock),
+            client_limiter=TokenBucketLimiter(CLIENT_RATE, CLIENT_BURST, clock),
+        )
+        per_tick = round(arguments.rate * TICK)
+        ticks = round(arguments.seconds / TICK)
+        start = time.perf_counter()
+        for _ in range(ticks):
+            await asyncio.gather(*(query(throttle) for _ in range(per_tick)))
+            clock.now += TICK
+        elapsed = time.perf_counter() - start
+
+    requests = per_tick * ticks
+    bound = arguments.addresses * (ADDRESS_BURST + int(ADDRESS_RATE * arguments.seconds))
+    print(
+        f"requests {requests:>12,} ({requests / arguments.seconds:,.0f}/s simulated, {requests / elapsed:,.0f}/s real)"
+    )
+    for outcome, count in outcomes.items():
+        print(f"{outcome:<16} {count:>12,}")
+    print(f"emails sent      {sender.sent:>12,} (bound {bound:,})")
+    assert sender.sent <= bound
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=10_000, help="requests per simulated second")
+    parser.add_argument("--seconds", type=int, default=30)
+    parser.add_argument("--addresses", type=int, default=20)
+    parser.add_argument("--clients", type=int, default=5_000)
+    arguments = parser.parse_args()
+    random.seed(0)
+    asyncio.run(_storm(arguments))
+
+
+if __name__ == "__main__":
+    main()
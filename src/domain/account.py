@@ -14,31 +14,63 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
-import re
 from abc import ABC
+from dataclasses import dataclass
 
 from src.domain.user import UserId
-from src.shared.domain.entity import Id, EntityBase
-from src.shared.domain.string import StringTooShort, StringTooLong, StringContainsInvalidCharacters
+from src.shared.domain.entity import Id
+from src.shared.domain.event import AggregateRoot, DomainEvent
+from src.shared.domain.money import Money
+from src.shared.domain.string import NAME_PATTERN, check_string
 from src.shared.domain.value_object import StringObject
 
 
 class AccountId(Id, ABC):
-    pass
+    __slots__ = ()
 
 
 class AccountName(StringObject):
+    __slots__ = ()
+
     def __post_init__(self):
-        if len(self.value) < 4:
-            raise StringTooShort(self.value)
-        if len(self.value) > 30:
-            raise StringTooLong(self.value)
-        if not re.match(r"^[a-zA-Z0-9_-]+$", self.value):
-            raise StringContainsInvalidCharacters(self.value)
+        check_string(self.value, 4, 30, NAME_PATTERN)
+
+
+@dataclass(frozen=True, slots=True)
+class AccountOpened(DomainEvent):
+    account_id: AccountId
+    user_id: UserId
+    name: AccountName
+    reference_balance: Money
+
+
+@dataclass(frozen=True, slots=True)
+class AccountRenamed(DomainEvent):
+    account_id: AccountId
+    name: AccountName
+
+
+@dataclass(frozen=True, slots=True)
+class AccountReferenceBalanceModified(DomainEvent):
+    account_id: AccountId
+    reference_balance: Money
 
 
-class Account(EntityBase[AccountId]):
-    def __init__(self, id_: AccountId, user_id: UserId, name: AccountName, reference_balance: float) -> None:
+@dataclass(frozen=True, slots=True)
+class AccountMoved(DomainEvent):
+    account_id: AccountId
+    user_id: UserId
+
+
+@dataclass(frozen=True, slots=True)
+class AccountClosed(DomainEvent):
+    account_id: AccountId
+
+
+class Account(AggregateRoot[AccountId]):
+    __slots__ = ("_user_id", "_name", "_reference_balance")
+
+    def __init__(self, id_: AccountId, user_id: UserId, name: AccountName, reference_balance: Money) -> None:
         super().__init__(id_)
         self._user_id = user_id
         self._name = name
@@ -53,11 +85,20 @@ class Account(EntityBase[AccountId]):
         return self._name
 
     @property
-    def reference_balance(self) -> float:
+    def reference_balance(self) -> Money:
         return self._reference_balance
 
     def rename(self, new_name: AccountName) -> None:
-        self._name = new_name
+        if new_name != self._name:
+            self._name = new_name
+            self._record(AccountRenamed(self.id, new_name))
+
+    def modify_reference_balance(self, new_reference_balance: Money) -> None:
+        if new_reference_balance != self._reference_balance:
+            self._reference_balance = new_reference_balance
+            self._record(AccountReferenceBalanceModified(self.id, new_reference_balance))
 
-    def modify_reference_balance(self, new_reference_balance: float) -> None:
-        self._reference_balance = new_reference_balance
+    def move_to(self, new_user_id: UserId) -> None:
+        if new_user_id != self._user_id:
+            self._user_id = new_user_id
+            self._record(AccountMoved(self.id, new_user_id))
@@ -0,0 +1,97 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Occurrences are expressed as day numbers (`datetime.date.toordinal()`), which keeps expansion to integer arithmetic.
+A day of month missing from a short month falls back to the last day of that month, e.g. `MonthlyFrequency(31)`
+happens on April 30th and `YearlyFrequency(29, 2)` on February 28th of non-leap years.
+"""
+import calendar
+import datetime
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+from src.domain.recurring_transaction import (
+    RecurringFrequency,
+    RecurringTransaction,
+    DailyFrequency,
+    WeeklyFrequency,
+    MonthlyFrequency,
+    YearlyFrequency,
+)
+
+
+def occurrence_days(frequency: RecurringFrequency, start: datetime.date, end: datetime.date) -> Sequence[int]:
+    """
+    Day numbers of the occurrences between `start` and `end`, both included, in ascending order.
+    """
+    first_day, last_day = start.toordinal(), end.toordinal()
+    match frequency:
+        case DailyFrequency():
+            return range(first_day, last_day + 1)
+        case WeeklyFrequency(day=day):
+            return range(first_day + (day - start.weekday()) % 7, last_day + 1, 7)
+        case MonthlyFrequency(day=day):
+            return _monthly_days(day, first_day, last_day)
+        case YearlyFrequency(day=day, month=month):
+            return _yearly_days(day, month, first_day, last_day)
+    raise ValueError(f"Unsupported frequency `{frequency}`")
+
+
+def occurrence_dates(frequency: RecurringFrequency, start: datetime.date, end: datetime.date) -> list[datetime.date]:
+    return [datetime.date.fromordinal(day) for day in occurrence_days(frequency, start, end)]
+
+
+def expand(
+    recurring_transactions: Iterable[RecurringTransaction], start: datetime.date, end: datetime.date
+) -> list[tuple[RecurringTransaction, Sequence[int]]]:
+    """
+    Occurrence day numbers of every recurring transaction between `start` and `end`, both included.
+    The returned sequences are shared between recurring transactions with the same frequency and must not be mutated.
+    """
+    return [
+        (recurring_transaction, occurrence_days(recurring_transaction.frequency, start, end))
+        for recurring_transaction in recurring_transactions
+    ]
+
+
+@lru_cache(maxsize=64)
+def _months(first_day: int, last_day: int) -> tuple[tuple[int, int], ...]:
+    """
+    First day number and length of every month overlapping the window.
+    """
+    start, end = datetime.date.fromordinal(first_day), datetime.date.fromordinal(last_day)
+    months = []
+    for index in range(start.year * 12 + start.month - 1, end.year * 12 + end.month):
+        year, month = divmod(index, 12)
+        months.append((datetime.date(year, month + 1, 1).toordinal(), calendar.monthrange(year, month + 1)[1]))
+    return tuple(months)
+
+
+@lru_cache(maxsize=1024)
+def _monthly_days(day: int, first_day: int, last_day: int) -> tuple[int, ...]:
+    candidates = (month_start + min(day, length) - 1 for month_start, length in _months(first_day, last_day))
+    return tuple(candidate for candidate in candidates if first_day <= candidate <= last_day)
+
+
+@lru_cache(maxsize=1024)
+def _yearly_days(day: int, month: int, first_day: int, last_day: int) -> tuple[int, ...]:
+    start, end = datetime.date.fromordinal(first_day), datetime.date.fromordinal(last_day)
+    candidates = (
+        datetime.date(year, month, min(day, calendar.monthrange(year, month)[1])).toordinal()
+        for year in range(start.year, end.year + 1)
+    )
+    return tuple(candidate for candidate in candidates if first_day <= candidate <= last_day)
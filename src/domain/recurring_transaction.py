@@ -14,32 +14,30 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
-import re
 from abc import ABC
 from dataclasses import dataclass
 from enum import IntEnum
 
 from src.domain.account import AccountId
-from src.shared.domain.entity import EntityBase, Id
-from src.shared.domain.string import StringTooShort, StringTooLong, StringContainsInvalidCharacters
+from src.shared.domain.entity import Id
+from src.shared.domain.event import AggregateRoot, DomainEvent
+from src.shared.domain.money import Money
+from src.shared.domain.string import NAME_PATTERN, check_string
 from src.shared.domain.value_object import StringObject
 
 
 class RecurringTransactionId(Id, ABC):
-    pass
+    __slots__ = ()
 
 
 class RecurringTransactionName(StringObject):
+    __slots__ = ()
+
     def __post_init__(self):
-        if len(self.value) < 2:
-            raise StringTooShort(self.value)
-        if len(self.value) > 80:
-            raise StringTooLong(self.value)
-        if not re.match(r"^[a-zA-Z0-9_-]+$", self.value):
-            raise StringContainsInvalidCharacters(self.value)
+        check_string(self.value, 2, 80, NAME_PATTERN)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyFrequency:
     pass
 
@@ -54,12 +52,12 @@ class Day(IntEnum):
     SUNDAY = 6
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeeklyFrequency:
     day: Day
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonthlyFrequency:
     day: int
 
@@ -68,7 +66,7 @@ class MonthlyFrequency:
             raise ValueError("Day must be an integer between 1 and 31")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class YearlyFrequency:
     day: int
     month: int
@@ -83,13 +81,47 @@ class YearlyFrequency:
 RecurringFrequency = DailyFrequency | WeeklyFrequency | MonthlyFrequency | YearlyFrequency
 
 
-class RecurringTransaction(EntityBase[RecurringTransactionId]):
+@dataclass(frozen=True, slots=True)
+class RecurringTransactionScheduled(DomainEvent):
+    recurring_transaction_id: RecurringTransactionId
+    account_id: AccountId
+    name: RecurringTransactionName
+    amount: Money
+    frequency: RecurringFrequency
+
+
+@dataclass(frozen=True, slots=True)
+class RecurringTransactionRenamed(DomainEvent):
+    recurring_transaction_id: RecurringTransactionId
+    name: RecurringTransactionName
+
+
+@dataclass(frozen=True, slots=True)
+class RecurringTransactionAmountModified(DomainEvent):
+    recurring_transaction_id: RecurringTransactionId
+    amount: Money
+
+
+@dataclass(frozen=True, slots=True)
+class RecurringTransactionFrequencyModified(DomainEvent):
+    recurring_transaction_id: RecurringTransactionId
+    frequency: RecurringFrequency
+
+
+@dataclass(frozen=True, slots=True)
+class RecurringTransactionCancelled(DomainEvent):
+    recurring_transaction_id: RecurringTransactionId
+
+
+class RecurringTransaction(AggregateRoot[RecurringTransactionId]):
+    __slots__ = ("_account_id", "_name", "_amount", "_frequency")
+
     def __init__(
         self,
         id_: RecurringTransactionId,
         account_id: AccountId,
         name: RecurringTransactionName,
-        amount: float,
+        amount: Money,
         frequency: RecurringFrequency,
     ) -> None:
         super().__init__(id_)
@@ -107,7 +139,7 @@ class RecurringTransaction(EntityBase[RecurringTransactionId]):
         return self._name
 
     @property
-    def amount(self) -> float:
+    def amount(self) -> Money:
         return self._amount
 
     @property
@@ -115,10 +147,16 @@ class RecurringTransaction(EntityBase[RecurringTransactionId]):
         return self._frequency
 
     def rename(self, new_name: RecurringTransactionName) -> None:
-        self._name = new_name
+        if new_name != self._name:
+            self._name = new_name
+            self._record(RecurringTransactionRenamed(self.id, new_name))
 
-    def modify_amount(self, new_amount: float) -> None:
-        self._amount = new_amount
+    def modify_amount(self, new_amount: Money) -> None:
+        if new_amount != self._amount:
+            self._amount = new_amount
+            self._record(RecurringTransactionAmountModified(self.id, new_amount))
 
     def modify_frequency(self, new_frequency: RecurringFrequency) -> None:
-        self._frequency = new_frequency
+        if new_frequency != self._frequency:
+            self._frequency = new_frequency
+            self._record(RecurringTransactionFrequencyModified(self.id, new_frequency))
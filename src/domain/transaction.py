@@ -16,18 +16,55 @@
 #   */
 import datetime
 from abc import ABC
+from dataclasses import dataclass
 
 from src.domain.account import AccountId
-from src.shared.domain.entity import EntityBase, TId, Id
+from src.shared.domain.entity import Id
+from src.shared.domain.event import AggregateRoot, DomainEvent
+from src.shared.domain.money import Money
 
 
 class TransactionId(Id, ABC):
-    pass
+    __slots__ = ()
 
 
-class Transaction(EntityBase[TransactionId]):
+@dataclass(frozen=True, slots=True)
+class TransactionRecorded(DomainEvent):
+    transaction_id: TransactionId
+    account_id: AccountId
+    date: datetime.date
+    label: str
+    amount: Money
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionDateRectified(DomainEvent):
+    transaction_id: TransactionId
+    date: datetime.date
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionAmountRectified(DomainEvent):
+    transaction_id: TransactionId
+    amount: Money
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionLabelModified(DomainEvent):
+    transaction_id: TransactionId
+    label: str
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionDeleted(DomainEvent):
+    transaction_id: TransactionId
+
+
+class Transaction(AggregateRoot[TransactionId]):
+    __slots__ = ("_account_id", "_date", "_label", "_amount")
+
     def __init__(
-        self, id_: TransactionId, account_id: AccountId, date: datetime.date, label: str, amount: float
+        self, id_: TransactionId, account_id: AccountId, date: datetime.date, label: str, amount: Money
     ) -> None:
         super().__init__(id_)
         self._account_id = account_id
@@ -48,14 +85,20 @@ class Transaction(EntityBase[TransactionId]):
         return self._label
 
     @property
-    def amount(self) -> float:
+    def amount(self) -> Money:
         return self._amount
 
     def rectify_date(self, new_date: datetime.date) -> None:
-        self._date = new_date
+        if new_date != self._date:
+            self._date = new_date
+            self._record(TransactionDateRectified(self.id, new_date))
 
-    def rectify_amount(self, new_amount: float) -> None:
-        self._amount = new_amount
+    def rectify_amount(self, new_amount: Money) -> None:
+        if new_amount != self._amount:
+            self._amount = new_amount
+            self._record(TransactionAmountRectified(self.id, new_amount))
 
     def modify_label(self, new_label: str) -> None:
-        self._label = new_label
+        if new_label != self._label:
+            self._label = new_label
+            self._record(TransactionLabelModified(self.id, new_label))
@@ -14,30 +14,54 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
-import re
 from abc import ABC
+from dataclasses import dataclass
 
 from src.shared.domain.email import EmailAddress
-from src.shared.domain.entity import EntityBase, Id
-from src.shared.domain.string import StringTooLong, StringTooShort, StringContainsInvalidCharacters
+from src.shared.domain.entity import Id
+from src.shared.domain.event import AggregateRoot, DomainEvent
+from src.shared.domain.string import NAME_PATTERN, check_string
 from src.shared.domain.value_object import ValueObject
 
 
 class UserId(Id, ABC):
-    pass
+    __slots__ = ()
 
 
 class UserName(ValueObject[str]):
+    __slots__ = ()
+
     def __post_init__(self):
-        if len(self.value) < 4:
-            raise StringTooShort(self.value)
-        if len(self.value) > 30:
-            raise StringTooLong(self.value)
-        if not re.match(r"^[a-zA-Z0-9_-]+$", self.value):
-            raise StringContainsInvalidCharacters(self.value)
+        check_string(self.value, 4, 30, NAME_PATTERN)
+
+
+@dataclass(frozen=True, slots=True)
+class UserRegistered(DomainEvent):
+    user_id: UserId
+    email_address: EmailAddress
+    username: UserName
+
+
+@dataclass(frozen=True, slots=True)
+class UserEmailAddressChanged(DomainEvent):
+    user_id: UserId
+    email_address: EmailAddress
+
+
+@dataclass(frozen=True, slots=True)
+class UserRenamed(DomainEvent):
+    user_id: UserId
+    username: UserName
+
+
+@dataclass(frozen=True, slots=True)
+class UserDeleted(DomainEvent):
+    user_id: UserId
+
 
+class User(AggregateRoot[UserId]):
+    __slots__ = ("_email_address", "_username")
 
-class User(EntityBase[UserId]):
     def __init__(self, id_: UserId, email_address: EmailAddress, username: UserName) -> None:
         super().__init__(id_=id_)
         self._email_address = email_address
@@ -52,7 +76,11 @@ class User(EntityBase[UserId]):
         return self._username
 
     def change_email_address(self, new_email: EmailAddress) -> None:
-        self._email_address = new_email
+        if new_email != self._email_address:
+            self._email_address = new_email
+            self._record(UserEmailAddressChanged(self.id, new_email))
 
     def rename(self, new_username: UserName) -> None:
-        self._username = new_username
+        if new_username != self._username:
+            self._username = new_username
+            self._record(UserRenamed(self.id, new_username))
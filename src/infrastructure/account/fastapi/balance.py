@@ -0,0 +1,43 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.application.account.balance import AccountBalanceCalculator
+from src.domain.account import AccountId
+from src.infrastructure.account.fastapi.ownership import owned_account_id
+from src.infrastructure.money import decimal_string
+from src.shared.domain.money import MoneyOverflow
+
+router = APIRouter()
+
+
+@router.get("/account/{account_id}/balance", status_code=200)
+@inject
+def retrieve_account_balance(
+    account_id: AccountId = Depends(owned_account_id),
+    at: datetime.date | None = None,
+    account_balance_calculator: AccountBalanceCalculator = Depends(Provide["account_balance_calculator"]),
+) -> dict:
+    at = at or datetime.date.today()
+    try:
+        balance = account_balance_calculator.balance(account_id, at)
+    except MoneyOverflow as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return {"at": at, "balance": decimal_string(balance), "currency": balance.currency}
@@ -0,0 +1,68 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.application.account.dashboard import AccountDashboardProjection
+from src.domain.account import AccountId
+from src.infrastructure.account.fastapi.ownership import owned_account_id
+from src.infrastructure.money import decimal_string
+from src.shared.domain.money import MoneyOverflow
+
+router = APIRouter()
+
+
+@router.get("/account/{account_id}/dashboard", status_code=200)
+@inject
+def retrieve_account_dashboard(
+    account_id: AccountId = Depends(owned_account_id),
+    account_dashboard_projection: AccountDashboardProjection = Depends(Provide["account_dashboard_projection"]),
+) -> dict:
+    try:
+        dashboard = account_dashboard_projection.dashboard(account_id)
+    except MoneyOverflow as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return {
+        "id": str(dashboard.id),
+        "user_id": str(dashboard.user_id),
+        "name": str(dashboard.name),
+        "at": dashboard.at,
+        "balance": decimal_string(dashboard.balance),
+        "currency": dashboard.balance.currency,
+        "monthly_totals": [
+            {"month": totals.month, "income": decimal_string(totals.income), "expense": decimal_string(totals.expense)}
+            for totals in dashboard.monthly_totals
+        ],
+        "last_transactions": [
+            {
+                "id": str(transaction.id),
+                "date": transaction.date,
+                "label": transaction.label,
+                "amount": decimal_string(transaction.amount),
+            }
+            for transaction in dashboard.last_transactions
+        ],
+        "next_occurrences": [
+            {
+                "date": occurrence.date,
+                "recurring_transaction_id": str(occurrence.recurring_transaction_id),
+                "name": str(occurrence.name),
+                "amount": decimal_string(occurrence.amount),
+            }
+            for occurrence in dashboard.next_occurrences
+        ],
+    }
@@ -18,8 +18,8 @@ from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends
 
 from src.application.account.deleter import AccountDeleter, AccountDeletionRequest
-from src.infrastructure.account.id import AccountUUID
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.domain.account import AccountId
+from src.infrastructure.account.fastapi.ownership import owned_account_id
 
 router = APIRouter()
 
@@ -27,7 +27,7 @@ router = APIRouter()
 @router.delete("/account/{account_id}", status_code=200)
 @inject
 def delete_account(
-    account_id: str,
-    account_deleter: AccountDeleter = Depends(Provide[InMemoryContainer.account_deleter]),
+    account_id: AccountId = Depends(owned_account_id),
+    account_deleter: AccountDeleter = Depends(Provide["account_deleter"]),
 ) -> None:
-    account_deleter.delete(AccountDeletionRequest(AccountUUID(account_id)))
+    account_deleter.delete(AccountDeletionRequest(account_id))
@@ -0,0 +1,46 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.application.account.forecast import AccountBalanceForecaster
+from src.domain.account import AccountId
+from src.infrastructure.account.fastapi.ownership import owned_account_id
+from src.infrastructure.money import decimal_string
+from src.shared.domain.money import MoneyOverflow
+
+router = APIRouter()
+
+
+@router.get("/account/{account_id}/forecast", status_code=200)
+@inject
+def forecast_account_balance(
+    account_id: AccountId = Depends(owned_account_id),
+    days: int = Query(default=30, ge=1, le=3660),
+    account_balance_forecaster: AccountBalanceForecaster = Depends(Provide["account_balance_forecaster"]),
+) -> dict:
+    try:
+        forecast = account_balance_forecaster.forecast(account_id, datetime.date.today(), days)
+    except MoneyOverflow as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return {
+        "start": forecast.start,
+        "balances": [decimal_string(balance) for balance in forecast.balances],
+        "currency": forecast.balances[0].currency,
+    }
@@ -0,0 +1,51 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, HTTPException
+
+from src.application.account.reader import AccountReader
+from src.domain.account import AccountId
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.id import InvalidUUID
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.user.fastapi.session import current_session
+from src.infrastructure.user.session.token import Session
+from src.shared.application.repository import EntityNotFound
+
+
+@inject
+async def owned_account_id(
+    account_id: str,
+    session: Session = Depends(current_session),
+    account_reader: AccountReader = Depends(Provide["account_reader"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
+) -> AccountId:
+    """
+    The account of the path, provided it belongs to the user signed in.
+    """
+    try:
+        id_ = AccountUUID(account_id)
+    except InvalidUUID as e:
+        # No account can have this id
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    try:
+        account = await blocking_call_runner.run(account_reader.retrieve, id_)
+    except EntityNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    if account.user_id != session.user_id:
+        raise HTTPException(status_code=403, detail="Not allowed to access the account of another user")
+    return id_
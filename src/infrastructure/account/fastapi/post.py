@@ -14,14 +14,19 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+from decimal import Decimal
+from typing import Any
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, validator
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, validator, root_validator
 
 from src.application.account.creator import AccountCreationRequest, AccountCreator
 from src.domain.account import AccountName
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.infrastructure.user.fastapi.session import current_session
+from src.infrastructure.user.session.token import Session
 from src.infrastructure.user.id import UserUUID
+from src.shared.domain.money import DEFAULT_CURRENCY, Money
 
 router = APIRouter()
 
@@ -29,7 +34,8 @@ router = APIRouter()
 class AccountCreationBody(BaseModel):
     user_id: str
     name: str
-    reference_balance: float
+    reference_balance: Decimal
+    currency: str = DEFAULT_CURRENCY
 
     @validator("user_id")
     def validate_user_id(cls, user_id: str) -> str:
@@ -41,13 +47,26 @@ class AccountCreationBody(BaseModel):
         AccountName(name)
         return name
 
+    @root_validator(skip_on_failure=True)
+    def validate_reference_balance(cls, values: dict[str, Any]) -> dict[str, Any]:
+        Money.from_decimal(values["reference_balance"], values["currency"]).check_bounds()
+        return values
+
 
 @router.post("/creation", status_code=201)
 @inject
 def create_account(
-    body: AccountCreationBody, account_creator: AccountCreator = Depends(Provide[InMemoryContainer.account_creator])
+    body: AccountCreationBody,
+    session: Session = Depends(current_session),
+    account_creator: AccountCreator = Depends(Provide["account_creator"]),
 ) -> dict:
+    if str(session.user_id) != body.user_id:
+        raise HTTPException(status_code=403, detail="Not allowed to create an account for another user")
     account_creator.create(
-        AccountCreationRequest(UserUUID(body.user_id), AccountName(body.name), body.reference_balance)
+        AccountCreationRequest(
+            UserUUID(body.user_id),
+            AccountName(body.name),
+            Money.from_decimal(body.reference_balance, body.currency),
+        )
     )
     return {}
@@ -14,30 +14,47 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+from decimal import Decimal
+from typing import Any
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, root_validator
 
+from src.application.account.currency import AccountCurrencyInUse
 from src.application.account.updater import AccountUpdater, AccountUpdateRequest
-from src.domain.account import AccountName
-from src.infrastructure.account.id import AccountUUID
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.domain.account import AccountId, AccountName
+from src.infrastructure.account.fastapi.ownership import owned_account_id
+from src.shared.domain.money import DEFAULT_CURRENCY, Money
 
 router = APIRouter()
 
 
 class AccountUpdateBody(BaseModel):
     name: str
-    reference_balance: float
+    reference_balance: Decimal
+    currency: str = DEFAULT_CURRENCY
+
+    @root_validator(skip_on_failure=True)
+    def validate_reference_balance(cls, values: dict[str, Any]) -> dict[str, Any]:
+        Money.from_decimal(values["reference_balance"], values["currency"]).check_bounds()
+        return values
 
 
 @router.put("/account/{account_id}", status_code=200)
 @inject
 def update_account(
-    account_id: str,
     body: AccountUpdateBody,
-    account_updater: AccountUpdater = Depends(Provide[InMemoryContainer.account_updater]),
+    account_id: AccountId = Depends(owned_account_id),
+    account_updater: AccountUpdater = Depends(Provide["account_updater"]),
 ) -> None:
-    account_updater.update(
-        AccountUpdateRequest(AccountUUID(account_id), AccountName(body.name), body.reference_balance)
-    )
+    try:
+        account_updater.update(
+            AccountUpdateRequest(
+                account_id,
+                AccountName(body.name),
+                Money.from_decimal(body.reference_balance, body.currency),
+            )
+        )
+    except AccountCurrencyInUse as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
@@ -18,8 +18,9 @@ from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends
 
 from src.application.account.reader import AccountReader
-from src.infrastructure.containers.in_memory import InMemoryContainer
-from src.infrastructure.account.id import AccountUUID
+from src.domain.account import AccountId
+from src.infrastructure.account.fastapi.ownership import owned_account_id
+from src.infrastructure.blocking import BlockingCallRunner
 
 router = APIRouter()
 
@@ -27,6 +28,8 @@ router = APIRouter()
 @router.get("/account/{account_id}", status_code=200)
 @inject
 async def retrieve_account(
-    account_id: str, account_reader: AccountReader = Depends(Provide[InMemoryContainer.account_reader])
+    account_id: AccountId = Depends(owned_account_id),
+    account_reader: AccountReader = Depends(Provide["account_reader"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
 ) -> None:
-    account_reader.retrieve(AccountUUID(account_id))
+    await blocking_call_runner.run(account_reader.retrieve, account_id)
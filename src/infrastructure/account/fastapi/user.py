@@ -0,0 +1,45 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+
+from src.application.account.reader import AccountReader
+from src.domain.user import UserId
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.money import decimal_string
+from src.infrastructure.user.fastapi.session import authorized_user_id
+
+router = APIRouter()
+
+
+@router.get("/user/{user_id}/accounts", status_code=200)
+@inject
+async def list_user_accounts(
+    user_id: UserId = Depends(authorized_user_id),
+    account_reader: AccountReader = Depends(Provide["account_reader"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
+) -> list[dict]:
+    accounts = await blocking_call_runner.run(account_reader.list_by_user, user_id)
+    return [
+        {
+            "id": str(account.id),
+            "name": str(account.name),
+            "reference_balance": decimal_string(account.reference_balance),
+            "currency": account.reference_balance.currency,
+        }
+        for account in accounts
+    ]
@@ -18,13 +18,13 @@ from uuid import uuid4
 
 from src.domain.account import AccountId
 from src.shared.application.id import IdFactory
-from src.shared.domain.entity import IdBase, TId
+from src.infrastructure.id import UUIDBase
 
 
-class AccountUUID(AccountId, IdBase[str]):
-    pass
+class AccountUUID(AccountId, UUIDBase):
+    __slots__ = ()
 
 
 class AccountUUIDFactory(IdFactory[AccountId]):
     def generate_id(self) -> AccountId:
-        return AccountUUID(str(uuid4()))
+        return AccountUUID.trusted(str(uuid4()))
@@ -0,0 +1,90 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import logging
+import queue
+import threading
+from typing import Iterator
+
+from src.application.account.cascade import AccountReclamationScheduler, AccountTransactionReclaimer
+from src.domain.account import AccountId
+
+_logger = logging.getLogger(__name__)
+
+
+class BackgroundAccountReclamationScheduler(AccountReclamationScheduler):
+    """
+    Reclaims the tombstoned accounts one after the other on a background thread, starting with the ones left pending
+    by the previous run. A reclamation failing is logged and scheduled again after a delay that doubles with every
+    failure in a row, during which nothing is reclaimed, as the storage is likely failing for the other accounts too.
+
+    :param reclaimer:
+    :param backoff: seconds before the first retry
+    :param max_backoff: seconds between two retries at most
+    """
+
+    def __init__(
+        self, reclaimer: AccountTransactionReclaimer, backoff: float = 1.0, max_backoff: float = 600.0
+    ) -> None:
+        self._reclaimer = reclaimer
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._stopping = threading.Event()
+        self._queue: queue.SimpleQueue[AccountId | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="account-reclamation", daemon=True)
+
+    def start(self) -> None:
+        for account_id in self._reclaimer.pending():
+            self._queue.put(account_id)
+        self._thread.start()
+
+    def schedule(self, account_id: AccountId) -> None:
+        self._queue.put(account_id)
+
+    def stop(self) -> None:
+        """
+        Wait for the reclamations scheduled so far, but not for the retries of the failed ones.
+        """
+        self._stopping.set()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        failures = 0
+        while (account_id := self._queue.get()) is not None:
+            try:
+                self._reclaimer.reclaim(account_id)
+            except Exception:
+                # The tombstone is kept: the account is reclaimed again after the delay, or at the next start
+                delay = min(self._max_backoff, self._backoff * 2**failures)
+                failures += 1
+                _logger.exception("Reclaiming account %s failed, retrying in %.1f s", account_id, delay)
+                self._queue.put(account_id)
+                self._stopping.wait(delay)
+            else:
+                failures = 0
+
+
+def background_account_reclamation_scheduler(
+    reclaimer: AccountTransactionReclaimer,
+) -> Iterator[BackgroundAccountReclamationScheduler]:
+    """
+    Container resource: the thread is stopped when the container resources are shut down.
+    """
+    scheduler = BackgroundAccountReclamationScheduler(reclaimer)
+    scheduler.start()
+    yield scheduler
+    scheduler.stop()
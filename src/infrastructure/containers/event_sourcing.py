@@ -0,0 +1,49 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dependency_injector.providers import Resource, ThreadSafeSingleton
+
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.event_sourcing.repositories import event_sourced_repositories
+from src.infrastructure.sqlite.unit_of_work import SqliteUnitOfWork
+from src.infrastructure.unit_of_work import JoinedUnitOfWork
+
+
+def event_sourcing_container(directory: str) -> SqliteContainer:
+    """
+    Production container whose repositories are rebuilt from the domain events recorded in `directory`.
+
+    Fingerprints, password hashes, tombstones and the email outbox stay in SQLite. A unit of work takes the lock of the
+    event store, then one SQLite transaction: the SQLite changes are undone on error, but the events recorded before
+    the error are kept. An import failing on its fingerprints keeps its transactions, so importing the statement again
+    duplicates them, a subscription failing on its password keeps its user, and an email address change whose token
+    was used up meanwhile is kept.
+    """
+    container = SqliteContainer()
+    repositories = Resource(event_sourced_repositories, directory=directory)
+    container.set_provider("event_sourced_repositories", repositories)
+    container.user_repository.override(repositories.provided.user)
+    container.account_repository.override(repositories.provided.account)
+    container.transaction_repository.override(repositories.provided.transaction)
+    container.recurring_transaction_repository.override(repositories.provided.recurring_transaction)
+    container.unit_of_work.override(
+        ThreadSafeSingleton(
+            JoinedUnitOfWork,
+            repositories.provided.unit_of_work,
+            ThreadSafeSingleton(SqliteUnitOfWork, database=container.database),
+        )
+    )
+    return container
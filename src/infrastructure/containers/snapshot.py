@@ -0,0 +1,46 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dependency_injector.providers import Resource
+
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.snapshot.transaction import snapshot_transaction_repository
+from src.infrastructure.transaction.id import TransactionUUID
+
+
+def snapshot_container(directory: str) -> SqliteContainer:
+    """
+    Production container whose transactions are kept in memory, persisted as snapshots and logs in `directory`, for
+    analytics-heavy deployments where restarting must not reload every transaction.
+
+    The transactions are not part of the SQLite unit of work: a unit of work rolled back keeps the transaction changes
+    made before the error. An import failing on its fingerprints keeps its transactions, so importing the statement
+    again duplicates them, and an account deletion failing after its transactions keeps the account without them.
+    """
+    container = SqliteContainer()
+    container.transaction_repository.override(
+        Resource(
+            snapshot_transaction_repository,
+            directory=directory,
+            id_to_bytes=uuid_bytes,
+            id_from_bytes=TransactionUUID.from_bytes,
+            account_id_to_bytes=uuid_bytes,
+            account_id_from_bytes=AccountUUID.from_bytes,
+        )
+    )
+    return container
@@ -0,0 +1,283 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dependency_injector.containers import DeclarativeContainer
+from dependency_injector.providers import Configuration, List, Resource, Singleton, ThreadSafeSingleton
+
+from src.application.account.balance import AccountBalanceCalculator
+from src.application.account.cascade import AccountCascade, AccountTransactionReclaimer
+from src.application.account.creator import AccountCreator
+from src.application.account.dashboard import AccountDashboardProjection
+from src.application.account.deleter import AccountDeleter
+from src.application.account.forecast import AccountBalanceForecaster
+from src.application.account.reader import AccountReader
+from src.application.account.updater import AccountUpdater
+from src.application.reccurring_transaction.creator import RecurringTransactionCreator
+from src.application.reccurring_transaction.deleter import RecurringTransactionDeleter
+from src.application.reccurring_transaction.updater import RecurringTransactionUpdater
+from src.application.transaction.batch import TransactionBatchProcessor
+from src.application.transaction.creator import TransactionCreator
+from src.application.transaction.deleter import TransactionDeleter
+from src.application.transaction.importer import TransactionImporter
+from src.application.transaction.updater import TransactionUpdater
+from src.application.user.creator import UserCreator
+from src.application.user.deleter import UserDeleter
+from src.application.user.email_address.modifier import UserEmailAddressModifier
+from src.application.user.reader import UserReader
+from src.application.user.subscription.email_address.checker import UnusedEmailAddressChecker
+from src.application.user.subscription.email_address.validator import EmailAddressValidator
+from src.application.user.updater import UserUpdater
+from src.infrastructure.blocking import blocking_call_runner
+from src.infrastructure.email.outbox import email_outbox_worker
+from src.infrastructure.email.smtp import SmtpMailer
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.account.reclamation import background_account_reclamation_scheduler
+from src.infrastructure.rate_limit import TokenBucketLimiter
+from src.infrastructure.sqlite.account import SqliteAccountRepository
+from src.infrastructure.sqlite.account_tombstone import SqliteAccountTombstoneRepository
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.email_outbox import SqliteEmailOutbox
+from src.infrastructure.sqlite.fingerprint import SqliteTransactionFingerprintIndex
+from src.infrastructure.sqlite.recurring_transaction import SqliteRecurringTransactionRepository
+from src.infrastructure.sqlite.transaction import SqliteTransactionRepository
+from src.infrastructure.sqlite.unit_of_work import SqliteUnitOfWork
+from src.infrastructure.sqlite.user import SqliteUserRepository
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.infrastructure.transaction.ofx import OfxStatementReader
+from src.infrastructure.user.id import UserUUID, UserUUIDFactory
+from src.infrastructure.user.password.scrypt import scrypt_user_password_vault
+from src.infrastructure.user.session.denylist import SessionDenylist
+from src.infrastructure.user.session.token import SessionTokenIssuer
+from src.infrastructure.user.validation.replay import ValidationTokenReplayCache
+from src.infrastructure.user.validation.throttle import EmailAddressValidationThrottle
+from src.infrastructure.user.validation.token import HmacValidationEmailSender
+
+
+class SqliteContainer(DeclarativeContainer):
+    """
+    Production container: infrastructure services are process-wide singletons and use cases are built once.
+    """
+
+    config = Configuration(
+        default={
+            "database_path": "keskireste.sqlite3",
+            "blocking_call_workers": 32,
+            "password_hashing_workers": None,
+            "password_hashing_max_pending": 64,
+            "session_secret": None,
+            "session_ttl": 3600,
+            "validation_token_secret": None,
+            "validation_token_ttl": 86400,
+            "validation_token_replay_cache_size": 100_000,
+            "smtp_host": "localhost",
+            "smtp_port": 25,
+            "smtp_sender": "no-reply@keskireste.local",
+            "smtp_username": None,
+            "smtp_password": None,
+            "smtp_starttls": False,
+            "email_batch_size": 100,
+            "validation_requests_per_address_burst": 3,
+            "validation_requests_per_address_rate": 1 / 60,
+            "validation_requests_per_client_burst": 10,
+            "validation_requests_per_client_rate": 1.0,
+        }
+    )
+    database = ThreadSafeSingleton(SqliteDatabase, path=config.database_path)
+    unit_of_work = ThreadSafeSingleton(SqliteUnitOfWork, database=database)
+    blocking_call_runner = Resource(blocking_call_runner, max_workers=config.blocking_call_workers)
+    user_repository = ThreadSafeSingleton(SqliteUserRepository, database=database)
+    user_id_factory = ThreadSafeSingleton(UserUUIDFactory)
+    user_creator = Singleton(UserCreator, repository=user_repository, id_factory=user_id_factory)
+    user_updater = Singleton(UserUpdater, repository=user_repository)
+    user_reader = Singleton(UserReader, repository=user_repository)
+    user_password_vault = Resource(
+        scrypt_user_password_vault,
+        database=database,
+        blocking_call_runner=blocking_call_runner,
+        max_workers=config.password_hashing_workers,
+        max_pending=config.password_hashing_max_pending,
+    )
+    user_email_address_modifier = Singleton(UserEmailAddressModifier, repository=user_repository)
+    session_denylist = ThreadSafeSingleton(SessionDenylist)
+    session_token_issuer = ThreadSafeSingleton(
+        SessionTokenIssuer,
+        user_id_parser=UserUUID.trusted,
+        denylist=session_denylist,
+        secret=config.session_secret,
+        ttl=config.session_ttl,
+    )
+
+    account_repository = ThreadSafeSingleton(SqliteAccountRepository, database=database)
+    account_id_factory = ThreadSafeSingleton(AccountUUIDFactory)
+    account_reader = Singleton(AccountReader, repository=account_repository)
+
+    recurring_transaction_repository = ThreadSafeSingleton(SqliteRecurringTransactionRepository, database=database)
+    transaction_repository = ThreadSafeSingleton(SqliteTransactionRepository, database=database)
+    transaction_id_factory = ThreadSafeSingleton(TransactionUUIDFactory)
+    transaction_fingerprint_index = ThreadSafeSingleton(SqliteTransactionFingerprintIndex, database=database)
+    statement_reader = ThreadSafeSingleton(OfxStatementReader)
+    account_balance_calculator = ThreadSafeSingleton(
+        AccountBalanceCalculator, account_repository=account_repository, transaction_repository=transaction_repository
+    )
+    account_balance_forecaster = ThreadSafeSingleton(
+        AccountBalanceForecaster,
+        balance_calculator=account_balance_calculator,
+        recurring_transaction_repository=recurring_transaction_repository,
+    )
+    account_dashboard_projection = ThreadSafeSingleton(
+        AccountDashboardProjection,
+        account_repository=account_repository,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+    )
+    account_observers = List(account_dashboard_projection, account_balance_calculator, account_balance_forecaster)
+    account_creator = Singleton(
+        AccountCreator,
+        repository=account_repository,
+        id_factory=account_id_factory,
+        observers=account_observers,
+    )
+    account_updater = Singleton(
+        AccountUpdater,
+        repository=account_repository,
+        observers=account_observers,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+    )
+    account_tombstone_repository = ThreadSafeSingleton(SqliteAccountTombstoneRepository, database=database)
+    account_transaction_reclaimer = ThreadSafeSingleton(
+        AccountTransactionReclaimer,
+        transaction_repository=transaction_repository,
+        tombstone_repository=account_tombstone_repository,
+        unit_of_work=unit_of_work,
+        fingerprint_index=transaction_fingerprint_index,
+    )
+    account_reclamation_scheduler = Resource(
+        background_account_reclamation_scheduler, reclaimer=account_transaction_reclaimer
+    )
+    account_cascade = Singleton(
+        AccountCascade,
+        account_repository=account_repository,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+        unit_of_work=unit_of_work,
+        tombstone_repository=account_tombstone_repository,
+        reclamation_scheduler=account_reclamation_scheduler,
+        fingerprint_index=transaction_fingerprint_index,
+    )
+    account_deleter = Singleton(
+        AccountDeleter, repository=account_repository, observers=account_observers, cascade=account_cascade
+    )
+    user_deleter = Singleton(
+        UserDeleter, repository=user_repository, account_deleter=account_deleter, unit_of_work=unit_of_work
+    )
+    transaction_observers = List(account_balance_calculator, account_balance_forecaster, account_dashboard_projection)
+    transaction_creator = Singleton(
+        TransactionCreator,
+        repository=transaction_repository,
+        observers=transaction_observers,
+        account_repository=account_repository,
+    )
+    transaction_updater = Singleton(
+        TransactionUpdater,
+        repository=transaction_repository,
+        observers=transaction_observers,
+        account_repository=account_repository,
+    )
+    transaction_deleter = Singleton(
+        TransactionDeleter, repository=transaction_repository, observers=transaction_observers
+    )
+    transaction_batch_processor = Singleton(
+        TransactionBatchProcessor,
+        repository=transaction_repository,
+        observers=transaction_observers,
+        account_repository=account_repository,
+    )
+    transaction_importer = Singleton(
+        TransactionImporter,
+        repository=transaction_repository,
+        id_factory=transaction_id_factory,
+        statement_reader=statement_reader,
+        fingerprint_index=transaction_fingerprint_index,
+        observers=transaction_observers,
+        account_repository=account_repository,
+        unit_of_work=unit_of_work,
+    )
+    recurring_transaction_observers = List(account_balance_forecaster, account_dashboard_projection)
+    recurring_transaction_creator = Singleton(
+        RecurringTransactionCreator,
+        repository=recurring_transaction_repository,
+        observers=recurring_transaction_observers,
+        account_repository=account_repository,
+    )
+    recurring_transaction_updater = Singleton(
+        RecurringTransactionUpdater,
+        repository=recurring_transaction_repository,
+        observers=recurring_transaction_observers,
+        account_repository=account_repository,
+    )
+    recurring_transaction_deleter = Singleton(
+        RecurringTransactionDeleter,
+        repository=recurring_transaction_repository,
+        observers=recurring_transaction_observers,
+    )
+
+    email_address_checker = Singleton(UnusedEmailAddressChecker, repository=user_repository)
+    email_outbox = ThreadSafeSingleton(SqliteEmailOutbox, database=database)
+    email_mailer = ThreadSafeSingleton(
+        SmtpMailer,
+        host=config.smtp_host,
+        port=config.smtp_port,
+        sender=config.smtp_sender,
+        username=config.smtp_username,
+        password=config.smtp_password,
+        starttls=config.smtp_starttls,
+    )
+    email_outbox_worker = Resource(
+        email_outbox_worker, outbox=email_outbox, mailer=email_mailer, batch_size=config.email_batch_size
+    )
+    validation_token_replay_cache = ThreadSafeSingleton(
+        ValidationTokenReplayCache, max_size=config.validation_token_replay_cache_size
+    )
+    validation_email_sender = ThreadSafeSingleton(
+        HmacValidationEmailSender,
+        transport=email_outbox,
+        replay_cache=validation_token_replay_cache,
+        secret=config.validation_token_secret,
+        ttl=config.validation_token_ttl,
+    )
+    email_address_validator = Singleton(
+        EmailAddressValidator,
+        email_address_checker=email_address_checker,
+        validation_email_sender=validation_email_sender,
+    )
+    email_address_validation_address_limiter = ThreadSafeSingleton(
+        TokenBucketLimiter,
+        rate=config.validation_requests_per_address_rate,
+        burst=config.validation_requests_per_address_burst,
+    )
+    email_address_validation_client_limiter = ThreadSafeSingleton(
+        TokenBucketLimiter,
+        rate=config.validation_requests_per_client_rate,
+        burst=config.validation_requests_per_client_burst,
+    )
+    email_address_validation_throttle = ThreadSafeSingleton(
+        EmailAddressValidationThrottle,
+        validator=email_address_validator,
+        blocking_call_runner=blocking_call_runner,
+        address_limiter=email_address_validation_address_limiter,
+        client_limiter=email_address_validation_client_limiter,
+    )
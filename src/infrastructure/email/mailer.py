@@ -0,0 +1,38 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Sequence
+
+from src.infrastructure.email.transport import EmailMessage
+
+
+class DeliveryOutcome(Enum):
+    DELIVERED = "delivered"
+    # Worth retrying later, such as when the server is unreachable or answers with a temporary error
+    DEFERRED = "deferred"
+    # Refused for good by the server
+    REJECTED = "rejected"
+
+
+class Mailer(ABC):
+    @abstractmethod
+    def send(self, messages: Sequence[EmailMessage]) -> list[DeliveryOutcome]:
+        """
+        :return: the outcome of each message, in order
+        """
+        pass
@@ -0,0 +1,186 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import logging
+import threading
+import time
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Iterator, Sequence
+
+from src.infrastructure.email.mailer import DeliveryOutcome, Mailer
+from src.infrastructure.email.transport import EmailMessage, EmailTransport
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OutboxEmail:
+    id: int
+    message: EmailMessage
+    attempts: int
+
+
+class EmailOutbox(EmailTransport):
+    """
+    Durable queue of the emails to send: `deliver` only stores the message, and a worker sends it later.
+    """
+
+    @abstractmethod
+    def due(self, limit: int, now: float) -> list[OutboxEmail]:
+        """
+        :return: the emails whose next attempt is due at `now`, the oldest first
+        """
+        pass
+
+    @abstractmethod
+    def next_attempt_at(self) -> float | None:
+        pass
+
+    @abstractmethod
+    def acknowledge(self, ids: Sequence[int]) -> None:
+        """
+        Remove emails that are done with, either sent or abandoned.
+        """
+        pass
+
+    @abstractmethod
+    def reschedule(self, attempts: Sequence[tuple[int, float]]) -> None:
+        """
+        Count one more failed attempt for each email, and set when to try again.
+
+        :param attempts: id and time of the next attempt of each email
+        """
+        pass
+
+    @abstractmethod
+    def wait(self, timeout: float | None) -> None:
+        """
+        Block until an email is delivered to the outbox, `wake` is called or `timeout` is over.
+        """
+        pass
+
+    @abstractmethod
+    def wake(self) -> None:
+        pass
+
+
+class EmailOutboxWorker:
+    """
+    Sends the emails of the outbox in batches on a background thread. A deferred email is tried again after a delay
+    that doubles with every attempt, and abandoned after `max_attempts`. Sending is paused until the first retry, as
+    the other emails would likely be deferred as well. Emails left when the worker stops are sent at the next start.
+
+    The outbox failing, on a full disk for instance, is logged and tried again after the same kind of delay, doubling
+    with every failure in a row.
+
+    :param backoff: seconds before the second attempt, or before trying the outbox again
+    :param max_backoff: seconds between two attempts at most
+    :param clock: seconds since the epoch
+    """
+
+    def __init__(
+        self,
+        outbox: EmailOutbox,
+        mailer: Mailer,
+        batch_size: int = 100,
+        max_attempts: int = 8,
+        backoff: float = 1.0,
+        max_backoff: float = 600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._outbox = outbox
+        self._mailer = mailer
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._stopping = False
+        self._resume_at = 0.0
+        self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Wait for the batch being sent, if any.
+        """
+        self._stopping = True
+        self._outbox.wake()
+        self._thread.join()
+
+    def send_due(self) -> int:
+        """
+        Send the emails that are due, batch after batch, until none is left or the mailer defers some.
+
+        :return: the number of emails sent
+        """
+        sent = 0
+        while not self._stopping:
+            now = self._clock()
+            if now < self._resume_at:
+                break
+            emails = self._outbox.due(self._batch_size, now)
+            if not emails:
+                break
+            try:
+                outcomes = self._mailer.send([email.message for email in emails])
+            except Exception:
+                _logger.warning("Sending %d emails failed, deferring them", len(emails), exc_info=True)
+                outcomes = [DeliveryOutcome.DEFERRED] * len(emails)
+            done, retries = [], []
+            for email, outcome in zip(emails, outcomes):
+                if outcome is DeliveryOutcome.DEFERRED and email.attempts + 1 < self._max_attempts:
+                    retries.append((email.id, now + min(self._max_backoff, self._backoff * 2**email.attempts)))
+                else:
+                    done.append(email.id)
+                sent += outcome is DeliveryOutcome.DELIVERED
+            self._outbox.acknowledge(done)
+            self._outbox.reschedule(retries)
+            if retries:
+                self._resume_at = min(at for _, at in retries)
+        return sent
+
+    def _run(self) -> None:
+        failures = 0
+        while not self._stopping:
+            try:
+                self.send_due()
+                next_attempt_at = self._outbox.next_attempt_at()
+            except Exception:
+                # Emails sent but not acknowledged yet are sent again: delivery is at least once
+                delay = min(self._max_backoff, self._backoff * 2**failures)
+                failures += 1
+                _logger.exception("Email outbox failed, retrying in %.1f s", delay)
+                self._outbox.wait(delay)
+                continue
+            failures = 0
+            if next_attempt_at is None:
+                self._outbox.wait(None)
+            else:
+                self._outbox.wait(max(0.0, max(next_attempt_at, self._resume_at) - self._clock()))
+
+
+def email_outbox_worker(outbox: EmailOutbox, mailer: Mailer, batch_size: int) -> Iterator[EmailOutboxWorker]:
+    """
+    Container resource: the thread is stopped when the container resources are shut down.
+    """
+    worker = EmailOutboxWorker(outbox, mailer, batch_size=batch_size)
+    worker.start()
+    yield worker
+    worker.stop()
@@ -0,0 +1,126 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import email.message
+import smtplib
+import time
+from typing import Callable, Sequence
+
+from src.infrastructure.email.mailer import DeliveryOutcome, Mailer
+from src.infrastructure.email.transport import EmailMessage
+
+
+def _outcome(code: int) -> DeliveryOutcome:
+    return DeliveryOutcome.REJECTED if code >= 500 else DeliveryOutcome.DEFERRED
+
+
+class SmtpMailer(Mailer):
+    """
+    Keeps one SMTP connection open from a batch to the next, so that the handshake is paid once rather than once per
+    email, and closes it after `idle_timeout` seconds without use. Meant to be used by a single thread.
+
+    :param sender: address of the `From` header and of the envelope
+    :param clock: seconds, only compared with each other
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        username: str | None = None,
+        password: str | None = None,
+        starttls: bool = False,
+        timeout: float = 10.0,
+        idle_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._sender = sender
+        self._username = username
+        self._password = password
+        self._starttls = starttls
+        self._timeout = timeout
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._connection: smtplib.SMTP | None = None
+        self._last_used_at = 0.0
+
+    def send(self, messages: Sequence[EmailMessage]) -> list[DeliveryOutcome]:
+        outcomes: list[DeliveryOutcome] = []
+        if self._connection is not None and self._clock() - self._last_used_at > self._idle_timeout:
+            self.close()
+        # A connection kept open may have been dropped by the server meanwhile: it is reopened once
+        reopened = self._connection is None
+        index = 0
+        while index < len(messages):
+            try:
+                connection = self._connected()
+            except (smtplib.SMTPException, OSError):
+                break
+            try:
+                connection.send_message(self._mime(messages[index]))
+                outcomes.append(DeliveryOutcome.DELIVERED)
+            except smtplib.SMTPRecipientsRefused as e:
+                # Each email has a single recipient
+                [(code, _)] = e.recipients.values()
+                outcomes.append(_outcome(code))
+            except smtplib.SMTPServerDisconnected:
+                connection.close()
+                self._connection = None
+                if reopened:
+                    break
+                reopened = True
+                continue
+            except smtplib.SMTPResponseException as e:
+                outcomes.append(_outcome(e.smtp_code))
+            except (smtplib.SMTPException, OSError):
+                self.close()
+                break
+            index += 1
+        self._last_used_at = self._clock()
+        return outcomes + [DeliveryOutcome.DEFERRED] * (len(messages) - len(outcomes))
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._connection = None
+
+    def _connected(self) -> smtplib.SMTP:
+        if self._connection is None:
+            connection = smtplib.SMTP(self._host, self._port, timeout=self._timeout)
+            try:
+                if self._starttls:
+                    connection.starttls()
+                if self._username is not None and self._password is not None:
+                    connection.login(self._username, self._password)
+            except BaseException:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _mime(self, message: EmailMessage) -> email.message.EmailMessage:
+        mime = email.message.EmailMessage()
+        mime["From"] = self._sender
+        mime["To"] = str(message.recipient)
+        mime["Subject"] = message.subject
+        mime.set_content(message.body)
+        return mime
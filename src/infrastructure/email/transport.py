@@ -14,14 +14,20 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
-import ppa
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
-from src.application.reccurring_transaction.repository import RecurringTransactionRepository
-from src.shared.application.repository import EntityAlreadyExists, EntityNotFound
+from src.shared.domain.email import EmailAddress
 
 
-@ppa.in_memory_repository(
-    entity_already_exists_exception=EntityAlreadyExists, entity_not_found_exception=EntityNotFound
-)
-class RecurringTransactionMockRepository(RecurringTransactionRepository):
-    pass
+@dataclass(frozen=True)
+class EmailMessage:
+    recipient: EmailAddress
+    subject: str
+    body: str
+
+
+class EmailTransport(ABC):
+    @abstractmethod
+    def deliver(self, message: EmailMessage) -> None:
+        pass
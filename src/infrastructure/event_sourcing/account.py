@@ -0,0 +1,113 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+from typing import Sequence
+
+from src.application.account.repository import AccountAlreadyExists, AccountNotFound
+from src.domain.account import (
+    Account,
+    AccountId,
+    AccountOpened,
+    AccountRenamed,
+    AccountReferenceBalanceModified,
+    AccountMoved,
+    AccountClosed,
+)
+from src.infrastructure.event_sourcing.store import EventSourced, EventStore
+from src.infrastructure.in_memory.account import InMemoryAccountRepository
+from src.shared.domain.event import DomainEvent
+
+
+class EventSourcedAccountRepository(InMemoryAccountRepository, EventSourced):
+    """
+    In-memory accounts rebuilt from their events. A change is acknowledged once its events are durable.
+    """
+
+    def __init__(self, event_store: EventStore) -> None:
+        super().__init__()
+        self._event_store = event_store
+        event_store.register("account", self)
+
+    def add(self, account: Account) -> None:
+        with self._event_store.lock:
+            if account.id in self._accounts:
+                raise AccountAlreadyExists(account_id=account.id)
+            account.pull_events()
+            sequence = self._record(
+                [AccountOpened(account.id, account.user_id, account.name, account.reference_balance)]
+            )
+        self._event_store.sync(sequence)
+
+    def delete(self, id_: AccountId) -> None:
+        with self._event_store.lock:
+            if id_ not in self._accounts:
+                raise AccountNotFound(account_id=id_)
+            sequence = self._record([AccountClosed(id_)])
+        self._event_store.sync(sequence)
+
+    def update(self, account: Account) -> None:
+        with self._event_store.lock:
+            try:
+                current = copy.copy(self._accounts[account.id])
+            except KeyError as e:
+                raise AccountNotFound(account_id=account.id) from e
+            events = account.pull_events()
+            if not events:
+                # Changed without recording events, such as an account built anew: they are the differences
+                current.move_to(account.user_id)
+                current.rename(account.name)
+                current.modify_reference_balance(account.reference_balance)
+                events = current.pull_events()
+            sequence = self._record(events)
+        self._event_store.sync(sequence)
+
+    def apply(self, event: DomainEvent) -> None:
+        match event:
+            case AccountOpened(account_id=account_id, user_id=user_id, name=name, reference_balance=balance):
+                self._store(Account(account_id, user_id, name, balance))
+            case AccountRenamed(account_id=account_id, name=name):
+                account = self._accounts[account_id]
+                account.rename(name)
+                account.pull_events()
+            case AccountReferenceBalanceModified(account_id=account_id, reference_balance=balance):
+                account = self._accounts[account_id]
+                account.modify_reference_balance(balance)
+                account.pull_events()
+            case AccountMoved(account_id=account_id, user_id=user_id):
+                # The user is the key of the user index: the account is stored again
+                previous = self._accounts[account_id]
+                account = copy.copy(previous)
+                account.move_to(user_id)
+                account.pull_events()
+                self._unstore(previous)
+                self._store(account)
+            case AccountClosed(account_id=account_id):
+                self._unstore(self._accounts[account_id])
+
+    def state(self) -> list[Account]:
+        return list(self._accounts.values())
+
+    def restore(self, state: list[Account]) -> None:
+        for account in state:
+            self._store(account)
+
+    def _record(self, events: Sequence[DomainEvent]) -> int:
+        if not events:
+            return 0
+        for event in events:
+            self.apply(event)
+        return self._event_store.record("account", events)
@@ -0,0 +1,222 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import os
+import re
+import struct
+import threading
+import zlib
+from typing import Iterator, Sequence
+
+_SEGMENT_NAME = re.compile(r"^segment-(\d{16})\.bin\Z")
+
+# Checksum of the rest of the record, then payload size and sequence
+_CHECKSUM = struct.Struct("<I")
+_RECORD_HEADER = struct.Struct("<IQ")
+
+
+class SegmentedEventLog:
+    """
+    Append-only log of numbered records, split in segment files named after their first sequence number.
+
+    Appending only buffers the records: `sync` makes them durable with group commit, the first waiting thread
+    writing and syncing the records of every thread that appended meanwhile while the others wait for it, so that a
+    single write and fsync acknowledge a whole batch. A record torn by a crash is detected by its checksum and
+    truncated when the log is opened.
+
+    :param directory:
+    :param segment_size: size past which the next batch goes to a new segment
+    :param fsync: whether synced records are flushed to disk, instead of being left to the OS
+    """
+
+    def __init__(self, directory: str, segment_size: int = 64 * 2**20, fsync: bool = True) -> None:
+        self._directory = directory
+        self._segment_size = segment_size
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        # Threads waiting for the batch being written, and for the next one
+        self._written = threading.Condition(self._lock)
+        self._next_written = threading.Condition(self._lock)
+        self._pending: list[bytes] = []
+        self._writing_up_to = 0
+
+        os.makedirs(directory, exist_ok=True)
+        segments = self._segments()
+        self._last_sequence = 0
+        if segments:
+            self._segment_first = segments[-1]
+            path = self._path(self._segment_first)
+            end = self._segment_first - 1
+            size = 0
+            for sequence, offset, _ in self._records(path):
+                end, size = sequence, offset
+            if size != os.path.getsize(path):
+                # The last records were torn by a crash before they were acknowledged
+                os.truncate(path, size)
+            self._last_sequence = end
+        else:
+            self._segment_first = 1
+        self._durable_sequence = self._last_sequence
+        self._file = os.open(self._path(self._segment_first), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._size = os.fstat(self._file).st_size
+
+    @property
+    def last_sequence(self) -> int:
+        """
+        :return: the sequence number of the last appended record, synced or not
+        """
+        return self._last_sequence
+
+    def append(self, payloads: Sequence[bytes]) -> int:
+        """
+        Buffer records, to be written by the next sync.
+        :param payloads:
+        :return: the sequence number of the last record
+        """
+        with self._lock:
+            for payload in payloads:
+                self._last_sequence += 1
+                header = _RECORD_HEADER.pack(len(payload), self._last_sequence)
+                self._pending.append(_CHECKSUM.pack(zlib.crc32(payload, zlib.crc32(header))) + header + payload)
+            return self._last_sequence
+
+    def sync(self, sequence: int) -> None:
+        """
+        Wait until every record up to `sequence` is durable, writing the pending records when no other thread does.
+        :param sequence:
+        :raises OSError: when the batch could not be written, in which case it is kept for the next sync
+        """
+        with self._lock:
+            while self._durable_sequence < sequence:
+                if self._writing_up_to:
+                    (self._written if sequence <= self._writing_up_to else self._next_written).wait()
+                    continue
+                batch, self._pending = self._pending, []
+                self._writing_up_to = last = self._last_sequence
+                self._lock.release()
+                try:
+                    self._write(batch, last - len(batch) + 1)
+                except BaseException:
+                    self._lock.acquire()
+                    self._pending[:0] = batch
+                    self._writing_up_to = 0
+                    self._written.notify_all()
+                    self._next_written.notify_all()
+                    raise
+                self._lock.acquire()
+                self._durable_sequence = last
+                self._writing_up_to = 0
+                self._written.notify_all()
+                # Only one of the threads waiting for the next batch is woken up, to write it for the others
+                self._written, self._next_written = self._next_written, self._written
+                self._written.notify()
+
+    def read(self, from_sequence: int = 1) -> Iterator[tuple[int, bytes]]:
+        """
+        Iterate over the durable records, starting at `from_sequence`.
+        :param from_sequence:
+        :return: sequence numbers and payloads
+        """
+        segments = self._segments()
+        for index, first in enumerate(segments):
+            if index + 1 < len(segments) and segments[index + 1] <= from_sequence:
+                continue
+            for sequence, _, payload in self._records(self._path(first)):
+                if sequence > self._durable_sequence:
+                    return
+                if sequence >= from_sequence:
+                    yield sequence, payload
+
+    def drop_before(self, sequence: int) -> None:
+        """
+        Delete the segments holding only records before `sequence`, once they are no longer needed.
+        :param sequence:
+        """
+        segments = self._segments()
+        for first, following in zip(segments, segments[1:]):
+            if following <= sequence and first != self._segment_first:
+                os.remove(self._path(first))
+
+    def close(self) -> None:
+        self.sync(self._last_sequence)
+        os.close(self._file)
+
+    def _write(self, batch: list[bytes], first_sequence: int) -> None:
+        if not batch:
+            return
+        data = b"".join(batch)
+        if self._size and self._size + len(data) > self._segment_size:
+            self._roll(first_sequence)
+        try:
+            written = os.write(self._file, data)
+            while written < len(data):
+                written += os.write(self._file, memoryview(data)[written:])
+            if self._fsync:
+                os.fsync(self._file)
+        except BaseException:
+            # Nothing of a failed batch must stay in the log, where it would come before its retry
+            os.ftruncate(self._file, self._size)
+            raise
+        self._size += len(data)
+
+    def _roll(self, first_sequence: int) -> None:
+        if self._fsync:
+            os.fsync(self._file)
+        os.close(self._file)
+        self._segment_first = first_sequence
+        self._file = os.open(self._path(first_sequence), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._size = 0
+        if self._fsync:
+            self._sync_directory()
+
+    @staticmethod
+    def _records(path: str) -> Iterator[tuple[int, int, bytes]]:
+        """
+        :return: sequence number, end offset and payload of the valid records of the segment
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        offset = 0
+        while offset + _CHECKSUM.size + _RECORD_HEADER.size <= len(data):
+            (checksum,) = _CHECKSUM.unpack_from(data, offset)
+            size, sequence = _RECORD_HEADER.unpack_from(data, offset + _CHECKSUM.size)
+            start = offset + _CHECKSUM.size + _RECORD_HEADER.size
+            payload = data[start : start + size]
+            if (
+                len(payload) != size
+                or zlib.crc32(payload, zlib.crc32(data[offset + _CHECKSUM.size : start])) != checksum
+            ):
+                return
+            offset = start + size
+            yield sequence, offset, payload
+
+    def _segments(self) -> list[int]:
+        segments = []
+        for name in os.listdir(self._directory):
+            match = _SEGMENT_NAME.match(name)
+            if match:
+                segments.append(int(match[1]))
+        return sorted(segments)
+
+    def _path(self, first_sequence: int) -> str:
+        return os.path.join(self._directory, f"segment-{first_sequence:016}.bin")
+
+    def _sync_directory(self) -> None:
+        directory = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
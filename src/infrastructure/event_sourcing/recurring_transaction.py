@@ -0,0 +1,131 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+from typing import Sequence
+
+from src.application.reccurring_transaction.repository import (
+    RecurringTransactionAlreadyExists,
+    RecurringTransactionNotFound,
+)
+from src.domain.account import AccountId
+from src.domain.recurring_transaction import (
+    RecurringTransaction,
+    RecurringTransactionId,
+    RecurringTransactionScheduled,
+    RecurringTransactionRenamed,
+    RecurringTransactionAmountModified,
+    RecurringTransactionFrequencyModified,
+    RecurringTransactionCancelled,
+)
+from src.infrastructure.event_sourcing.store import EventSourced, EventStore
+from src.infrastructure.in_memory.recurring_transaction import InMemoryRecurringTransactionRepository
+from src.shared.domain.event import DomainEvent
+
+
+class EventSourcedRecurringTransactionRepository(InMemoryRecurringTransactionRepository, EventSourced):
+    """
+    In-memory recurring transactions rebuilt from their events. A change is acknowledged once its events are durable.
+    """
+
+    def __init__(self, event_store: EventStore) -> None:
+        super().__init__()
+        self._event_store = event_store
+        event_store.register("recurring_transaction", self)
+
+    def add(self, recurring_transaction: RecurringTransaction) -> None:
+        with self._event_store.lock:
+            if recurring_transaction.id in self._recurring_transactions:
+                raise RecurringTransactionAlreadyExists(recurring_transaction_id=recurring_transaction.id)
+            recurring_transaction.pull_events()
+            sequence = self._record(
+                [
+                    RecurringTransactionScheduled(
+                        recurring_transaction.id,
+                        recurring_transaction.account_id,
+                        recurring_transaction.name,
+                        recurring_transaction.amount,
+                        recurring_transaction.frequency,
+                    )
+                ]
+            )
+        self._event_store.sync(sequence)
+
+    def delete(self, id_: RecurringTransactionId) -> None:
+        with self._event_store.lock:
+            if id_ not in self._recurring_transactions:
+                raise RecurringTransactionNotFound(recurring_transaction_id=id_)
+            sequence = self._record([RecurringTransactionCancelled(id_)])
+        self._event_store.sync(sequence)
+
+    def delete_by_account(self, account_id: AccountId) -> int:
+        with self._event_store.lock:
+            events = [RecurringTransactionCancelled(id_) for id_ in self._account_indexes.get(account_id, ())]
+            sequence = self._record(events)
+        self._event_store.sync(sequence)
+        return len(events)
+
+    def update(self, recurring_transaction: RecurringTransaction) -> None:
+        with self._event_store.lock:
+            try:
+                current = copy.copy(self._recurring_transactions[recurring_transaction.id])
+            except KeyError as e:
+                raise RecurringTransactionNotFound(recurring_transaction_id=recurring_transaction.id) from e
+            events = recurring_transaction.pull_events()
+            if not events:
+                # Changed without recording events, such as a recurring transaction built anew: they are the
+                # differences
+                current.rename(recurring_transaction.name)
+                current.modify_amount(recurring_transaction.amount)
+                current.modify_frequency(recurring_transaction.frequency)
+                events = current.pull_events()
+            sequence = self._record(events)
+        self._event_store.sync(sequence)
+
+    def apply(self, event: DomainEvent) -> None:
+        match event:
+            case RecurringTransactionScheduled(
+                recurring_transaction_id=id_, account_id=account_id, name=name, amount=amount, frequency=frequency
+            ):
+                self._store(RecurringTransaction(id_, account_id, name, amount, frequency))
+            case RecurringTransactionRenamed(recurring_transaction_id=id_, name=name):
+                recurring_transaction = self._recurring_transactions[id_]
+                recurring_transaction.rename(name)
+                recurring_transaction.pull_events()
+            case RecurringTransactionAmountModified(recurring_transaction_id=id_, amount=amount):
+                recurring_transaction = self._recurring_transactions[id_]
+                recurring_transaction.modify_amount(amount)
+                recurring_transaction.pull_events()
+            case RecurringTransactionFrequencyModified(recurring_transaction_id=id_, frequency=frequency):
+                recurring_transaction = self._recurring_transactions[id_]
+                recurring_transaction.modify_frequency(frequency)
+                recurring_transaction.pull_events()
+            case RecurringTransactionCancelled(recurring_transaction_id=id_):
+                self._unstore(self._recurring_transactions[id_])
+
+    def state(self) -> list[RecurringTransaction]:
+        return list(self._recurring_transactions.values())
+
+    def restore(self, state: list[RecurringTransaction]) -> None:
+        for recurring_transaction in state:
+            self._store(recurring_transaction)
+
+    def _record(self, events: Sequence[DomainEvent]) -> int:
+        if not events:
+            return 0
+        for event in events:
+            self.apply(event)
+        return self._event_store.record("recurring_transaction", events)
@@ -0,0 +1,54 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.infrastructure.event_sourcing.account import EventSourcedAccountRepository
+from src.infrastructure.event_sourcing.recurring_transaction import EventSourcedRecurringTransactionRepository
+from src.infrastructure.event_sourcing.store import EventStore
+from src.infrastructure.event_sourcing.transaction import EventSourcedTransactionRepository
+from src.infrastructure.event_sourcing.user import EventSourcedUserRepository
+from src.infrastructure.in_memory.unit_of_work import InMemoryUnitOfWork
+
+
+@dataclass(frozen=True)
+class EventSourcedRepositories:
+    user: EventSourcedUserRepository
+    account: EventSourcedAccountRepository
+    transaction: EventSourcedTransactionRepository
+    recurring_transaction: EventSourcedRecurringTransactionRepository
+    unit_of_work: InMemoryUnitOfWork
+
+
+def event_sourced_repositories(
+    directory: str, snapshot_interval: int = 1_000_000
+) -> Iterator[EventSourcedRepositories]:
+    """
+    Container resource: the repositories share an event store, rebuilt when the container resources are initialised
+    and closed when they are shut down.
+    """
+    store = EventStore(directory, snapshot_interval)
+    repositories = EventSourcedRepositories(
+        user=EventSourcedUserRepository(store),
+        account=EventSourcedAccountRepository(store),
+        transaction=EventSourcedTransactionRepository(store),
+        recurring_transaction=EventSourcedRecurringTransactionRepository(store),
+        unit_of_work=InMemoryUnitOfWork(store.lock),
+    )
+    store.open()
+    yield repositories
+    store.close()
@@ -0,0 +1,171 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import os
+import pickle
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Sequence
+
+from src.infrastructure.event_sourcing.log import SegmentedEventLog
+from src.shared.domain.event import DomainEvent
+
+
+class EventSourced(ABC):
+    """
+    State rebuilt by an event store from the events recorded for it, starting from its last snapshot.
+    """
+
+    @abstractmethod
+    def apply(self, event: DomainEvent) -> None:
+        """
+        :param event: an event recorded for this state, which always applies to it
+        """
+
+    @abstractmethod
+    def state(self) -> Any:
+        """
+        :return: a picklable copy of the state, to be restored from a snapshot
+        """
+
+    @abstractmethod
+    def restore(self, state: Any) -> None:
+        """
+        :param state: as returned by `state`, before any event is applied
+        """
+
+
+class EventStore:
+    """
+    Domain events of several event-sourced states, recorded in a segmented log and rebuilt at start-up from the last
+    snapshot plus the events recorded after it. Once `snapshot_interval` events were recorded since the last snapshot,
+    a background thread writes the next one and drops the log segments it supersedes.
+
+    Every change is made holding `lock`: checking that events apply, applying them and recording them, so that the
+    snapshots are consistent. Waiting for the events to be durable with `sync` should be done after releasing it, for
+    the events of concurrent changes to be synced together.
+
+    Events are pickled: the log is private to the application, which reads it back with the same domain classes.
+
+    :param directory:
+    :param snapshot_interval:
+    :param segment_size: see SegmentedEventLog
+    :param fsync:
+    """
+
+    def __init__(
+        self, directory: str, snapshot_interval: int = 1_000_000, segment_size: int = 64 * 2**20, fsync: bool = True
+    ) -> None:
+        self._directory = directory
+        self._snapshot_interval = snapshot_interval
+        self._fsync = fsync
+        self._lock = threading.RLock()
+        self._states: dict[str, EventSourced] = {}
+        self._snapshot_sequence = 0
+        self._snapshotting: threading.Thread | None = None
+        self._log = SegmentedEventLog(os.path.join(directory, "log"), segment_size, fsync)
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._lock
+
+    def register(self, name: str, state: EventSourced) -> None:
+        """
+        :param name: under which the events of `state` are recorded, unique in the store
+        :param state:
+        """
+        if name in self._states:
+            raise ValueError(f"`{name}` is already registered")
+        self._states[name] = state
+
+    def open(self) -> None:
+        """
+        Rebuild the registered states from the last snapshot and the events recorded after it.
+        """
+        with self._lock:
+            try:
+                with open(self._snapshot_path, "rb") as file:
+                    self._snapshot_sequence, states = pickle.load(file)
+            except FileNotFoundError:
+                states = {}
+            for name, state in states.items():
+                self._states[name].restore(state)
+            for _, payload in self._log.read(self._snapshot_sequence + 1):
+                name, events = pickle.loads(payload)
+                target = self._states[name]
+                for event in events:
+                    target.apply(event)
+
+    def record(self, name: str, events: Sequence[DomainEvent]) -> int:
+        """
+        Record events already applied to a registered state, holding `lock`.
+        :param name:
+        :param events:
+        :return: the sequence number to sync
+        """
+        with self._lock:
+            sequence = self._log.append([pickle.dumps((name, tuple(events)), pickle.HIGHEST_PROTOCOL)])
+            if sequence - self._snapshot_sequence >= self._snapshot_interval and (
+                self._snapshotting is None or not self._snapshotting.is_alive()
+            ):
+                self._snapshot_sequence = sequence
+                self._snapshotting = threading.Thread(target=self.write_snapshot, name="event-snapshot", daemon=True)
+                self._snapshotting.start()
+            return sequence
+
+    def sync(self, sequence: int) -> None:
+        """
+        Wait until the events recorded up to `sequence` are durable.
+        :param sequence:
+        """
+        self._log.sync(sequence)
+
+    def write_snapshot(self) -> None:
+        """
+        Write a snapshot of the registered states, then drop the log segments it supersedes. Only the states are
+        pickled under the lock: changes go on meanwhile.
+        """
+        with self._lock:
+            sequence = self._log.last_sequence
+            snapshot = pickle.dumps(
+                (sequence, {name: state.state() for name, state in self._states.items()}), pickle.HIGHEST_PROTOCOL
+            )
+            self._snapshot_sequence = sequence
+        # The snapshot must not hold changes that a crash could still undo
+        self._log.sync(sequence)
+
+        with open(f"{self._snapshot_path}.tmp", "wb") as file:
+            file.write(snapshot)
+            file.flush()
+            if self._fsync:
+                os.fsync(file.fileno())
+        os.replace(f"{self._snapshot_path}.tmp", self._snapshot_path)
+        if self._fsync:
+            directory = os.open(self._directory, os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+        self._log.drop_before(sequence + 1)
+
+    def close(self) -> None:
+        if self._snapshotting is not None:
+            self._snapshotting.join()
+        self._log.close()
+
+    @property
+    def _snapshot_path(self) -> str:
+        return os.path.join(self._directory, "snapshot.pickle")
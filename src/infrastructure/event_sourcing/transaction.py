@@ -0,0 +1,189 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+from typing import Iterable, Sequence
+
+from src.application.transaction.repository import (
+    TransactionAlreadyExists,
+    TransactionNotFound,
+    TransactionOperation,
+    TransactionOperationResult,
+    TransactionAddition,
+    TransactionReplacement,
+    TransactionRemoval,
+)
+from src.domain.account import AccountId
+from src.domain.transaction import (
+    Transaction,
+    TransactionId,
+    TransactionRecorded,
+    TransactionDateRectified,
+    TransactionAmountRectified,
+    TransactionLabelModified,
+    TransactionDeleted,
+)
+from src.infrastructure.event_sourcing.store import EventSourced, EventStore
+from src.infrastructure.in_memory.transaction import InMemoryTransactionRepository
+from src.shared.domain.event import DomainEvent
+
+
+def _recorded(transaction: Transaction) -> TransactionRecorded:
+    return TransactionRecorded(
+        transaction.id, transaction.account_id, transaction.date, transaction.label, transaction.amount
+    )
+
+
+class EventSourcedTransactionRepository(InMemoryTransactionRepository, EventSourced):
+    """
+    In-memory transactions rebuilt from their events. A change is acknowledged once its events are durable, and a
+    batch is recorded at once.
+    """
+
+    def __init__(self, event_store: EventStore) -> None:
+        super().__init__()
+        self._event_store = event_store
+        event_store.register("transaction", self)
+
+    def add(self, transaction: Transaction) -> None:
+        with self._event_store.lock:
+            if transaction.id in self._transactions:
+                raise TransactionAlreadyExists(transaction_id=transaction.id)
+            transaction.pull_events()
+            sequence = self._record([_recorded(transaction)])
+        self._event_store.sync(sequence)
+
+    def add_many(self, transactions: Iterable[Transaction]) -> None:
+        events: dict[TransactionId, TransactionRecorded] = {}
+        for transaction in transactions:
+            if transaction.id in events:
+                raise TransactionAlreadyExists(transaction_id=transaction.id)
+            transaction.pull_events()
+            events[transaction.id] = _recorded(transaction)
+        with self._event_store.lock:
+            for id_ in events:
+                if id_ in self._transactions:
+                    raise TransactionAlreadyExists(transaction_id=id_)
+            sequence = self._record(list(events.values()))
+        self._event_store.sync(sequence)
+
+    def delete(self, id_: TransactionId) -> None:
+        with self._event_store.lock:
+            if id_ not in self._transactions:
+                raise TransactionNotFound(transaction_id=id_)
+            sequence = self._record([TransactionDeleted(id_)])
+        self._event_store.sync(sequence)
+
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        with self._event_store.lock:
+            keys = self._account_indexes.get(account_id, [])
+            # The latest transactions go first, as in memory
+            start = 0 if limit is None else max(len(keys) - limit, 0)
+            events = [TransactionDeleted(self._ids[id_]) for _, id_ in keys[start:]]
+            sequence = self._record(events)
+        self._event_store.sync(sequence)
+        return len(events)
+
+    def update(self, transaction: Transaction) -> None:
+        with self._event_store.lock:
+            try:
+                current = copy.copy(self._transactions[transaction.id])
+            except KeyError as e:
+                raise TransactionNotFound(transaction_id=transaction.id) from e
+            events = transaction.pull_events()
+            if not events:
+                # Changed without recording events, such as a transaction built anew: they are the differences
+                current.rectify_date(transaction.date)
+                current.rectify_amount(transaction.amount)
+                current.modify_label(transaction.label)
+                events = current.pull_events()
+            sequence = self._record(events)
+        self._event_store.sync(sequence)
+
+    def apply_batch(
+        self, account_id: AccountId, operations: Sequence[TransactionOperation]
+    ) -> list[TransactionOperationResult]:
+        results = []
+        events: list[DomainEvent] = []
+        with self._event_store.lock:
+            for operation in operations:
+                result, operation_events = self._operation_events(account_id, operation)
+                for event in operation_events:
+                    self.apply(event)
+                results.append(result)
+                events += operation_events
+            sequence = self._event_store.record("transaction", events) if events else 0
+        self._event_store.sync(sequence)
+        return results
+
+    def apply(self, event: DomainEvent) -> None:
+        match event:
+            case TransactionRecorded(transaction_id=id_, account_id=account_id, date=date, label=label, amount=amount):
+                self._store(Transaction(id_, account_id, date, label, amount))
+            case TransactionDateRectified(transaction_id=id_, date=date):
+                # The date is part of the account index key: the transaction is stored again
+                previous = self._transactions[id_]
+                transaction = copy.copy(previous)
+                transaction.rectify_date(date)
+                transaction.pull_events()
+                self._unstore(previous)
+                self._store(transaction)
+            case TransactionAmountRectified(transaction_id=id_, amount=amount):
+                transaction = self._transactions[id_]
+                transaction.rectify_amount(amount)
+                transaction.pull_events()
+            case TransactionLabelModified(transaction_id=id_, label=label):
+                transaction = self._transactions[id_]
+                transaction.modify_label(label)
+                transaction.pull_events()
+            case TransactionDeleted(transaction_id=id_):
+                self._unstore(self._transactions[id_])
+
+    def state(self) -> list[Transaction]:
+        return list(self._transactions.values())
+
+    def restore(self, state: list[Transaction]) -> None:
+        for transaction in state:
+            self._store(transaction)
+
+    def _operation_events(
+        self, account_id: AccountId, operation: TransactionOperation
+    ) -> tuple[TransactionOperationResult, list[DomainEvent]]:
+        replacement: Transaction | None
+        match operation:
+            case TransactionAddition(transaction=transaction):
+                if transaction.id in self._transactions:
+                    return TransactionOperationResult(error=TransactionAlreadyExists(transaction_id=transaction.id)), []
+                return TransactionOperationResult(), [_recorded(transaction)]
+            case TransactionReplacement(transaction=replacement):
+                transaction_id = replacement.id
+            case TransactionRemoval(transaction_id=transaction_id):
+                replacement = None
+
+        previous = self._transactions.get(transaction_id)
+        if previous is None or previous.account_id != account_id:
+            return TransactionOperationResult(error=TransactionNotFound(transaction_id=transaction_id)), []
+        events: list[DomainEvent] = [TransactionDeleted(transaction_id)]
+        if replacement is not None:
+            events.append(_recorded(replacement))
+        return TransactionOperationResult(previous=previous), events
+
+    def _record(self, events: Sequence[DomainEvent]) -> int:
+        if not events:
+            return 0
+        for event in events:
+            self.apply(event)
+        return self._event_store.record("transaction", events)
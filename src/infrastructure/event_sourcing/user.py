@@ -0,0 +1,127 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+from typing import Sequence
+
+from src.application.user.repository import (
+    UserRepository,
+    UserAlreadyExists,
+    UserNotFound,
+    UserEmailAddressNotFound,
+    UserEmailAddressAlreadyUsed,
+)
+from src.domain.user import User, UserId, UserRegistered, UserEmailAddressChanged, UserRenamed, UserDeleted
+from src.infrastructure.event_sourcing.store import EventSourced, EventStore
+from src.shared.domain.email import EmailAddress
+from src.shared.domain.event import DomainEvent
+
+
+class EventSourcedUserRepository(UserRepository, EventSourced):
+    """
+    Users kept in memory and rebuilt from their events, with their ids by email address. A change is acknowledged once
+    its events are durable.
+    """
+
+    def __init__(self, event_store: EventStore) -> None:
+        self._event_store = event_store
+        self._users: dict[UserId, User] = {}
+        self._ids_by_email_address: dict[EmailAddress, UserId] = {}
+        event_store.register("user", self)
+
+    def add(self, user: User) -> None:
+        with self._event_store.lock:
+            if user.id in self._users:
+                raise UserAlreadyExists(user_id=user.id)
+            self._check_email_address_unused(user)
+            user.pull_events()
+            sequence = self._record([UserRegistered(user.id, user.email_address, user.username)])
+        self._event_store.sync(sequence)
+
+    def retrieve(self, id_: UserId) -> User:
+        try:
+            return copy.copy(self._users[id_])
+        except KeyError as e:
+            raise UserNotFound(user_id=id_) from e
+
+    def retrieve_by_email_address(self, email_address: EmailAddress) -> User:
+        try:
+            return copy.copy(self._users[self._ids_by_email_address[email_address]])
+        except KeyError as e:
+            raise UserEmailAddressNotFound(email_address=email_address) from e
+
+    def update(self, user: User) -> None:
+        with self._event_store.lock:
+            try:
+                current = copy.copy(self._users[user.id])
+            except KeyError as e:
+                raise UserNotFound(user_id=user.id) from e
+            self._check_email_address_unused(user)
+            events = user.pull_events()
+            if not events:
+                # Changed without recording events, such as a user built anew: they are the differences
+                current.change_email_address(user.email_address)
+                current.rename(user.username)
+                events = current.pull_events()
+            sequence = self._record(events)
+        self._event_store.sync(sequence)
+
+    def delete(self, id_: UserId) -> None:
+        with self._event_store.lock:
+            if id_ not in self._users:
+                raise UserNotFound(user_id=id_)
+            sequence = self._record([UserDeleted(id_)])
+        self._event_store.sync(sequence)
+
+    def apply(self, event: DomainEvent) -> None:
+        match event:
+            case UserRegistered(user_id=user_id, email_address=email_address, username=username):
+                self._users[user_id] = User(user_id, email_address, username)
+                self._ids_by_email_address[email_address] = user_id
+            case UserEmailAddressChanged(user_id=user_id, email_address=email_address):
+                user = self._users[user_id]
+                self._forget_email_address(user)
+                user.change_email_address(email_address)
+                user.pull_events()
+                self._ids_by_email_address[email_address] = user_id
+            case UserRenamed(user_id=user_id, username=username):
+                user = self._users[user_id]
+                user.rename(username)
+                user.pull_events()
+            case UserDeleted(user_id=user_id):
+                self._forget_email_address(self._users.pop(user_id))
+
+    def state(self) -> list[User]:
+        return list(self._users.values())
+
+    def restore(self, state: list[User]) -> None:
+        self._users = {user.id: user for user in state}
+        self._ids_by_email_address = {user.email_address: user.id for user in state}
+
+    def _record(self, events: Sequence[DomainEvent]) -> int:
+        if not events:
+            return 0
+        for event in events:
+            self.apply(event)
+        return self._event_store.record("user", events)
+
+    def _check_email_address_unused(self, user: User) -> None:
+        if self._ids_by_email_address.get(user.email_address, user.id) != user.id:
+            raise UserEmailAddressAlreadyUsed(email_address=user.email_address)
+
+    def _forget_email_address(self, user: User) -> None:
+        if self._ids_by_email_address.get(user.email_address) == user.id:
+            del self._ids_by_email_address[user.email_address]
@@ -15,34 +15,43 @@
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
 
+import functools
+
+from dependency_injector.containers import DeclarativeContainer
 from fastapi import FastAPI
 
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.infrastructure.containers.sqlite import SqliteContainer
 from src.infrastructure.user.fastapi.email_address import router as user_email_address_router
 from src.infrastructure.user.fastapi.put import router as user_put_router
 from src.infrastructure.user.fastapi.delete import router as user_delete_router
 from src.infrastructure.user.fastapi.read import router as user_read_router
+from src.infrastructure.user.fastapi.session import router as user_session_router
 from src.infrastructure.user.fastapi.subscription import router as user_subscription_router
 from src.infrastructure.account.fastapi.post import router as account_post_router
 from src.infrastructure.account.fastapi.put import router as account_put_router
 from src.infrastructure.account.fastapi.delete import router as account_delete_router
 from src.infrastructure.account.fastapi.read import router as account_read_router
+from src.infrastructure.account.fastapi.balance import router as account_balance_router
+from src.infrastructure.account.fastapi.forecast import router as account_forecast_router
+from src.infrastructure.account.fastapi.dashboard import router as account_dashboard_router
+from src.infrastructure.account.fastapi.user import router as account_user_router
+from src.infrastructure.transaction.fastapi.batch import router as transaction_batch_router
 
 
-def create_app() -> FastAPI:
+def create_app(container: DeclarativeContainer | None = None) -> FastAPI:
     new_app = FastAPI()
-    container = InMemoryContainer()
+    if container is None:
+        container = SqliteContainer()
     container.init_resources()
-    container.wire(modules=["src.infrastructure.user.fastapi.put"])
-    container.wire(modules=["src.infrastructure.user.fastapi.delete"])
-    container.wire(modules=["src.infrastructure.user.fastapi.read"])
-    container.wire(modules=["src.infrastructure.user.fastapi.email_address"])
-    container.wire(modules=["src.infrastructure.user.fastapi.subscription"])
-    container.wire(modules=["src.infrastructure.account.fastapi.post"])
-    container.wire(modules=["src.infrastructure.account.fastapi.put"])
-    container.wire(modules=["src.infrastructure.account.fastapi.delete"])
-    container.wire(modules=["src.infrastructure.account.fastapi.read"])
+    container.wire(
+        packages=[
+            "src.infrastructure.user.fastapi",
+            "src.infrastructure.account.fastapi",
+            "src.infrastructure.transaction.fastapi",
+        ]
+    )
     new_app.container = container  # type: ignore
+    new_app.include_router(user_session_router)
     new_app.include_router(user_put_router)
     new_app.include_router(user_delete_router)
     new_app.include_router(user_read_router)
@@ -52,7 +61,22 @@ def create_app() -> FastAPI:
     new_app.include_router(account_put_router)
     new_app.include_router(account_delete_router)
     new_app.include_router(account_read_router)
+    new_app.include_router(account_balance_router)
+    new_app.include_router(account_forecast_router)
+    new_app.include_router(account_dashboard_router)
+    new_app.include_router(account_user_router)
+    new_app.include_router(transaction_batch_router)
     return new_app
 
 
-app = create_app()
+@functools.cache
+def _production_app() -> FastAPI:
+    return create_app()
+
+
+def __getattr__(name: str) -> FastAPI:
+    # The production application, e.g. for uvicorn, is built on first access rather than on import, so that importing
+    # `create_app` neither opens the production database nor starts its workers
+    if name == "app":
+        return _production_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
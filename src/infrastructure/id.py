@@ -0,0 +1,87 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import re
+from typing import Any, ClassVar, Self
+from weakref import WeakValueDictionary
+
+from src.shared.domain.entity import Id, IdBase
+
+_UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z")
+
+
+class InvalidUUID(ValueError):
+    def __init__(self, string: str) -> None:
+        super().__init__(f"`{string}` is not a canonical UUID")
+
+
+class UUIDBase(IdBase[str]):
+    """
+    Id holding a canonical UUID string. Equal ids share one instance while any of them is referenced, so comparisons
+    and dict lookups mostly stop at the identity check. Each subclass has its own interning table.
+    """
+
+    __slots__ = ("__weakref__",)
+    _interned: ClassVar[WeakValueDictionary[str, Any]] = WeakValueDictionary()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._interned = WeakValueDictionary()
+
+    def __new__(cls, value: str) -> Self:
+        id_ = cls._interned.get(value)
+        if id_ is None:
+            if not _UUID_PATTERN.match(value):
+                raise InvalidUUID(value)
+            id_ = cls._intern(value)
+        return id_
+
+    def __init__(self, value: str) -> None:
+        # Everything is done by __new__, which may return an instance built earlier
+        pass
+
+    @classmethod
+    def trusted(cls, value: str) -> Self:
+        id_ = cls._interned.get(value)
+        return cls._intern(value) if id_ is None else id_
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> Self:
+        """
+        Build the id from its 16 bytes, as stored by repositories.
+        """
+        digits = raw.hex()
+        return cls.trusted(f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}")
+
+    def __reduce__(self) -> tuple[Any, tuple[str]]:
+        # Copies and unpickled ids resolve to the interned instance
+        return type(self).trusted, (self._value,)
+
+    @classmethod
+    def _intern(cls, value: str) -> Self:
+        # Two threads interning the same value may both build an instance: they still compare equal by value
+        id_ = object.__new__(cls)
+        id_._value = value
+        id_._hash = hash(value)
+        cls._interned[value] = id_
+        return id_
+
+
+def uuid_bytes(id_: Id) -> bytes:
+    """
+    16-byte form of an id whose string form is a UUID, as stored by repositories and indexes.
+    """
+    return bytes.fromhex(str(id_).replace("-", ""))
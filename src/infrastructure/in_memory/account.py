@@ -0,0 +1,74 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+from typing import Iterator
+
+from src.application.account.repository import AccountRepository, AccountAlreadyExists, AccountNotFound
+from src.domain.account import Account, AccountId
+from src.domain.user import UserId
+
+
+class InMemoryAccountRepository(AccountRepository):
+    """
+    Accounts are kept in a dict by id, and every user keeps the ids of its accounts so that listing them is not a
+    full scan.
+    """
+
+    def __init__(self) -> None:
+        self._accounts: dict[AccountId, Account] = {}
+        self._user_indexes: dict[UserId, dict[AccountId, None]] = {}
+
+    def add(self, account: Account) -> None:
+        if account.id in self._accounts:
+            raise AccountAlreadyExists(account_id=account.id)
+        self._store(copy.copy(account))
+
+    def retrieve(self, id_: AccountId) -> Account:
+        try:
+            return copy.copy(self._accounts[id_])
+        except KeyError as e:
+            raise AccountNotFound(account_id=id_) from e
+
+    def delete(self, id_: AccountId) -> None:
+        try:
+            account = self._accounts[id_]
+        except KeyError as e:
+            raise AccountNotFound(account_id=id_) from e
+        self._unstore(account)
+
+    def update(self, account: Account) -> None:
+        try:
+            previous = self._accounts[account.id]
+        except KeyError as e:
+            raise AccountNotFound(account_id=account.id) from e
+        self._unstore(previous)
+        self._store(copy.copy(account))
+
+    def list_by_user(self, user_id: UserId) -> Iterator[Account]:
+        for id_ in list(self._user_indexes.get(user_id, ())):
+            yield copy.copy(self._accounts[id_])
+
+    def _store(self, account: Account) -> None:
+        self._accounts[account.id] = account
+        self._user_indexes.setdefault(account.user_id, {})[account.id] = None
+
+    def _unstore(self, account: Account) -> None:
+        del self._accounts[account.id]
+        user_index = self._user_indexes[account.user_id]
+        del user_index[account.id]
+        if not user_index:
+            del self._user_indexes[account.user_id]
@@ -0,0 +1,35 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from src.application.account.tombstone import AccountTombstoneRepository
+from src.domain.account import AccountId
+
+
+class InMemoryAccountTombstoneRepository(AccountTombstoneRepository):
+    def __init__(self) -> None:
+        self._account_ids: dict[AccountId, None] = {}
+
+    def add(self, account_id: AccountId) -> None:
+        self._account_ids[account_id] = None
+
+    def exists(self, account_id: AccountId) -> bool:
+        return account_id in self._account_ids
+
+    def delete(self, account_id: AccountId) -> None:
+        self._account_ids.pop(account_id, None)
+
+    def list_account_ids(self) -> list[AccountId]:
+        return list(self._account_ids)
@@ -0,0 +1,506 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, compress
+from typing import BinaryIO, Callable, Iterable, Iterator, Self, Sequence, cast
+
+from src.application.transaction.repository import (
+    TransactionRepository,
+    TransactionAlreadyExists,
+    TransactionNotFound,
+    TransactionCursor,
+    TransactionOperation,
+    TransactionOperationResult,
+    TransactionAddition,
+    TransactionReplacement,
+    TransactionRemoval,
+)
+from src.domain.account import AccountId
+from src.domain.transaction import Transaction, TransactionId
+from src.infrastructure.in_memory.row_index import RowIndex
+from src.shared.domain.money import DEFAULT_CURRENCY, CurrencyMismatch, Money
+
+_RowKey = tuple[int, bytes]
+
+# Compaction is not worth it below this many tombstones
+_MIN_TOMBSTONES = 1024
+
+_SNAPSHOT_MAGIC = b"KSKRCOL1"
+# Magic, id size, rows, tombstones, label bytes, index slots, used index slots, accounts, currencies
+_SNAPSHOT_HEADER = struct.Struct("<8s8Q")
+_ACCOUNT_ID_SIZE = struct.Struct("<H")
+
+
+class InvalidSnapshot(ValueError):
+    def __init__(self) -> None:
+        super().__init__("Not a columnar transaction snapshot")
+
+
+def _copy_array(typecode: str, column: array | memoryview) -> array:
+    copy = array(typecode)
+    copy.frombytes(memoryview(column).cast("B"))
+    return copy
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+class ColumnarTransactionRepository(TransactionRepository):
+    """
+    Transactions are stored as parallel arrays, one row per transaction: id bytes, account index, date ordinal, amount
+    in minor units, currency index and label offsets into a shared UTF-8 buffer. Transaction objects are only built
+    when read, and ids are found through a hash index kept in an array as well.
+
+    Every account keeps its rows sorted by date then by id, so listings and per-account aggregates are bisections
+    followed by a gather of the matching rows. Removed and replaced rows are tombstoned, and the arrays are compacted
+    once the tombstones outnumber `compaction_ratio` of the rows.
+
+    Since every structure is a flat buffer, the repository can be saved as is and loaded back from a memory-mapped
+    file without copy: the mapped buffers are only copied on the first change.
+
+    :param id_to_bytes: byte form of a transaction id, `id_size` bytes long, which must sort like its string form
+    :param id_from_bytes: transaction id of a byte form
+    :param id_size:
+    :param compaction_ratio:
+    """
+
+    def __init__(
+        self,
+        id_to_bytes: Callable[[TransactionId], bytes],
+        id_from_bytes: Callable[[bytes], TransactionId],
+        id_size: int = 16,
+        compaction_ratio: float = 0.5,
+    ) -> None:
+        self._id_to_bytes = id_to_bytes
+        self._id_from_bytes = id_from_bytes
+        self._id_size = id_size
+        self._compaction_ratio = compaction_ratio
+
+        # Columns are read-only memoryviews instead of arrays while they are mapped from a snapshot
+        self._ids = bytearray()
+        self._accounts = array("i")
+        self._dates = array("i")
+        self._amounts = array("q")
+        self._currencies = array("H")
+        self._label_offsets = array("q", [0])
+        self._labels = bytearray()
+        self._live = bytearray()
+        self._tombstones = 0
+        self._mapped = False
+
+        self._rows = RowIndex(self._id_at)
+        self._account_ids: list[AccountId] = []
+        self._account_indexes: dict[AccountId, int] = {}
+        self._account_rows: list[array] = []
+        self._currency_codes: list[str] = []
+        self._currency_indexes: dict[str, int] = {}
+
+    @property
+    def id_size(self) -> int:
+        return self._id_size
+
+    def __len__(self) -> int:
+        return len(self._live) - self._tombstones
+
+    def add(self, transaction: Transaction) -> None:
+        key = self._id_to_bytes(transaction.id)
+        if self._rows.get(key) is not None:
+            raise TransactionAlreadyExists(transaction_id=transaction.id)
+        self._store(key, transaction)
+
+    def add_many(self, transactions: Iterable[Transaction]) -> None:
+        pending: dict[bytes, Transaction] = {}
+        for transaction in transactions:
+            key = self._id_to_bytes(transaction.id)
+            if key in pending or self._rows.get(key) is not None:
+                raise TransactionAlreadyExists(transaction_id=transaction.id)
+            pending[key] = transaction
+        for key, transaction in pending.items():
+            self._store(key, transaction)
+
+    def retrieve(self, id_: TransactionId) -> Transaction:
+        row = self._rows.get(self._id_to_bytes(id_))
+        if row is None:
+            raise TransactionNotFound(transaction_id=id_)
+        return self._materialise(row)
+
+    def delete(self, id_: TransactionId) -> None:
+        row = self._rows.get(self._id_to_bytes(id_))
+        if row is None:
+            raise TransactionNotFound(transaction_id=id_)
+        self._unstore(row)
+        self._compact_if_needed()
+
+    def update(self, transaction: Transaction) -> None:
+        key = self._id_to_bytes(transaction.id)
+        row = self._rows.get(key)
+        if row is None:
+            raise TransactionNotFound(transaction_id=transaction.id)
+        self._unstore(row)
+        self._store(key, transaction)
+        self._compact_if_needed()
+
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        account_index = self._account_indexes.get(account_id)
+        if account_index is None:
+            return 0
+        self._unmap()
+        rows = self._account_rows[account_index]
+        # The latest transactions go first, so that the account rows shrink from their end
+        start = 0 if limit is None else max(len(rows) - limit, 0)
+        for row in rows[start:]:
+            self._rows.remove(self._id_at(row))
+            self._live[row] = 0
+        count = len(rows) - start
+        del rows[start:]
+        self._tombstones += count
+        self._compact_if_needed()
+        return count
+
+    def apply_batch(
+        self, account_id: AccountId, operations: Sequence[TransactionOperation]
+    ) -> list[TransactionOperationResult]:
+        results = [self._apply(account_id, operation) for operation in operations]
+        self._compact_if_needed()
+        return results
+
+    def list_by_account(
+        self,
+        account_id: AccountId,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+        limit: int | None = None,
+        cursor: TransactionCursor | None = None,
+    ) -> Iterator[Transaction]:
+        lower: tuple = (date_from.toordinal(),) if date_from else ()
+        if cursor is not None:
+            lower = max(lower, (cursor.date.toordinal(), self._id_to_bytes(cursor.transaction_id)))
+        upper = (date_to.toordinal() + 1,) if date_to else None
+        remaining = limit
+
+        while remaining is None or remaining > 0:
+            # The position is searched again at each step so that the iteration survives mutations and compactions
+            rows = self._rows_of(account_id)
+            position = bisect_right(rows, lower, key=self._row_key)
+            if position == len(rows) or (upper is not None and self._row_key(rows[position]) >= upper):
+                return
+            lower = self._row_key(rows[position])
+            yield self._materialise(rows[position])
+            if remaining is not None:
+                remaining -= 1
+
+    def sum_by_account(
+        self,
+        account_id: AccountId,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+        currency: str = DEFAULT_CURRENCY,
+    ) -> Money:
+        """
+        Sum of the account transactions dated between `date_from` and `date_to` (both included).
+        :raises CurrencyMismatch: a transaction is not in `currency`
+        """
+        rows = self._rows_between(self._rows_of(account_id), date_from, date_to)
+        currencies = set(map(self._currencies.__getitem__, rows))
+        for index in currencies:
+            if self._currency_codes[index] != currency:
+                raise CurrencyMismatch(currency, self._currency_codes[index])
+        return Money(sum(map(self._amounts.__getitem__, rows)), currency)
+
+    def sums_by_account(
+        self, date_from: datetime.date | None = None, date_to: datetime.date | None = None
+    ) -> dict[AccountId, Money]:
+        """
+        Sum of the transactions dated between `date_from` and `date_to` (both included) of every account having some,
+        in the currency of these transactions.
+        :raises CurrencyMismatch: the transactions of an account are not all in the same currency
+        """
+        sums = {}
+        for account_index, account_rows in enumerate(self._account_rows):
+            rows = self._rows_between(account_rows, date_from, date_to)
+            if not rows:
+                continue
+            currencies = set(map(self._currencies.__getitem__, rows))
+            currency = self._currency_codes[currencies.pop()]
+            if currencies:
+                raise CurrencyMismatch(currency, self._currency_codes[currencies.pop()])
+            sums[self._account_ids[account_index]] = Money(sum(map(self._amounts.__getitem__, rows)), currency)
+        return sums
+
+    def compact(self) -> None:
+        """
+        Drop the tombstoned rows, renumbering the live ones in their current order.
+        """
+        live_rows = array("q", compress(range(len(self._live)), self._live))
+        # A live row is renumbered to the count of live rows before it
+        new_rows = array("q", accumulate(self._live, initial=0))
+
+        ids, size = self._ids, self._id_size
+        self._ids = bytearray().join([ids[row * size : (row + 1) * size] for row in live_rows])
+        self._accounts = array("i", map(self._accounts.__getitem__, live_rows))
+        self._dates = array("i", map(self._dates.__getitem__, live_rows))
+        self._amounts = array("q", map(self._amounts.__getitem__, live_rows))
+        self._currencies = array("H", map(self._currencies.__getitem__, live_rows))
+        labels, offsets = self._labels, self._label_offsets
+        self._labels = bytearray().join([labels[offsets[row] : offsets[row + 1]] for row in live_rows])
+        self._label_offsets = array("q", accumulate((offsets[row + 1] - offsets[row] for row in live_rows), initial=0))
+        self._rows.compact(self._live)
+        self._live = bytearray(b"\x01") * len(live_rows)
+        self._tombstones = 0
+        self._account_rows = [array("q", map(new_rows.__getitem__, rows)) for rows in self._account_rows]
+        self._mapped = False
+
+    def copy(self) -> "ColumnarTransactionRepository":
+        """
+        Independent copy of the repository, made of buffer copies only.
+        """
+        copy = type(self)(self._id_to_bytes, self._id_from_bytes, self._id_size, self._compaction_ratio)
+        copy._ids = bytearray(self._ids)
+        copy._accounts = _copy_array("i", self._accounts)
+        copy._dates = _copy_array("i", self._dates)
+        copy._amounts = _copy_array("q", self._amounts)
+        copy._currencies = _copy_array("H", self._currencies)
+        copy._label_offsets = _copy_array("q", self._label_offsets)
+        copy._labels = bytearray(self._labels)
+        copy._live = bytearray(self._live)
+        copy._tombstones = self._tombstones
+        copy._rows = RowIndex(copy._id_at, _copy_array("q", self._rows.slots), self._rows.used)
+        copy._account_ids = list(self._account_ids)
+        copy._account_indexes = dict(self._account_indexes)
+        copy._account_rows = [_copy_array("q", rows) for rows in self._account_rows]
+        copy._currency_codes = list(self._currency_codes)
+        copy._currency_indexes = dict(self._currency_indexes)
+        return copy
+
+    def save(self, file: BinaryIO, account_id_to_bytes: Callable[[AccountId], bytes]) -> None:
+        """
+        Write every buffer of the repository, in native byte order, so that `load` can map them back.
+        """
+        file.write(
+            _SNAPSHOT_HEADER.pack(
+                _SNAPSHOT_MAGIC,
+                self._id_size,
+                len(self._live),
+                self._tombstones,
+                len(self._labels),
+                len(self._rows.slots),
+                self._rows.used,
+                len(self._account_ids),
+                len(self._currency_codes),
+            )
+        )
+        buffers: list[bytearray | array | memoryview] = [
+            self._ids,
+            self._accounts,
+            self._dates,
+            self._amounts,
+            self._currencies,
+            self._label_offsets,
+            self._labels,
+            self._live,
+            self._rows.slots,
+            array("q", map(len, self._account_rows)),
+            *self._account_rows,
+        ]
+        for buffer in buffers:
+            data = memoryview(buffer).cast("B")
+            file.write(data)
+            file.write(bytes(_padding(len(data))))
+        for account_id in self._account_ids:
+            raw = account_id_to_bytes(account_id)
+            file.write(_ACCOUNT_ID_SIZE.pack(len(raw)) + raw)
+        file.write("".join(self._currency_codes).encode("ascii"))
+
+    @classmethod
+    def load(
+        cls,
+        buffer: memoryview,
+        id_to_bytes: Callable[[TransactionId], bytes],
+        id_from_bytes: Callable[[bytes], TransactionId],
+        account_id_from_bytes: Callable[[bytes], AccountId],
+        compaction_ratio: float = 0.5,
+    ) -> Self:
+        """
+        Repository served from a buffer written by `save`, usually a memory-mapped file which must then stay open.
+        Nothing is copied until the first change.
+        :raises InvalidSnapshot
+        """
+        buffer = buffer.cast("B")
+        if buffer[: len(_SNAPSHOT_MAGIC)] != _SNAPSHOT_MAGIC:
+            raise InvalidSnapshot()
+        (
+            _,
+            id_size,
+            row_count,
+            tombstones,
+            label_size,
+            index_size,
+            index_used,
+            account_count,
+            currency_count,
+        ) = _SNAPSHOT_HEADER.unpack_from(buffer)
+        offset = _SNAPSHOT_HEADER.size
+
+        def take(size: int, typecode: str = "B") -> memoryview:
+            nonlocal offset
+            view = buffer[offset : offset + size]
+            offset += size + _padding(size)
+            return view.cast(typecode)
+
+        repository = cls(id_to_bytes, id_from_bytes, id_size, compaction_ratio)
+        # The mapped buffers stand in for the arrays until they are copied by _unmap
+        repository._ids = cast(bytearray, take(row_count * id_size))
+        repository._accounts = cast(array, take(row_count * 4, "i"))
+        repository._dates = cast(array, take(row_count * 4, "i"))
+        repository._amounts = cast(array, take(row_count * 8, "q"))
+        repository._currencies = cast(array, take(row_count * 2, "H"))
+        repository._label_offsets = cast(array, take((row_count + 1) * 8, "q"))
+        repository._labels = cast(bytearray, take(label_size))
+        repository._live = cast(bytearray, take(row_count))
+        repository._tombstones = tombstones
+        repository._rows = RowIndex(repository._id_at, take(index_size * 8, "q"), index_used)
+        account_row_counts = take(account_count * 8, "q")
+        repository._account_rows = [cast(array, take(count * 8, "q")) for count in account_row_counts]
+        for account_index in range(account_count):
+            (size,) = _ACCOUNT_ID_SIZE.unpack_from(buffer, offset)
+            account_id = account_id_from_bytes(bytes(buffer[offset + 2 : offset + 2 + size]))
+            offset += 2 + size
+            repository._account_ids.append(account_id)
+            repository._account_indexes[account_id] = account_index
+        currencies = bytes(buffer[offset : offset + currency_count * 3]).decode("ascii")
+        repository._currency_codes = [currencies[index : index + 3] for index in range(0, len(currencies), 3)]
+        repository._currency_indexes = {currency: index for index, currency in enumerate(repository._currency_codes)}
+        repository._mapped = True
+        return repository
+
+    def _apply(self, account_id: AccountId, operation: TransactionOperation) -> TransactionOperationResult:
+        replacement: Transaction | None
+        match operation:
+            case TransactionAddition(transaction=transaction):
+                key = self._id_to_bytes(transaction.id)
+                if self._rows.get(key) is not None:
+                    return TransactionOperationResult(error=TransactionAlreadyExists(transaction_id=transaction.id))
+                self._store(key, transaction)
+                return TransactionOperationResult()
+            case TransactionReplacement(transaction=replacement):
+                transaction_id = replacement.id
+            case TransactionRemoval(transaction_id=transaction_id):
+                replacement = None
+
+        key = self._id_to_bytes(transaction_id)
+        row = self._rows.get(key)
+        if row is None or self._account_ids[self._accounts[row]] != account_id:
+            return TransactionOperationResult(error=TransactionNotFound(transaction_id=transaction_id))
+        previous = self._materialise(row)
+        self._unstore(row)
+        if replacement is not None:
+            self._store(key, replacement)
+        return TransactionOperationResult(previous=previous)
+
+    def _store(self, key: bytes, transaction: Transaction) -> None:
+        if len(key) != self._id_size:
+            raise ValueError(f"`{transaction.id}` is not {self._id_size} bytes long once encoded")
+        self._unmap()
+        row = len(self._live)
+        account_index = self._account_index(transaction.account_id)
+        self._ids += key
+        self._accounts.append(account_index)
+        self._dates.append(transaction.date.toordinal())
+        self._amounts.append(transaction.amount.minor_units)
+        self._currencies.append(self._currency_index(transaction.amount.currency))
+        self._labels += transaction.label.encode()
+        self._label_offsets.append(len(self._labels))
+        self._live.append(1)
+        self._rows.add(key, row)
+
+        rows = self._account_rows[account_index]
+        # Rows mostly arrive in date order, which spares the bisection
+        if not rows or self._row_key(rows[-1]) < self._row_key(row):
+            rows.append(row)
+        else:
+            rows.insert(bisect_left(rows, self._row_key(row), key=self._row_key), row)
+
+    def _unstore(self, row: int) -> None:
+        self._unmap()
+        rows = self._account_rows[self._accounts[row]]
+        del rows[bisect_left(rows, self._row_key(row), key=self._row_key)]
+        self._rows.remove(self._id_at(row))
+        self._live[row] = 0
+        self._tombstones += 1
+
+    def _unmap(self) -> None:
+        if not self._mapped:
+            return
+        self._ids = bytearray(self._ids)
+        self._accounts = _copy_array("i", self._accounts)
+        self._dates = _copy_array("i", self._dates)
+        self._amounts = _copy_array("q", self._amounts)
+        self._currencies = _copy_array("H", self._currencies)
+        self._label_offsets = _copy_array("q", self._label_offsets)
+        self._labels = bytearray(self._labels)
+        self._live = bytearray(self._live)
+        self._account_rows = [_copy_array("q", rows) for rows in self._account_rows]
+        self._mapped = False
+
+    def _compact_if_needed(self) -> None:
+        if self._tombstones >= _MIN_TOMBSTONES and self._tombstones > len(self._live) * self._compaction_ratio:
+            self.compact()
+
+    def _materialise(self, row: int) -> Transaction:
+        return Transaction(
+            self._id_from_bytes(self._id_at(row)),
+            self._account_ids[self._accounts[row]],
+            datetime.date.fromordinal(self._dates[row]),
+            str(self._labels[self._label_offsets[row] : self._label_offsets[row + 1]], "utf-8"),
+            Money(self._amounts[row], self._currency_codes[self._currencies[row]]),
+        )
+
+    def _id_at(self, row: int) -> bytes:
+        return bytes(self._ids[row * self._id_size : (row + 1) * self._id_size])
+
+    def _row_key(self, row: int) -> _RowKey:
+        return self._dates[row], self._id_at(row)
+
+    def _rows_of(self, account_id: AccountId) -> array:
+        account_index = self._account_indexes.get(account_id)
+        return array("q") if account_index is None else self._account_rows[account_index]
+
+    def _rows_between(
+        self, rows: array, date_from: datetime.date | None, date_to: datetime.date | None
+    ) -> Sequence[int]:
+        start = 0 if date_from is None else bisect_left(rows, date_from.toordinal(), key=self._dates.__getitem__)
+        end = len(rows) if date_to is None else bisect_right(rows, date_to.toordinal(), key=self._dates.__getitem__)
+        return rows[start:end]
+
+    def _account_index(self, account_id: AccountId) -> int:
+        account_index = self._account_indexes.get(account_id)
+        if account_index is None:
+            account_index = self._account_indexes[account_id] = len(self._account_ids)
+            self._account_ids.append(account_id)
+            self._account_rows.append(array("q"))
+        return account_index
+
+    def _currency_index(self, currency: str) -> int:
+        currency_index = self._currency_indexes.get(currency)
+        if currency_index is None:
+            currency_index = self._currency_indexes[currency] = len(self._currency_codes)
+            self._currency_codes.append(currency)
+        return currency_index
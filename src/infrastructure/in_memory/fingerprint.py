@@ -0,0 +1,45 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from itertools import islice
+from typing import Collection, Iterable
+
+from src.application.transaction.fingerprint import Fingerprint, TransactionFingerprintIndex
+from src.domain.account import AccountId
+
+
+class InMemoryTransactionFingerprintIndex(TransactionFingerprintIndex):
+    def __init__(self) -> None:
+        self._fingerprints: set[Fingerprint] = set()
+        self._account_indexes: dict[AccountId, set[Fingerprint]] = {}
+
+    def add_many(self, account_id: AccountId, fingerprints: Iterable[Fingerprint]) -> None:
+        added = set(fingerprints).difference(self._fingerprints)
+        if added:
+            self._fingerprints.update(added)
+            self._account_indexes.setdefault(account_id, set()).update(added)
+
+    def known(self, fingerprints: Collection[Fingerprint]) -> set[Fingerprint]:
+        return self._fingerprints.intersection(fingerprints)
+
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        fingerprints = self._account_indexes.get(account_id, set())
+        deleted = set(islice(fingerprints, limit))
+        fingerprints.difference_update(deleted)
+        self._fingerprints.difference_update(deleted)
+        if not fingerprints:
+            self._account_indexes.pop(account_id, None)
+        return len(deleted)
@@ -0,0 +1,79 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+from typing import Iterator
+
+from src.application.reccurring_transaction.repository import (
+    RecurringTransactionRepository,
+    RecurringTransactionAlreadyExists,
+    RecurringTransactionNotFound,
+)
+from src.domain.account import AccountId
+from src.domain.recurring_transaction import RecurringTransaction, RecurringTransactionId
+
+
+class InMemoryRecurringTransactionRepository(RecurringTransactionRepository):
+    def __init__(self) -> None:
+        self._recurring_transactions: dict[RecurringTransactionId, RecurringTransaction] = {}
+        self._account_indexes: dict[AccountId, dict[RecurringTransactionId, None]] = {}
+
+    def add(self, recurring_transaction: RecurringTransaction) -> None:
+        if recurring_transaction.id in self._recurring_transactions:
+            raise RecurringTransactionAlreadyExists(recurring_transaction_id=recurring_transaction.id)
+        self._store(copy.copy(recurring_transaction))
+
+    def retrieve(self, id_: RecurringTransactionId) -> RecurringTransaction:
+        try:
+            return copy.copy(self._recurring_transactions[id_])
+        except KeyError as e:
+            raise RecurringTransactionNotFound(recurring_transaction_id=id_) from e
+
+    def delete(self, id_: RecurringTransactionId) -> None:
+        try:
+            recurring_transaction = self._recurring_transactions[id_]
+        except KeyError as e:
+            raise RecurringTransactionNotFound(recurring_transaction_id=id_) from e
+        self._unstore(recurring_transaction)
+
+    def update(self, recurring_transaction: RecurringTransaction) -> None:
+        try:
+            previous = self._recurring_transactions[recurring_transaction.id]
+        except KeyError as e:
+            raise RecurringTransactionNotFound(recurring_transaction_id=recurring_transaction.id) from e
+        self._unstore(previous)
+        self._store(copy.copy(recurring_transaction))
+
+    def delete_by_account(self, account_id: AccountId) -> int:
+        ids = self._account_indexes.pop(account_id, {})
+        for id_ in ids:
+            del self._recurring_transactions[id_]
+        return len(ids)
+
+    def list_by_account(self, account_id: AccountId) -> Iterator[RecurringTransaction]:
+        for id_ in list(self._account_indexes.get(account_id, ())):
+            yield copy.copy(self._recurring_transactions[id_])
+
+    def _store(self, recurring_transaction: RecurringTransaction) -> None:
+        self._recurring_transactions[recurring_transaction.id] = recurring_transaction
+        self._account_indexes.setdefault(recurring_transaction.account_id, {})[recurring_transaction.id] = None
+
+    def _unstore(self, recurring_transaction: RecurringTransaction) -> None:
+        del self._recurring_transactions[recurring_transaction.id]
+        account_index = self._account_indexes[recurring_transaction.account_id]
+        del account_index[recurring_transaction.id]
+        if not account_index:
+            del self._account_indexes[recurring_transaction.account_id]
@@ -0,0 +1,117 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from array import array
+from itertools import accumulate
+from operator import add, mul
+from typing import Callable
+from zlib import crc32
+
+_EMPTY = 0
+_REMOVED = -1
+_MIN_SLOTS = 1024
+
+
+class RowIndex:
+    """
+    Open-addressing hash table from fixed-width keys to row numbers. The keys stay in the caller's columns: the table
+    is a single int64 array holding the row number plus one of each slot, 0 when the slot is empty and -1 once its
+    row was removed, so that it can be saved and mapped back as is. Keys are hashed with CRC-32, which is stable
+    across processes.
+
+    :param key_at: key of a row
+    :param slots: table to adopt, e.g. mapped from a snapshot; it is copied on the first change
+    :param used: number of slots of the adopted table which are not empty
+    """
+
+    def __init__(self, key_at: Callable[[int], bytes], slots: array | memoryview | None = None, used: int = 0) -> None:
+        self._key_at = key_at
+        self._slots = array("q", [_EMPTY]) * _MIN_SLOTS if slots is None else slots
+        self._used = used
+
+    @property
+    def slots(self) -> array | memoryview:
+        return self._slots
+
+    @property
+    def used(self) -> int:
+        return self._used
+
+    def get(self, key: bytes) -> int | None:
+        mask = len(self._slots) - 1
+        slot = crc32(key) & mask
+        while (entry := self._slots[slot]) != _EMPTY:
+            if entry != _REMOVED and self._key_at(entry - 1) == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+        return None
+
+    def add(self, key: bytes, row: int) -> None:
+        """
+        :param key: a key which is not in the index yet
+        :param row:
+        """
+        if (self._used + 1) * 2 > len(self._slots):
+            self._resize()
+        slots = self._writable_slots()
+        mask = len(slots) - 1
+        slot = crc32(key) & mask
+        while slots[slot] > _EMPTY:
+            slot = (slot + 1) & mask
+        if slots[slot] == _EMPTY:
+            self._used += 1
+        slots[slot] = row + 1
+
+    def remove(self, key: bytes) -> None:
+        """
+        :param key:
+        :raises KeyError: the key is not in the index
+        """
+        slots = self._writable_slots()
+        mask = len(slots) - 1
+        slot = crc32(key) & mask
+        while (entry := slots[slot]) != _EMPTY:
+            if entry != _REMOVED and self._key_at(entry - 1) == key:
+                slots[slot] = _REMOVED
+                return
+            slot = (slot + 1) & mask
+        raise KeyError(key)
+
+    def compact(self, live: bytearray | memoryview) -> None:
+        """
+        Follow the removal of the rows which are not live, the others being renumbered in order.
+        :param live: 1 for every row which is kept, 0 for the others
+        """
+        # Entries are shifted by one so that removed (-1) and empty (0) slots index the head of the mapping, and a
+        # kept row maps to the count of kept rows up to itself, which is its new number plus one
+        mapping = array("q", [_REMOVED, _EMPTY])
+        mapping.extend(map((-1).__add__, map(add, map(mul, accumulate(live), live), live)))
+        self._slots = array("q", map(mapping.__getitem__, map((1).__add__, self._slots)))
+
+    def _writable_slots(self) -> array:
+        if not isinstance(self._slots, array):
+            self._slots = array("q", self._slots.tobytes())
+        return self._slots
+
+    def _resize(self) -> None:
+        rows = [entry - 1 for entry in self._slots if entry > _EMPTY]
+        size = _MIN_SLOTS
+        while size < len(rows) * 4:
+            size *= 2
+        self._slots = array("q", [_EMPTY]) * size
+        self._used = 0
+        for row in rows:
+            self.add(self._key_at(row), row)
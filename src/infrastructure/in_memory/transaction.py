@@ -0,0 +1,163 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+import datetime
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Iterator, Sequence
+
+from src.application.transaction.repository import (
+    TransactionRepository,
+    TransactionAlreadyExists,
+    TransactionNotFound,
+    TransactionCursor,
+    TransactionOperation,
+    TransactionOperationResult,
+    TransactionAddition,
+    TransactionReplacement,
+    TransactionRemoval,
+)
+from src.domain.account import AccountId
+from src.domain.transaction import Transaction, TransactionId
+
+_IndexKey = tuple[int, str]
+
+
+def _index_key(transaction: Transaction) -> _IndexKey:
+    return transaction.date.toordinal(), str(transaction.id)
+
+
+class InMemoryTransactionRepository(TransactionRepository):
+    """
+    Transactions are kept in a dict by id, and every account keeps its transaction keys sorted by date so that
+    range listings are bisections instead of full scans.
+    """
+
+    def __init__(self) -> None:
+        self._transactions: dict[TransactionId, Transaction] = {}
+        self._ids: dict[str, TransactionId] = {}
+        self._account_indexes: dict[AccountId, list[_IndexKey]] = {}
+
+    def add(self, transaction: Transaction) -> None:
+        if transaction.id in self._transactions:
+            raise TransactionAlreadyExists(transaction_id=transaction.id)
+        self._store(copy.copy(transaction))
+
+    def add_many(self, transactions: Iterable[Transaction]) -> None:
+        pending: dict[TransactionId, Transaction] = {}
+        for transaction in transactions:
+            if transaction.id in self._transactions or transaction.id in pending:
+                raise TransactionAlreadyExists(transaction_id=transaction.id)
+            pending[transaction.id] = copy.copy(transaction)
+        for transaction in pending.values():
+            self._store(transaction)
+
+    def retrieve(self, id_: TransactionId) -> Transaction:
+        try:
+            return copy.copy(self._transactions[id_])
+        except KeyError as e:
+            raise TransactionNotFound(transaction_id=id_) from e
+
+    def delete(self, id_: TransactionId) -> None:
+        try:
+            transaction = self._transactions[id_]
+        except KeyError as e:
+            raise TransactionNotFound(transaction_id=id_) from e
+        self._unstore(transaction)
+
+    def update(self, transaction: Transaction) -> None:
+        try:
+            previous = self._transactions[transaction.id]
+        except KeyError as e:
+            raise TransactionNotFound(transaction_id=transaction.id) from e
+        self._unstore(previous)
+        self._store(copy.copy(transaction))
+
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        keys = self._account_indexes.get(account_id, [])
+        # The latest transactions go first, so that the account index shrinks from its end
+        start = 0 if limit is None else max(len(keys) - limit, 0)
+        for _, id_ in keys[start:]:
+            del self._transactions[self._ids.pop(id_)]
+        count = len(keys) - start
+        del keys[start:]
+        if not keys:
+            self._account_indexes.pop(account_id, None)
+        return count
+
+    def apply_batch(
+        self, account_id: AccountId, operations: Sequence[TransactionOperation]
+    ) -> list[TransactionOperationResult]:
+        return [self._apply(account_id, operation) for operation in operations]
+
+    def list_by_account(
+        self,
+        account_id: AccountId,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+        limit: int | None = None,
+        cursor: TransactionCursor | None = None,
+    ) -> Iterator[Transaction]:
+        lower: tuple = (date_from.toordinal(),) if date_from else ()
+        if cursor is not None:
+            lower = max(lower, (cursor.date.toordinal(), str(cursor.transaction_id)))
+        upper = (date_to.toordinal() + 1,) if date_to else None
+        remaining = limit
+
+        while remaining is None or remaining > 0:
+            # The position is searched again at each step so that the iteration survives concurrent mutations
+            keys = self._account_indexes.get(account_id, [])
+            position = bisect_right(keys, lower)
+            if position == len(keys) or (upper is not None and keys[position] >= upper):
+                return
+            lower = keys[position]
+            yield copy.copy(self._transactions[self._ids[lower[1]]])
+            if remaining is not None:
+                remaining -= 1
+
+    def _apply(self, account_id: AccountId, operation: TransactionOperation) -> TransactionOperationResult:
+        replacement: Transaction | None
+        match operation:
+            case TransactionAddition(transaction=transaction):
+                if transaction.id in self._transactions:
+                    return TransactionOperationResult(error=TransactionAlreadyExists(transaction_id=transaction.id))
+                self._store(copy.copy(transaction))
+                return TransactionOperationResult()
+            case TransactionReplacement(transaction=replacement):
+                transaction_id = replacement.id
+            case TransactionRemoval(transaction_id=transaction_id):
+                replacement = None
+
+        previous = self._transactions.get(transaction_id)
+        if previous is None or previous.account_id != account_id:
+            return TransactionOperationResult(error=TransactionNotFound(transaction_id=transaction_id))
+        self._unstore(previous)
+        if replacement is not None:
+            self._store(copy.copy(replacement))
+        return TransactionOperationResult(previous=previous)
+
+    def _store(self, transaction: Transaction) -> None:
+        self._transactions[transaction.id] = transaction
+        self._ids[str(transaction.id)] = transaction.id
+        insort(self._account_indexes.setdefault(transaction.account_id, []), _index_key(transaction))
+
+    def _unstore(self, transaction: Transaction) -> None:
+        del self._transactions[transaction.id]
+        del self._ids[str(transaction.id)]
+        keys = self._account_indexes[transaction.account_id]
+        del keys[bisect_left(keys, _index_key(transaction))]
+        if not keys:
+            del self._account_indexes[transaction.account_id]
@@ -0,0 +1,39 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from src.shared.application.unit_of_work import UnitOfWork
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """
+    Units of work are isolated from each other by a lock, but in-memory changes are not undone on error: repositories
+    check what they can before changing anything.
+
+    :param lock: lock taken by the repositories on every change, if any, so that they are isolated from the units of
+    work too
+    """
+
+    def __init__(self, lock: "threading.RLock | None" = None) -> None:
+        self._lock = threading.RLock() if lock is None else lock
+
+    @contextmanager
+    def atomic(self) -> Iterator[None]:
+        with self._lock:
+            yield
@@ -0,0 +1,85 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+
+from src.application.user.repository import (
+    UserRepository,
+    UserAlreadyExists,
+    UserNotFound,
+    UserEmailAddressNotFound,
+    UserEmailAddressAlreadyUsed,
+)
+from src.domain.user import User, UserId
+from src.shared.domain.email import EmailAddress
+
+
+class InMemoryUserRepository(UserRepository):
+    """
+    Users are kept in a dict by id, along with their ids by email address so that signing in is not a full scan and
+    an email address belongs to one user only.
+    """
+
+    def __init__(self) -> None:
+        self._users: dict[UserId, User] = {}
+        self._ids_by_email_address: dict[EmailAddress, UserId] = {}
+
+    def add(self, user: User) -> None:
+        if user.id in self._users:
+            raise UserAlreadyExists(user_id=user.id)
+        self._check_email_address_unused(user)
+        self._store(copy.copy(user))
+
+    def retrieve(self, id_: UserId) -> User:
+        try:
+            return copy.copy(self._users[id_])
+        except KeyError as e:
+            raise UserNotFound(user_id=id_) from e
+
+    def retrieve_by_email_address(self, email_address: EmailAddress) -> User:
+        try:
+            return copy.copy(self._users[self._ids_by_email_address[email_address]])
+        except KeyError as e:
+            raise UserEmailAddressNotFound(email_address=email_address) from e
+
+    def update(self, user: User) -> None:
+        try:
+            previous = self._users[user.id]
+        except KeyError as e:
+            raise UserNotFound(user_id=user.id) from e
+        self._check_email_address_unused(user)
+        self._unstore(previous)
+        self._store(copy.copy(user))
+
+    def delete(self, id_: UserId) -> None:
+        try:
+            user = self._users[id_]
+        except KeyError as e:
+            raise UserNotFound(user_id=id_) from e
+        self._unstore(user)
+
+    def _store(self, user: User) -> None:
+        self._users[user.id] = user
+        self._ids_by_email_address[user.email_address] = user.id
+
+    def _unstore(self, user: User) -> None:
+        del self._users[user.id]
+        if self._ids_by_email_address.get(user.email_address) == user.id:
+            del self._ids_by_email_address[user.email_address]
+
+    def _check_email_address_unused(self, user: User) -> None:
+        if self._ids_by_email_address.get(user.email_address, user.id) != user.id:
+            raise UserEmailAddressAlreadyUsed(email_address=user.email_address)
@@ -0,0 +1,66 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+
+class TokenBucketLimiter:
+    """
+    One token bucket per key, holding up to `burst` tokens and refilled with `rate` tokens per second. A bucket left
+    alone long enough to be full again is the same as no bucket, so buckets are evicted once idle that long, and the
+    limiter only keeps the keys seen recently.
+
+    :param clock: seconds, only compared with each other
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._refill_time = burst / rate
+        self._clock = clock
+        # Key to tokens left and time of the last update, the least recently updated first
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, key: Hashable) -> float:
+        """
+        Take a token from the bucket of `key`.
+
+        :return: 0 when a token was taken, otherwise the seconds to wait for the next one
+        """
+        with self._lock:
+            now = self._clock()
+            self._evict(now)
+            tokens, updated_at = self._buckets.pop(key, (self._burst, now))
+            tokens = min(self._burst, tokens + (now - updated_at) * self._rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / self._rate
+
+    def _evict(self, now: float) -> None:
+        while self._buckets:
+            key, (_, updated_at) = next(iter(self._buckets.items()))
+            if now - updated_at < self._refill_time:
+                break
+            del self._buckets[key]
@@ -0,0 +1,30 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from uuid import uuid4
+
+from src.domain.recurring_transaction import RecurringTransactionId
+from src.shared.application.id import IdFactory
+from src.infrastructure.id import UUIDBase
+
+
+class RecurringTransactionUUID(RecurringTransactionId, UUIDBase):
+    __slots__ = ()
+
+
+class RecurringTransactionUUIDFactory(IdFactory[RecurringTransactionId]):
+    def generate_id(self) -> RecurringTransactionId:
+        return RecurringTransactionUUID.trusted(str(uuid4()))
@@ -0,0 +1,335 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from typing import BinaryIO, Callable, Iterable, Iterator, Sequence
+
+from src.application.transaction.repository import (
+    TransactionRepository,
+    TransactionCursor,
+    TransactionOperation,
+    TransactionOperationResult,
+    TransactionAddition,
+    TransactionReplacement,
+    TransactionRemoval,
+)
+from src.domain.account import AccountId
+from src.domain.transaction import Transaction, TransactionId
+from src.infrastructure.in_memory.columnar_transaction import ColumnarTransactionRepository
+from src.shared.domain.money import Money
+
+_FILE_NAME = re.compile(r"^(snapshot|log)-(\d{8})\.bin\Z")
+
+# Checksum of the rest of the record, payload size and operation
+_RECORD_HEADER = struct.Struct("<IIB")
+_ADD, _REMOVE, _REMOVE_ACCOUNT = 1, 2, 3
+# Date ordinal, amount in minor units, currency and account id size, between the id and the account id
+_ADDITION = struct.Struct("<iq3sH")
+# Number of transactions removed, before the account id
+_ACCOUNT_REMOVAL = struct.Struct("<Q")
+
+
+class SnapshotTransactionRepository(TransactionRepository):
+    """
+    Columnar transaction repository persisted in a directory as a snapshot, memory-mapped at start-up so that nothing
+    is read before it is used, plus an append log of the changes made since that snapshot. Once the log outgrows
+    `compaction_log_size` bytes, a background thread compacts a copy of the repository into the next snapshot and
+    drops the files it supersedes.
+
+    Generation `n` snapshot holds every change of the logs before generation `n`: starting up maps the latest
+    snapshot and replays the logs from its generation on. A record torn by a crash is detected by its checksum and
+    truncated.
+
+    Changes are applied as they are made, whatever unit of work they are made in: they are not undone by a rollback.
+
+    :param directory:
+    :param id_to_bytes: see ColumnarTransactionRepository
+    :param id_from_bytes:
+    :param account_id_to_bytes:
+    :param account_id_from_bytes:
+    :param id_size:
+    :param compaction_log_size:
+    :param fsync: whether every change is synced to disk before returning, instead of being left to the OS
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        id_to_bytes: Callable[[TransactionId], bytes],
+        id_from_bytes: Callable[[bytes], TransactionId],
+        account_id_to_bytes: Callable[[AccountId], bytes],
+        account_id_from_bytes: Callable[[bytes], AccountId],
+        id_size: int = 16,
+        compaction_log_size: int = 64 * 2**20,
+        fsync: bool = False,
+    ) -> None:
+        self._directory = directory
+        self._id_to_bytes = id_to_bytes
+        self._id_from_bytes = id_from_bytes
+        self._account_id_to_bytes = account_id_to_bytes
+        self._account_id_from_bytes = account_id_from_bytes
+        self._compaction_log_size = compaction_log_size
+        self._fsync = fsync
+        self._lock = threading.RLock()
+        self._compaction: threading.Thread | None = None
+
+        os.makedirs(directory, exist_ok=True)
+        snapshots, logs = self._generations()
+        self._repository = ColumnarTransactionRepository(id_to_bytes, id_from_bytes, id_size)
+        generation = 0
+        if snapshots:
+            generation = snapshots[-1]
+            with open(self._path("snapshot", generation), "rb") as file:
+                # The mapping outlives the file, and is released with the last view on it
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._repository = ColumnarTransactionRepository.load(
+                memoryview(mapped), id_to_bytes, id_from_bytes, account_id_from_bytes
+            )
+        for log_generation in logs:
+            if log_generation >= generation:
+                self._replay(self._path("log", log_generation))
+                generation = log_generation
+        # Changes go on in the last log, or in the first log after the snapshot
+        self._log_generation = max(generation, 1)
+        self._log = open(self._path("log", self._log_generation), "ab")
+
+    def add(self, transaction: Transaction) -> None:
+        with self._lock:
+            self._repository.add(transaction)
+            self._append([self._addition(transaction)])
+
+    def add_many(self, transactions: Iterable[Transaction]) -> None:
+        transactions = list(transactions)
+        with self._lock:
+            self._repository.add_many(transactions)
+            self._append([self._addition(transaction) for transaction in transactions])
+
+    def retrieve(self, id_: TransactionId) -> Transaction:
+        with self._lock:
+            return self._repository.retrieve(id_)
+
+    def delete(self, id_: TransactionId) -> None:
+        with self._lock:
+            self._repository.delete(id_)
+            self._append([self._removal(id_)])
+
+    def update(self, transaction: Transaction) -> None:
+        with self._lock:
+            self._repository.update(transaction)
+            self._append([self._removal(transaction.id), self._addition(transaction)])
+
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        with self._lock:
+            count = self._repository.delete_by_account(account_id, limit)
+            if count:
+                # Replaying removes the same transactions: the latest ones of the account
+                payload = _ACCOUNT_REMOVAL.pack(count) + self._account_id_to_bytes(account_id)
+                self._append([self._record(_REMOVE_ACCOUNT, payload)])
+        return count
+
+    def apply_batch(
+        self, account_id: AccountId, operations: Sequence[TransactionOperation]
+    ) -> list[TransactionOperationResult]:
+        with self._lock:
+            results = self._repository.apply_batch(account_id, operations)
+            records = []
+            for operation, result in zip(operations, results):
+                if result.error is not None:
+                    continue
+                match operation:
+                    case TransactionAddition(transaction=transaction):
+                        records.append(self._addition(transaction))
+                    case TransactionReplacement(transaction=transaction):
+                        records += [self._removal(transaction.id), self._addition(transaction)]
+                    case TransactionRemoval(transaction_id=transaction_id):
+                        records.append(self._removal(transaction_id))
+            self._append(records)
+        return results
+
+    def list_by_account(
+        self,
+        account_id: AccountId,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+        limit: int | None = None,
+        cursor: TransactionCursor | None = None,
+    ) -> Iterator[Transaction]:
+        listed = self._repository.list_by_account(account_id, date_from, date_to, limit, cursor)
+        while True:
+            with self._lock:
+                transaction = next(listed, None)
+            if transaction is None:
+                return
+            yield transaction
+
+    def write_snapshot(self) -> None:
+        """
+        Write the next snapshot from a compacted copy of the repository, then drop the files it supersedes.
+        Only the copy is made under the lock: changes go on meanwhile, into the next log.
+        """
+        with self._lock:
+            generation = self._log_generation + 1
+            self._rotate_log(generation)
+            repository = self._repository.copy()
+        repository.compact()
+
+        path = self._path("snapshot", generation)
+        with open(f"{path}.tmp", "wb") as file:
+            repository.save(file, self._account_id_to_bytes)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{path}.tmp", path)
+        self._sync_directory()
+
+        snapshots, logs = self._generations()
+        for kind, generations in (("snapshot", snapshots), ("log", logs)):
+            for superseded in generations:
+                if superseded < generation:
+                    os.remove(self._path(kind, superseded))
+
+    def close(self) -> None:
+        if self._compaction is not None:
+            self._compaction.join()
+        with self._lock:
+            self._sync(self._log)
+            self._log.close()
+
+    def _append(self, records: list[bytes]) -> None:
+        if not records:
+            return
+        self._log.write(b"".join(records))
+        self._log.flush()
+        if self._fsync:
+            os.fsync(self._log.fileno())
+        if self._log.tell() >= self._compaction_log_size and (
+            self._compaction is None or not self._compaction.is_alive()
+        ):
+            self._compaction = threading.Thread(target=self.write_snapshot, name="transaction-snapshot", daemon=True)
+            self._compaction.start()
+
+    def _addition(self, transaction: Transaction) -> bytes:
+        account_id = self._account_id_to_bytes(transaction.account_id)
+        payload = b"".join(
+            (
+                self._id_to_bytes(transaction.id),
+                _ADDITION.pack(
+                    transaction.date.toordinal(),
+                    transaction.amount.minor_units,
+                    transaction.amount.currency.encode("ascii"),
+                    len(account_id),
+                ),
+                account_id,
+                transaction.label.encode(),
+            )
+        )
+        return self._record(_ADD, payload)
+
+    def _removal(self, id_: TransactionId) -> bytes:
+        return self._record(_REMOVE, self._id_to_bytes(id_))
+
+    @staticmethod
+    def _record(operation: int, payload: bytes) -> bytes:
+        checksum = zlib.crc32(payload, zlib.crc32(bytes((operation,))))
+        return _RECORD_HEADER.pack(checksum, len(payload), operation) + payload
+
+    def _replay(self, path: str) -> None:
+        with open(path, "rb") as file:
+            log = file.read()
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(log):
+            checksum, size, operation = _RECORD_HEADER.unpack_from(log, offset)
+            payload = log[offset + _RECORD_HEADER.size : offset + _RECORD_HEADER.size + size]
+            if len(payload) != size or zlib.crc32(payload, zlib.crc32(bytes((operation,)))) != checksum:
+                break
+            if operation == _ADD:
+                self._repository.add(self._transaction(payload))
+            elif operation == _REMOVE:
+                self._repository.delete(self._id_from_bytes(payload))
+            else:
+                (count,) = _ACCOUNT_REMOVAL.unpack_from(payload)
+                account_id = self._account_id_from_bytes(payload[_ACCOUNT_REMOVAL.size :])
+                self._repository.delete_by_account(account_id, count)
+            offset += _RECORD_HEADER.size + size
+        if offset != len(log):
+            # The last changes were torn by a crash before they were acknowledged
+            with open(path, "r+b") as file:
+                file.truncate(offset)
+
+    def _transaction(self, payload: bytes) -> Transaction:
+        id_size = self._repository.id_size
+        ordinal, minor_units, currency, account_id_size = _ADDITION.unpack_from(payload, id_size)
+        account_id_offset = id_size + _ADDITION.size
+        label_offset = account_id_offset + account_id_size
+        return Transaction(
+            self._id_from_bytes(payload[:id_size]),
+            self._account_id_from_bytes(payload[account_id_offset:label_offset]),
+            datetime.date.fromordinal(ordinal),
+            payload[label_offset:].decode(),
+            Money(minor_units, currency.decode("ascii")),
+        )
+
+    def _rotate_log(self, generation: int) -> None:
+        self._sync(self._log)
+        self._log.close()
+        self._log_generation = generation
+        self._log = open(self._path("log", generation), "ab")
+
+    def _generations(self) -> tuple[list[int], list[int]]:
+        snapshots: list[int] = []
+        logs: list[int] = []
+        for name in os.listdir(self._directory):
+            match = _FILE_NAME.match(name)
+            if match:
+                (snapshots if match[1] == "snapshot" else logs).append(int(match[2]))
+        return sorted(snapshots), sorted(logs)
+
+    def _path(self, kind: str, generation: int) -> str:
+        return os.path.join(self._directory, f"{kind}-{generation:08}.bin")
+
+    @staticmethod
+    def _sync(file: BinaryIO) -> None:
+        file.flush()
+        os.fsync(file.fileno())
+
+    def _sync_directory(self) -> None:
+        directory = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def snapshot_transaction_repository(
+    directory: str,
+    id_to_bytes: Callable[[TransactionId], bytes],
+    id_from_bytes: Callable[[bytes], TransactionId],
+    account_id_to_bytes: Callable[[AccountId], bytes],
+    account_id_from_bytes: Callable[[bytes], AccountId],
+) -> Iterator[SnapshotTransactionRepository]:
+    """
+    Container resource: the log is synced and closed when the container resources are shut down.
+    """
+    repository = SnapshotTransactionRepository(
+        directory, id_to_bytes, id_from_bytes, account_id_to_bytes, account_id_from_bytes
+    )
+    yield repository
+    repository.close()
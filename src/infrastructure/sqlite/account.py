@@ -0,0 +1,97 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import sqlite3
+from typing import Iterator
+
+from src.application.account.repository import AccountRepository, AccountAlreadyExists, AccountNotFound
+from src.domain.account import Account, AccountId, AccountName
+from src.domain.user import UserId
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.user.id import UserUUID
+from src.shared.domain.money import Money
+
+_INSERT = "INSERT INTO account (id, user_id, name, reference_balance, currency) VALUES (?, ?, ?, ?, ?)"
+_SELECT = "SELECT id, user_id, name, reference_balance, currency FROM account WHERE id = ?"
+_LIST_BY_USER = "SELECT id, user_id, name, reference_balance, currency FROM account WHERE user_id = ?"
+_UPDATE = "UPDATE account SET user_id = ?, name = ?, reference_balance = ?, currency = ? WHERE id = ?"
+_DELETE = "DELETE FROM account WHERE id = ?"
+
+
+class SqliteAccountRepository(AccountRepository):
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    def add(self, account: Account) -> None:
+        try:
+            with self._database.transaction() as connection:
+                connection.execute(
+                    _INSERT,
+                    (
+                        uuid_bytes(account.id),
+                        uuid_bytes(account.user_id),
+                        str(account.name),
+                        account.reference_balance.minor_units,
+                        account.reference_balance.currency,
+                    ),
+                )
+        except sqlite3.IntegrityError as e:
+            raise AccountAlreadyExists(account_id=account.id) from e
+
+    def retrieve(self, id_: AccountId) -> Account:
+        with self._database.read() as connection:
+            row = connection.execute(_SELECT, (uuid_bytes(id_),)).fetchone()
+        if row is None:
+            raise AccountNotFound(account_id=id_)
+        return self._load(row)
+
+    def delete(self, id_: AccountId) -> None:
+        with self._database.transaction() as connection:
+            cursor = connection.execute(_DELETE, (uuid_bytes(id_),))
+        if not cursor.rowcount:
+            raise AccountNotFound(account_id=id_)
+
+    def update(self, account: Account) -> None:
+        with self._database.transaction() as connection:
+            cursor = connection.execute(
+                _UPDATE,
+                (
+                    uuid_bytes(account.user_id),
+                    str(account.name),
+                    account.reference_balance.minor_units,
+                    account.reference_balance.currency,
+                    uuid_bytes(account.id),
+                ),
+            )
+        if not cursor.rowcount:
+            raise AccountNotFound(account_id=account.id)
+
+    def list_by_user(self, user_id: UserId) -> Iterator[Account]:
+        with self._database.read() as connection:
+            rows = connection.execute(_LIST_BY_USER, (uuid_bytes(user_id),)).fetchall()
+        for row in rows:
+            yield self._load(row)
+
+    @staticmethod
+    def _load(row: tuple) -> Account:
+        return Account(
+            id_=AccountUUID.from_bytes(row[0]),
+            user_id=UserUUID.from_bytes(row[1]),
+            name=AccountName.trusted(row[2]),
+            reference_balance=Money(row[3], row[4]),
+        )
@@ -0,0 +1,48 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from src.application.account.tombstone import AccountTombstoneRepository
+from src.domain.account import AccountId
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.sqlite.database import SqliteDatabase
+
+_INSERT = "INSERT OR IGNORE INTO account_tombstone (account_id) VALUES (?)"
+_EXISTS = "SELECT 1 FROM account_tombstone WHERE account_id = ?"
+_DELETE = "DELETE FROM account_tombstone WHERE account_id = ?"
+_LIST = "SELECT account_id FROM account_tombstone"
+
+
+class SqliteAccountTombstoneRepository(AccountTombstoneRepository):
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    def add(self, account_id: AccountId) -> None:
+        with self._database.transaction() as connection:
+            connection.execute(_INSERT, (uuid_bytes(account_id),))
+
+    def exists(self, account_id: AccountId) -> bool:
+        with self._database.read() as connection:
+            return connection.execute(_EXISTS, (uuid_bytes(account_id),)).fetchone() is not None
+
+    def delete(self, account_id: AccountId) -> None:
+        with self._database.transaction() as connection:
+            connection.execute(_DELETE, (uuid_bytes(account_id),))
+
+    def list_account_ids(self) -> list[AccountId]:
+        with self._database.read() as connection:
+            rows = connection.execute(_LIST).fetchall()
+        return [AccountUUID.from_bytes(row[0]) for row in rows]
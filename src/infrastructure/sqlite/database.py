@@ -0,0 +1,164 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS user (
+    id BLOB PRIMARY KEY,
+    email_address TEXT NOT NULL,
+    username TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS user_email_address ON user (email_address);
+
+CREATE TABLE IF NOT EXISTS user_password (
+    user_id BLOB PRIMARY KEY,
+    hash TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS account (
+    id BLOB PRIMARY KEY,
+    user_id BLOB NOT NULL,
+    name TEXT NOT NULL,
+    reference_balance INTEGER NOT NULL,
+    currency TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS account_user_id ON account (user_id);
+
+CREATE TABLE IF NOT EXISTS account_tombstone (
+    account_id BLOB PRIMARY KEY
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS account_transaction (
+    id BLOB PRIMARY KEY,
+    account_id BLOB NOT NULL,
+    date TEXT NOT NULL,
+    label TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    currency TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS account_transaction_account_id_date ON account_transaction (account_id, date);
+
+CREATE TABLE IF NOT EXISTS transaction_fingerprint (
+    fingerprint BLOB PRIMARY KEY,
+    account_id BLOB NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS transaction_fingerprint_account_id ON transaction_fingerprint (account_id);
+
+CREATE TABLE IF NOT EXISTS recurring_transaction (
+    id BLOB PRIMARY KEY,
+    account_id BLOB NOT NULL,
+    name TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    frequency TEXT NOT NULL,
+    frequency_day INTEGER,
+    frequency_month INTEGER
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS recurring_transaction_account_id ON recurring_transaction (account_id);
+
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recipient TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS email_outbox_next_attempt_at ON email_outbox (next_attempt_at);
+"""
+
+
+class SqliteDatabase:
+    """
+    Connections to the database, in WAL mode. Writes go through one connection, one transaction at a time, while each
+    thread reads through a connection of its own, so that readers never wait for the writer nor for one another.
+    A thread in a write transaction reads through the write connection, to see its own changes, and so do all the
+    threads of an in-memory database, which a second connection would not share.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._connection = self._connect()
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._writer: int | None = None
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._shared = path in ("", ":memory:")
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run the block inside a write transaction, committed on exit and rolled back on error.
+        Nested calls join the outermost transaction.
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self._connection
+                finally:
+                    self._depth -= 1
+                return
+
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            self._writer = threading.get_ident()
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+            finally:
+                self._depth = 0
+                self._writer = None
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run the block with the connection to read from, in autocommit mode: each statement sees the last commit.
+        """
+        if self._shared or self._writer == threading.get_ident():
+            with self._lock:
+                yield self._connection
+            return
+
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+            with self._readers_lock:
+                self._readers.append(connection)
+        yield connection
+
+    def close(self) -> None:
+        with self._lock, self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, isolation_level=None, check_same_thread=False, cached_statements=128)
@@ -0,0 +1,81 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import threading
+import time
+from typing import Callable, Sequence
+
+from src.infrastructure.email.outbox import EmailOutbox, OutboxEmail
+from src.infrastructure.email.transport import EmailMessage
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.shared.domain.email import EmailAddress
+
+_INSERT = "INSERT INTO email_outbox (recipient, subject, body, next_attempt_at) VALUES (?, ?, ?, ?)"
+_SELECT_DUE = (
+    "SELECT id, recipient, subject, body, attempts FROM email_outbox WHERE next_attempt_at <= ? "
+    "ORDER BY next_attempt_at, id LIMIT ?"
+)
+_SELECT_NEXT_ATTEMPT_AT = "SELECT MIN(next_attempt_at) FROM email_outbox"
+_DELETE = "DELETE FROM email_outbox WHERE id = ?"
+_RESCHEDULE = "UPDATE email_outbox SET attempts = attempts + 1, next_attempt_at = ? WHERE id = ?"
+
+
+class SqliteEmailOutbox(EmailOutbox):
+    """
+    Emails are rows of the `email_outbox` table along with the time of their next attempt, and the worker is woken up
+    in process when one is delivered.
+
+    :param clock: seconds since the epoch
+    """
+
+    def __init__(self, database: SqliteDatabase, clock: Callable[[], float] = time.time) -> None:
+        self._database = database
+        self._clock = clock
+        self._delivered = threading.Event()
+
+    def deliver(self, message: EmailMessage) -> None:
+        with self._database.transaction() as connection:
+            connection.execute(_INSERT, (str(message.recipient), message.subject, message.body, self._clock()))
+        self._delivered.set()
+
+    def due(self, limit: int, now: float) -> list[OutboxEmail]:
+        with self._database.read() as connection:
+            rows = connection.execute(_SELECT_DUE, (now, limit)).fetchall()
+        return [
+            OutboxEmail(id_, EmailMessage(EmailAddress.trusted(recipient), subject, body), attempts)
+            for id_, recipient, subject, body, attempts in rows
+        ]
+
+    def next_attempt_at(self) -> float | None:
+        with self._database.read() as connection:
+            return connection.execute(_SELECT_NEXT_ATTEMPT_AT).fetchone()[0]
+
+    def acknowledge(self, ids: Sequence[int]) -> None:
+        if ids:
+            with self._database.transaction() as connection:
+                connection.executemany(_DELETE, ((id_,) for id_ in ids))
+
+    def reschedule(self, attempts: Sequence[tuple[int, float]]) -> None:
+        if attempts:
+            with self._database.transaction() as connection:
+                connection.executemany(_RESCHEDULE, ((at, id_) for id_, at in attempts))
+
+    def wait(self, timeout: float | None) -> None:
+        self._delivered.wait(timeout)
+        self._delivered.clear()
+
+    def wake(self) -> None:
+        self._delivered.set()
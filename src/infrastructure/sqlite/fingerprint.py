@@ -0,0 +1,62 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from itertools import islice
+from typing import Collection, Iterable
+
+from src.application.transaction.fingerprint import Fingerprint, TransactionFingerprintIndex
+from src.domain.account import AccountId
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.sqlite.database import SqliteDatabase
+
+_INSERT = "INSERT OR IGNORE INTO transaction_fingerprint (fingerprint, account_id) VALUES (?, ?)"
+_DELETE_BY_ACCOUNT = "DELETE FROM transaction_fingerprint WHERE account_id = ?"
+# SQLite is not built with DELETE ... LIMIT by default: the rows are selected through the account index instead
+_DELETE_BY_ACCOUNT_LIMITED = (
+    "DELETE FROM transaction_fingerprint WHERE fingerprint IN "
+    "(SELECT fingerprint FROM transaction_fingerprint WHERE account_id = ? LIMIT ?)"
+)
+# Stays below the historical limit of 999 bound parameters per statement
+_QUERY_SIZE = 500
+_SELECT_KNOWN = f"SELECT fingerprint FROM transaction_fingerprint WHERE fingerprint IN ({', '.join('?' * _QUERY_SIZE)})"
+
+
+class SqliteTransactionFingerprintIndex(TransactionFingerprintIndex):
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    def add_many(self, account_id: AccountId, fingerprints: Iterable[Fingerprint]) -> None:
+        account_id_bytes = uuid_bytes(account_id)
+        with self._database.transaction() as connection:
+            connection.executemany(_INSERT, ((fingerprint, account_id_bytes) for fingerprint in fingerprints))
+
+    def known(self, fingerprints: Collection[Fingerprint]) -> set[Fingerprint]:
+        known: set[Fingerprint] = set()
+        remaining = iter(fingerprints)
+        with self._database.read() as connection:
+            while queried := list(islice(remaining, _QUERY_SIZE)):
+                # Padding the last query keeps a single cached statement
+                queried += queried[-1:] * (_QUERY_SIZE - len(queried))
+                known.update(row[0] for row in connection.execute(_SELECT_KNOWN, queried))
+        return known
+
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        with self._database.transaction() as connection:
+            if limit is None:
+                cursor = connection.execute(_DELETE_BY_ACCOUNT, (uuid_bytes(account_id),))
+            else:
+                cursor = connection.execute(_DELETE_BY_ACCOUNT_LIMITED, (uuid_bytes(account_id), limit))
+        return cursor.rowcount
@@ -0,0 +1,162 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import sqlite3
+from typing import Iterator
+
+from src.application.reccurring_transaction.repository import (
+    RecurringTransactionRepository,
+    RecurringTransactionAlreadyExists,
+    RecurringTransactionNotFound,
+)
+from src.domain.recurring_transaction import (
+    RecurringTransaction,
+    RecurringTransactionId,
+    RecurringTransactionName,
+    RecurringFrequency,
+    DailyFrequency,
+    WeeklyFrequency,
+    MonthlyFrequency,
+    YearlyFrequency,
+    Day,
+)
+from src.domain.account import AccountId
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.recurring_transaction.id import RecurringTransactionUUID
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.shared.domain.money import Money
+
+_INSERT = (
+    "INSERT INTO recurring_transaction "
+    "(id, account_id, name, amount, currency, frequency, frequency_day, frequency_month) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT = (
+    "SELECT id, account_id, name, amount, currency, frequency, frequency_day, frequency_month "
+    "FROM recurring_transaction WHERE id = ?"
+)
+_UPDATE = (
+    "UPDATE recurring_transaction "
+    "SET account_id = ?, name = ?, amount = ?, currency = ?, frequency = ?, frequency_day = ?, frequency_month = ? "
+    "WHERE id = ?"
+)
+_DELETE = "DELETE FROM recurring_transaction WHERE id = ?"
+_DELETE_BY_ACCOUNT = "DELETE FROM recurring_transaction WHERE account_id = ?"
+_LIST_BY_ACCOUNT = (
+    "SELECT id, account_id, name, amount, currency, frequency, frequency_day, frequency_month "
+    "FROM recurring_transaction WHERE account_id = ?"
+)
+
+_FrequencyRow = tuple[str, int | None, int | None]
+
+
+def _dump_frequency(frequency: RecurringFrequency) -> _FrequencyRow:
+    match frequency:
+        case DailyFrequency():
+            return "daily", None, None
+        case WeeklyFrequency(day=day):
+            return "weekly", int(day), None
+        case MonthlyFrequency(day=day):
+            return "monthly", day, None
+        case YearlyFrequency(day=day, month=month):
+            return "yearly", day, month
+    raise ValueError(f"Unsupported frequency `{frequency}`")
+
+
+def _load_frequency(kind: str, day: int | None, month: int | None) -> RecurringFrequency:
+    match kind, day, month:
+        case "daily", _, _:
+            return DailyFrequency()
+        case "weekly", int(weekday), _:
+            return WeeklyFrequency(Day(weekday))
+        case "monthly", int(month_day), _:
+            return MonthlyFrequency(month_day)
+        case "yearly", int(month_day), int(year_month):
+            return YearlyFrequency(month_day, year_month)
+    raise ValueError(f"Unsupported frequency `{kind}`")
+
+
+class SqliteRecurringTransactionRepository(RecurringTransactionRepository):
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    def add(self, recurring_transaction: RecurringTransaction) -> None:
+        try:
+            with self._database.transaction() as connection:
+                connection.execute(
+                    _INSERT,
+                    (
+                        uuid_bytes(recurring_transaction.id),
+                        uuid_bytes(recurring_transaction.account_id),
+                        str(recurring_transaction.name),
+                        recurring_transaction.amount.minor_units,
+                        recurring_transaction.amount.currency,
+                        *_dump_frequency(recurring_transaction.frequency),
+                    ),
+                )
+        except sqlite3.IntegrityError as e:
+            raise RecurringTransactionAlreadyExists(recurring_transaction_id=recurring_transaction.id) from e
+
+    def retrieve(self, id_: RecurringTransactionId) -> RecurringTransaction:
+        with self._database.read() as connection:
+            row = connection.execute(_SELECT, (uuid_bytes(id_),)).fetchone()
+        if row is None:
+            raise RecurringTransactionNotFound(recurring_transaction_id=id_)
+        return self._load(row)
+
+    def delete(self, id_: RecurringTransactionId) -> None:
+        with self._database.transaction() as connection:
+            cursor = connection.execute(_DELETE, (uuid_bytes(id_),))
+        if not cursor.rowcount:
+            raise RecurringTransactionNotFound(recurring_transaction_id=id_)
+
+    def update(self, recurring_transaction: RecurringTransaction) -> None:
+        with self._database.transaction() as connection:
+            cursor = connection.execute(
+                _UPDATE,
+                (
+                    uuid_bytes(recurring_transaction.account_id),
+                    str(recurring_transaction.name),
+                    recurring_transaction.amount.minor_units,
+                    recurring_transaction.amount.currency,
+                    *_dump_frequency(recurring_transaction.frequency),
+                    uuid_bytes(recurring_transaction.id),
+                ),
+            )
+        if not cursor.rowcount:
+            raise RecurringTransactionNotFound(recurring_transaction_id=recurring_transaction.id)
+
+    def delete_by_account(self, account_id: AccountId) -> int:
+        with self._database.transaction() as connection:
+            cursor = connection.execute(_DELETE_BY_ACCOUNT, (uuid_bytes(account_id),))
+        return cursor.rowcount
+
+    def list_by_account(self, account_id: AccountId) -> Iterator[RecurringTransaction]:
+        with self._database.read() as connection:
+            rows = connection.execute(_LIST_BY_ACCOUNT, (uuid_bytes(account_id),)).fetchall()
+        for row in rows:
+            yield self._load(row)
+
+    @staticmethod
+    def _load(row: tuple) -> RecurringTransaction:
+        return RecurringTransaction(
+            id_=RecurringTransactionUUID.from_bytes(row[0]),
+            account_id=AccountUUID.from_bytes(row[1]),
+            name=RecurringTransactionName.trusted(row[2]),
+            amount=Money(row[3], row[4]),
+            frequency=_load_frequency(row[5], row[6], row[7]),
+        )
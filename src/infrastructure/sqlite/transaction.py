@@ -0,0 +1,230 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import sqlite3
+from typing import Iterable, Iterator, Sequence
+
+from src.application.transaction.repository import (
+    TransactionRepository,
+    TransactionAlreadyExists,
+    TransactionNotFound,
+    TransactionCursor,
+    TransactionOperation,
+    TransactionOperationResult,
+    TransactionAddition,
+    TransactionReplacement,
+    TransactionRemoval,
+)
+from src.domain.account import AccountId
+from src.domain.transaction import Transaction, TransactionId
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.transaction.id import TransactionUUID
+from src.shared.domain.money import Money
+
+_INSERT = "INSERT INTO account_transaction (id, account_id, date, label, amount, currency) VALUES (?, ?, ?, ?, ?, ?)"
+_SELECT = "SELECT id, account_id, date, label, amount, currency FROM account_transaction WHERE id = ?"
+_UPDATE = "UPDATE account_transaction SET account_id = ?, date = ?, label = ?, amount = ?, currency = ? WHERE id = ?"
+_DELETE = "DELETE FROM account_transaction WHERE id = ?"
+_DELETE_BY_ACCOUNT = "DELETE FROM account_transaction WHERE account_id = ?"
+# SQLite is not built with DELETE ... LIMIT by default: the rows are selected through the account index instead
+_DELETE_BY_ACCOUNT_LIMITED = (
+    "DELETE FROM account_transaction WHERE id IN "
+    "(SELECT id FROM account_transaction WHERE account_id = ? ORDER BY date DESC, id DESC LIMIT ?)"
+)
+_SELECT_IN_ACCOUNT = (
+    "SELECT id, account_id, date, label, amount, currency FROM account_transaction WHERE id = ? AND account_id = ?"
+)
+_LIST_BY_ACCOUNT = (
+    "SELECT id, account_id, date, label, amount, currency FROM account_transaction "
+    "WHERE account_id = ? AND date >= ? AND date <= ? AND (date, id) > (?, ?) "
+    "ORDER BY date, id LIMIT ?"
+)
+_PAGE_SIZE = 512
+
+
+class SqliteTransactionRepository(TransactionRepository):
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    def add(self, transaction: Transaction) -> None:
+        try:
+            with self._database.transaction() as connection:
+                connection.execute(
+                    _INSERT,
+                    (
+                        uuid_bytes(transaction.id),
+                        uuid_bytes(transaction.account_id),
+                        transaction.date.isoformat(),
+                        transaction.label,
+                        transaction.amount.minor_units,
+                        transaction.amount.currency,
+                    ),
+                )
+        except sqlite3.IntegrityError as e:
+            raise TransactionAlreadyExists(transaction_id=transaction.id) from e
+
+    def add_many(self, transactions: Iterable[Transaction]) -> None:
+        # The rows are produced while being inserted, so the transaction being inserted on failure is the last one
+        current: list[Transaction] = []
+
+        def rows() -> Iterator[tuple]:
+            for transaction in transactions:
+                current[:] = [transaction]
+                yield (
+                    uuid_bytes(transaction.id),
+                    uuid_bytes(transaction.account_id),
+                    transaction.date.isoformat(),
+                    transaction.label,
+                    transaction.amount.minor_units,
+                    transaction.amount.currency,
+                )
+
+        try:
+            with self._database.transaction() as connection:
+                connection.executemany(_INSERT, rows())
+        except sqlite3.IntegrityError as e:
+            raise TransactionAlreadyExists(transaction_id=current[0].id) from e
+
+    def retrieve(self, id_: TransactionId) -> Transaction:
+        with self._database.read() as connection:
+            row = connection.execute(_SELECT, (uuid_bytes(id_),)).fetchone()
+        if row is None:
+            raise TransactionNotFound(transaction_id=id_)
+        return self._load(row)
+
+    def delete(self, id_: TransactionId) -> None:
+        with self._database.transaction() as connection:
+            cursor = connection.execute(_DELETE, (uuid_bytes(id_),))
+        if not cursor.rowcount:
+            raise TransactionNotFound(transaction_id=id_)
+
+    def update(self, transaction: Transaction) -> None:
+        with self._database.transaction() as connection:
+            cursor = connection.execute(
+                _UPDATE,
+                (
+                    uuid_bytes(transaction.account_id),
+                    transaction.date.isoformat(),
+                    transaction.label,
+                    transaction.amount.minor_units,
+                    transaction.amount.currency,
+                    uuid_bytes(transaction.id),
+                ),
+            )
+        if not cursor.rowcount:
+            raise TransactionNotFound(transaction_id=transaction.id)
+
+    def delete_by_account(self, account_id: AccountId, limit: int | None = None) -> int:
+        with self._database.transaction() as connection:
+            if limit is None:
+                cursor = connection.execute(_DELETE_BY_ACCOUNT, (uuid_bytes(account_id),))
+            else:
+                cursor = connection.execute(_DELETE_BY_ACCOUNT_LIMITED, (uuid_bytes(account_id), limit))
+        return cursor.rowcount
+
+    def apply_batch(
+        self, account_id: AccountId, operations: Sequence[TransactionOperation]
+    ) -> list[TransactionOperationResult]:
+        with self._database.transaction() as connection:
+            return [self._apply(connection, account_id, operation) for operation in operations]
+
+    def list_by_account(
+        self,
+        account_id: AccountId,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+        limit: int | None = None,
+        cursor: TransactionCursor | None = None,
+    ) -> Iterator[Transaction]:
+        lower = date_from.isoformat() if date_from else ""
+        upper = date_to.isoformat() if date_to else "9999-12-31"
+        after = (cursor.date.isoformat(), uuid_bytes(cursor.transaction_id)) if cursor else ("", b"")
+        remaining = limit
+
+        # Keyset pagination over the (account_id, date) index: every page is a short read, so a long iteration
+        # never holds the connection
+        while remaining is None or remaining > 0:
+            page_size = _PAGE_SIZE if remaining is None else min(_PAGE_SIZE, remaining)
+            with self._database.read() as connection:
+                rows = connection.execute(
+                    _LIST_BY_ACCOUNT, (uuid_bytes(account_id), lower, upper, *after, page_size)
+                ).fetchall()
+            for row in rows:
+                yield self._load(row)
+            if len(rows) < page_size:
+                return
+            after = rows[-1][2], rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def _apply(
+        self, connection: sqlite3.Connection, account_id: AccountId, operation: TransactionOperation
+    ) -> TransactionOperationResult:
+        replacement: Transaction | None
+        match operation:
+            case TransactionAddition(transaction=transaction):
+                try:
+                    # A failing statement is undone alone, the database transaction goes on
+                    connection.execute(
+                        _INSERT,
+                        (
+                            uuid_bytes(transaction.id),
+                            uuid_bytes(transaction.account_id),
+                            transaction.date.isoformat(),
+                            transaction.label,
+                            transaction.amount.minor_units,
+                            transaction.amount.currency,
+                        ),
+                    )
+                except sqlite3.IntegrityError:
+                    return TransactionOperationResult(error=TransactionAlreadyExists(transaction_id=transaction.id))
+                return TransactionOperationResult()
+            case TransactionReplacement(transaction=replacement):
+                transaction_id = replacement.id
+            case TransactionRemoval(transaction_id=transaction_id):
+                replacement = None
+
+        row = connection.execute(_SELECT_IN_ACCOUNT, (uuid_bytes(transaction_id), uuid_bytes(account_id))).fetchone()
+        if row is None:
+            return TransactionOperationResult(error=TransactionNotFound(transaction_id=transaction_id))
+        if replacement is None:
+            connection.execute(_DELETE, (uuid_bytes(transaction_id),))
+        else:
+            connection.execute(
+                _UPDATE,
+                (
+                    uuid_bytes(replacement.account_id),
+                    replacement.date.isoformat(),
+                    replacement.label,
+                    replacement.amount.minor_units,
+                    replacement.amount.currency,
+                    uuid_bytes(replacement.id),
+                ),
+            )
+        return TransactionOperationResult(previous=self._load(row))
+
+    @staticmethod
+    def _load(row: tuple) -> Transaction:
+        return Transaction(
+            id_=TransactionUUID.from_bytes(row[0]),
+            account_id=AccountUUID.from_bytes(row[1]),
+            date=datetime.date.fromisoformat(row[2]),
+            label=row[3],
+            amount=Money(row[4], row[5]),
+        )
@@ -0,0 +1,35 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from contextlib import contextmanager
+from typing import Iterator
+
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.shared.application.unit_of_work import UnitOfWork
+
+
+class SqliteUnitOfWork(UnitOfWork):
+    """
+    The changes of the repositories sharing the database are made in one of its transactions.
+    """
+
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    @contextmanager
+    def atomic(self) -> Iterator[None]:
+        with self._database.transaction():
+            yield
@@ -0,0 +1,89 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import sqlite3
+
+from src.application.user.repository import (
+    UserRepository,
+    UserAlreadyExists,
+    UserNotFound,
+    UserEmailAddressNotFound,
+    UserEmailAddressAlreadyUsed,
+)
+from src.domain.user import User, UserId, UserName
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.user.id import UserUUID
+from src.shared.domain.email import EmailAddress
+
+_INSERT = "INSERT INTO user (id, email_address, username) VALUES (?, ?, ?)"
+_SELECT = "SELECT id, email_address, username FROM user WHERE id = ?"
+_SELECT_BY_EMAIL_ADDRESS = "SELECT id, email_address, username FROM user WHERE email_address = ?"
+_EXISTS = "SELECT 1 FROM user WHERE id = ?"
+_UPDATE = "UPDATE user SET email_address = ?, username = ? WHERE id = ?"
+_DELETE = "DELETE FROM user WHERE id = ?"
+
+
+class SqliteUserRepository(UserRepository):
+    def __init__(self, database: SqliteDatabase) -> None:
+        self._database = database
+
+    def add(self, user: User) -> None:
+        with self._database.transaction() as connection:
+            try:
+                connection.execute(_INSERT, (uuid_bytes(user.id), str(user.email_address), str(user.username)))
+            except sqlite3.IntegrityError as e:
+                # Either the id or the email address is taken
+                if connection.execute(_EXISTS, (uuid_bytes(user.id),)).fetchone() is not None:
+                    raise UserAlreadyExists(user_id=user.id) from e
+                raise UserEmailAddressAlreadyUsed(email_address=user.email_address) from e
+
+    def retrieve(self, id_: UserId) -> User:
+        with self._database.read() as connection:
+            row = connection.execute(_SELECT, (uuid_bytes(id_),)).fetchone()
+        if row is None:
+            raise UserNotFound(user_id=id_)
+        return _user(row)
+
+    def retrieve_by_email_address(self, email_address: EmailAddress) -> User:
+        with self._database.read() as connection:
+            row = connection.execute(_SELECT_BY_EMAIL_ADDRESS, (str(email_address),)).fetchone()
+        if row is None:
+            raise UserEmailAddressNotFound(email_address=email_address)
+        return _user(row)
+
+    def update(self, user: User) -> None:
+        try:
+            with self._database.transaction() as connection:
+                cursor = connection.execute(_UPDATE, (str(user.email_address), str(user.username), uuid_bytes(user.id)))
+        except sqlite3.IntegrityError as e:
+            raise UserEmailAddressAlreadyUsed(email_address=user.email_address) from e
+        if not cursor.rowcount:
+            raise UserNotFound(user_id=user.id)
+
+    def delete(self, id_: UserId) -> None:
+        with self._database.transaction() as connection:
+            cursor = connection.execute(_DELETE, (uuid_bytes(id_),))
+        if not cursor.rowcount:
+            raise UserNotFound(user_id=id_)
+
+
+def _user(row: tuple) -> User:
+    return User(
+        id_=UserUUID.from_bytes(row[0]),
+        email_address=EmailAddress.trusted(row[1]),
+        username=UserName.trusted(row[2]),
+    )
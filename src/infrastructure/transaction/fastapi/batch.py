@@ -0,0 +1,139 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+from decimal import Decimal
+from typing import Annotated, Any, Literal
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, validator, root_validator
+
+from src.application.transaction.batch import (
+    TransactionBatchProcessor,
+    TransactionBatchRequest,
+    TransactionBatchOperation,
+    TransactionBatchError,
+)
+from src.application.transaction.creator import TransactionCreationRequest
+from src.application.transaction.deleter import TransactionDeletionRequest
+from src.application.transaction.repository import TransactionAlreadyExists
+from src.application.transaction.updater import TransactionUpdateRequest
+from src.domain.account import AccountId
+from src.infrastructure.account.fastapi.ownership import owned_account_id
+from src.infrastructure.transaction.id import TransactionUUID
+from src.shared.domain.money import DEFAULT_CURRENCY, CurrencyMismatch, Money
+
+router = APIRouter()
+
+MAX_OPERATIONS = 10_000
+
+
+class _TransactionOperationBase(BaseModel):
+    id: str
+
+    @validator("id")
+    def validate_id(cls, id_: str) -> str:
+        TransactionUUID(id_)
+        return id_
+
+
+class _TransactionWriteOperationBase(_TransactionOperationBase):
+    date: datetime.date
+    label: str
+    amount: Decimal
+    currency: str = DEFAULT_CURRENCY
+
+    @root_validator(skip_on_failure=True)
+    def validate_amount(cls, values: dict[str, Any]) -> dict[str, Any]:
+        Money.from_decimal(values["amount"], values["currency"]).check_bounds()
+        return values
+
+    def money(self) -> Money:
+        return Money.from_decimal(self.amount, self.currency)
+
+
+class TransactionCreationOperation(_TransactionWriteOperationBase):
+    operation: Literal["create"]
+
+    def to_request(self, account_id: AccountId) -> TransactionBatchOperation:
+        return TransactionCreationRequest(
+            id=TransactionUUID(self.id), account_id=account_id, date=self.date, label=self.label, amount=self.money()
+        )
+
+
+class TransactionUpdateOperation(_TransactionWriteOperationBase):
+    operation: Literal["update"]
+
+    def to_request(self, account_id: AccountId) -> TransactionBatchOperation:
+        return TransactionUpdateRequest(
+            id=TransactionUUID(self.id), account_id=account_id, date=self.date, label=self.label, amount=self.money()
+        )
+
+
+class TransactionDeletionOperation(_TransactionOperationBase):
+    operation: Literal["delete"]
+
+    def to_request(self, account_id: AccountId) -> TransactionBatchOperation:
+        return TransactionDeletionRequest(id=TransactionUUID(self.id))
+
+
+TransactionOperationBody = Annotated[
+    TransactionCreationOperation | TransactionUpdateOperation | TransactionDeletionOperation,
+    Field(discriminator="operation"),
+]
+
+
+class TransactionBatchBody(BaseModel):
+    operations: list[TransactionOperationBody]
+
+    # A constrained field would lose the discriminator, and checking the size first avoids validating huge bodies
+    @validator("operations", pre=True)
+    def validate_operation_count(cls, operations: object) -> object:
+        if isinstance(operations, list) and len(operations) > MAX_OPERATIONS:
+            raise ValueError(f"At most {MAX_OPERATIONS} operations are allowed")
+        return operations
+
+
+def _status(error: TransactionBatchError | None) -> str:
+    match error:
+        case None:
+            return "applied"
+        case TransactionAlreadyExists():
+            return "already_exists"
+        case CurrencyMismatch():
+            return "currency_mismatch"
+        case _:
+            return "not_found"
+
+
+@router.post("/account/{account_id}/transactions:batch", status_code=200)
+@inject
+def process_transaction_batch(
+    body: TransactionBatchBody,
+    account_id: AccountId = Depends(owned_account_id),
+    transaction_batch_processor: TransactionBatchProcessor = Depends(Provide["transaction_batch_processor"]),
+) -> JSONResponse:
+    errors = transaction_batch_processor.process(
+        TransactionBatchRequest(
+            account_id=account_id,
+            operations=[operation.to_request(account_id) for operation in body.operations],
+        )
+    )
+    # The results are plain JSON already: returning the response directly skips their generic encoding
+    results = [{"id": operation.id, "status": _status(error)} for operation, error in zip(body.operations, errors)]
+    return JSONResponse({"results": results})
@@ -0,0 +1,130 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+"""
+Streaming OFX reader: the statement is decoded by chunks and every `<STMTTRN>` aggregate is parsed as soon as it is
+complete, so memory use is bounded by the chunk size whatever the statement size. Both the SGML (OFX 1.x) and the
+XML (OFX 2.x) syntaxes are supported, closing tags of elements being optional.
+"""
+import codecs
+import datetime
+import html
+import re
+from decimal import Decimal
+from typing import BinaryIO, Iterator
+
+from src.application.transaction.statement import StatementReader, StatementEntry, InvalidStatementEntry
+from src.shared.domain.money import DEFAULT_CURRENCY, Money
+
+_CHUNK_SIZE = 1 << 16
+_MAX_ENTRY_SIZE = 1 << 16
+# The headers declaring the encoding come first, in a few hundred bytes
+_HEADER_SIZE = 1 << 10
+# Long enough to hold a truncated `<STMTTRN>` or `<CURDEF>EUR` at the end of the buffer
+_TAIL_SIZE = 16
+
+_SGML_CHARSET = re.compile(rb"CHARSET:\s*(\w+)", re.IGNORECASE)
+_SGML_ENCODING = re.compile(rb"ENCODING:\s*([\w-]+)", re.IGNORECASE)
+_XML_ENCODING = re.compile(rb"<\?xml[^>]*encoding=[\"']([\w-]+)[\"']", re.IGNORECASE)
+
+_TRANSACTION_START = re.compile(r"<STMTTRN>", re.IGNORECASE)
+_TRANSACTION_END = re.compile(r"</STMTTRN>", re.IGNORECASE)
+_ELEMENT = re.compile(r"<(\w+)>([^<]*)")
+_CURRENCY = re.compile(r"<CURDEF>\s*([A-Za-z]{3})", re.IGNORECASE)
+_DATE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+
+
+def _encoding(head: bytes) -> str:
+    """
+    Encoding declared by the statement headers, defaulting to UTF-8.
+    """
+    if match := _XML_ENCODING.search(head):
+        encoding = match.group(1).decode("ascii")
+    elif (match := _SGML_CHARSET.search(head)) and match.group(1).isdigit():
+        encoding = f"cp{match.group(1).decode('ascii')}"
+    elif (match := _SGML_ENCODING.search(head)) and match.group(1).upper() != b"USASCII":
+        encoding = match.group(1).decode("ascii")
+    else:
+        encoding = "utf-8"
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return "utf-8"
+
+
+def _text(value: str) -> str:
+    value = value.strip()
+    return html.unescape(value) if "&" in value else value
+
+
+def _parse_entry(block: str, currency: str) -> StatementEntry | InvalidStatementEntry:
+    fields = {tag.upper(): _text(value) for tag, value in _ELEMENT.findall(block)}
+
+    date_match = _DATE.match(fields.get("DTPOSTED", ""))
+    if date_match is None:
+        return InvalidStatementEntry(f"Invalid posting date `{fields.get('DTPOSTED')}`")
+    try:
+        date = datetime.date(*map(int, date_match.groups()))
+    except ValueError:
+        return InvalidStatementEntry(f"Invalid posting date `{fields['DTPOSTED']}`")
+
+    try:
+        # Some banks use a decimal comma
+        amount = Money.from_decimal(Decimal(fields.get("TRNAMT", "").replace(",", ".")), currency).check_bounds()
+    except (ArithmeticError, ValueError):
+        return InvalidStatementEntry(f"Invalid amount `{fields.get('TRNAMT')}`")
+
+    name, memo = fields.get("NAME", ""), fields.get("MEMO", "")
+    label = f"{name} {memo}" if name and memo and memo != name else name or memo
+    return StatementEntry(date=date, label=label, amount=amount, reference=fields.get("FITID") or None)
+
+
+class OfxStatementReader(StatementReader):
+    def __init__(self, chunk_size: int = _CHUNK_SIZE) -> None:
+        self._chunk_size = chunk_size
+
+    def read(self, statement: BinaryIO) -> Iterator[StatementEntry | InvalidStatementEntry]:
+        chunk = statement.read(max(self._chunk_size, _HEADER_SIZE))
+        decoder = codecs.getincrementaldecoder(_encoding(chunk))(errors="replace")
+        buffer = ""
+        # Statement currency, declared before the transactions of each statement
+        currency = DEFAULT_CURRENCY
+        while True:
+            buffer += decoder.decode(chunk, final=not chunk)
+            position = 0
+            while start := _TRANSACTION_START.search(buffer, position):
+                end = _TRANSACTION_END.search(buffer, start.end())
+                for match in _CURRENCY.finditer(buffer, position, start.start()):
+                    currency = match.group(1).upper()
+                if end is not None:
+                    yield _parse_entry(buffer[start.end() : end.start()], currency)
+                    position = end.end()
+                elif len(buffer) - start.start() > _MAX_ENTRY_SIZE or not chunk:
+                    yield InvalidStatementEntry("Unterminated transaction")
+                    position = start.end()
+                else:
+                    break
+            else:
+                # No transaction starts in what is left, only a truncated tag may remain
+                tail = max(position, len(buffer) - _TAIL_SIZE)
+                for match in _CURRENCY.finditer(buffer, position):
+                    if match.start() < tail:
+                        currency = match.group(1).upper()
+                position = tail
+            if not chunk:
+                return
+            buffer = buffer[position:] if start is None else buffer[start.start() :]
+            chunk = statement.read(self._chunk_size)
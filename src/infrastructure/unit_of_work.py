@@ -0,0 +1,39 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from contextlib import ExitStack, contextmanager
+from typing import Iterator
+
+from src.shared.application.unit_of_work import UnitOfWork
+
+
+class JoinedUnitOfWork(UnitOfWork):
+    """
+    Runs the units of work of several storages as one, entered in order and exited in reverse order: the changes of a
+    storage are undone on error only if it undoes them itself, whatever the other storages do.
+
+    :param units_of_work: always entered in the same order, so that units of work joined this way never deadlock
+    """
+
+    def __init__(self, *units_of_work: UnitOfWork) -> None:
+        self._units_of_work = units_of_work
+
+    @contextmanager
+    def atomic(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for unit_of_work in self._units_of_work:
+                stack.enter_context(unit_of_work.atomic())
+            yield
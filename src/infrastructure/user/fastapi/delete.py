@@ -18,15 +18,40 @@ from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, APIRouter
 
 from src.application.user.deleter import UserDeleter, UserDeletionRequest
-from src.infrastructure.containers.in_memory import InMemoryContainer
-from src.infrastructure.user.id import UserUUID
+from src.domain.user import UserId
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.user.fastapi.session import authorized_user_id
+from src.infrastructure.user.password.vault import UserPasswordVault
+from src.infrastructure.user.session.token import SessionTokenIssuer
+from src.shared.application.unit_of_work import UnitOfWork
 
 router = APIRouter()
 
 
+def _delete_user(
+    user_deleter: UserDeleter,
+    user_password_vault: UserPasswordVault,
+    unit_of_work: UnitOfWork,
+    request: UserDeletionRequest,
+) -> None:
+    # The password is deleted in the unit of work deleting its user, which it joins
+    with unit_of_work.atomic():
+        user_deleter.delete(request)
+        user_password_vault.delete(request.id)
+
+
 @router.delete("/user/{user_id}", status_code=200)
 @inject
 async def delete_user(
-    user_id: str, user_deleter: UserDeleter = Depends(Provide[InMemoryContainer.user_deleter])
+    user_id: UserId = Depends(authorized_user_id),
+    user_deleter: UserDeleter = Depends(Provide["user_deleter"]),
+    user_password_vault: UserPasswordVault = Depends(Provide["user_password_vault"]),
+    unit_of_work: UnitOfWork = Depends(Provide["unit_of_work"]),
+    session_token_issuer: SessionTokenIssuer = Depends(Provide["session_token_issuer"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
 ) -> None:
-    user_deleter.delete(UserDeletionRequest(id=UserUUID(user_id)))
+    await blocking_call_runner.run(
+        _delete_user, user_deleter, user_password_vault, unit_of_work, UserDeletionRequest(id=user_id)
+    )
+    # Sessions are not stored: the ones of the deleted user would let it create accounts again
+    session_token_issuer.revoke_user(user_id)
@@ -15,14 +15,18 @@
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from src.application.user.email_address.modifier import UserEmailAddressModifier, UserEmailAddressModificationRequest
-from src.application.user.subscription.email_address.validator import EmailAddressValidator
-from src.application.user.subscription.emailer import ValidationEmailSender
-from src.infrastructure.containers.in_memory import InMemoryContainer
-from src.infrastructure.user.id import UserUUID
+from src.application.user.repository import UserEmailAddressAlreadyUsed
+from src.application.user.subscription.emailer import ValidationEmailSender, InvalidToken
+from src.domain.user import UserId
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.user.fastapi.session import authorized_user_id
+from src.infrastructure.user.validation.replay import ValidationTokenReplayCacheFull
+from src.infrastructure.user.validation.throttle import EmailAddressValidationThrottle, TooManyValidationRequests
+from src.shared.application.unit_of_work import UnitOfWork
 from src.shared.domain.email import EmailAddress
 
 router = APIRouter()
@@ -36,9 +40,18 @@ class _EmailAddressValidationBody(BaseModel):
 @inject
 async def submit_user_email_address_validation(
     body: _EmailAddressValidationBody,
-    email_address_validator: EmailAddressValidator = Depends(Provide[InMemoryContainer.email_address_validator]),
+    request: Request,
+    email_address_validation_throttle: EmailAddressValidationThrottle = Depends(
+        Provide["email_address_validation_throttle"]
+    ),
 ) -> None:
-    email_address_validator.query(EmailAddress(body.email_address))
+    client = request.client.host if request.client is not None else None
+    try:
+        await email_address_validation_throttle.query(EmailAddress(body.email_address), client)
+    except TooManyValidationRequests as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
+    except UserEmailAddressAlreadyUsed as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
 
 
 class _EmailAddressModificationBody(BaseModel):
@@ -46,18 +59,43 @@ class _EmailAddressModificationBody(BaseModel):
     validation_token: str
 
 
+def _modify_email_address(
+    user_email_address_modifier: UserEmailAddressModifier,
+    validation_email_sender: ValidationEmailSender,
+    unit_of_work: UnitOfWork,
+    request: UserEmailAddressModificationRequest,
+    validation_token: str,
+) -> None:
+    # The token is only used up once the email address is changed, and a token used up meanwhile undoes the change
+    with unit_of_work.atomic():
+        user_email_address_modifier.modify(request)
+        validation_email_sender.use_validation_token(request.email_address, validation_token)
+
+
 @router.put("/user/{user_id}/email_address", status_code=200)
 @inject
 async def modify_user_email_address(
-    user_id: str,
     body: _EmailAddressModificationBody,
-    validation_email_sender: ValidationEmailSender = Depends(Provide[InMemoryContainer.validation_email_sender]),
-    user_email_address_modifier: UserEmailAddressModifier = Depends(
-        Provide[InMemoryContainer.user_email_address_modifier]
-    ),
+    user_id: UserId = Depends(authorized_user_id),
+    validation_email_sender: ValidationEmailSender = Depends(Provide["validation_email_sender"]),
+    user_email_address_modifier: UserEmailAddressModifier = Depends(Provide["user_email_address_modifier"]),
+    unit_of_work: UnitOfWork = Depends(Provide["unit_of_work"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
 ) -> None:
     email_address = EmailAddress(body.email_address)
-    validation_email_sender.check_validation_token(email_address, body.validation_token)
-    user_email_address_modifier.modify(
-        UserEmailAddressModificationRequest(UserUUID(user_id), email_address=email_address)
-    )
+    try:
+        validation_email_sender.check_validation_token(email_address, body.validation_token)
+        await blocking_call_runner.run(
+            _modify_email_address,
+            user_email_address_modifier,
+            validation_email_sender,
+            unit_of_work,
+            UserEmailAddressModificationRequest(user_id, email_address=email_address),
+            body.validation_token,
+        )
+    except InvalidToken as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except ValidationTokenReplayCacheFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
+    except UserEmailAddressAlreadyUsed as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
@@ -20,9 +20,9 @@ from fastapi import Depends
 from pydantic import BaseModel
 
 from src.application.user.updater import UserUpdater, UserUpdateRequest
-from src.domain.user import UserName
-from src.infrastructure.containers.in_memory import InMemoryContainer
-from src.infrastructure.user.id import UserUUID
+from src.domain.user import UserId, UserName
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.user.fastapi.session import authorized_user_id
 
 router = APIRouter()
 
@@ -34,8 +34,11 @@ class UserUpdateBody(BaseModel):
 @router.put("/user/{user_id}", status_code=200)
 @inject
 async def update_user(
-    user_id: str, body: UserUpdateBody, user_updater: UserUpdater = Depends(Provide[InMemoryContainer.user_updater])
+    body: UserUpdateBody,
+    user_id: UserId = Depends(authorized_user_id),
+    user_updater: UserUpdater = Depends(Provide["user_updater"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
 ) -> None:
-    user_update_request = UserUpdateRequest(id=UserUUID(user_id), username=UserName(body.username))
+    user_update_request = UserUpdateRequest(id=user_id, username=UserName(body.username))
 
-    user_updater.update(user_update_request)
+    await blocking_call_runner.run(user_updater.update, user_update_request)
@@ -18,8 +18,9 @@ from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends
 
 from src.application.user.reader import UserReader
-from src.infrastructure.containers.in_memory import InMemoryContainer
-from src.infrastructure.user.id import UserUUID
+from src.domain.user import UserId
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.user.fastapi.session import authorized_user_id
 
 router = APIRouter()
 
@@ -27,6 +28,8 @@ router = APIRouter()
 @router.get("/user/{user_id}", status_code=200)
 @inject
 async def retrieve_user(
-    user_id: str, user_reader: UserReader = Depends(Provide[InMemoryContainer.user_reader])
+    user_id: UserId = Depends(authorized_user_id),
+    user_reader: UserReader = Depends(Provide["user_reader"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
 ) -> None:
-    user_reader.retrieve(UserUUID(user_id))
+    await blocking_call_runner.run(user_reader.retrieve, user_id)
@@ -0,0 +1,107 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel, validator
+
+from src.application.user.reader import UserReader
+from src.domain.user import UserId
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.user.password.vault import UserPasswordVault, InvalidPassword, PasswordVaultOverloaded
+from src.infrastructure.user.session.token import SessionTokenIssuer, Session, InvalidSessionToken
+from src.shared.application.repository import EntityNotFound
+from src.shared.domain.email import EmailAddress
+
+router = APIRouter()
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(status_code=401, detail=detail, headers={"WWW-Authenticate": "Bearer"})
+
+
+@inject
+async def current_session(
+    credentials: HTTPAuthorizationCredentials | None = Depends(_bearer),
+    session_token_issuer: SessionTokenIssuer = Depends(Provide["session_token_issuer"]),
+) -> Session:
+    """
+    The session of the bearer token of the request, checked without leaving the event loop.
+    """
+    if credentials is None:
+        raise _unauthorized("Missing session token")
+    try:
+        return session_token_issuer.verify(credentials.credentials)
+    except InvalidSessionToken as e:
+        raise _unauthorized(str(e)) from e
+
+
+async def authorized_user_id(user_id: str, session: Session = Depends(current_session)) -> UserId:
+    """
+    The user of the path, provided it is the one signed in.
+    """
+    if str(session.user_id) != user_id:
+        raise HTTPException(status_code=403, detail="Not allowed to access another user")
+    return session.user_id
+
+
+class _SessionCreationBody(BaseModel):
+    email_address: str
+    password: str
+
+    @validator("email_address")
+    def email_address_validator(cls, email_address: str) -> str:
+        EmailAddress(email_address)
+        return email_address
+
+
+@router.post("/user/session", status_code=201)
+@inject
+async def create_session(
+    body: _SessionCreationBody,
+    user_password_vault: UserPasswordVault = Depends(Provide["user_password_vault"]),
+    user_reader: UserReader = Depends(Provide["user_reader"]),
+    session_token_issuer: SessionTokenIssuer = Depends(Provide["session_token_issuer"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
+) -> dict:
+    user_id: UserId | None
+    try:
+        user = await blocking_call_runner.run(user_reader.retrieve_by_email_address, EmailAddress(body.email_address))
+        user_id = user.id
+    except EntityNotFound:
+        user_id = None
+    try:
+        # Checked all the same for an unknown address, so that the response time does not tell which ones are known
+        await user_password_vault.check(user_id, body.password)
+        if user_id is None:
+            raise InvalidPassword()
+    except InvalidPassword as e:
+        raise _unauthorized("Invalid email address or password") from e
+    except PasswordVaultOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"}) from e
+    return {"access_token": session_token_issuer.issue(user_id), "token_type": "bearer"}
+
+
+@router.delete("/user/session", status_code=200)
+@inject
+async def delete_session(
+    session: Session = Depends(current_session),
+    session_token_issuer: SessionTokenIssuer = Depends(Provide["session_token_issuer"]),
+) -> None:
+    session_token_issuer.revoke(session)
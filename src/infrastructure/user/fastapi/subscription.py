@@ -18,14 +18,17 @@ import re
 from typing import Any
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, validator, root_validator
 
 from src.application.user.creator import UserCreationRequest, UserCreator
-from src.application.user.subscription.emailer import ValidationEmailSender
+from src.application.user.repository import UserEmailAddressAlreadyUsed
+from src.application.user.subscription.emailer import ValidationEmailSender, InvalidToken
 from src.domain.user import UserName
-from src.infrastructure.containers.in_memory import InMemoryContainer
-from src.infrastructure.user.password.vault import UserPasswordVault
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.user.password.vault import UserPasswordVault, PasswordVaultOverloaded
+from src.infrastructure.user.validation.replay import ValidationTokenReplayCacheFull
+from src.shared.application.unit_of_work import UnitOfWork
 from src.shared.domain.email import EmailAddress
 
 router = APIRouter()
@@ -79,21 +82,60 @@ class _SubscriptionValidationBody(BaseModel):
     def _check_validation_token(
         validation_token: str,
         email_address: str,
-        validation_email_sender: ValidationEmailSender = Provide[InMemoryContainer.validation_email_sender],
+        validation_email_sender: ValidationEmailSender = Provide["validation_email_sender"],
     ):
         validation_email_sender.check_validation_token(EmailAddress(email_address), validation_token)
 
 
+def _create_user(
+    user_creator: UserCreator,
+    user_password_vault: UserPasswordVault,
+    validation_email_sender: ValidationEmailSender,
+    unit_of_work: UnitOfWork,
+    request: UserCreationRequest,
+    password_hash: str,
+    validation_token: str,
+) -> None:
+    # A user is never left without a password, nor a password without its user. The token is only used up once both
+    # are stored, and a token used up meanwhile by another request undoes them.
+    with unit_of_work.atomic():
+        user_id = user_creator.create(request)
+        user_password_vault.store(user_id, password_hash)
+        validation_email_sender.use_validation_token(request.email_address, validation_token)
+
+
 @router.post("", status_code=201)
 @inject
 async def confirm_user_email_address(
     subscription_validation_body: _SubscriptionValidationBody,
-    user_creator: UserCreator = Depends(Provide[InMemoryContainer.user_creator]),
-    user_password_vault: UserPasswordVault = Depends(Provide[InMemoryContainer.user_password_vault]),
+    user_creator: UserCreator = Depends(Provide["user_creator"]),
+    user_password_vault: UserPasswordVault = Depends(Provide["user_password_vault"]),
+    validation_email_sender: ValidationEmailSender = Depends(Provide["validation_email_sender"]),
+    unit_of_work: UnitOfWork = Depends(Provide["unit_of_work"]),
+    blocking_call_runner: BlockingCallRunner = Depends(Provide["blocking_call_runner"]),
 ):
     user_creation_request = UserCreationRequest(
         EmailAddress(subscription_validation_body.email_address), UserName(subscription_validation_body.username)
     )
-    user_password_vault.save(user_creation_request.email_address, subscription_validation_body.password)
-
-    user_creator.create(user_creation_request)
+    try:
+        password_hash = await user_password_vault.hash(subscription_validation_body.password)
+    except PasswordVaultOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"}) from e
+
+    try:
+        await blocking_call_runner.run(
+            _create_user,
+            user_creator,
+            user_password_vault,
+            validation_email_sender,
+            unit_of_work,
+            user_creation_request,
+            password_hash,
+            subscription_validation_body.validation_token,
+        )
+    except UserEmailAddressAlreadyUsed as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    except InvalidToken as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except ValidationTokenReplayCacheFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
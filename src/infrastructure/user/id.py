@@ -18,13 +18,13 @@ from uuid import uuid4
 
 from src.domain.user import UserId
 from src.shared.application.id import IdFactory
-from src.shared.domain.entity import IdBase
+from src.infrastructure.id import UUIDBase
 
 
-class UserUUID(UserId, IdBase[str]):
-    pass
+class UserUUID(UserId, UUIDBase):
+    __slots__ = ()
 
 
 class UserUUIDFactory(IdFactory[UserId]):
     def generate_id(self) -> UserId:
-        return UserUUID(str(uuid4()))
+        return UserUUID.trusted(str(uuid4()))
@@ -0,0 +1,167 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import asyncio
+import hashlib
+import hmac
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, ParamSpec, TypeVar
+
+from src.domain.user import UserId
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.id import uuid_bytes
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.user.password.vault import UserPasswordVault, InvalidPassword, PasswordVaultOverloaded
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_SCHEME = "scrypt"
+_SALT_SIZE = 16
+_KEY_SIZE = 32
+_UPSERT = (
+    "INSERT INTO user_password (user_id, hash) VALUES (?, ?) ON CONFLICT (user_id) DO UPDATE SET hash = excluded.hash"
+)
+_DELETE = "DELETE FROM user_password WHERE user_id = ?"
+_SELECT = "SELECT hash FROM user_password WHERE user_id = ?"
+
+
+def _max_memory(n: int, r: int, p: int) -> int:
+    # scrypt needs 128 * n * r * p bytes, OpenSSL refuses anything above `maxmem` including its own overhead
+    return 2 * 128 * n * r * p + 2**20
+
+
+def _hash_password(password: str, n: int, r: int, p: int) -> str:
+    """
+    Run by the pool processes: the cost parameters and the salt are encoded along with the key, so that hashes made
+    with former parameters can still be verified.
+    """
+    salt = os.urandom(_SALT_SIZE)
+    key = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=_max_memory(n, r, p), dklen=_KEY_SIZE)
+    return f"{_SCHEME}${n}${r}${p}${salt.hex()}${key.hex()}"
+
+
+def _verify_password(password: str, encoded: str) -> bool:
+    """
+    Run by the pool processes.
+    """
+    _, n, r, p, salt, key = encoded.split("$")
+    expected = bytes.fromhex(key)
+    computed = hashlib.scrypt(
+        password.encode(),
+        salt=bytes.fromhex(salt),
+        n=int(n),
+        r=int(r),
+        p=int(p),
+        maxmem=_max_memory(int(n), int(r), int(p)),
+        dklen=len(expected),
+    )
+    return hmac.compare_digest(computed, expected)
+
+
+class ScryptUserPasswordVault(UserPasswordVault):
+    """
+    Stores the scrypt hashes of the passwords, computed on a pool of processes: hashing is deliberately slow and
+    memory-hard, it must neither block the event loop nor have every login wait for the GIL. At most `max_pending`
+    passwords are hashed or waiting for a process: beyond that, calls fail at once with PasswordVaultOverloaded
+    instead of piling up behind the pool.
+
+    Checking the password of an unknown user verifies it against a dummy hash, so that the response time does not
+    tell which users are known.
+
+    :param database:
+    :param blocking_call_runner: runs the database calls
+    :param max_workers: number of processes, the number of CPUs by default
+    :param max_pending:
+    :param n: scrypt CPU and memory cost, a power of 2
+    :param r: scrypt block size
+    :param p: scrypt parallelization
+    """
+
+    def __init__(
+        self,
+        database: SqliteDatabase,
+        blocking_call_runner: BlockingCallRunner,
+        max_workers: int | None = None,
+        max_pending: int = 64,
+        n: int = 2**14,
+        r: int = 8,
+        p: int = 1,
+    ) -> None:
+        self._database = database
+        self._blocking_call_runner = blocking_call_runner
+        self._max_pending = max_pending
+        self._n = n
+        self._r = r
+        self._p = p
+        self._pending = 0
+        self._lock = threading.Lock()
+        # Forking a process running threads, such as the blocking call ones, could leave a lock held in the child
+        self._executor = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("forkserver"))
+        self._dummy_hash = _hash_password("", n, r, p)
+
+    async def hash(self, password: str) -> str:
+        return await self._hash(_hash_password, password, self._n, self._r, self._p)
+
+    def store(self, user_id: UserId, password_hash: str) -> None:
+        with self._database.transaction() as connection:
+            connection.execute(_UPSERT, (uuid_bytes(user_id), password_hash))
+
+    def delete(self, user_id: UserId) -> None:
+        with self._database.transaction() as connection:
+            connection.execute(_DELETE, (uuid_bytes(user_id),))
+
+    async def check(self, user_id: UserId | None, password: str) -> None:
+        encoded = None if user_id is None else await self._blocking_call_runner.run(self._load, user_id)
+        valid = await self._hash(_verify_password, password, self._dummy_hash if encoded is None else encoded)
+        if encoded is None or not valid:
+            raise InvalidPassword()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    async def _hash(self, function: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        with self._lock:
+            if self._pending >= self._max_pending:
+                raise PasswordVaultOverloaded()
+            self._pending += 1
+        try:
+            return await asyncio.wrap_future(self._executor.submit(function, *args, **kwargs))
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _load(self, user_id: UserId) -> str | None:
+        with self._database.read() as connection:
+            row = connection.execute(_SELECT, (uuid_bytes(user_id),)).fetchone()
+        return None if row is None else row[0]
+
+
+def scrypt_user_password_vault(
+    database: SqliteDatabase,
+    blocking_call_runner: BlockingCallRunner,
+    max_workers: int | None = None,
+    max_pending: int = 64,
+) -> Iterator[ScryptUserPasswordVault]:
+    """
+    Container resource: the processes are stopped when the container resources are shut down.
+    """
+    vault = ScryptUserPasswordVault(database, blocking_call_runner, max_workers, max_pending)
+    yield vault
+    vault.shutdown()
@@ -16,7 +16,7 @@
 #   */
 from abc import ABC, abstractmethod
 
-from src.shared.domain.email import EmailAddress
+from src.domain.user import UserId
 
 
 class InvalidPassword(ValueError):
@@ -24,14 +24,45 @@ class InvalidPassword(ValueError):
         super().__init__("Invalid password")
 
 
+class PasswordVaultOverloaded(RuntimeError):
+    def __init__(self):
+        super().__init__("Too many passwords are being hashed, retry later")
+
+
 class UserPasswordVault(ABC):
+    """
+    Passwords are stored by user id, so that they follow their user through email address changes. Hashing is
+    asynchronous, so that implementations can hash passwords out of the event loop, and apart from storing, so that a
+    hash can be stored in the unit of work creating its user.
+    """
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """
+        :raises: PasswordVaultOverloaded
+        """
+        pass
+
+    @abstractmethod
+    def store(self, user_id: UserId, password_hash: str) -> None:
+        """
+        :param user_id:
+        :param password_hash: made by `hash`, replaces the one of the user if any
+        """
+        pass
+
     @abstractmethod
-    def save(self, email_address: EmailAddress, password: str) -> None:
+    def delete(self, user_id: UserId) -> None:
+        """
+        :param user_id: whose password, if any, is deleted along with the user
+        """
         pass
 
     @abstractmethod
-    def check(self, email_address: EmailAddress, password: str) -> None:
+    async def check(self, user_id: UserId | None, password: str) -> None:
         """
-        :raises: InvalidPassword
+        :param user_id: None for an unknown user, whose password is invalid
+        :param password:
+        :raises: InvalidPassword, PasswordVaultOverloaded
         """
         pass
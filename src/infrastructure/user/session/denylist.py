@@ -0,0 +1,56 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import heapq
+import threading
+import time
+from typing import Callable
+
+
+class SessionDenylist:
+    """
+    Ids of the revoked session tokens, or of the users whose tokens are all revoked, that have not expired yet. A revoked token is only worth remembering until it
+    expires, so the entries are evicted by expiry as revocations come in, and the list stays as small as the number of
+    live revoked tokens.
+
+    :param clock: seconds since the epoch
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._expiries: dict[bytes, float] = {}
+        self._by_expiry: list[tuple[float, bytes]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    def revoke(self, token_id: bytes, expires_at: float) -> None:
+        with self._lock:
+            self._evict()
+            if token_id not in self._expiries:
+                self._expiries[token_id] = expires_at
+                heapq.heappush(self._by_expiry, (expires_at, token_id))
+
+    def is_revoked(self, token_id: bytes) -> bool:
+        # Lock-free: a dict lookup is atomic, and an entry evicted meanwhile is the one of a token already expired
+        return token_id in self._expiries
+
+    def _evict(self) -> None:
+        now = self._clock()
+        while self._by_expiry and self._by_expiry[0][0] <= now:
+            _, token_id = heapq.heappop(self._by_expiry)
+            del self._expiries[token_id]
@@ -0,0 +1,124 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import base64
+import binascii
+import hashlib
+import hmac
+import secrets
+import struct
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from src.domain.user import UserId
+from src.infrastructure.user.session.denylist import SessionDenylist
+
+_TOKEN_ID_SIZE = 16
+_HEADER = struct.Struct(f"<{_TOKEN_ID_SIZE}sQ")
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+# Denylist entries revoking every token of a user, apart from the token ids which are 16 bytes long
+_USER_PREFIX = b"user\x1f"
+
+
+class InvalidSessionToken(ValueError):
+    def __init__(self):
+        super().__init__("Invalid or expired session token")
+
+
+@dataclass(frozen=True)
+class Session:
+    user_id: UserId
+    token_id: bytes
+    expires_at: int
+
+
+def _encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class SessionTokenIssuer:
+    """
+    Stateless session tokens: the token id, the expiry and the user id, signed with HMAC-SHA256. The password is
+    checked once when the token is issued, and every request after that only checks the signature, with no storage
+    involved besides the denylist of revoked tokens and users.
+
+    :param user_id_parser: builds back the user id written in a token, which is trusted once the signature matches
+    :param secret: signing key, random when omitted, in which case tokens do not outlive the process
+    :param ttl: lifetime of a token in seconds
+    :param clock: seconds since the epoch
+    """
+
+    def __init__(
+        self,
+        user_id_parser: Callable[[str], UserId],
+        denylist: SessionDenylist,
+        secret: str | None = None,
+        ttl: int = 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._user_id_parser = user_id_parser
+        self._denylist = denylist
+        self._secret = secret.encode() if secret else secrets.token_bytes(32)
+        self._ttl = ttl
+        self._clock = clock
+
+    def issue(self, user_id: UserId) -> str:
+        header = _HEADER.pack(secrets.token_bytes(_TOKEN_ID_SIZE), int(self._clock()) + self._ttl)
+        payload = header + str(user_id).encode()
+        return f"{_encode(payload)}.{_encode(self._sign(payload))}"
+
+    def verify(self, token: str) -> Session:
+        """
+        :raises: InvalidSessionToken
+        """
+        encoded_payload, _, encoded_signature = token.partition(".")
+        try:
+            payload, signature = _decode(encoded_payload), _decode(encoded_signature)
+        except (binascii.Error, ValueError) as e:
+            raise InvalidSessionToken() from e
+        if (
+            len(payload) < _HEADER.size
+            or len(signature) != _SIGNATURE_SIZE
+            or not hmac.compare_digest(signature, self._sign(payload))
+        ):
+            raise InvalidSessionToken()
+        token_id, expires_at = _HEADER.unpack_from(payload)
+        user_id = payload[_HEADER.size :]
+        if (
+            expires_at <= self._clock()
+            or self._denylist.is_revoked(token_id)
+            or self._denylist.is_revoked(_USER_PREFIX + user_id)
+        ):
+            raise InvalidSessionToken()
+        return Session(self._user_id_parser(user_id.decode()), token_id, expires_at)
+
+    def revoke(self, session: Session) -> None:
+        self._denylist.revoke(session.token_id, session.expires_at)
+
+    def revoke_user(self, user_id: UserId) -> None:
+        """
+        Revoke every token issued to the user so far, such as when it is deleted: they all expire within the lifetime
+        of a token from now.
+        """
+        self._denylist.revoke(_USER_PREFIX + str(user_id).encode(), int(self._clock()) + self._ttl)
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.digest(self._secret, payload, "sha256")
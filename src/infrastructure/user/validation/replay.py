@@ -0,0 +1,85 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import heapq
+import math
+import threading
+import time
+from typing import Callable
+
+
+class ValidationTokenReplayCacheFull(RuntimeError):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Too many validation tokens used lately, retry later")
+        self._retry_after = retry_after
+
+    @property
+    def retry_after(self) -> int:
+        """
+        Seconds to wait, rounded up.
+        """
+        return math.ceil(self._retry_after)
+
+
+class ValidationTokenReplayCache:
+    """
+    Ids of the validation tokens already used, until they expire, so that a token is only accepted once. A token is
+    never forgotten before it expires, since it could be used again: when the cache is full of unexpired tokens, no
+    other token can be used until the first of them expires.
+
+    The cache must thus hold the tokens used within a token lifetime, that is the rate of sign-ups and email address
+    changes times the lifetime: 100 000 tokens with a lifetime of a day allow more than one per second, about 20 MB.
+
+    :param max_size: number of used tokens remembered at most
+    :param clock: seconds since the epoch
+    """
+
+    def __init__(self, max_size: int = 100_000, clock: Callable[[], float] = time.time) -> None:
+        self._max_size = max_size
+        self._clock = clock
+        self._expiries: dict[bytes, float] = {}
+        self._by_expiry: list[tuple[float, bytes]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    def used(self, token_id: bytes) -> bool:
+        with self._lock:
+            return token_id in self._expiries
+
+    def use(self, token_id: bytes, expires_at: float) -> bool:
+        """
+        Remember the token as used.
+
+        :return: whether it was not used yet
+        :raises: ValidationTokenReplayCacheFull
+        """
+        with self._lock:
+            if token_id in self._expiries:
+                return False
+            now = self._clock()
+            self._evict(now)
+            if len(self._by_expiry) >= self._max_size:
+                raise ValidationTokenReplayCacheFull(self._by_expiry[0][0] - now)
+            self._expiries[token_id] = expires_at
+            heapq.heappush(self._by_expiry, (expires_at, token_id))
+            return True
+
+    def _evict(self, now: float) -> None:
+        while self._by_expiry and self._by_expiry[0][0] <= now:
+            _, token_id = heapq.heappop(self._by_expiry)
+            del self._expiries[token_id]
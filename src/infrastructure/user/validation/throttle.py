@@ -0,0 +1,81 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import asyncio
+import math
+
+from src.application.user.subscription.email_address.validator import EmailAddressValidator
+from src.infrastructure.blocking import BlockingCallRunner
+from src.infrastructure.rate_limit import TokenBucketLimiter
+from src.shared.domain.email import EmailAddress
+
+
+class TooManyValidationRequests(RuntimeError):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Too many email address validation requests, retry later")
+        self._retry_after = retry_after
+
+    @property
+    def retry_after(self) -> int:
+        """
+        Seconds to wait, rounded up.
+        """
+        return math.ceil(self._retry_after)
+
+
+class EmailAddressValidationThrottle:
+    """
+    Stands in front of the email address validator. Requests are limited per client first, then a request for an
+    address whose validation is in flight waits for it rather than sending another email, and only then is the
+    address limit checked, so that the retries of a client do not use up the requests allowed for the address.
+    Meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        validator: EmailAddressValidator,
+        blocking_call_runner: BlockingCallRunner,
+        address_limiter: TokenBucketLimiter,
+        client_limiter: TokenBucketLimiter,
+    ) -> None:
+        self._validator = validator
+        self._blocking_call_runner = blocking_call_runner
+        self._address_limiter = address_limiter
+        self._client_limiter = client_limiter
+        self._in_flight: dict[EmailAddress, asyncio.Future[None]] = {}
+
+    async def query(self, email_address: EmailAddress, client: str | None) -> None:
+        """
+        :param client: address of the client, if known
+        :raises: TooManyValidationRequests
+        """
+        if client is not None and (retry_after := self._client_limiter.acquire(client)):
+            raise TooManyValidationRequests(retry_after)
+        if (in_flight := self._in_flight.get(email_address)) is not None:
+            # Shielded: a client giving up must not cancel the validation the others wait for
+            return await asyncio.shield(in_flight)
+        if retry_after := self._address_limiter.acquire(email_address):
+            raise TooManyValidationRequests(retry_after)
+        future = asyncio.ensure_future(self._blocking_call_runner.run(self._validator.query, email_address))
+        self._in_flight[email_address] = future
+        future.add_done_callback(lambda _: self._settle(email_address, future))
+        return await asyncio.shield(future)
+
+    def _settle(self, email_address: EmailAddress, future: asyncio.Future[None]) -> None:
+        del self._in_flight[email_address]
+        if not future.cancelled():
+            # Retrieved even when every client gave up waiting for it
+            future.exception()
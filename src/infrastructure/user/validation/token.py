@@ -0,0 +1,98 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import base64
+import binascii
+import hashlib
+import hmac
+import secrets
+import struct
+import time
+from typing import Callable
+
+from src.application.user.subscription.emailer import ValidationEmailSender, InvalidToken
+from src.infrastructure.email.transport import EmailTransport, EmailMessage
+from src.infrastructure.user.validation.replay import ValidationTokenReplayCache
+from src.shared.domain.email import EmailAddress
+
+_TOKEN_ID_SIZE = 12
+_HEADER = struct.Struct(f"<{_TOKEN_ID_SIZE}sQ")
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+_SUBJECT = "Validate your email address"
+
+
+class HmacValidationEmailSender(ValidationEmailSender):
+    """
+    Validation tokens carry a random id and their expiry, signed with HMAC-SHA256 along with the email address they
+    were sent to, so checking one is a computation with no storage involved besides the cache of the tokens already
+    used. Using a token raises ValidationTokenReplayCacheFull while that cache is full.
+
+    :param secret: signing key, random when omitted, in which case the tokens sent do not outlive the process
+    :param ttl: lifetime of a token in seconds
+    :param clock: seconds since the epoch
+    """
+
+    def __init__(
+        self,
+        transport: EmailTransport,
+        replay_cache: ValidationTokenReplayCache,
+        secret: str | None = None,
+        ttl: int = 86400,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._transport = transport
+        self._replay_cache = replay_cache
+        self._secret = secret.encode() if secret else secrets.token_bytes(32)
+        self._ttl = ttl
+        self._clock = clock
+
+    def send(self, email_address: EmailAddress) -> None:
+        token = self.token(email_address)
+        self._transport.deliver(EmailMessage(email_address, _SUBJECT, f"Your validation token: {token}"))
+
+    def token(self, email_address: EmailAddress) -> str:
+        header = _HEADER.pack(secrets.token_bytes(_TOKEN_ID_SIZE), int(self._clock()) + self._ttl)
+        return base64.urlsafe_b64encode(header + self._sign(header, email_address)).rstrip(b"=").decode("ascii")
+
+    def check_validation_token(self, email_address: EmailAddress, token: str) -> None:
+        token_id, _ = self._verify(email_address, token)
+        if self._replay_cache.used(token_id):
+            raise InvalidToken()
+
+    def use_validation_token(self, email_address: EmailAddress, token: str) -> None:
+        token_id, expires_at = self._verify(email_address, token)
+        if not self._replay_cache.use(token_id, expires_at):
+            raise InvalidToken()
+
+    def _verify(self, email_address: EmailAddress, token: str) -> tuple[bytes, int]:
+        """
+        :return: the id and expiry of the token, whose signature and expiry are checked
+        :raises: InvalidToken
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except (binascii.Error, ValueError) as e:
+            raise InvalidToken() from e
+        header, signature = raw[: _HEADER.size], raw[_HEADER.size :]
+        if len(signature) != _SIGNATURE_SIZE or not hmac.compare_digest(signature, self._sign(header, email_address)):
+            raise InvalidToken()
+        token_id, expires_at = _HEADER.unpack(header)
+        if expires_at <= self._clock():
+            raise InvalidToken()
+        return token_id, expires_at
+
+    def _sign(self, header: bytes, email_address: EmailAddress) -> bytes:
+        return hmac.digest(self._secret, header + str(email_address).encode(), "sha256")
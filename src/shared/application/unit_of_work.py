@@ -0,0 +1,31 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from abc import ABC, abstractmethod
+from typing import ContextManager
+
+
+class UnitOfWork(ABC):
+    """
+    Groups the changes made through repositories sharing a storage.
+    """
+
+    @abstractmethod
+    def atomic(self) -> ContextManager[None]:
+        """
+        Context whose changes are stored at once, and not at all when it exits on error. Nested contexts join the
+        outermost one.
+        """
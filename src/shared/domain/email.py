@@ -19,9 +19,12 @@ import re
 from src.shared.domain.string import StringContainsInvalidCharacters
 from src.shared.domain.value_object import StringObject
 
+_EMAIL_ADDRESS_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 class EmailAddress(StringObject):
+    __slots__ = ()
+
     def __post_init__(self):
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(pattern, self.value):
+        if not _EMAIL_ADDRESS_PATTERN.match(self.value):
             raise StringContainsInvalidCharacters(self.value)
@@ -22,6 +22,8 @@ from src.shared.domain.value_object import ValueObject, T
 
 
 class Id(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __str__(self) -> str:
         pass
@@ -39,10 +41,12 @@ TId = TypeVar("TId", bound=Id)
 
 
 class IdBase(ValueObject[T], Id, ABC):
-    pass
+    __slots__ = ()
 
 
 class Entity(ABC, Generic[TId]):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> TId:
@@ -61,6 +65,8 @@ TEntity = TypeVar("TEntity", bound=Entity)
 
 
 class EntityBase(Entity[TId]):
+    __slots__ = ("_id",)
+
     def __init__(self, id_: TId):
         self._id = id_
 
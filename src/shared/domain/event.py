@@ -0,0 +1,68 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dataclasses import dataclass
+from functools import cache
+from typing import Self
+
+from src.shared.domain.entity import EntityBase, TId
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """
+    Fact about an aggregate, recorded when it happens.
+    """
+
+
+class AggregateRoot(EntityBase[TId]):
+    """
+    Entity recording an event for each of its changes, until a repository pulls them. Copies start without pending
+    events, so that stores keeping copies never accumulate them.
+    """
+
+    __slots__ = ("_events",)
+
+    def __init__(self, id_: TId) -> None:
+        super().__init__(id_)
+        self._events: tuple[DomainEvent, ...] = ()
+
+    def pull_events(self) -> tuple[DomainEvent, ...]:
+        """
+        :return: the events recorded since the last pull, oldest first
+        """
+        events, self._events = self._events, ()
+        return events
+
+    def _record(self, event: DomainEvent) -> None:
+        self._events += (event,)
+
+    def __copy__(self) -> Self:
+        clone = type(self).__new__(type(self))
+        for slot in _state_slots(type(self)):
+            setattr(clone, slot, getattr(self, slot))
+        clone._events = ()
+        return clone
+
+
+@cache
+def _state_slots(cls: type) -> tuple[str, ...]:
+    return tuple(
+        slot
+        for klass in cls.__mro__
+        for slot in getattr(klass, "__slots__", ())
+        if slot not in ("__weakref__", "_events")
+    )
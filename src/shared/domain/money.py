@@ -0,0 +1,181 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Self
+
+DEFAULT_CURRENCY = "EUR"
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+# Bound of a single amount entered, far above any personal finance amount, so that an account would need millions of
+# amounts at the bound before its balance overflows
+MAX_AMOUNT_MINOR_UNITS = 10**12
+
+# ISO 4217 currencies whose minor unit is not the hundredth
+_EXPONENTS = {
+    "BHD": 3,
+    "IQD": 3,
+    "JOD": 3,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "TND": 3,
+    "CLP": 0,
+    "ISK": 0,
+    "JPY": 0,
+    "KRW": 0,
+    "PYG": 0,
+    "VND": 0,
+    "XAF": 0,
+    "XOF": 0,
+}
+
+
+class InvalidCurrency(ValueError):
+    def __init__(self, currency: str) -> None:
+        super().__init__(f"`{currency}` is not an ISO 4217 currency code")
+
+
+class CurrencyMismatch(ValueError):
+    def __init__(self, currency: str, other_currency: str) -> None:
+        super().__init__(f"`{currency}` and `{other_currency}` amounts cannot be combined")
+
+
+class MoneyOverflow(ValueError):
+    def __init__(self, minor_units: int) -> None:
+        super().__init__(f"`{minor_units}` minor units do not fit in 64 bits")
+
+
+class AmountOutOfBounds(ValueError):
+    def __init__(self, minor_units: int) -> None:
+        super().__init__(f"`{minor_units}` minor units exceed the {MAX_AMOUNT_MINOR_UNITS} allowed for an amount")
+
+
+class InexactAmount(ValueError):
+    def __init__(self, amount: Decimal, currency: str) -> None:
+        super().__init__(f"`{amount}` has more decimals than `{currency}` minor units")
+
+
+def exponent(currency: str) -> int:
+    """
+    Number of decimals of the currency minor unit.
+    """
+    return _EXPONENTS.get(currency, 2)
+
+
+@dataclass(frozen=True, slots=True)
+class Money:
+    """
+    Amount as an integer count of the currency minor units, e.g. cents, so that sums never drift. Amounts of
+    different currencies are never combined.
+    """
+
+    minor_units: int
+    currency: str = DEFAULT_CURRENCY
+
+    def __post_init__(self) -> None:
+        if not _INT64_MIN <= self.minor_units <= _INT64_MAX:
+            raise MoneyOverflow(self.minor_units)
+        if len(self.currency) != 3 or not self.currency.isascii() or not self.currency.isupper():
+            raise InvalidCurrency(self.currency)
+
+    @classmethod
+    def zero(cls, currency: str = DEFAULT_CURRENCY) -> Self:
+        return cls(0, currency)
+
+    @classmethod
+    def from_decimal(cls, amount: Decimal | int | str, currency: str = DEFAULT_CURRENCY) -> Self:
+        """
+        :raises InexactAmount: the amount has more decimals than the currency minor unit
+        """
+        amount = Decimal(amount)
+        minor_units = amount.scaleb(exponent(currency))
+        if not minor_units.is_finite() or minor_units != minor_units.to_integral_value():
+            raise InexactAmount(amount, currency)
+        return cls(int(minor_units), currency)
+
+    @classmethod
+    def sum(cls, amounts: Iterable[Self], currency: str = DEFAULT_CURRENCY) -> Self:
+        """
+        :raises CurrencyMismatch: an amount is not in `currency`
+        """
+        return cls(sum(minor_units_array(amounts, currency)), currency)
+
+    def check_bounds(self) -> Self:
+        """
+        Check an amount entered, such as a transaction amount or a reference balance.
+        :raises AmountOutOfBounds: the amount is beyond `MAX_AMOUNT_MINOR_UNITS` either way
+        """
+        if abs(self.minor_units) > MAX_AMOUNT_MINOR_UNITS:
+            raise AmountOutOfBounds(self.minor_units)
+        return self
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.minor_units).scaleb(-exponent(self.currency))
+
+    def __add__(self, other: Self) -> Self:
+        self._check_currency(other)
+        return type(self)(self.minor_units + other.minor_units, self.currency)
+
+    def __sub__(self, other: Self) -> Self:
+        self._check_currency(other)
+        return type(self)(self.minor_units - other.minor_units, self.currency)
+
+    def __neg__(self) -> Self:
+        return type(self)(-self.minor_units, self.currency)
+
+    def __mul__(self, factor: int) -> Self:
+        return type(self)(self.minor_units * factor, self.currency)
+
+    __rmul__ = __mul__
+
+    def __lt__(self, other: Self) -> bool:
+        self._check_currency(other)
+        return self.minor_units < other.minor_units
+
+    def __le__(self, other: Self) -> bool:
+        self._check_currency(other)
+        return self.minor_units <= other.minor_units
+
+    def __gt__(self, other: Self) -> bool:
+        self._check_currency(other)
+        return self.minor_units > other.minor_units
+
+    def __ge__(self, other: Self) -> bool:
+        self._check_currency(other)
+        return self.minor_units >= other.minor_units
+
+    def __str__(self) -> str:
+        return f"{self.to_decimal():f} {self.currency}"
+
+    def _check_currency(self, other: "Money") -> None:
+        if other.currency != self.currency:
+            raise CurrencyMismatch(self.currency, other.currency)
+
+
+def minor_units_array(amounts: Iterable[Money], currency: str = DEFAULT_CURRENCY) -> array:
+    """
+    Pack the amounts in a signed 64-bit array, for bulk sums that stay exact.
+    :raises CurrencyMismatch: an amount is not in `currency`
+    """
+    minor_units = array("q")
+    for amount in amounts:
+        if amount.currency != currency:
+            raise CurrencyMismatch(currency, amount.currency)
+        minor_units.append(amount.minor_units)
+    return minor_units
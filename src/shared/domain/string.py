@@ -14,6 +14,9 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+import re
+
+NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
 
 class StringContainsInvalidCharacters(ValueError):
@@ -29,3 +32,15 @@ class StringTooLong(ValueError):
 class StringTooShort(ValueError):
     def __init__(self, string: str) -> None:
         super().__init__(f"`{string}` length is too short")
+
+
+def check_string(string: str, min_length: int, max_length: int, pattern: re.Pattern[str]) -> None:
+    """
+    :raises StringTooShort, StringTooLong, StringContainsInvalidCharacters:
+    """
+    if len(string) < min_length:
+        raise StringTooShort(string)
+    if len(string) > max_length:
+        raise StringTooLong(string)
+    if not pattern.match(string):
+        raise StringContainsInvalidCharacters(string)
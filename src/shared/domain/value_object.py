@@ -15,34 +15,60 @@
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
 from abc import ABC
-from typing import Generic, TypeVar
+from typing import Any, Generic, Self, TypeVar
 
 T = TypeVar("T")
 
 
 class ValueObject(ABC, Generic[T]):
+    """
+    Immutable value: subclasses declare `__slots__ = ()` to stay free of a per-instance `__dict__`, and the hash is
+    computed once, after validation.
+    """
+
+    __slots__ = ("_value", "_hash")
+
     def __init__(self, value: T) -> None:
         self._value = value
         self.__post_init__()
+        self._hash = hash(value)
+
+    @classmethod
+    def trusted(cls, value: T) -> Self:
+        """
+        Build the value without validating it, for values read back from a storage that only holds validated ones.
+        """
+        value_object = cls.__new__(cls)
+        value_object._value = value
+        value_object._hash = hash(value)
+        return value_object
 
     def __post_init__(self) -> None:
         pass
 
+    def __reduce__(self) -> tuple[Any, tuple[T]]:
+        # The cached hash may differ in another process, where str hashes are salted differently
+        return type(self).trusted, (self._value,)
+
     @property
     def value(self) -> T:
         return self._value
 
     def __eq__(self, other: object) -> bool:
-        return self.__dict__ == other.__dict__ if isinstance(other, self.__class__) else False
+        if other is self:
+            return True
+        return self._value == other._value if isinstance(other, self.__class__) else False
 
     def __hash__(self) -> int:
-        return hash(tuple(sorted(self.__dict__.items())))
+        return self._hash
 
     def __str__(self) -> str:
         return str(self._value)
 
 
 class StringObject(ValueObject[str]):
+    __slots__ = ()
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, ValueObject):
             return super().__eq__(other)
@@ -51,5 +77,5 @@ class StringObject(ValueObject[str]):
 
         return False
 
-    def __hash__(self):
-        return self.value.__hash__()
+    def __hash__(self) -> int:
+        return self._hash
@@ -19,16 +19,16 @@ from src.shared.domain.value_object import ValueObject
 
 
 class MockId(IdBase[str]):
-    pass
+    __slots__ = ()
 
 
 class MockEntity(EntityBase[MockId]):
-    pass
+    __slots__ = ()
 
 
 class MockValueObject(ValueObject[int]):
-    pass
+    __slots__ = ()
 
 
 class OtherValueObject(ValueObject):
-    pass
+    __slots__ = ()
@@ -39,3 +39,9 @@ def test_entity_base_eq():
     assert entity1 == entity2
     assert entity1 != entity3
     assert entity1 != "not_an_entity"
+
+
+def test_entity_base_is_slotted():
+    entity = MockEntity(MockId("test_id"))
+
+    assert not hasattr(entity, "__dict__")
@@ -0,0 +1,98 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from decimal import Decimal
+
+import pytest
+
+from src.shared.domain.money import (
+    AmountOutOfBounds,
+    CurrencyMismatch,
+    InexactAmount,
+    InvalidCurrency,
+    Money,
+    MoneyOverflow,
+    minor_units_array,
+)
+
+
+def test_money_from_decimal():
+    assert Money.from_decimal(Decimal("12.34")) == Money(1234)
+    assert Money.from_decimal("-0.10") == Money(-10)
+    assert Money.from_decimal(500, "JPY") == Money(500, "JPY")
+    assert Money.from_decimal("1.234", "KWD") == Money(1234, "KWD")
+
+
+def test_money_from_inexact_decimal():
+    with pytest.raises(InexactAmount):
+        Money.from_decimal("0.001")
+    with pytest.raises(InexactAmount):
+        Money.from_decimal("1.5", "JPY")
+    with pytest.raises(InexactAmount):
+        Money.from_decimal(Decimal("NaN"))
+
+
+def test_money_to_decimal():
+    assert Money(1234).to_decimal() == Decimal("12.34")
+    assert Money(500, "JPY").to_decimal() == Decimal(500)
+    assert str(Money(-5)) == "-0.05 EUR"
+
+
+def test_money_arithmetic():
+    assert Money(10) + Money(20) == Money(30)
+    assert Money(10) - Money(20) == Money(-10)
+    assert -Money(10) == Money(-10)
+    assert Money(10) * 3 == 3 * Money(10) == Money(30)
+    assert Money(10) < Money(20) <= Money(20)
+    assert Money(30) > Money(20) >= Money(20)
+
+
+def test_money_currency_mismatch():
+    with pytest.raises(CurrencyMismatch):
+        Money(10) + Money(10, "USD")
+    with pytest.raises(CurrencyMismatch):
+        Money(10) < Money(10, "USD")
+    assert Money(10) != Money(10, "USD")
+
+
+def test_invalid_money():
+    with pytest.raises(InvalidCurrency):
+        Money(10, "eur")
+    with pytest.raises(InvalidCurrency):
+        Money(10, "EURO")
+    with pytest.raises(MoneyOverflow):
+        Money(2**63)
+    with pytest.raises(MoneyOverflow):
+        Money(2**62) * 2
+
+
+def test_money_bounds():
+    assert Money(10**12).check_bounds() == Money(10**12)
+    assert Money(-(10**12), "JPY").check_bounds() == Money(-(10**12), "JPY")
+    with pytest.raises(AmountOutOfBounds):
+        Money(10**12 + 1).check_bounds()
+    with pytest.raises(AmountOutOfBounds):
+        Money(-(10**12) - 1).check_bounds()
+
+
+def test_money_sum():
+    amounts = [Money(1)] * 1000 + [Money(-250)]
+
+    assert Money.sum(amounts) == Money(750)
+    assert Money.sum([], "JPY") == Money.zero("JPY")
+    assert minor_units_array(amounts).typecode == "q"
+    with pytest.raises(CurrencyMismatch):
+        Money.sum(amounts, "USD")
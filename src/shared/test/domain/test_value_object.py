@@ -14,7 +14,7 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
-
+import pickle
 
 from src.shared.test.domain.mock import MockValueObject, OtherValueObject
 
@@ -44,3 +44,24 @@ def test_value_object_hash():
     assert d[obj1] == "obj2"
     assert d[obj2] == "obj2"
     assert d[obj3] == "obj3"
+
+
+def test_trusted_value_object():
+    obj = MockValueObject.trusted(1)
+
+    assert obj == MockValueObject(1)
+    assert hash(obj) == hash(MockValueObject(1))
+    assert obj != OtherValueObject.trusted(1)
+
+
+def test_value_object_is_slotted():
+    obj = MockValueObject(1)
+
+    assert not hasattr(obj, "__dict__")
+
+
+def test_value_object_pickling():
+    obj = pickle.loads(pickle.dumps(MockValueObject(1)))
+
+    assert obj == MockValueObject(1)
+    assert hash(obj) == hash(MockValueObject(1))
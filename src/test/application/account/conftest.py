@@ -19,9 +19,10 @@ import pytest
 from src.application.account.creator import AccountCreationRequest
 from src.application.account.deleter import AccountDeletionRequest
 from src.domain.account import AccountName
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.test.container import InMemoryContainer
 from src.test.application.account.mock import MockAccountIdFactory
 from src.test.domain.mocks import MockAccountId, MockUserId
+from src.shared.domain.money import Money
 
 
 @pytest.fixture
@@ -36,9 +37,31 @@ def account_id_factory(container: InMemoryContainer):
 
 @pytest.fixture
 def account_creation_request():
-    return AccountCreationRequest(user_id=MockUserId("1"), name=AccountName("account_name"), reference_balance=100.0)
+    return AccountCreationRequest(
+        user_id=MockUserId("1"), name=AccountName("account_name"), reference_balance=Money(10000)
+    )
 
 
 @pytest.fixture
 def account_deletion_request(account_id_factory: MockAccountIdFactory):
     return AccountDeletionRequest(id=account_id_factory.id_template)
+
+
+@pytest.fixture
+def transaction_repository(container: InMemoryContainer):
+    return container.transaction_repository()
+
+
+@pytest.fixture
+def recurring_transaction_repository(container: InMemoryContainer):
+    return container.recurring_transaction_repository()
+
+
+@pytest.fixture
+def account_tombstone_repository(container: InMemoryContainer):
+    return container.account_tombstone_repository()
+
+
+@pytest.fixture
+def unit_of_work(container: InMemoryContainer):
+    return container.unit_of_work()
@@ -14,20 +14,10 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
-import ppa
-
-from src.application.account.repository import AccountRepository
+from src.application.account.cascade import AccountReclamationScheduler
 from src.domain.account import AccountId
 from src.test.domain.mocks import MockAccountId
 from src.shared.application.id import IdFactory
-from src.shared.application.repository import EntityAlreadyExists, EntityNotFound
-
-
-@ppa.in_memory_repository(
-    entity_already_exists_exception=EntityAlreadyExists, entity_not_found_exception=EntityNotFound
-)
-class AccountMockRepository(AccountRepository):
-    pass
 
 
 class MockAccountIdFactory(IdFactory[AccountId]):
@@ -44,3 +34,11 @@ class MockAccountIdFactory(IdFactory[AccountId]):
     @id_template.setter
     def id_template(self, id_template: MockAccountId) -> None:
         self._id_template = id_template
+
+
+class AccountReclamationSchedulerMock(AccountReclamationScheduler):
+    def __init__(self) -> None:
+        self.scheduled: list[AccountId] = []
+
+    def schedule(self, account_id: AccountId) -> None:
+        self.scheduled.append(account_id)
@@ -0,0 +1,131 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.application.account.balance import AccountBalanceCalculator
+from src.application.account.creator import AccountCreationRequest, AccountCreator
+from src.application.account.repository import AccountRepository, AccountNotFound
+from src.application.transaction.creator import TransactionCreator, TransactionCreationRequest
+from src.application.transaction.deleter import TransactionDeleter, TransactionDeletionRequest
+from src.application.transaction.repository import TransactionRepository
+from src.application.transaction.updater import TransactionUpdater, TransactionUpdateRequest
+from src.test.application.account.mock import MockAccountIdFactory
+from src.test.domain.mocks import MockTransactionId
+from src.shared.domain.money import Money
+
+
+@pytest.fixture
+def account_balance_calculator(account_repository: AccountRepository, transaction_repository: TransactionRepository):
+    return AccountBalanceCalculator(
+        account_repository=account_repository, transaction_repository=transaction_repository
+    )
+
+
+@pytest.fixture
+def transaction_creator(
+    transaction_repository: TransactionRepository, account_balance_calculator: AccountBalanceCalculator
+):
+    return TransactionCreator(repository=transaction_repository, observers=[account_balance_calculator])
+
+
+@pytest.fixture
+def created_account(
+    account_creation_request: AccountCreationRequest,
+    account_repository: AccountRepository,
+    account_id_factory: MockAccountIdFactory,
+):
+    AccountCreator(repository=account_repository, id_factory=account_id_factory).create(account_creation_request)
+    return account_repository.retrieve(account_id_factory.id_template)
+
+
+def _create(transaction_creator: TransactionCreator, account_id, id_: str, date: datetime.date, amount: Money):
+    transaction_creator.create(
+        TransactionCreationRequest(
+            id=MockTransactionId(id_), account_id=account_id, date=date, label=id_, amount=amount
+        )
+    )
+
+
+def test_balance(
+    created_account,
+    transaction_repository: TransactionRepository,
+    account_balance_calculator: AccountBalanceCalculator,
+    transaction_creator: TransactionCreator,
+):
+    _create(transaction_creator, created_account.id, "1", datetime.date(2023, 1, 1), Money(-1000))
+    _create(transaction_creator, created_account.id, "2", datetime.date(2023, 2, 1), Money(2500))
+    _create(transaction_creator, created_account.id, "3", datetime.date(2043, 2, 1), Money(100000))
+
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2022, 12, 31)) == Money(10000)
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2023, 1, 1)) == Money(9000)
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2023, 6, 1)) == Money(11500)
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2050, 1, 1)) == Money(111500)
+
+
+def test_balance_follows_transaction_changes(
+    created_account,
+    transaction_repository: TransactionRepository,
+    account_balance_calculator: AccountBalanceCalculator,
+    transaction_creator: TransactionCreator,
+):
+    _create(transaction_creator, created_account.id, "1", datetime.date(2023, 1, 1), Money(-1000))
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2023, 1, 1)) == Money(9000)
+
+    _create(transaction_creator, created_account.id, "2", datetime.date(2023, 1, 1), Money(-500))
+    TransactionUpdater(repository=transaction_repository, observers=[account_balance_calculator]).update(
+        TransactionUpdateRequest(
+            id=MockTransactionId("1"),
+            account_id=created_account.id,
+            date=datetime.date(2023, 3, 1),
+            label="1",
+            amount=Money(-2000),
+        )
+    )
+
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2023, 1, 1)) == Money(9500)
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2023, 3, 1)) == Money(7500)
+
+    TransactionDeleter(repository=transaction_repository, observers=[account_balance_calculator]).delete(
+        TransactionDeletionRequest(id=MockTransactionId("2"))
+    )
+
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2023, 3, 1)) == Money(8000)
+
+
+def test_balance_of_unexisting_account(
+    account_balance_calculator: AccountBalanceCalculator, account_id_factory: MockAccountIdFactory
+):
+    with pytest.raises(AccountNotFound):
+        account_balance_calculator.balance(account_id_factory.id_template, datetime.date(2023, 1, 1))
+
+
+def test_balance_with_transactions_far_apart(
+    created_account,
+    account_balance_calculator: AccountBalanceCalculator,
+    transaction_creator: TransactionCreator,
+):
+    _create(transaction_creator, created_account.id, "1", datetime.date.min, Money(-1000))
+    _create(transaction_creator, created_account.id, "2", datetime.date.max, Money(2500))
+
+    assert account_balance_calculator.balance(created_account.id, datetime.date.min) == Money(9000)
+    assert account_balance_calculator.balance(created_account.id, datetime.date(2023, 1, 1)) == Money(9000)
+    assert account_balance_calculator.balance(created_account.id, datetime.date.max) == Money(11500)
+    assert account_balance_calculator.balances(
+        created_account.id, datetime.date.max - datetime.timedelta(days=1), 2
+    ) == [Money(9000), Money(11500)]
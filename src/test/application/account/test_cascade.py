@@ -0,0 +1,163 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.application.account.cascade import AccountCascade, AccountTransactionReclaimer
+from src.application.account.deleter import AccountDeleter, AccountDeletionRequest
+from src.application.account.repository import AccountRepository, AccountNotFound
+from src.application.account.tombstone import AccountTombstoneRepository
+from src.application.reccurring_transaction.repository import RecurringTransactionRepository
+from src.application.transaction.fingerprint import TransactionFingerprintIndex
+from src.application.transaction.repository import TransactionRepository
+from src.domain.account import Account, AccountName
+from src.domain.recurring_transaction import RecurringTransaction, RecurringTransactionName, DailyFrequency
+from src.domain.transaction import Transaction
+from src.test.container import InMemoryContainer
+from src.shared.application.unit_of_work import UnitOfWork
+from src.test.application.account.mock import AccountReclamationSchedulerMock
+from src.test.domain.mocks import MockAccountId, MockTransactionId, MockUserId, RecurringTransactionMockId
+from src.shared.domain.money import Money
+
+
+@pytest.fixture
+def account(
+    account_repository: AccountRepository,
+    transaction_repository: TransactionRepository,
+    recurring_transaction_repository: RecurringTransactionRepository,
+):
+    account = Account(MockAccountId("1"), MockUserId("1"), AccountName("checking"), Money(0))
+    account_repository.add(account)
+    transaction_repository.add_many(
+        Transaction(MockTransactionId(str(day)), account.id, datetime.date(2023, 1, day), "label", Money(100))
+        for day in range(1, 8)
+    )
+    transaction_repository.add(
+        Transaction(MockTransactionId("other"), MockAccountId("2"), datetime.date(2023, 1, 1), "label", Money(100))
+    )
+    recurring_transaction_repository.add(
+        RecurringTransaction(
+            RecurringTransactionMockId("1"), account.id, RecurringTransactionName("rent"), Money(-500), DailyFrequency()
+        )
+    )
+    return account
+
+
+def _cascade(
+    account_repository: AccountRepository,
+    transaction_repository: TransactionRepository,
+    recurring_transaction_repository: RecurringTransactionRepository,
+    unit_of_work: UnitOfWork,
+    **kwargs,
+) -> AccountCascade:
+    return AccountCascade(
+        account_repository=account_repository,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+        unit_of_work=unit_of_work,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def fingerprint_index(container: InMemoryContainer, account: Account):
+    fingerprint_index = container.transaction_fingerprint_index()
+    fingerprint_index.add_many(account.id, [bytes([day]) for day in range(1, 8)])
+    fingerprint_index.add_many(MockAccountId("2"), [b"other"])
+    return fingerprint_index
+
+
+def test_delete_removes_dependents(
+    account: Account,
+    account_repository: AccountRepository,
+    transaction_repository: TransactionRepository,
+    recurring_transaction_repository: RecurringTransactionRepository,
+    fingerprint_index: TransactionFingerprintIndex,
+    unit_of_work: UnitOfWork,
+):
+    cascade = _cascade(
+        account_repository,
+        transaction_repository,
+        recurring_transaction_repository,
+        unit_of_work,
+        fingerprint_index=fingerprint_index,
+    )
+    account_deleter = AccountDeleter(repository=account_repository, cascade=cascade)
+
+    account_deleter.delete(AccountDeletionRequest(id=account.id))
+
+    with pytest.raises(AccountNotFound):
+        account_deleter.delete(AccountDeletionRequest(id=account.id))
+    assert list(transaction_repository.list_by_account(account.id)) == []
+    assert list(recurring_transaction_repository.list_by_account(account.id)) == []
+    assert len(list(transaction_repository.list_by_account(MockAccountId("2")))) == 1
+    assert fingerprint_index.delete_by_account(account.id) == 0
+    assert fingerprint_index.known([b"other"]) == {b"other"}
+
+
+def test_asynchronous_delete_tombstones_the_account(
+    account: Account,
+    account_repository: AccountRepository,
+    transaction_repository: TransactionRepository,
+    recurring_transaction_repository: RecurringTransactionRepository,
+    account_tombstone_repository: AccountTombstoneRepository,
+    fingerprint_index: TransactionFingerprintIndex,
+    unit_of_work: UnitOfWork,
+):
+    scheduler = AccountReclamationSchedulerMock()
+    cascade = _cascade(
+        account_repository,
+        transaction_repository,
+        recurring_transaction_repository,
+        unit_of_work,
+        tombstone_repository=account_tombstone_repository,
+        reclamation_scheduler=scheduler,
+    )
+    reclaimer = AccountTransactionReclaimer(
+        transaction_repository,
+        account_tombstone_repository,
+        unit_of_work,
+        batch_size=3,
+        fingerprint_index=fingerprint_index,
+    )
+
+    cascade.delete(account.id)
+
+    assert scheduler.scheduled == [account.id]
+    assert reclaimer.pending() == [account.id]
+    assert list(recurring_transaction_repository.list_by_account(account.id)) == []
+    assert len(list(transaction_repository.list_by_account(account.id))) == 7
+
+    assert reclaimer.reclaim(account.id) == 7
+    assert reclaimer.pending() == []
+    assert list(transaction_repository.list_by_account(account.id)) == []
+    assert len(list(transaction_repository.list_by_account(MockAccountId("2")))) == 1
+    assert fingerprint_index.delete_by_account(account.id) == 0
+    assert fingerprint_index.known([b"other"]) == {b"other"}
+
+
+def test_reclaim_leaves_accounts_not_tombstoned(
+    account: Account,
+    transaction_repository: TransactionRepository,
+    account_tombstone_repository: AccountTombstoneRepository,
+    unit_of_work: UnitOfWork,
+):
+    reclaimer = AccountTransactionReclaimer(transaction_repository, account_tombstone_repository, unit_of_work)
+
+    assert reclaimer.reclaim(account.id) == 0
+    assert len(list(transaction_repository.list_by_account(account.id))) == 7
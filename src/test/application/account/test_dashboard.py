@@ -0,0 +1,216 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.application.account.creator import AccountCreationRequest, AccountCreator
+from src.application.account.dashboard import (
+    AccountDashboardProjection,
+    DashboardOccurrence,
+    DashboardTransaction,
+    MonthlyTotals,
+)
+from src.application.account.deleter import AccountDeleter, AccountDeletionRequest
+from src.application.account.repository import AccountRepository, AccountNotFound
+from src.application.account.updater import AccountUpdater, AccountUpdateRequest
+from src.application.reccurring_transaction.creator import (
+    RecurringTransactionCreator,
+    RecurringTransactionCreationRequest,
+)
+from src.application.reccurring_transaction.repository import RecurringTransactionRepository
+from src.application.transaction.creator import TransactionCreator, TransactionCreationRequest
+from src.application.transaction.deleter import TransactionDeleter, TransactionDeletionRequest
+from src.application.transaction.repository import TransactionRepository
+from src.application.transaction.updater import TransactionUpdater, TransactionUpdateRequest
+from src.domain.account import AccountName
+from src.domain.recurring_transaction import MonthlyFrequency, RecurringTransactionName, WeeklyFrequency, Day
+from src.domain.transaction import Transaction
+from src.test.application.account.mock import MockAccountIdFactory
+from src.test.domain.mocks import MockTransactionId, RecurringTransactionMockId
+from src.shared.domain.money import Money
+
+TODAY = datetime.date(2023, 2, 15)
+
+
+@pytest.fixture
+def projection(
+    account_repository: AccountRepository,
+    transaction_repository: TransactionRepository,
+    recurring_transaction_repository: RecurringTransactionRepository,
+):
+    return AccountDashboardProjection(
+        account_repository=account_repository,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+        last_transactions=2,
+        next_occurrences=3,
+        today=lambda: TODAY,
+    )
+
+
+@pytest.fixture
+def account_id(
+    account_creation_request: AccountCreationRequest,
+    account_repository: AccountRepository,
+    account_id_factory: MockAccountIdFactory,
+    projection: AccountDashboardProjection,
+):
+    AccountCreator(repository=account_repository, id_factory=account_id_factory, observers=[projection]).create(
+        account_creation_request
+    )
+    return account_id_factory.id_template
+
+
+@pytest.fixture
+def transaction_creator(transaction_repository: TransactionRepository, projection: AccountDashboardProjection):
+    return TransactionCreator(repository=transaction_repository, observers=[projection])
+
+
+def _create_transaction(transaction_creator: TransactionCreator, account_id, id_: str, date: datetime.date, amount):
+    transaction_creator.create(
+        TransactionCreationRequest(
+            id=MockTransactionId(id_), account_id=account_id, date=date, label=id_, amount=amount
+        )
+    )
+
+
+def _fresh_dashboard(projection: AccountDashboardProjection, account_id):
+    projection.rebuild([account_id])
+    return projection.dashboard(account_id)
+
+
+def test_dashboard(
+    account_id,
+    projection: AccountDashboardProjection,
+    transaction_creator: TransactionCreator,
+    recurring_transaction_repository: RecurringTransactionRepository,
+):
+    _create_transaction(transaction_creator, account_id, "a", datetime.date(2023, 1, 10), Money(5000))
+    _create_transaction(transaction_creator, account_id, "b", datetime.date(2023, 1, 20), Money(-1000))
+    _create_transaction(transaction_creator, account_id, "c", datetime.date(2023, 2, 1), Money(-300))
+    _create_transaction(transaction_creator, account_id, "d", datetime.date(2023, 3, 1), Money(-700))
+    RecurringTransactionCreator(repository=recurring_transaction_repository, observers=[projection]).create(
+        RecurringTransactionCreationRequest(
+            id=RecurringTransactionMockId("rent"),
+            account_id=account_id,
+            name=RecurringTransactionName("rent"),
+            amount=Money(-2000),
+            frequency=MonthlyFrequency(1),
+        )
+    )
+
+    dashboard = projection.dashboard(account_id)
+
+    assert dashboard.at == TODAY
+    assert dashboard.name == AccountName("account_name")
+    # The transaction of March is not part of the balance yet
+    assert dashboard.balance == Money(10000 + 5000 - 1000 - 300)
+    assert dashboard.monthly_totals == (
+        MonthlyTotals(datetime.date(2023, 1, 1), Money(5000), Money(-1000)),
+        MonthlyTotals(datetime.date(2023, 2, 1), Money(0), Money(-300)),
+        MonthlyTotals(datetime.date(2023, 3, 1), Money(0), Money(-700)),
+    )
+    assert dashboard.last_transactions == (
+        DashboardTransaction(MockTransactionId("c"), datetime.date(2023, 2, 1), "c", Money(-300)),
+        DashboardTransaction(MockTransactionId("b"), datetime.date(2023, 1, 20), "b", Money(-1000)),
+    )
+    assert [occurrence.date for occurrence in dashboard.next_occurrences] == [
+        datetime.date(2023, 3, 1),
+        datetime.date(2023, 4, 1),
+        datetime.date(2023, 5, 1),
+    ]
+    assert dashboard.next_occurrences[0] == DashboardOccurrence(
+        datetime.date(2023, 3, 1), RecurringTransactionMockId("rent"), RecurringTransactionName("rent"), Money(-2000)
+    )
+    assert projection.dashboard(account_id) is dashboard
+
+
+def test_dashboard_follows_changes(
+    account_id,
+    projection: AccountDashboardProjection,
+    transaction_creator: TransactionCreator,
+    transaction_repository: TransactionRepository,
+    recurring_transaction_repository: RecurringTransactionRepository,
+    account_repository: AccountRepository,
+):
+    _create_transaction(transaction_creator, account_id, "a", datetime.date(2023, 1, 10), Money(5000))
+    projection.dashboard(account_id)
+    _create_transaction(transaction_creator, account_id, "b", datetime.date(2023, 2, 10), Money(-1000))
+    TransactionUpdater(repository=transaction_repository, observers=[projection]).update(
+        TransactionUpdateRequest(
+            id=MockTransactionId("a"),
+            account_id=account_id,
+            date=datetime.date(2023, 2, 12),
+            label="a again",
+            amount=Money(4000),
+        )
+    )
+    TransactionDeleter(repository=transaction_repository, observers=[projection]).delete(
+        TransactionDeletionRequest(id=MockTransactionId("b"))
+    )
+    RecurringTransactionCreator(repository=recurring_transaction_repository, observers=[projection]).create(
+        RecurringTransactionCreationRequest(
+            id=RecurringTransactionMockId("gym"),
+            account_id=account_id,
+            name=RecurringTransactionName("gym_class"),
+            amount=Money(-500),
+            frequency=WeeklyFrequency(Day.MONDAY),
+        )
+    )
+    AccountUpdater(repository=account_repository, observers=[projection]).update(
+        AccountUpdateRequest(id=account_id, name=AccountName("renamed"), reference_balance=Money(0))
+    )
+
+    dashboard = projection.dashboard(account_id)
+
+    assert dashboard.name == AccountName("renamed")
+    assert dashboard.balance == Money(4000)
+    assert dashboard.last_transactions == (
+        DashboardTransaction(MockTransactionId("a"), datetime.date(2023, 2, 12), "a again", Money(4000)),
+    )
+    assert len(dashboard.next_occurrences) == 3
+    assert projection.check() == []
+    assert _fresh_dashboard(projection, account_id) == dashboard
+
+
+def test_check_finds_changes_missed_by_the_projection(
+    account_id,
+    projection: AccountDashboardProjection,
+    transaction_creator: TransactionCreator,
+    transaction_repository: TransactionRepository,
+):
+    _create_transaction(transaction_creator, account_id, "a", datetime.date(2023, 1, 10), Money(5000))
+    projection.dashboard(account_id)
+    transaction_repository.add(
+        Transaction(MockTransactionId("b"), account_id, datetime.date(2023, 1, 11), "b", Money(100))
+    )
+
+    assert projection.check() == [account_id]
+    projection.rebuild(projection.check())
+    assert projection.check() == []
+    assert projection.dashboard(account_id).balance == Money(15100)
+
+
+def test_dashboard_of_deleted_account(
+    account_id, projection: AccountDashboardProjection, account_repository: AccountRepository
+):
+    projection.dashboard(account_id)
+    AccountDeleter(repository=account_repository, observers=[projection]).delete(AccountDeletionRequest(id=account_id))
+
+    with pytest.raises(AccountNotFound):
+        projection.dashboard(account_id)
@@ -0,0 +1,193 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.application.account.balance import AccountBalanceCalculator
+from src.application.account.creator import AccountCreationRequest, AccountCreator
+from src.application.account.forecast import AccountBalanceForecaster
+from src.application.account.repository import AccountRepository, AccountNotFound
+from src.application.reccurring_transaction.creator import (
+    RecurringTransactionCreator,
+    RecurringTransactionCreationRequest,
+)
+from src.application.reccurring_transaction.deleter import (
+    RecurringTransactionDeleter,
+    RecurringTransactionDeletionRequest,
+)
+from src.application.reccurring_transaction.repository import RecurringTransactionRepository
+from src.application.transaction.creator import TransactionCreator, TransactionCreationRequest
+from src.application.transaction.repository import TransactionRepository
+from src.domain.recurring_transaction import (
+    RecurringTransactionName,
+    RecurringFrequency,
+    DailyFrequency,
+    WeeklyFrequency,
+    MonthlyFrequency,
+    Day,
+)
+from src.test.application.account.mock import MockAccountIdFactory
+from src.test.domain.mocks import MockTransactionId, RecurringTransactionMockId
+from src.shared.domain.money import Money
+
+START = datetime.date(2023, 1, 30)
+
+
+@pytest.fixture
+def account_balance_calculator(account_repository: AccountRepository, transaction_repository: TransactionRepository):
+    return AccountBalanceCalculator(
+        account_repository=account_repository, transaction_repository=transaction_repository
+    )
+
+
+@pytest.fixture
+def account_balance_forecaster(
+    account_balance_calculator: AccountBalanceCalculator,
+    recurring_transaction_repository: RecurringTransactionRepository,
+):
+    return AccountBalanceForecaster(
+        balance_calculator=account_balance_calculator,
+        recurring_transaction_repository=recurring_transaction_repository,
+    )
+
+
+@pytest.fixture
+def transaction_creator(
+    transaction_repository: TransactionRepository,
+    account_balance_calculator: AccountBalanceCalculator,
+    account_balance_forecaster: AccountBalanceForecaster,
+):
+    return TransactionCreator(
+        repository=transaction_repository, observers=[account_balance_calculator, account_balance_forecaster]
+    )
+
+
+@pytest.fixture
+def recurring_transaction_creator(
+    recurring_transaction_repository: RecurringTransactionRepository,
+    account_balance_forecaster: AccountBalanceForecaster,
+):
+    return RecurringTransactionCreator(
+        repository=recurring_transaction_repository, observers=[account_balance_forecaster]
+    )
+
+
+@pytest.fixture
+def created_account(
+    account_creation_request: AccountCreationRequest,
+    account_repository: AccountRepository,
+    account_id_factory: MockAccountIdFactory,
+):
+    AccountCreator(repository=account_repository, id_factory=account_id_factory).create(account_creation_request)
+    return account_repository.retrieve(account_id_factory.id_template)
+
+
+def _create_transaction(transaction_creator: TransactionCreator, account_id, id_: str, date: datetime.date, amount):
+    transaction_creator.create(
+        TransactionCreationRequest(
+            id=MockTransactionId(id_), account_id=account_id, date=date, label=id_, amount=amount
+        )
+    )
+
+
+def _create_recurring_transaction(
+    recurring_transaction_creator: RecurringTransactionCreator,
+    account_id,
+    id_: str,
+    amount: Money,
+    frequency: RecurringFrequency,
+):
+    recurring_transaction_creator.create(
+        RecurringTransactionCreationRequest(
+            id=RecurringTransactionMockId(id_),
+            account_id=account_id,
+            name=RecurringTransactionName(f"recurring_{id_}"),
+            amount=amount,
+            frequency=frequency,
+        )
+    )
+
+
+def test_forecast(
+    created_account,
+    account_balance_forecaster: AccountBalanceForecaster,
+    transaction_creator: TransactionCreator,
+    recurring_transaction_creator: RecurringTransactionCreator,
+):
+    _create_transaction(transaction_creator, created_account.id, "past", datetime.date(2023, 1, 1), Money(-1000))
+    _create_transaction(transaction_creator, created_account.id, "today", START, Money(-500))
+    _create_transaction(transaction_creator, created_account.id, "future", datetime.date(2023, 2, 3), Money(5000))
+    _create_recurring_transaction(recurring_transaction_creator, created_account.id, "1", Money(-100), DailyFrequency())
+    _create_recurring_transaction(
+        recurring_transaction_creator, created_account.id, "2", Money(-2000), WeeklyFrequency(Day.WEDNESDAY)
+    )
+    _create_recurring_transaction(
+        recurring_transaction_creator, created_account.id, "3", Money(10000), MonthlyFrequency(31)
+    )
+
+    forecast = account_balance_forecaster.forecast(created_account.id, START, 7)
+
+    assert forecast.start == START
+    # Daily -1 from January 31st, weekly -20 on February 1st, monthly +100 on January 31st, +50 on February 3rd
+    assert forecast.balances == (
+        Money(8500),
+        Money(18400),
+        Money(16300),
+        Money(16200),
+        Money(21100),
+        Money(21000),
+        Money(20900),
+    )
+
+
+def test_forecast_follows_changes(
+    created_account,
+    account_balance_forecaster: AccountBalanceForecaster,
+    transaction_creator: TransactionCreator,
+    recurring_transaction_creator: RecurringTransactionCreator,
+    recurring_transaction_repository: RecurringTransactionRepository,
+):
+    _create_recurring_transaction(recurring_transaction_creator, created_account.id, "1", Money(-100), DailyFrequency())
+    assert account_balance_forecaster.forecast(created_account.id, START, 3).balances == (
+        Money(10000),
+        Money(9900),
+        Money(9800),
+    )
+
+    _create_transaction(transaction_creator, created_account.id, "1", datetime.date(2023, 1, 31), Money(1000))
+    assert account_balance_forecaster.forecast(created_account.id, START, 3).balances == (
+        Money(10000),
+        Money(10900),
+        Money(10800),
+    )
+
+    RecurringTransactionDeleter(
+        repository=recurring_transaction_repository, observers=[account_balance_forecaster]
+    ).delete(RecurringTransactionDeletionRequest(id=RecurringTransactionMockId("1")))
+    assert account_balance_forecaster.forecast(created_account.id, START, 3).balances == (
+        Money(10000),
+        Money(11000),
+        Money(11000),
+    )
+
+
+def test_forecast_of_unexisting_account(
+    account_balance_forecaster: AccountBalanceForecaster, account_id_factory: MockAccountIdFactory
+):
+    with pytest.raises(AccountNotFound):
+        account_balance_forecaster.forecast(account_id_factory.id_template, START, 7)
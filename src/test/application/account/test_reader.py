@@ -21,6 +21,7 @@ from src.application.account.reader import AccountReader
 from src.application.account.repository import AccountRepository, AccountNotFound
 from src.domain.account import AccountId
 from src.test.application.mock import MockIdFactory
+from src.test.domain.mocks import MockUserId
 
 
 def test_retrieve(
@@ -42,3 +43,18 @@ def test_retrieve_not_found(
     account_reader = AccountReader(repository=account_repository)
     with pytest.raises(AccountNotFound):
         account_reader.retrieve(account_id_factory.id_template)
+
+
+def test_list_by_user(
+    account_creation_request: AccountCreationRequest,
+    account_repository: AccountRepository,
+    account_id_factory: MockIdFactory[AccountId],
+):
+    sample_account_creator = AccountCreator(repository=account_repository, id_factory=account_id_factory)
+    account_reader = AccountReader(repository=account_repository)
+    sample_account_creator.create(account_creation_request)
+
+    accounts = account_reader.list_by_user(account_creation_request.user_id)
+
+    assert [account.id for account in accounts] == [account_id_factory.id_template]
+    assert account_reader.list_by_user(MockUserId("2")) == []
@@ -14,14 +14,21 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+import datetime
+
 import pytest
 
 from src.application.account.creator import AccountCreationRequest, AccountCreator
 from src.application.account.repository import AccountRepository, AccountNotFound
+from src.application.account.currency import AccountCurrencyInUse
 from src.application.account.updater import AccountUpdateRequest, AccountUpdater
+from src.application.reccurring_transaction.repository import RecurringTransactionRepository
+from src.application.transaction.repository import TransactionRepository
 from src.domain.account import AccountName, Account
+from src.domain.transaction import Transaction
 from src.test.application.account.mock import MockAccountIdFactory
-from src.test.domain.mocks import MockAccountId
+from src.test.domain.mocks import MockAccountId, MockTransactionId
+from src.shared.domain.money import Money
 
 
 @pytest.fixture
@@ -32,7 +39,7 @@ def account_update_request(
     return AccountUpdateRequest(
         id=account_id_factory.id_template,
         name=AccountName(f"{account_creation_request.name}_updated"),
-        reference_balance=account_creation_request.reference_balance + 10,
+        reference_balance=account_creation_request.reference_balance + Money(1000),
     )
 
 
@@ -69,3 +76,31 @@ def test_update_unexisting_account(account_update_request: AccountUpdateRequest,
 
     with pytest.raises(AccountNotFound):
         sample_account_updater.update(account_update_request)
+
+
+def test_update_account_currency(
+    account_creation_request: AccountCreationRequest,
+    account_repository: AccountRepository,
+    transaction_repository: TransactionRepository,
+    recurring_transaction_repository: RecurringTransactionRepository,
+    account_id_factory: MockAccountIdFactory,
+):
+    AccountCreator(repository=account_repository, id_factory=account_id_factory).create(account_creation_request)
+    account_id = account_id_factory.id_template
+    sample_account_updater = AccountUpdater(
+        repository=account_repository,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+    )
+    request = AccountUpdateRequest(account_id, AccountName("account_name"), Money(100, "JPY"))
+
+    sample_account_updater.update(request)
+    assert account_repository.retrieve(account_id).reference_balance == Money(100, "JPY")
+
+    transaction_repository.add(
+        Transaction(MockTransactionId("1"), account_id, datetime.date(2023, 1, 1), "label", Money(-10, "JPY"))
+    )
+    with pytest.raises(AccountCurrencyInUse):
+        sample_account_updater.update(AccountUpdateRequest(account_id, AccountName("account_name"), Money(100)))
+    sample_account_updater.update(AccountUpdateRequest(account_id, AccountName("renamed"), Money(200, "JPY")))
+    assert account_repository.retrieve(account_id).reference_balance == Money(200, "JPY")
@@ -3,8 +3,9 @@ import pytest
 from src.application.reccurring_transaction.creator import RecurringTransactionCreationRequest
 from src.application.reccurring_transaction.deleter import RecurringTransactionDeletionRequest
 from src.domain.recurring_transaction import RecurringTransactionName, DailyFrequency
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.test.container import InMemoryContainer
 from src.test.domain.mocks import RecurringTransactionMockId, MockAccountId
+from src.shared.domain.money import Money
 
 
 @pytest.fixture
@@ -18,7 +19,7 @@ def recurring_transaction_creation_request():
         id=RecurringTransactionMockId("1"),
         account_id=MockAccountId("1"),
         name=RecurringTransactionName("RecurringTransaction"),
-        amount=1.0,
+        amount=Money(100),
         frequency=DailyFrequency,
     )
 
@@ -23,8 +23,12 @@ from src.application.reccurring_transaction.creator import (
 from src.application.reccurring_transaction.repository import (
     RecurringTransactionRepository,
     RecurringTransactionAlreadyExists,
+    RecurringTransactionNotFound,
 )
-from src.test.domain.mocks import RecurringTransactionMockId
+from src.domain.account import Account, AccountName
+from src.test.container import InMemoryContainer
+from src.shared.domain.money import CurrencyMismatch, Money
+from src.test.domain.mocks import RecurringTransactionMockId, MockAccountId, MockUserId
 
 
 def test_create_recurring_transaction(
@@ -47,3 +51,20 @@ def test_create_recurring_transaction_already_exists(
 
     with pytest.raises(RecurringTransactionAlreadyExists):
         sample_recurring_transaction_creator.create(recurring_transaction_creation_request)
+
+
+def test_create_recurring_transaction_in_another_currency(
+    recurring_transaction_creation_request: RecurringTransactionCreationRequest,
+    recurring_transaction_repository: RecurringTransactionRepository,
+    container: InMemoryContainer,
+):
+    account_repository = container.account_repository()
+    account_repository.add(Account(MockAccountId("1"), MockUserId("1"), AccountName("account_name"), Money(0, "JPY")))
+    sample_recurring_transaction_creator = RecurringTransactionCreator(
+        repository=recurring_transaction_repository, account_repository=account_repository
+    )
+
+    with pytest.raises(CurrencyMismatch):
+        sample_recurring_transaction_creator.create(recurring_transaction_creation_request)
+    with pytest.raises(RecurringTransactionNotFound):
+        recurring_transaction_repository.retrieve(RecurringTransactionMockId("1"))
@@ -19,6 +19,7 @@ from src.domain.recurring_transaction import (
     RecurringTransaction,
 )
 from src.test.domain.mocks import RecurringTransactionMockId
+from src.shared.domain.money import Money
 
 
 @pytest.fixture
@@ -27,7 +28,7 @@ def recurring_transaction_update_request(recurring_transaction_creation_request:
         id=recurring_transaction_creation_request.id,
         account_id=recurring_transaction_creation_request.account_id,
         name=RecurringTransactionName(f"{recurring_transaction_creation_request.name}_updated"),
-        amount=recurring_transaction_creation_request.amount + 10,
+        amount=recurring_transaction_creation_request.amount + Money(1000),
         frequency=WeeklyFrequency(Day(1)),
     )
 
@@ -21,8 +21,9 @@ import pytest
 
 from src.application.transaction.creator import TransactionCreationRequest
 from src.application.transaction.deleter import TransactionDeletionRequest
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.test.container import InMemoryContainer
 from src.test.domain.mocks import MockTransactionId, MockAccountId
+from src.shared.domain.money import Money
 
 
 @pytest.fixture
@@ -30,10 +31,19 @@ def transaction_repository(container: InMemoryContainer):
     return container.transaction_repository()
 
 
+@pytest.fixture
+def account_repository(container: InMemoryContainer):
+    return container.account_repository()
+
+
 @pytest.fixture
 def transaction_creation_request():
     return TransactionCreationRequest(
-        id=MockTransactionId("1"), account_id=MockAccountId("1"), date=datetime.date.today(), label="label", amount=1.0
+        id=MockTransactionId("1"),
+        account_id=MockAccountId("1"),
+        date=datetime.date.today(),
+        label="label",
+        amount=Money(100),
     )
 
 
@@ -1,11 +1,51 @@
-import ppa
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from itertools import count
+from typing import BinaryIO, Iterator, Sequence
 
-from src.application.transaction.repository import TransactionRepository
-from src.shared.application.repository import EntityAlreadyExists, EntityNotFound
+from src.application.transaction.observer import TransactionObserver
+from src.application.transaction.statement import StatementReader, StatementEntry, InvalidStatementEntry
+from src.domain.transaction import Transaction, TransactionId
+from src.shared.application.id import IdFactory
+from src.test.domain.mocks import MockTransactionId
 
 
-@ppa.in_memory_repository(
-    entity_already_exists_exception=EntityAlreadyExists, entity_not_found_exception=EntityNotFound
-)
-class TransactionMockRepository(TransactionRepository):
-    pass
+class MockTransactionIdFactory(IdFactory[TransactionId]):
+    def __init__(self) -> None:
+        self._counter = count(1)
+
+    def generate_id(self) -> MockTransactionId:
+        return MockTransactionId(f"mock_id_{next(self._counter)}")
+
+
+class StatementMockReader(StatementReader):
+    def __init__(self, entries: Sequence[StatementEntry | InvalidStatementEntry] = ()) -> None:
+        self.entries = entries
+
+    def read(self, statement: BinaryIO) -> Iterator[StatementEntry | InvalidStatementEntry]:
+        return iter(self.entries)
+
+
+class TransactionObserverMock(TransactionObserver):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Transaction]] = []
+
+    def on_transaction_added(self, transaction: Transaction) -> None:
+        self.events.append(("added", transaction))
+
+    def on_transaction_removed(self, transaction: Transaction) -> None:
+        self.events.append(("removed", transaction))
@@ -0,0 +1,105 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.application.account.repository import AccountRepository
+from src.application.transaction.batch import TransactionBatchProcessor, TransactionBatchRequest
+from src.application.transaction.creator import TransactionCreationRequest
+from src.application.transaction.deleter import TransactionDeletionRequest
+from src.application.transaction.repository import TransactionRepository, TransactionAlreadyExists, TransactionNotFound
+from src.application.transaction.updater import TransactionUpdateRequest
+from src.domain.account import Account, AccountName
+from src.domain.transaction import Transaction
+from src.test.application.transaction.mock import TransactionObserverMock
+from src.test.domain.mocks import MockAccountId, MockTransactionId, MockUserId
+from src.shared.domain.money import CurrencyMismatch, Money
+
+DATE = datetime.date(2023, 1, 1)
+
+
+@pytest.fixture
+def existing_transactions(transaction_repository: TransactionRepository):
+    transactions = [
+        Transaction(MockTransactionId("1"), MockAccountId("1"), DATE, "first", Money(100)),
+        Transaction(MockTransactionId("2"), MockAccountId("1"), DATE, "second", Money(200)),
+        Transaction(MockTransactionId("3"), MockAccountId("2"), DATE, "other account", Money(300)),
+    ]
+    transaction_repository.add_many(transactions)
+    return transactions
+
+
+def test_process_batch(transaction_repository: TransactionRepository, existing_transactions: list[Transaction]):
+    observer = TransactionObserverMock()
+    processor = TransactionBatchProcessor(repository=transaction_repository, observers=[observer])
+
+    errors = processor.process(
+        TransactionBatchRequest(
+            account_id=MockAccountId("1"),
+            operations=[
+                TransactionCreationRequest(MockTransactionId("4"), MockAccountId("1"), DATE, "fourth", Money(400)),
+                TransactionCreationRequest(MockTransactionId("1"), MockAccountId("1"), DATE, "duplicate", Money(100)),
+                TransactionUpdateRequest(MockTransactionId("1"), MockAccountId("1"), DATE, "updated", Money(1000)),
+                TransactionUpdateRequest(
+                    MockTransactionId("3"), MockAccountId("1"), DATE, "other account", Money(3000)
+                ),
+                TransactionDeletionRequest(MockTransactionId("2")),
+                TransactionDeletionRequest(MockTransactionId("5")),
+            ],
+        )
+    )
+
+    assert [type(error) for error in errors] == [
+        type(None),
+        TransactionAlreadyExists,
+        type(None),
+        TransactionNotFound,
+        type(None),
+        TransactionNotFound,
+    ]
+    assert [
+        (transaction.label, transaction.amount)
+        for transaction in transaction_repository.list_by_account(MockAccountId("1"))
+    ] == [("updated", Money(1000)), ("fourth", Money(400))]
+    assert transaction_repository.retrieve(MockTransactionId("3")).amount == Money(300)
+    assert [(event, transaction.label) for event, transaction in observer.events] == [
+        ("added", "fourth"),
+        ("removed", "first"),
+        ("added", "updated"),
+        ("removed", "second"),
+    ]
+
+
+def test_process_batch_in_another_currency(
+    transaction_repository: TransactionRepository, account_repository: AccountRepository
+):
+    account_repository.add(Account(MockAccountId("1"), MockUserId("1"), AccountName("account_name"), Money(0)))
+    processor = TransactionBatchProcessor(repository=transaction_repository, account_repository=account_repository)
+
+    errors = processor.process(
+        TransactionBatchRequest(
+            account_id=MockAccountId("1"),
+            operations=[
+                TransactionCreationRequest(MockTransactionId("1"), MockAccountId("1"), DATE, "yen", Money(100, "JPY")),
+                TransactionCreationRequest(MockTransactionId("2"), MockAccountId("1"), DATE, "euro", Money(100)),
+            ],
+        )
+    )
+
+    assert [type(error) for error in errors] == [CurrencyMismatch, type(None)]
+    assert [transaction.label for transaction in transaction_repository.list_by_account(MockAccountId("1"))] == ["euro"]
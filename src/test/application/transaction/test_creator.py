@@ -1,7 +1,10 @@
+import dataclasses
+
 import pytest
 
 from src.application.transaction.creator import TransactionCreationRequest, TransactionCreator
 from src.application.transaction.repository import TransactionRepository, TransactionAlreadyExists
+from src.shared.domain.money import AmountOutOfBounds, Money
 from src.test.domain.mocks import MockTransactionId
 
 
@@ -23,3 +26,13 @@ def test_create_transaction_already_exists(
 
     with pytest.raises(TransactionAlreadyExists):
         sample_transaction_creator.create(transaction_creation_request)
+
+
+def test_create_transaction_beyond_the_bound(
+    transaction_creation_request: TransactionCreationRequest, transaction_repository: TransactionRepository
+):
+    sample_transaction_creator = TransactionCreator(repository=transaction_repository)
+
+    with pytest.raises(AmountOutOfBounds):
+        sample_transaction_creator.create(dataclasses.replace(transaction_creation_request, amount=Money(2**62)))
+    assert list(transaction_repository.list_by_account(transaction_creation_request.account_id)) == []
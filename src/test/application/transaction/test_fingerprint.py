@@ -0,0 +1,60 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.application.transaction.fingerprint import fingerprint
+from src.application.transaction.statement import StatementEntry
+from src.test.domain.mocks import MockAccountId
+from src.shared.domain.money import Money
+
+DATE = datetime.date(2023, 1, 1)
+
+
+@pytest.mark.parametrize("label", ["coffee shop", "  coffee shop", "coffee  shop ", "coffee\tshop", "Coffee Shop"])
+def test_labels_differing_by_whitespaces_or_case_match(label: str):
+    assert fingerprint(MockAccountId("1"), StatementEntry(DATE, label, Money(-250))) == fingerprint(
+        MockAccountId("1"), StatementEntry(DATE, "coffee shop", Money(-250))
+    )
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        StatementEntry(DATE, "coffeeshop", Money(-250)),
+        StatementEntry(DATE, "coffee shop", Money(-240)),
+        StatementEntry(DATE + datetime.timedelta(days=1), "coffee shop", Money(-250)),
+    ],
+)
+def test_different_entries_do_not_match(entry: StatementEntry):
+    assert fingerprint(MockAccountId("1"), entry) != fingerprint(
+        MockAccountId("1"), StatementEntry(DATE, "coffee shop", Money(-250))
+    )
+
+
+def test_entries_match_by_reference():
+    assert fingerprint(MockAccountId("1"), StatementEntry(DATE, "coffee shop", Money(-250), "ABC")) == fingerprint(
+        MockAccountId("1"), StatementEntry(DATE, "corrected label", Money(-250), "ABC")
+    )
+
+
+def test_fingerprints_depend_on_account_and_occurrence():
+    entry = StatementEntry(DATE, "coffee shop", Money(-250))
+
+    assert fingerprint(MockAccountId("1"), entry) != fingerprint(MockAccountId("2"), entry)
+    assert fingerprint(MockAccountId("1"), entry) != fingerprint(MockAccountId("1"), entry, occurrence=1)
@@ -0,0 +1,158 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import io
+
+import pytest
+
+from src.application.transaction.fingerprint import TransactionFingerprintIndex
+from src.application.transaction.importer import (
+    TransactionImporter,
+    TransactionImportRequest,
+    TransactionImportReport,
+)
+from src.application.transaction.repository import TransactionRepository
+from src.application.transaction.statement import StatementEntry, InvalidStatementEntry
+from src.test.container import InMemoryContainer
+from src.test.application.transaction.mock import MockTransactionIdFactory, StatementMockReader
+from src.domain.account import Account, AccountName
+from src.test.domain.mocks import MockAccountId, MockUserId
+from src.shared.domain.money import CurrencyMismatch, Money
+
+
+@pytest.fixture
+def fingerprint_index(container: InMemoryContainer):
+    return container.transaction_fingerprint_index()
+
+
+@pytest.fixture
+def statement_reader():
+    return StatementMockReader(
+        [
+            StatementEntry(datetime.date(2023, 1, 1), "first", Money(-100), "1"),
+            InvalidStatementEntry("Invalid amount"),
+            StatementEntry(datetime.date(2023, 1, 2), "second", Money(-200), "2"),
+            StatementEntry(datetime.date(2023, 1, 3), "third", Money(300)),
+            InvalidStatementEntry("Invalid posting date"),
+        ]
+    )
+
+
+@pytest.fixture
+def importer_factory(
+    transaction_repository: TransactionRepository,
+    fingerprint_index: TransactionFingerprintIndex,
+    statement_reader: StatementMockReader,
+):
+    def make(batch_size: int = 1000) -> TransactionImporter:
+        return TransactionImporter(
+            repository=transaction_repository,
+            id_factory=MockTransactionIdFactory(),
+            statement_reader=statement_reader,
+            fingerprint_index=fingerprint_index,
+            batch_size=batch_size,
+        )
+
+    return make
+
+
+def _import(importer: TransactionImporter, account_id: str = "1") -> TransactionImportReport:
+    return importer.import_statement(
+        TransactionImportRequest(account_id=MockAccountId(account_id), statement=io.BytesIO())
+    )
+
+
+def _imported(transaction_repository: TransactionRepository, account_id: str = "1") -> list[tuple]:
+    return [
+        (transaction.date, transaction.label, transaction.amount)
+        for transaction in transaction_repository.list_by_account(MockAccountId(account_id))
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_import_statement(transaction_repository: TransactionRepository, importer_factory, batch_size: int):
+    report = _import(importer_factory(batch_size))
+
+    assert report == TransactionImportReport(inserted=3, skipped=2)
+    assert _imported(transaction_repository) == [
+        (datetime.date(2023, 1, 1), "first", Money(-100)),
+        (datetime.date(2023, 1, 2), "second", Money(-200)),
+        (datetime.date(2023, 1, 3), "third", Money(300)),
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [1, 1000])
+def test_import_statement_twice(transaction_repository: TransactionRepository, importer_factory, batch_size: int):
+    importer = importer_factory(batch_size)
+    _import(importer)
+
+    assert _import(importer) == TransactionImportReport(inserted=0, skipped=5)
+    assert len(_imported(transaction_repository)) == 3
+    assert _import(importer, account_id="2") == TransactionImportReport(inserted=3, skipped=2)
+
+
+def test_import_overlapping_statement(
+    transaction_repository: TransactionRepository, importer_factory, statement_reader: StatementMockReader
+):
+    importer = importer_factory()
+    _import(importer)
+    statement_reader.entries = [
+        StatementEntry(datetime.date(2023, 1, 2), "other label", Money(-500), "2"),
+        StatementEntry(datetime.date(2023, 1, 3), "  THIRD ", Money(300)),
+        StatementEntry(datetime.date(2023, 1, 3), "third\t", Money(300)),
+        StatementEntry(datetime.date(2023, 1, 4), "fourth", Money(400), "4"),
+    ]
+
+    assert _import(importer) == TransactionImportReport(inserted=2, skipped=2)
+    assert _imported(transaction_repository)[-2:] == [
+        (datetime.date(2023, 1, 3), "third\t", Money(300)),
+        (datetime.date(2023, 1, 4), "fourth", Money(400)),
+    ]
+
+
+def test_import_identical_entries(transaction_repository: TransactionRepository, importer_factory, statement_reader):
+    statement_reader.entries = [
+        StatementEntry(datetime.date(2023, 1, 1), "coffee", Money(-200)),
+        StatementEntry(datetime.date(2023, 1, 1), "coffee ", Money(-200)),
+        StatementEntry(datetime.date(2023, 1, 1), "tea", Money(-200), "1"),
+        StatementEntry(datetime.date(2023, 1, 1), "tea", Money(-200), "1"),
+    ]
+    importer = importer_factory(batch_size=1)
+
+    assert _import(importer) == TransactionImportReport(inserted=3, skipped=1)
+    assert _import(importer) == TransactionImportReport(inserted=0, skipped=4)
+
+
+def test_import_statement_in_another_currency(
+    transaction_repository: TransactionRepository,
+    fingerprint_index: TransactionFingerprintIndex,
+    statement_reader: StatementMockReader,
+    container: InMemoryContainer,
+):
+    account_repository = container.account_repository()
+    account_repository.add(Account(MockAccountId("1"), MockUserId("1"), AccountName("account_name"), Money(0, "JPY")))
+    importer = TransactionImporter(
+        repository=transaction_repository,
+        id_factory=MockTransactionIdFactory(),
+        statement_reader=statement_reader,
+        fingerprint_index=fingerprint_index,
+        account_repository=account_repository,
+    )
+
+    with pytest.raises(CurrencyMismatch):
+        _import(importer)
+    assert _imported(transaction_repository) == []
@@ -7,6 +7,7 @@ from src.application.transaction.repository import TransactionRepository, Transa
 from src.application.transaction.updater import TransactionUpdateRequest, TransactionUpdater
 from src.domain.transaction import Transaction
 from src.test.domain.mocks import MockTransactionId
+from src.shared.domain.money import Money
 
 
 @pytest.fixture
@@ -14,7 +15,7 @@ def transaction_update_request(transaction_creation_request: TransactionUpdateRe
     return TransactionUpdateRequest(
         id=transaction_creation_request.id,
         account_id=transaction_creation_request.account_id,
-        amount=transaction_creation_request.amount + 10,
+        amount=transaction_creation_request.amount + Money(1000),
         date=datetime.date.today(),
         label=f"{transaction_creation_request.label}_updated",
     )
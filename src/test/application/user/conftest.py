@@ -19,7 +19,7 @@ import pytest
 from src.application.user.creator import UserCreationRequest
 from src.application.user.repository import UserRepository
 from src.domain.user import UserName, UserId
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.test.container import InMemoryContainer
 from src.test.application.mock import MockIdFactory
 from src.shared.domain.email import EmailAddress
 
@@ -34,6 +34,9 @@ class ValidationEmailMockSender(ValidationEmailSender):
         if email_address != token:
             raise InvalidToken()
 
+    def use_validation_token(self, email_address: EmailAddress, token: str) -> None:
+        self.check_validation_token(email_address, token)
+
 
 class EmailAddressCheckerMock(EmailAddressChecker):
     def __init__(self) -> None:
@@ -0,0 +1,40 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.application.user.repository import UserRepository, UserEmailAddressAlreadyUsed
+from src.domain.user import User, UserId, UserName
+from src.test.container import InMemoryContainer
+from src.shared.domain.email import EmailAddress
+from src.test.application.mock import MockIdFactory
+
+
+def test_check_unused_email_address(container: InMemoryContainer, user_repository: UserRepository) -> None:
+    email_address_checker = container.email_address_checker(repository=user_repository)
+
+    email_address_checker.check(EmailAddress("john@example.com"))
+
+
+def test_check_used_email_address(
+    container: InMemoryContainer, user_repository: UserRepository, user_id_factory: MockIdFactory[UserId]
+) -> None:
+    email_address_checker = container.email_address_checker(repository=user_repository)
+    email_address = EmailAddress("john@example.com")
+    user_repository.add(User(user_id_factory.generate_id(), email_address, UserName("john_doe")))
+
+    with pytest.raises(UserEmailAddressAlreadyUsed):
+        email_address_checker.check(email_address)
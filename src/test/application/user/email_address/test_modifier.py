@@ -14,12 +14,15 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+import pytest
+
 from src.application.user.creator import UserCreator, UserCreationRequest
 from src.application.user.email_address.modifier import UserEmailAddressModificationRequest, UserEmailAddressModifier
-from src.application.user.repository import UserRepository
-from src.domain.user import UserId
+from src.application.user.repository import UserRepository, UserEmailAddressAlreadyUsed
+from src.domain.user import UserId, User, UserName
 from src.shared.domain.email import EmailAddress
 from src.test.application.mock import MockIdFactory
+from src.test.domain.mocks import MockUserId
 
 
 def test_modify(
@@ -38,3 +41,20 @@ def test_modify(
     )
 
     assert user_repository.retrieve(user_id_factory.id_template).email_address == new_email_address
+
+
+def test_modify_email_address_already_used(
+    user_creation_request: UserCreationRequest,
+    user_repository: UserRepository,
+    user_id_factory: MockIdFactory[UserId],
+):
+    user_email_address_modifier = UserEmailAddressModifier(repository=user_repository)
+    UserCreator(repository=user_repository, id_factory=user_id_factory).create(user_creation_request)
+    used_email_address = EmailAddress("jane@example.com")
+    user_repository.add(User(MockUserId("other"), used_email_address, UserName("jane_doe")))
+
+    with pytest.raises(UserEmailAddressAlreadyUsed):
+        user_email_address_modifier.modify(
+            UserEmailAddressModificationRequest(user_id=user_id_factory.id_template, email_address=used_email_address)
+        )
+    assert user_repository.retrieve(user_id_factory.id_template).email_address == user_creation_request.email_address
@@ -14,7 +14,7 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.test.container import InMemoryContainer
 from src.test.application.user.email_address.mock import ValidationEmailMockSender, EmailAddressCheckerMock
 from src.shared.domain.email import EmailAddress
 
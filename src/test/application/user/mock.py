@@ -15,22 +15,10 @@
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
 
-import ppa
-
-from src.application.user.repository import UserRepository
 from src.domain.user import UserId
 from src.infrastructure.user.password.vault import UserPasswordVault, InvalidPassword
 from src.test.application.mock import mock_id_factory, MockIdFactory
 from src.test.domain.mocks import MockUserId
-from src.shared.application.repository import EntityAlreadyExists, EntityNotFound
-from src.shared.domain.email import EmailAddress
-
-
-@ppa.in_memory_repository(
-    entity_already_exists_exception=EntityAlreadyExists, entity_not_found_exception=EntityNotFound
-)
-class UserMockRepository(UserRepository):
-    pass
 
 
 @mock_id_factory(MockUserId)
@@ -40,11 +28,17 @@ class MockUserIdFactory(MockIdFactory[UserId]):
 
 class UserPasswordVaultMock(UserPasswordVault):
     def __init__(self) -> None:
-        self._passwords: dict[EmailAddress, str] = {}
+        self._passwords: dict[UserId, str] = {}
+
+    async def hash(self, password: str) -> str:
+        return password
+
+    def store(self, user_id: UserId, password_hash: str) -> None:
+        self._passwords[user_id] = password_hash
 
-    def save(self, email_address: EmailAddress, password: str) -> None:
-        self._passwords[email_address] = password
+    def delete(self, user_id: UserId) -> None:
+        self._passwords.pop(user_id, None)
 
-    def check(self, email_address: EmailAddress, password: str) -> None:
-        if self._passwords.get(email_address) != password:
+    async def check(self, user_id: UserId | None, password: str) -> None:
+        if user_id is None or self._passwords.get(user_id) != password:
             raise InvalidPassword()
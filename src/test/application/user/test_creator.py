@@ -17,9 +17,10 @@
 import pytest
 
 from src.application.user.creator import UserCreationRequest, UserCreator
-from src.application.user.repository import UserAlreadyExists, UserRepository
-from src.domain.user import UserId
+from src.application.user.repository import UserAlreadyExists, UserRepository, UserEmailAddressAlreadyUsed
+from src.domain.user import UserId, User, UserName
 from src.test.application.mock import MockIdFactory
+from src.test.domain.mocks import MockUserId
 
 
 def test_create_user(
@@ -29,8 +30,9 @@ def test_create_user(
 ):
     sample_user_creator = UserCreator(repository=user_repository, id_factory=user_id_factory)
 
-    sample_user_creator.create(user_creation_request)
+    user_id = sample_user_creator.create(user_creation_request)
 
+    assert user_id == user_id_factory.id_template
     assert user_repository.retrieve(user_id_factory.id_template)
 
 
@@ -44,3 +46,15 @@ def test_create_user_already_exists(
 
     with pytest.raises(UserAlreadyExists):
         sample_user_creator.create(user_creation_request)
+
+
+def test_create_user_email_address_already_used(
+    user_creation_request: UserCreationRequest,
+    user_repository: UserRepository,
+    user_id_factory: MockIdFactory[UserId],
+):
+    user_repository.add(User(MockUserId("other"), user_creation_request.email_address, UserName("jane_doe")))
+    sample_user_creator = UserCreator(repository=user_repository, id_factory=user_id_factory)
+
+    with pytest.raises(UserEmailAddressAlreadyUsed):
+        sample_user_creator.create(user_creation_request)
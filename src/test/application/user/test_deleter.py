@@ -17,11 +17,17 @@
 import pytest
 from pytest_mock import MockerFixture
 
+from src.application.account.deleter import AccountDeleter
+from src.application.account.reader import AccountReader
 from src.application.user.creator import UserCreationRequest, UserCreator
 from src.application.user.deleter import UserDeletionRequest, UserDeleter
 from src.application.user.repository import UserRepository, UserNotFound
+from src.domain.account import Account, AccountName
 from src.domain.user import UserId
+from src.test.container import InMemoryContainer
 from src.test.application.mock import MockIdFactory
+from src.test.domain.mocks import MockAccountId
+from src.shared.domain.money import Money
 
 
 @pytest.fixture
@@ -53,3 +59,24 @@ def test_delete_unexisting_user(user_deletion_request: UserDeletionRequest, user
 
     with pytest.raises(UserNotFound):
         sample_user_deleter.delete(user_deletion_request)
+
+
+def test_delete_user_cascades_to_accounts(
+    container: InMemoryContainer,
+    user_creation_request: UserCreationRequest,
+    user_deletion_request: UserDeletionRequest,
+    user_repository: UserRepository,
+    user_id_factory: MockIdFactory[UserId],
+):
+    account_repository = container.account_repository()
+    sample_user_creator = UserCreator(repository=user_repository, id_factory=user_id_factory)
+    sample_user_deleter = UserDeleter(
+        repository=user_repository, account_deleter=AccountDeleter(repository=account_repository)
+    )
+    sample_user_creator.create(user_creation_request)
+    account_repository.add(Account(MockAccountId("1"), user_deletion_request.id, AccountName("checking"), Money(0)))
+    account_repository.add(Account(MockAccountId("2"), user_deletion_request.id, AccountName("savings"), Money(0)))
+
+    sample_user_deleter.delete(user_deletion_request)
+
+    assert AccountReader(repository=account_repository).list_by_user(user_deletion_request.id) == []
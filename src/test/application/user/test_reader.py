@@ -14,11 +14,14 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+import pytest
+
 from src.application.user.creator import UserCreationRequest, UserCreator
 from src.application.user.reader import UserReader
-from src.application.user.repository import UserRepository
+from src.application.user.repository import UserRepository, UserEmailAddressNotFound
 from src.domain.user import UserId
 from src.test.application.mock import MockIdFactory
+from src.shared.domain.email import EmailAddress
 
 
 def test_retrieve(
@@ -31,3 +34,16 @@ def test_retrieve(
     sample_user_creator.create(user_creation_request)
 
     assert user_reader.retrieve(user_id_factory.id_template)
+
+
+def test_retrieve_by_email_address(
+    user_creation_request: UserCreationRequest,
+    user_repository: UserRepository,
+    user_id_factory: MockIdFactory[UserId],
+):
+    UserCreator(repository=user_repository, id_factory=user_id_factory).create(user_creation_request)
+    user_reader = UserReader(repository=user_repository)
+
+    assert user_reader.retrieve_by_email_address(user_creation_request.email_address).id == user_id_factory.id_template
+    with pytest.raises(UserEmailAddressNotFound):
+        user_reader.retrieve_by_email_address(EmailAddress("jane@example.com"))
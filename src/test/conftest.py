@@ -16,7 +16,7 @@
 #   */
 import pytest
 
-from src.infrastructure.containers.in_memory import InMemoryContainer
+from src.test.container import InMemoryContainer
 
 
 @pytest.fixture(scope="package")
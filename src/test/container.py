@@ -0,0 +1,196 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from dependency_injector.containers import DeclarativeContainer
+from dependency_injector.providers import Factory, List, Resource
+
+from src.application.account.balance import AccountBalanceCalculator
+from src.application.account.cascade import AccountCascade
+from src.application.account.creator import AccountCreator
+from src.application.account.dashboard import AccountDashboardProjection
+from src.application.account.deleter import AccountDeleter
+from src.application.account.forecast import AccountBalanceForecaster
+from src.application.account.reader import AccountReader
+from src.application.account.updater import AccountUpdater
+from src.application.reccurring_transaction.creator import RecurringTransactionCreator
+from src.application.reccurring_transaction.deleter import RecurringTransactionDeleter
+from src.application.reccurring_transaction.updater import RecurringTransactionUpdater
+from src.application.transaction.batch import TransactionBatchProcessor
+from src.application.transaction.creator import TransactionCreator
+from src.application.transaction.deleter import TransactionDeleter
+from src.application.transaction.importer import TransactionImporter
+from src.application.transaction.updater import TransactionUpdater
+from src.application.user.creator import UserCreator
+from src.application.user.deleter import UserDeleter
+from src.application.user.email_address.modifier import UserEmailAddressModifier
+from src.application.user.reader import UserReader
+from src.application.user.subscription.email_address.checker import UnusedEmailAddressChecker
+from src.application.user.subscription.email_address.validator import EmailAddressValidator
+from src.application.user.updater import UserUpdater
+from src.infrastructure.blocking import blocking_call_runner
+from src.infrastructure.in_memory.account import InMemoryAccountRepository
+from src.infrastructure.in_memory.account_tombstone import InMemoryAccountTombstoneRepository
+from src.infrastructure.in_memory.fingerprint import InMemoryTransactionFingerprintIndex
+from src.infrastructure.in_memory.recurring_transaction import InMemoryRecurringTransactionRepository
+from src.infrastructure.in_memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.in_memory.unit_of_work import InMemoryUnitOfWork
+from src.infrastructure.in_memory.user import InMemoryUserRepository
+from src.infrastructure.rate_limit import TokenBucketLimiter
+from src.infrastructure.transaction.ofx import OfxStatementReader
+from src.infrastructure.user.session.denylist import SessionDenylist
+from src.infrastructure.user.session.token import SessionTokenIssuer
+from src.infrastructure.user.validation.throttle import EmailAddressValidationThrottle
+from src.test.application.account.mock import MockAccountIdFactory
+from src.test.application.transaction.mock import MockTransactionIdFactory
+from src.test.application.user.email_address.mock import ValidationEmailMockSender
+from src.test.application.user.mock import MockUserIdFactory, UserPasswordVaultMock
+from src.test.domain.mocks import MockUserId
+
+
+class InMemoryContainer(DeclarativeContainer):
+    unit_of_work = Factory(InMemoryUnitOfWork)
+
+    user_repository = Factory(InMemoryUserRepository)
+    user_id_factory = Factory(MockUserIdFactory)
+    user_creator = Factory(UserCreator, repository=user_repository, id_factory=user_id_factory)
+    user_updater = Factory(UserUpdater, repository=user_repository)
+    user_reader = Factory(UserReader, repository=user_repository)
+    user_password_vault = Factory(UserPasswordVaultMock)
+    user_email_address_modifier = Factory(UserEmailAddressModifier, repository=user_repository)
+    session_denylist = Factory(SessionDenylist)
+    session_token_issuer = Factory(SessionTokenIssuer, user_id_parser=MockUserId.trusted, denylist=session_denylist)
+
+    account_repository = Factory(InMemoryAccountRepository)
+    account_tombstone_repository = Factory(InMemoryAccountTombstoneRepository)
+    account_id_factory = Factory(MockAccountIdFactory)
+    account_reader = Factory(AccountReader, repository=account_repository)
+
+    recurring_transaction_repository = Factory(InMemoryRecurringTransactionRepository)
+    transaction_repository = Factory(InMemoryTransactionRepository)
+    transaction_id_factory = Factory(MockTransactionIdFactory)
+    transaction_fingerprint_index = Factory(InMemoryTransactionFingerprintIndex)
+    statement_reader = Factory(OfxStatementReader)
+    account_balance_calculator = Factory(
+        AccountBalanceCalculator, account_repository=account_repository, transaction_repository=transaction_repository
+    )
+    account_balance_forecaster = Factory(
+        AccountBalanceForecaster,
+        balance_calculator=account_balance_calculator,
+        recurring_transaction_repository=recurring_transaction_repository,
+    )
+    account_dashboard_projection = Factory(
+        AccountDashboardProjection,
+        account_repository=account_repository,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+    )
+    account_observers = List(account_dashboard_projection, account_balance_calculator, account_balance_forecaster)
+    account_creator = Factory(
+        AccountCreator,
+        repository=account_repository,
+        id_factory=account_id_factory,
+        observers=account_observers,
+    )
+    account_updater = Factory(
+        AccountUpdater,
+        repository=account_repository,
+        observers=account_observers,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+    )
+    account_cascade = Factory(
+        AccountCascade,
+        account_repository=account_repository,
+        transaction_repository=transaction_repository,
+        recurring_transaction_repository=recurring_transaction_repository,
+        unit_of_work=unit_of_work,
+        fingerprint_index=transaction_fingerprint_index,
+    )
+    account_deleter = Factory(
+        AccountDeleter, repository=account_repository, observers=account_observers, cascade=account_cascade
+    )
+    user_deleter = Factory(
+        UserDeleter, repository=user_repository, account_deleter=account_deleter, unit_of_work=unit_of_work
+    )
+    transaction_observers = List(account_balance_calculator, account_balance_forecaster, account_dashboard_projection)
+    transaction_creator = Factory(
+        TransactionCreator,
+        repository=transaction_repository,
+        observers=transaction_observers,
+        account_repository=account_repository,
+    )
+    transaction_updater = Factory(
+        TransactionUpdater,
+        repository=transaction_repository,
+        observers=transaction_observers,
+        account_repository=account_repository,
+    )
+    transaction_deleter = Factory(
+        TransactionDeleter, repository=transaction_repository, observers=transaction_observers
+    )
+    transaction_batch_processor = Factory(
+        TransactionBatchProcessor,
+        repository=transaction_repository,
+        observers=transaction_observers,
+        account_repository=account_repository,
+    )
+    transaction_importer = Factory(
+        TransactionImporter,
+        repository=transaction_repository,
+        id_factory=transaction_id_factory,
+        statement_reader=statement_reader,
+        fingerprint_index=transaction_fingerprint_index,
+        observers=transaction_observers,
+        account_repository=account_repository,
+        unit_of_work=unit_of_work,
+    )
+    recurring_transaction_observers = List(account_balance_forecaster, account_dashboard_projection)
+    recurring_transaction_creator = Factory(
+        RecurringTransactionCreator,
+        repository=recurring_transaction_repository,
+        observers=recurring_transaction_observers,
+        account_repository=account_repository,
+    )
+    recurring_transaction_updater = Factory(
+        RecurringTransactionUpdater,
+        repository=recurring_transaction_repository,
+        observers=recurring_transaction_observers,
+        account_repository=account_repository,
+    )
+    recurring_transaction_deleter = Factory(
+        RecurringTransactionDeleter,
+        repository=recurring_transaction_repository,
+        observers=recurring_transaction_observers,
+    )
+
+    email_address_checker = Factory(UnusedEmailAddressChecker, repository=user_repository)
+    validation_email_sender = Factory(ValidationEmailMockSender)
+    email_address_validator = Factory(
+        EmailAddressValidator,
+        email_address_checker=email_address_checker,
+        validation_email_sender=validation_email_sender,
+    )
+
+    blocking_call_runner = Resource(blocking_call_runner, max_workers=4)
+    email_address_validation_address_limiter = Factory(TokenBucketLimiter, rate=1 / 60, burst=3)
+    email_address_validation_client_limiter = Factory(TokenBucketLimiter, rate=1.0, burst=10)
+    email_address_validation_throttle = Factory(
+        EmailAddressValidationThrottle,
+        validator=email_address_validator,
+        blocking_call_runner=blocking_call_runner,
+        address_limiter=email_address_validation_address_limiter,
+        client_limiter=email_address_validation_client_limiter,
+    )
@@ -22,16 +22,16 @@ from src.shared.test.domain.mock import MockId
 
 
 class MockUserId(UserId, MockId):
-    pass
+    __slots__ = ()
 
 
 class RecurringTransactionMockId(RecurringTransactionId, MockId):
-    pass
+    __slots__ = ()
 
 
 class MockAccountId(AccountId, MockId):
-    pass
+    __slots__ = ()
 
 
 class MockTransactionId(TransactionId, MockId):
-    pass
+    __slots__ = ()
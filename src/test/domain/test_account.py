@@ -14,17 +14,20 @@
 #   * You should have received a copy of the GNU General Public License
 #   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #   */
+import copy
+
 import pytest
 
-from src.domain.account import AccountName, Account
+from src.domain.account import AccountName, Account, AccountMoved, AccountRenamed
 from src.test.domain.mocks import MockAccountId, MockUserId
 from src.shared.domain.string import StringTooShort, StringTooLong, StringContainsInvalidCharacters
+from src.shared.domain.money import Money
 
 
 @pytest.fixture()
 def sample_account():
     return Account(
-        id_=MockAccountId("1"), user_id=MockUserId("1"), name=AccountName("my_account"), reference_balance=50.0
+        id_=MockAccountId("1"), user_id=MockUserId("1"), name=AccountName("my_account"), reference_balance=Money(5000)
     )
 
 
@@ -48,11 +51,18 @@ def test_invalid_account_name_invalid_characters():
         AccountName("my_account!")
 
 
+def test_trusted_account_name_is_not_validated():
+    account_name = AccountName.trusted("abc")
+
+    assert account_name == AccountName.trusted("abc")
+    assert hash(account_name) == hash("abc")
+
+
 def test_account_creation(sample_account: Account):
     assert sample_account.id == MockAccountId("1")
     assert sample_account.user_id == MockUserId("1")
     assert sample_account.name == AccountName("my_account")
-    assert sample_account.reference_balance == 50.0
+    assert sample_account.reference_balance == Money(5000)
 
 
 def test_rename(sample_account: Account):
@@ -63,7 +73,33 @@ def test_rename(sample_account: Account):
 
 
 def test_modify_reference_balance(sample_account: Account):
-    new_reference_balance = 100.0
+    new_reference_balance = Money(10000)
     sample_account.modify_reference_balance(new_reference_balance)
 
     assert sample_account.reference_balance == new_reference_balance
+
+
+def test_move_to(sample_account: Account):
+    sample_account.move_to(MockUserId("1"))
+    sample_account.move_to(MockUserId("2"))
+
+    assert sample_account.user_id == MockUserId("2")
+    assert sample_account.pull_events() == (AccountMoved(MockAccountId("1"), MockUserId("2")),)
+
+
+def test_changes_record_events(sample_account: Account):
+    sample_account.rename(AccountName("my_account"))
+    sample_account.rename(AccountName("new_account"))
+
+    assert sample_account.pull_events() == (AccountRenamed(MockAccountId("1"), AccountName("new_account")),)
+    assert sample_account.pull_events() == ()
+
+
+def test_copy_has_no_pending_events(sample_account: Account):
+    sample_account.rename(AccountName("new_account"))
+
+    clone = copy.copy(sample_account)
+
+    assert clone.name == AccountName("new_account")
+    assert clone.pull_events() == ()
+    assert len(sample_account.pull_events()) == 1
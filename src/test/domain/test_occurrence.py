@@ -0,0 +1,94 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+from src.domain.occurrence import occurrence_dates, occurrence_days, expand
+from src.domain.recurring_transaction import (
+    DailyFrequency,
+    WeeklyFrequency,
+    MonthlyFrequency,
+    YearlyFrequency,
+    Day,
+    RecurringTransaction,
+    RecurringTransactionName,
+)
+from src.test.domain.mocks import RecurringTransactionMockId, MockAccountId
+from src.shared.domain.money import Money
+
+
+def test_daily_occurrences():
+    dates = occurrence_dates(DailyFrequency(), datetime.date(2023, 2, 27), datetime.date(2023, 3, 2))
+
+    assert dates == [
+        datetime.date(2023, 2, 27),
+        datetime.date(2023, 2, 28),
+        datetime.date(2023, 3, 1),
+        datetime.date(2023, 3, 2),
+    ]
+
+
+def test_weekly_occurrences():
+    dates = occurrence_dates(WeeklyFrequency(Day.FRIDAY), datetime.date(2023, 6, 2), datetime.date(2023, 6, 22))
+
+    assert dates == [datetime.date(2023, 6, 2), datetime.date(2023, 6, 9), datetime.date(2023, 6, 16)]
+
+
+def test_monthly_occurrences_in_short_months():
+    dates = occurrence_dates(MonthlyFrequency(31), datetime.date(2023, 1, 31), datetime.date(2024, 4, 30))
+
+    assert dates[:4] == [
+        datetime.date(2023, 1, 31),
+        datetime.date(2023, 2, 28),
+        datetime.date(2023, 3, 31),
+        datetime.date(2023, 4, 30),
+    ]
+    assert dates[-3:] == [datetime.date(2024, 2, 29), datetime.date(2024, 3, 31), datetime.date(2024, 4, 30)]
+
+
+def test_monthly_occurrences_window_is_inclusive():
+    dates = occurrence_dates(MonthlyFrequency(15), datetime.date(2023, 1, 15), datetime.date(2023, 3, 14))
+
+    assert dates == [datetime.date(2023, 1, 15), datetime.date(2023, 2, 15)]
+
+
+def test_yearly_occurrences_on_leap_day():
+    dates = occurrence_dates(YearlyFrequency(29, 2), datetime.date(2023, 1, 1), datetime.date(2025, 2, 28))
+
+    assert dates == [datetime.date(2023, 2, 28), datetime.date(2024, 2, 29), datetime.date(2025, 2, 28)]
+
+
+def test_empty_window():
+    assert not occurrence_days(DailyFrequency(), datetime.date(2023, 1, 2), datetime.date(2023, 1, 1))
+    assert not occurrence_days(MonthlyFrequency(1), datetime.date(2023, 1, 2), datetime.date(2023, 1, 31))
+
+
+def test_expand():
+    recurring_transactions = [
+        RecurringTransaction(
+            RecurringTransactionMockId(str(index)),
+            MockAccountId("1"),
+            RecurringTransactionName("rent"),
+            Money(-80000),
+            MonthlyFrequency(5),
+        )
+        for index in range(3)
+    ]
+
+    expanded = expand(recurring_transactions, datetime.date(2023, 1, 1), datetime.date(2023, 12, 31))
+
+    assert [recurring_transaction for recurring_transaction, _ in expanded] == recurring_transactions
+    assert all(len(days) == 12 for _, days in expanded)
@@ -21,11 +21,13 @@ from src.domain.recurring_transaction import (
     DailyFrequency,
     RecurringTransaction,
     RecurringTransactionName,
+    RecurringTransactionFrequencyModified,
     WeeklyFrequency,
     Day,
 )
 from src.test.domain.mocks import RecurringTransactionMockId, MockAccountId
 from src.shared.domain.string import StringTooShort, StringTooLong, StringContainsInvalidCharacters
+from src.shared.domain.money import Money
 
 
 class TestRecurringTransactionName:
@@ -48,7 +50,7 @@ def sample_transaction():
         id_=RecurringTransactionMockId("1"),
         account_id=MockAccountId("1"),
         name=RecurringTransactionName("sample-transaction"),
-        amount=50.0,
+        amount=Money(5000),
         frequency=DailyFrequency(),
     )
 
@@ -58,7 +60,7 @@ class TestRecurringTransaction:
         assert sample_transaction.id == RecurringTransactionMockId("1")
         assert sample_transaction.account_id == MockAccountId("1")
         assert sample_transaction.name == "sample-transaction"
-        assert sample_transaction.amount == 50.0
+        assert sample_transaction.amount == Money(5000)
         assert sample_transaction.frequency == DailyFrequency()
 
     def test_recurring_transaction_rename(self, sample_transaction: RecurringTransaction):
@@ -68,7 +70,7 @@ class TestRecurringTransaction:
         assert sample_transaction.name == new_name
 
     def test_recurring_transaction_modify_amount(self, sample_transaction: RecurringTransaction):
-        new_amount = 100.0
+        new_amount = Money(10000)
         sample_transaction.modify_amount(new_amount)
 
         assert sample_transaction.amount == new_amount
@@ -78,3 +80,11 @@ class TestRecurringTransaction:
         sample_transaction.modify_frequency(new_frequency)
 
         assert sample_transaction.frequency == new_frequency
+
+    def test_recurring_transaction_modify_frequency_records_event(self, sample_transaction: RecurringTransaction):
+        new_frequency = WeeklyFrequency(Day.MONDAY)
+        sample_transaction.modify_frequency(new_frequency)
+
+        assert sample_transaction.pull_events() == (
+            RecurringTransactionFrequencyModified(sample_transaction.id, new_frequency),
+        )
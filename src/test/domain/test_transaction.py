@@ -18,14 +18,15 @@ import datetime
 
 import pytest
 
-from src.domain.transaction import Transaction
+from src.domain.transaction import Transaction, TransactionAmountRectified
 from src.test.domain.mocks import MockAccountId, MockTransactionId
+from src.shared.domain.money import Money
 
 
 @pytest.fixture
 def sample_transaction():
     return Transaction(
-        MockTransactionId("1"), MockAccountId("1"), datetime.date(2022, 1, 1), "Sample Transaction", 100.0
+        MockTransactionId("1"), MockAccountId("1"), datetime.date(2022, 1, 1), "Sample Transaction", Money(10000)
     )
 
 
@@ -33,7 +34,7 @@ def test_transaction_properties(sample_transaction):
     assert sample_transaction.account_id == MockAccountId("1")
     assert sample_transaction.date == datetime.date(2022, 1, 1)
     assert sample_transaction.label == "Sample Transaction"
-    assert sample_transaction.amount == 100.0
+    assert sample_transaction.amount == Money(10000)
 
 
 def test_rectify_date(sample_transaction):
@@ -43,7 +44,7 @@ def test_rectify_date(sample_transaction):
 
 
 def test_rectify_amount(sample_transaction):
-    new_amount = 200.0
+    new_amount = Money(20000)
     sample_transaction.rectify_amount(new_amount)
     assert sample_transaction.amount == new_amount
 
@@ -52,3 +53,10 @@ def test_modify_label(sample_transaction):
     new_label = "Updated Label"
     sample_transaction.modify_label(new_label)
     assert sample_transaction.label == new_label
+
+
+def test_rectify_amount_records_event(sample_transaction):
+    sample_transaction.rectify_amount(Money(10000))
+    sample_transaction.rectify_amount(Money(-500))
+
+    assert sample_transaction.pull_events() == (TransactionAmountRectified(MockTransactionId("1"), Money(-500)),)
@@ -17,7 +17,7 @@
 
 import pytest
 
-from src.domain.user import UserName, User
+from src.domain.user import UserName, User, UserRenamed
 from src.test.domain.mocks import MockUserId
 from src.shared.domain.email import EmailAddress
 from src.shared.domain.string import StringTooShort, StringTooLong, StringContainsInvalidCharacters
@@ -76,3 +76,11 @@ def test_rename():
     user.rename(new_username)
 
     assert user.username == new_username
+
+
+def test_rename_records_event():
+    user = User(MockUserId("1"), EmailAddress("john@example.com"), UserName("john_doe"))
+
+    user.rename(UserName("johndoe"))
+
+    assert user.pull_events() == (UserRenamed(MockUserId("1"), UserName("johndoe")),)
@@ -0,0 +1,150 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import json
+import uuid
+
+import pytest
+
+from src.domain.account import Account, AccountName
+from src.domain.transaction import Transaction
+from src.domain.user import User, UserName
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.email import EmailAddress
+from src.shared.domain.money import Money
+from src.test.infrastructure.conftest import RouteClient
+
+_ACCOUNT_ROUTES = [
+    ("GET", ""),
+    ("PUT", ""),
+    ("DELETE", ""),
+    ("GET", "/balance"),
+    ("GET", "/forecast"),
+    ("GET", "/dashboard"),
+    ("POST", "/transactions:batch"),
+]
+
+
+@pytest.mark.parametrize("method, suffix", _ACCOUNT_ROUTES)
+def test_malformed_account_id_is_not_found(client: RouteClient, method: str, suffix: str):
+    status, _ = client.request(method, f"/account/notauuid{suffix}", {})
+
+    assert status == 404
+
+
+def test_account_of_another_user_is_forbidden(client: RouteClient, sqlite_container: SqliteContainer):
+    other_user = User(UserUUIDFactory().generate_id(), EmailAddress("jane@example.com"), UserName("jane_doe"))
+    account = Account(AccountUUIDFactory().generate_id(), other_user.id, AccountName("account_name"), Money(0))
+    sqlite_container.user_repository().add(other_user)
+    sqlite_container.account_repository().add(account)
+
+    status, _ = client.request("GET", f"/account/{account.id}")
+
+    assert status == 403
+
+
+def test_unknown_account_is_not_found(client: RouteClient):
+    status, _ = client.request("GET", f"/account/{AccountUUIDFactory().generate_id()}")
+
+    assert status == 404
+
+
+def test_amounts_in_another_currency_are_rejected(
+    client: RouteClient, sqlite_container: SqliteContainer, signed_in_user: User
+):
+    account = Account(AccountUUIDFactory().generate_id(), signed_in_user.id, AccountName("account_name"), Money(0))
+    sqlite_container.account_repository().add(account)
+    operations = [
+        {
+            "operation": "create",
+            "id": str(uuid.uuid4()),
+            "date": "2023-01-01",
+            "label": "label",
+            "amount": "100000",
+            "currency": currency,
+        }
+        for currency in ("JPY", "EUR")
+    ]
+
+    status, body = client.request("POST", f"/account/{account.id}/transactions:batch", {"operations": operations})
+    assert status == 200
+    assert [result["status"] for result in json.loads(body)["results"]] == ["currency_mismatch", "applied"]
+
+    status, body = client.request("GET", f"/account/{account.id}/balance", query="at=2023-01-01")
+    assert status == 200
+    assert (json.loads(body)["balance"], json.loads(body)["currency"]) == ("100000.00", "EUR")
+
+    update = {"name": "account_name", "reference_balance": "0", "currency": "JPY"}
+    status, _ = client.request("PUT", f"/account/{account.id}", update)
+    assert status == 409
+
+
+def test_amounts_beyond_the_bound_are_rejected(
+    client: RouteClient, sqlite_container: SqliteContainer, signed_in_user: User
+):
+    account = Account(AccountUUIDFactory().generate_id(), signed_in_user.id, AccountName("account_name"), Money(0))
+    sqlite_container.account_repository().add(account)
+    operation = {"operation": "create", "date": "2023-01-01", "label": "label", "amount": "92233720368547758"}
+
+    status, _ = client.request(
+        "POST", f"/account/{account.id}/transactions:batch", {"operations": [{"id": str(uuid.uuid4()), **operation}]}
+    )
+    assert status == 422
+
+    update = {"name": "account_name", "reference_balance": "92233720368547758"}
+    status, _ = client.request("PUT", f"/account/{account.id}", update)
+    assert status == 422
+
+
+def test_amounts_are_decimal_strings(client: RouteClient, sqlite_container: SqliteContainer, signed_in_user: User):
+    account = Account(AccountUUIDFactory().generate_id(), signed_in_user.id, AccountName("account_name"), Money(1050))
+    sqlite_container.account_repository().add(account)
+
+    status, body = client.request("GET", f"/user/{signed_in_user.id}/accounts")
+    assert status == 200
+    assert json.loads(body)[0]["reference_balance"] == "10.50"
+
+    status, body = client.request("GET", f"/account/{account.id}/forecast", query="days=1")
+    assert status == 200
+    assert json.loads(body)["balances"] == ["10.50"]
+
+    status, body = client.request("GET", f"/account/{account.id}/dashboard")
+    assert status == 200
+    assert json.loads(body)["balance"] == "10.50"
+
+
+@pytest.mark.parametrize("suffix", ["/balance", "/forecast", "/dashboard"])
+def test_overflowing_balance_is_a_conflict(
+    client: RouteClient, sqlite_container: SqliteContainer, signed_in_user: User, suffix: str
+):
+    # Stored without the bound on amounts entered, as by an earlier version
+    account = Account(AccountUUIDFactory().generate_id(), signed_in_user.id, AccountName("account_name"), Money(0))
+    sqlite_container.account_repository().add(account)
+    sqlite_container.transaction_repository().add_many(
+        Transaction(
+            TransactionUUIDFactory().generate_id(), account.id, datetime.date(2023, 1, 1), "label", Money(2**62)
+        )
+        for _ in range(2)
+    )
+
+    status, body = client.request("GET", f"/account/{account.id}{suffix}")
+
+    assert status == 409
+    assert "64 bits" in json.loads(body)["detail"]
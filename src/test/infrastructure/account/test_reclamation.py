@@ -0,0 +1,88 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import time
+
+from src.application.account.cascade import AccountTransactionReclaimer
+from src.domain.account import AccountId
+from src.domain.transaction import Transaction
+from src.infrastructure.account.reclamation import (
+    BackgroundAccountReclamationScheduler,
+    background_account_reclamation_scheduler,
+)
+from src.infrastructure.in_memory.account_tombstone import InMemoryAccountTombstoneRepository
+from src.infrastructure.in_memory.transaction import InMemoryTransactionRepository
+from src.infrastructure.in_memory.unit_of_work import InMemoryUnitOfWork
+from src.test.domain.mocks import MockAccountId, MockTransactionId
+from src.shared.domain.money import Money
+
+
+def test_reclaims_pending_then_scheduled_accounts():
+    transaction_repository = InMemoryTransactionRepository()
+    tombstone_repository = InMemoryAccountTombstoneRepository()
+    transaction_repository.add_many(
+        Transaction(
+            MockTransactionId(str(index)),
+            MockAccountId(str(index % 3)),
+            datetime.date(2023, 1, 1),
+            "label",
+            Money(100),
+        )
+        for index in range(30)
+    )
+    tombstone_repository.add(MockAccountId("0"))
+    reclaimer = AccountTransactionReclaimer(
+        transaction_repository, tombstone_repository, InMemoryUnitOfWork(), batch_size=4
+    )
+
+    resource = background_account_reclamation_scheduler(reclaimer)
+    scheduler = next(resource)
+    tombstone_repository.add(MockAccountId("1"))
+    scheduler.schedule(MockAccountId("1"))
+    next(resource, None)
+
+    assert tombstone_repository.list_account_ids() == []
+    assert list(transaction_repository.list_by_account(MockAccountId("0"))) == []
+    assert list(transaction_repository.list_by_account(MockAccountId("1"))) == []
+    assert len(list(transaction_repository.list_by_account(MockAccountId("2")))) == 10
+
+
+class _FailingOnceReclaimer(AccountTransactionReclaimer):
+    def __init__(self) -> None:
+        super().__init__(InMemoryTransactionRepository(), InMemoryAccountTombstoneRepository(), InMemoryUnitOfWork())
+        self.reclaimed: list[AccountId] = []
+
+    def reclaim(self, account_id: AccountId) -> int:
+        if not self.reclaimed:
+            self.reclaimed.append(account_id)
+            raise OSError("disk I/O error")
+        self.reclaimed.append(account_id)
+        return 0
+
+
+def test_failed_reclamation_is_logged_then_retried(caplog):
+    reclaimer = _FailingOnceReclaimer()
+    scheduler = BackgroundAccountReclamationScheduler(reclaimer, backoff=0.0)
+    scheduler.start()
+    scheduler.schedule(MockAccountId("1"))
+    scheduler.schedule(MockAccountId("2"))
+    while len(reclaimer.reclaimed) < 3:
+        time.sleep(0.001)
+    scheduler.stop()
+
+    assert reclaimer.reclaimed == [MockAccountId("1"), MockAccountId("2"), MockAccountId("1")]
+    assert "Reclaiming account 1 failed" in caplog.text
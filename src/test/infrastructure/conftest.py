@@ -0,0 +1,77 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import asyncio
+from typing import Any, Iterator
+
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.asgi import authorization, call
+from src.domain.user import User, UserName
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.fastapi import create_app
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.email import EmailAddress
+from src.test.infrastructure.mock import ClockMock
+
+
+class RouteClient:
+    """
+    Sends requests straight to the application, signed in as `user` unless told otherwise.
+    """
+
+    def __init__(self, app: FastAPI, container: SqliteContainer, user: User) -> None:
+        self._app = app
+        self._token = container.session_token_issuer().issue(user.id)
+
+    def request(
+        self, method: str, path: str, body: Any = None, query: str = "", signed_in: bool = True
+    ) -> tuple[int, bytes]:
+        headers = authorization(self._token) if signed_in else []
+        return asyncio.run(call(self._app, method, path, body, query, headers))
+
+
+@pytest.fixture
+def clock() -> ClockMock:
+    return ClockMock()
+
+
+@pytest.fixture
+def sqlite_container() -> Iterator[SqliteContainer]:
+    container = SqliteContainer()
+    container.config.database_path.from_value(":memory:")
+    container.config.password_hashing_workers.from_value(1)
+    yield container
+    container.unwire()
+    container.shutdown_resources()
+
+
+@pytest.fixture
+def signed_in_user(sqlite_container: SqliteContainer) -> User:
+    user = User(UserUUIDFactory().generate_id(), EmailAddress("john@example.com"), UserName("john_doe"))
+    sqlite_container.user_repository().add(user)
+    return user
+
+
+@pytest.fixture
+def app(sqlite_container: SqliteContainer) -> FastAPI:
+    return create_app(sqlite_container)
+
+
+@pytest.fixture
+def client(app: FastAPI, sqlite_container: SqliteContainer, signed_in_user: User) -> RouteClient:
+    return RouteClient(app, sqlite_container, signed_in_user)
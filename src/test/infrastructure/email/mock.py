@@ -0,0 +1,46 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from typing import Sequence
+
+from src.infrastructure.email.mailer import DeliveryOutcome, Mailer
+from src.infrastructure.email.transport import EmailTransport, EmailMessage
+
+
+class EmailTransportMock(EmailTransport):
+    def __init__(self) -> None:
+        self._messages: list[EmailMessage] = []
+
+    def deliver(self, message: EmailMessage) -> None:
+        self._messages.append(message)
+
+    @property
+    def messages(self) -> list[EmailMessage]:
+        return self._messages
+
+
+class MailerMock(Mailer):
+    def __init__(self) -> None:
+        self.outcome = DeliveryOutcome.DELIVERED
+        self._batches: list[list[EmailMessage]] = []
+
+    def send(self, messages: Sequence[EmailMessage]) -> list[DeliveryOutcome]:
+        self._batches.append(list(messages))
+        return [self.outcome] * len(messages)
+
+    @property
+    def batches(self) -> list[list[EmailMessage]]:
+        return self._batches
@@ -0,0 +1,151 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import sqlite3
+import threading
+
+import pytest
+
+from src.infrastructure.email.mailer import DeliveryOutcome
+from src.infrastructure.email.outbox import EmailOutboxWorker, OutboxEmail, email_outbox_worker
+from src.infrastructure.email.transport import EmailMessage
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.email_outbox import SqliteEmailOutbox
+from src.shared.domain.email import EmailAddress
+from src.test.infrastructure.email.mock import MailerMock
+from src.test.infrastructure.mock import ClockMock
+
+
+@pytest.fixture
+def outbox(clock: ClockMock):
+    database = SqliteDatabase(":memory:")
+    yield SqliteEmailOutbox(database, clock=clock)
+    database.close()
+
+
+@pytest.fixture
+def mailer() -> MailerMock:
+    return MailerMock()
+
+
+@pytest.fixture
+def worker(outbox: SqliteEmailOutbox, mailer: MailerMock, clock: ClockMock) -> EmailOutboxWorker:
+    return EmailOutboxWorker(outbox, mailer, batch_size=2, max_attempts=3, backoff=10.0, clock=clock)
+
+
+def _deliver(outbox: SqliteEmailOutbox, count: int) -> None:
+    for index in range(count):
+        outbox.deliver(EmailMessage(EmailAddress(f"user{index}@example.com"), "subject", "body"))
+
+
+def test_send_due_in_batches(worker: EmailOutboxWorker, outbox: SqliteEmailOutbox, mailer: MailerMock):
+    _deliver(outbox, 5)
+
+    assert worker.send_due() == 5
+
+    assert [len(batch) for batch in mailer.batches] == [2, 2, 1]
+    assert outbox.next_attempt_at() is None
+
+
+def test_rejected_emails_are_dropped(worker: EmailOutboxWorker, outbox: SqliteEmailOutbox, mailer: MailerMock):
+    _deliver(outbox, 3)
+    mailer.outcome = DeliveryOutcome.REJECTED
+
+    assert worker.send_due() == 0
+
+    assert outbox.next_attempt_at() is None
+
+
+def test_deferred_emails_pause_sending(
+    worker: EmailOutboxWorker, outbox: SqliteEmailOutbox, mailer: MailerMock, clock: ClockMock
+):
+    _deliver(outbox, 3)
+    mailer.outcome = DeliveryOutcome.DEFERRED
+    start = clock.now
+
+    worker.send_due()
+    clock.now = start + 9
+    worker.send_due()
+
+    assert [len(batch) for batch in mailer.batches] == [2]
+    mailer.outcome = DeliveryOutcome.DELIVERED
+    clock.now = start + 10
+    assert worker.send_due() == 3
+
+
+def test_deferred_emails_back_off_then_are_abandoned(
+    worker: EmailOutboxWorker, outbox: SqliteEmailOutbox, mailer: MailerMock, clock: ClockMock
+):
+    _deliver(outbox, 1)
+    mailer.outcome = DeliveryOutcome.DEFERRED
+    start = clock.now
+
+    worker.send_due()
+    assert outbox.next_attempt_at() == start + 10
+    clock.now = start + 10
+    worker.send_due()
+    assert outbox.next_attempt_at() == start + 30
+    clock.now = start + 30
+    worker.send_due()
+
+    assert len(mailer.batches) == 3
+    assert outbox.next_attempt_at() is None
+
+
+def test_resource_sends_emails_delivered_while_running(outbox: SqliteEmailOutbox, mailer: MailerMock):
+    resource = email_outbox_worker(outbox, mailer, batch_size=10)
+    next(resource)
+
+    _deliver(outbox, 3)
+    for _ in range(200):
+        if outbox.next_attempt_at() is None:
+            break
+        threading.Event().wait(0.01)
+    next(resource, None)
+
+    assert sum(len(batch) for batch in mailer.batches) == 3
+    assert outbox.next_attempt_at() is None
+
+
+class _FailingOnceOutbox(SqliteEmailOutbox):
+    def __init__(self, database: SqliteDatabase, clock: ClockMock) -> None:
+        super().__init__(database, clock=clock)
+        self.failed = False
+
+    def due(self, limit: int, now: float) -> list[OutboxEmail]:
+        if not self.failed:
+            self.failed = True
+            raise sqlite3.OperationalError("database or disk is full")
+        return super().due(limit, now)
+
+
+def test_worker_survives_outbox_failures(mailer: MailerMock, clock: ClockMock, caplog):
+    database = SqliteDatabase(":memory:")
+    outbox = _FailingOnceOutbox(database, clock)
+    _deliver(outbox, 3)
+    worker = EmailOutboxWorker(outbox, mailer, backoff=0.0, clock=clock)
+
+    worker.start()
+    for _ in range(200):
+        if outbox.next_attempt_at() is None:
+            break
+        threading.Event().wait(0.01)
+    worker.stop()
+    database.close()
+
+    assert outbox.failed
+    assert sum(len(batch) for batch in mailer.batches) == 3
+    assert "Email outbox failed" in caplog.text
@@ -0,0 +1,109 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import socket
+import threading
+from typing import Iterator
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from src.infrastructure.email.mailer import DeliveryOutcome
+from src.infrastructure.email.outbox import email_outbox_worker
+from src.infrastructure.email.smtp import SmtpMailer
+from src.infrastructure.email.transport import EmailMessage
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.email_outbox import SqliteEmailOutbox
+from src.shared.domain.email import EmailAddress
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _message(local_part: str) -> EmailMessage:
+    return EmailMessage(EmailAddress(f"{local_part}@example.com"), "subject", "body")
+
+
+class _Handler:
+    """
+    Local SMTP stand-in that refuses the recipients whose address starts with `unknown`.
+    """
+
+    def __init__(self) -> None:
+        self.peers: list[tuple[str, int]] = []
+        self.recipients: list[str] = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options) -> str:
+        if address.startswith("unknown"):
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.peers.append(session.peer)
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server() -> Iterator[tuple[_Handler, int]]:
+    handler, port = _Handler(), _free_port()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def test_batches_share_one_connection(smtp_server: tuple[_Handler, int]):
+    handler, port = smtp_server
+    mailer = SmtpMailer("127.0.0.1", port, "no-reply@example.com")
+
+    first = mailer.send([_message("john"), _message("unknown"), _message("jane")])
+    second = mailer.send([_message("jack")])
+    mailer.close()
+
+    assert first == [DeliveryOutcome.DELIVERED, DeliveryOutcome.REJECTED, DeliveryOutcome.DELIVERED]
+    assert second == [DeliveryOutcome.DELIVERED]
+    assert handler.recipients == ["john@example.com", "jane@example.com", "jack@example.com"]
+    assert len(set(handler.peers)) == 1
+
+
+def test_outbox_is_sent_through_smtp(smtp_server: tuple[_Handler, int]):
+    handler, port = smtp_server
+    database = SqliteDatabase(":memory:")
+    outbox = SqliteEmailOutbox(database)
+    resource = email_outbox_worker(outbox, SmtpMailer("127.0.0.1", port, "no-reply@example.com"), batch_size=2)
+    next(resource)
+
+    for index in range(5):
+        outbox.deliver(_message(f"user{index}"))
+    for _ in range(500):
+        if outbox.next_attempt_at() is None:
+            break
+        threading.Event().wait(0.01)
+    next(resource, None)
+    database.close()
+
+    assert sorted(handler.recipients) == [f"user{index}@example.com" for index in range(5)]
+
+
+def test_unreachable_server_defers():
+    mailer = SmtpMailer("127.0.0.1", _free_port(), "no-reply@example.com", timeout=1.0)
+
+    assert mailer.send([_message("john"), _message("jane")]) == [DeliveryOutcome.DEFERRED] * 2
@@ -0,0 +1,106 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import os
+import threading
+
+import pytest
+
+from src.infrastructure.event_sourcing.log import SegmentedEventLog
+
+
+@pytest.fixture
+def directory(tmp_path) -> str:
+    return str(tmp_path / "log")
+
+
+def test_records_survive_a_reopening(directory: str):
+    log = SegmentedEventLog(directory)
+    log.sync(log.append([b"a", b"b"]))
+    log.sync(log.append([b"c"]))
+    log.close()
+
+    reopened = SegmentedEventLog(directory)
+
+    assert list(reopened.read()) == [(1, b"a"), (2, b"b"), (3, b"c")]
+    assert list(reopened.read(3)) == [(3, b"c")]
+    assert reopened.append([b"d"]) == 4
+    reopened.close()
+
+
+def test_unsynced_records_are_not_read(directory: str):
+    log = SegmentedEventLog(directory)
+    log.append([b"a"])
+
+    assert list(log.read()) == []
+    log.close()
+
+
+def test_concurrent_syncs_are_grouped(directory: str, monkeypatch: pytest.MonkeyPatch):
+    log = SegmentedEventLog(directory)
+    writes = []
+    write = SegmentedEventLog._write
+
+    def counting_write(self, batch, first_sequence):
+        writes.append(len(batch))
+        write(self, batch, first_sequence)
+
+    monkeypatch.setattr(SegmentedEventLog, "_write", counting_write)
+    barrier = threading.Barrier(8)
+
+    def writer(index: int) -> None:
+        for _ in range(50):
+            barrier.wait()
+            log.sync(log.append([bytes([index])]))
+
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(writes) == 400
+    assert len(writes) < 400
+    assert [sequence for sequence, _ in log.read()] == list(range(1, 401))
+    log.close()
+
+
+def test_segments_roll_and_are_dropped(directory: str):
+    log = SegmentedEventLog(directory, segment_size=64)
+    for _ in range(10):
+        log.sync(log.append([bytes(20)]))
+
+    assert len(os.listdir(directory)) > 1
+    log.drop_before(8)
+    assert [sequence for sequence, _ in log.read()][0] > 1
+    assert [sequence for sequence, _ in log.read(8)] == [8, 9, 10]
+    log.close()
+
+
+def test_torn_tail_is_truncated(directory: str):
+    log = SegmentedEventLog(directory)
+    log.sync(log.append([b"first", b"second"]))
+    log.close()
+    (segment,) = os.listdir(directory)
+    path = os.path.join(directory, segment)
+    os.truncate(path, os.path.getsize(path) - 3)
+
+    reopened = SegmentedEventLog(directory)
+
+    assert list(reopened.read()) == [(1, b"first")]
+    reopened.sync(reopened.append([b"again"]))
+    assert list(reopened.read()) == [(1, b"first"), (2, b"again")]
+    reopened.close()
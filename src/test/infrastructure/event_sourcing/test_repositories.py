@@ -0,0 +1,198 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import os
+from typing import Iterator
+
+import pytest
+
+from src.application.account.repository import AccountNotFound
+from src.application.transaction.repository import TransactionRemoval, TransactionReplacement
+from src.application.user.repository import UserEmailAddressNotFound, UserEmailAddressAlreadyUsed
+from src.domain.account import Account, AccountName
+from src.domain.recurring_transaction import (
+    DailyFrequency,
+    RecurringTransaction,
+    RecurringTransactionName,
+    WeeklyFrequency,
+    Day,
+)
+from src.domain.transaction import Transaction
+from src.domain.user import User, UserName
+from src.infrastructure.event_sourcing.repositories import EventSourcedRepositories, event_sourced_repositories
+from src.shared.domain.email import EmailAddress
+from src.shared.domain.money import Money
+from src.test.domain.mocks import MockAccountId, MockTransactionId, MockUserId, RecurringTransactionMockId
+
+
+class _Opened:
+    def __init__(self, directory: str, snapshot_interval: int = 1_000_000) -> None:
+        self._resource = event_sourced_repositories(directory, snapshot_interval)
+
+    def __enter__(self) -> EventSourcedRepositories:
+        return next(self._resource)
+
+    def __exit__(self, *_) -> None:
+        next(self._resource, None)
+
+
+def _transaction(id_: int, amount: int = 100) -> Transaction:
+    return Transaction(
+        MockTransactionId(str(id_)), MockAccountId("1"), datetime.date(2023, 1, id_ + 1), "label", Money(amount)
+    )
+
+
+def _amounts(repositories: EventSourcedRepositories) -> list[int]:
+    transactions = repositories.transaction.list_by_account(MockAccountId("1"))
+    return [transaction.amount.minor_units for transaction in transactions]
+
+
+@pytest.fixture
+def directory(tmp_path) -> Iterator[str]:
+    yield str(tmp_path / "events")
+
+
+def _change(repositories: EventSourcedRepositories) -> None:
+    repositories.user.add(User(MockUserId("1"), EmailAddress("john@example.com"), UserName("john_doe")))
+    repositories.account.add(Account(MockAccountId("1"), MockUserId("1"), AccountName("checking"), Money(1000)))
+    repositories.account.add(Account(MockAccountId("2"), MockUserId("1"), AccountName("savings"), Money(0)))
+    repositories.transaction.add_many(_transaction(index, index) for index in range(5))
+    repositories.recurring_transaction.add(
+        RecurringTransaction(
+            RecurringTransactionMockId("1"),
+            MockAccountId("1"),
+            RecurringTransactionName("rent"),
+            Money(-500),
+            DailyFrequency(),
+        )
+    )
+
+    account = repositories.account.retrieve(MockAccountId("1"))
+    account.rename(AccountName("current"))
+    repositories.account.update(account)
+    repositories.account.delete(MockAccountId("2"))
+    user = repositories.user.retrieve(MockUserId("1"))
+    user.rename(UserName("johndoe"))
+    repositories.user.update(user)
+    transaction = repositories.transaction.retrieve(MockTransactionId("2"))
+    transaction.rectify_amount(Money(-2))
+    transaction.rectify_date(datetime.date(2023, 2, 1))
+    repositories.transaction.update(transaction)
+    repositories.transaction.apply_batch(
+        MockAccountId("1"), [TransactionRemoval(MockTransactionId("0")), TransactionReplacement(_transaction(1, 11))]
+    )
+    recurring_transaction = repositories.recurring_transaction.retrieve(RecurringTransactionMockId("1"))
+    recurring_transaction.modify_frequency(WeeklyFrequency(Day.FRIDAY))
+    repositories.recurring_transaction.update(recurring_transaction)
+
+
+def _check(repositories: EventSourcedRepositories) -> None:
+    assert repositories.user.retrieve(MockUserId("1")).username == UserName("johndoe")
+    assert repositories.account.retrieve(MockAccountId("1")).name == AccountName("current")
+    with pytest.raises(AccountNotFound):
+        repositories.account.retrieve(MockAccountId("2"))
+    assert _amounts(repositories) == [11, 3, 4, -2]
+    recurring_transaction = repositories.recurring_transaction.retrieve(RecurringTransactionMockId("1"))
+    assert recurring_transaction.frequency == WeeklyFrequency(Day.FRIDAY)
+
+
+def test_state_is_rebuilt_from_events(directory: str):
+    with _Opened(directory) as repositories:
+        _change(repositories)
+        _check(repositories)
+
+    with _Opened(directory) as repositories:
+        _check(repositories)
+
+
+def test_state_is_rebuilt_from_snapshot_and_events(directory: str):
+    with _Opened(directory, snapshot_interval=5) as repositories:
+        _change(repositories)
+
+    assert os.path.exists(os.path.join(directory, "snapshot.pickle"))
+    with _Opened(directory, snapshot_interval=5) as repositories:
+        _check(repositories)
+
+
+def test_update_without_events_records_differences(directory: str):
+    with _Opened(directory) as repositories:
+        repositories.account.add(Account(MockAccountId("1"), MockUserId("1"), AccountName("checking"), Money(1000)))
+        repositories.account.update(Account(MockAccountId("1"), MockUserId("1"), AccountName("checking"), Money(7)))
+
+    with _Opened(directory) as repositories:
+        assert repositories.account.retrieve(MockAccountId("1")).reference_balance == Money(7)
+
+
+def test_moved_account_is_listed_by_its_new_user(directory: str):
+    with _Opened(directory) as repositories:
+        repositories.account.add(Account(MockAccountId("1"), MockUserId("1"), AccountName("checking"), Money(1000)))
+        account = repositories.account.retrieve(MockAccountId("1"))
+        account.move_to(MockUserId("2"))
+        repositories.account.update(account)
+
+    with _Opened(directory) as repositories:
+        assert list(repositories.account.list_by_user(MockUserId("1"))) == []
+        assert [account.id for account in repositories.account.list_by_user(MockUserId("2"))] == [MockAccountId("1")]
+
+
+def test_user_is_retrieved_by_its_current_email_address(directory: str):
+    with _Opened(directory) as repositories:
+        repositories.user.add(User(MockUserId("1"), EmailAddress("john@example.com"), UserName("john_doe")))
+        user = repositories.user.retrieve(MockUserId("1"))
+        user.change_email_address(EmailAddress("johnny@example.com"))
+        repositories.user.update(user)
+
+    with _Opened(directory) as repositories:
+        assert repositories.user.retrieve_by_email_address(EmailAddress("johnny@example.com")).id == MockUserId("1")
+        with pytest.raises(UserEmailAddressNotFound):
+            repositories.user.retrieve_by_email_address(EmailAddress("john@example.com"))
+
+
+def test_email_address_belongs_to_one_user(directory: str):
+    with _Opened(directory) as repositories:
+        repositories.user.add(User(MockUserId("1"), EmailAddress("john@example.com"), UserName("john_doe")))
+        repositories.user.add(User(MockUserId("2"), EmailAddress("jane@example.com"), UserName("jane_doe")))
+        with pytest.raises(UserEmailAddressAlreadyUsed):
+            repositories.user.add(User(MockUserId("3"), EmailAddress("john@example.com"), UserName("johnny")))
+        user = repositories.user.retrieve(MockUserId("2"))
+        user.change_email_address(EmailAddress("john@example.com"))
+        with pytest.raises(UserEmailAddressAlreadyUsed):
+            repositories.user.update(user)
+
+    with _Opened(directory) as repositories:
+        assert repositories.user.retrieve_by_email_address(EmailAddress("john@example.com")).id == MockUserId("1")
+        assert repositories.user.retrieve_by_email_address(EmailAddress("jane@example.com")).id == MockUserId("2")
+
+
+def test_deletions_by_account_are_rebuilt(directory: str):
+    with _Opened(directory) as repositories:
+        repositories.transaction.add_many(_transaction(index, index) for index in range(5))
+        repositories.recurring_transaction.add(
+            RecurringTransaction(
+                RecurringTransactionMockId("1"),
+                MockAccountId("1"),
+                RecurringTransactionName("rent"),
+                Money(-500),
+                DailyFrequency(),
+            )
+        )
+        assert repositories.transaction.delete_by_account(MockAccountId("1"), limit=2) == 2
+        assert repositories.recurring_transaction.delete_by_account(MockAccountId("1")) == 1
+
+    with _Opened(directory) as repositories:
+        assert _amounts(repositories) == [0, 1, 2]
+        assert list(repositories.recurring_transaction.list_by_account(MockAccountId("1"))) == []
@@ -0,0 +1,78 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.application.account.repository import AccountAlreadyExists, AccountNotFound
+from src.domain.account import Account, AccountName
+from src.infrastructure.in_memory.account import InMemoryAccountRepository
+from src.test.domain.mocks import MockAccountId, MockUserId
+from src.shared.domain.money import Money
+
+
+@pytest.fixture
+def account_repository():
+    return InMemoryAccountRepository()
+
+
+@pytest.fixture
+def accounts(account_repository: InMemoryAccountRepository):
+    accounts = [
+        Account(MockAccountId("1"), MockUserId("1"), AccountName("checking"), Money(10000)),
+        Account(MockAccountId("2"), MockUserId("2"), AccountName("savings"), Money(50000)),
+        Account(MockAccountId("3"), MockUserId("1"), AccountName("savings"), Money(0)),
+    ]
+    for account in accounts:
+        account_repository.add(account)
+    return accounts
+
+
+def _ids(accounts) -> list[str]:
+    return sorted(str(account.id) for account in accounts)
+
+
+def test_add_already_exists(account_repository: InMemoryAccountRepository, accounts: list[Account]):
+    with pytest.raises(AccountAlreadyExists):
+        account_repository.add(accounts[0])
+
+
+def test_list_by_user(account_repository: InMemoryAccountRepository, accounts: list[Account]):
+    assert _ids(account_repository.list_by_user(MockUserId("1"))) == ["1", "3"]
+    assert _ids(account_repository.list_by_user(MockUserId("2"))) == ["2"]
+    assert _ids(account_repository.list_by_user(MockUserId("3"))) == []
+
+
+def test_list_by_user_after_delete(account_repository: InMemoryAccountRepository, accounts: list[Account]):
+    account_repository.delete(MockAccountId("1"))
+
+    assert _ids(account_repository.list_by_user(MockUserId("1"))) == ["3"]
+    with pytest.raises(AccountNotFound):
+        account_repository.retrieve(MockAccountId("1"))
+
+
+def test_list_by_user_after_move(account_repository: InMemoryAccountRepository, accounts: list[Account]):
+    account = account_repository.retrieve(MockAccountId("3"))
+    account.move_to(MockUserId("2"))
+
+    account_repository.update(account)
+
+    assert _ids(account_repository.list_by_user(MockUserId("1"))) == ["1"]
+    assert _ids(account_repository.list_by_user(MockUserId("2"))) == ["2", "3"]
+
+
+def test_update_unexisting(account_repository: InMemoryAccountRepository, accounts: list[Account]):
+    with pytest.raises(AccountNotFound):
+        account_repository.update(Account(MockAccountId("4"), MockUserId("1"), AccountName("cash"), Money(0)))
@@ -0,0 +1,148 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import io
+
+import pytest
+
+from src.domain.transaction import Transaction
+from src.infrastructure.in_memory.columnar_transaction import ColumnarTransactionRepository, InvalidSnapshot
+from src.test.domain.mocks import MockAccountId, MockTransactionId
+from src.shared.domain.money import CurrencyMismatch, Money
+
+
+@pytest.fixture
+def transaction_repository():
+    return ColumnarTransactionRepository(
+        lambda id_: str(id_).encode().ljust(8, b"\0"), lambda raw: MockTransactionId(raw.rstrip(b"\0").decode()), 8
+    )
+
+
+def _transaction(id_: int, account: str, day: int, amount: Money, label: str = "label") -> Transaction:
+    return Transaction(
+        MockTransactionId(f"{id_:05}"), MockAccountId(account), datetime.date(2023, 1, day), label, amount
+    )
+
+
+def test_retrieve_materialises_columns(transaction_repository: ColumnarTransactionRepository):
+    transaction_repository.add(_transaction(1, "1", 2, Money(-1250, "JPY"), "café"))
+
+    transaction = transaction_repository.retrieve(MockTransactionId("00001"))
+
+    assert transaction.account_id == MockAccountId("1")
+    assert transaction.date == datetime.date(2023, 1, 2)
+    assert transaction.label == "café"
+    assert transaction.amount == Money(-1250, "JPY")
+
+
+def test_sum_by_account(transaction_repository: ColumnarTransactionRepository):
+    transaction_repository.add_many(_transaction(day, "1", day, Money(100 * day)) for day in range(1, 11))
+    transaction_repository.add(_transaction(11, "2", 1, Money(5)))
+    transaction_repository.delete(MockTransactionId("00003"))
+
+    assert transaction_repository.sum_by_account(MockAccountId("1")) == Money(5200)
+    assert transaction_repository.sum_by_account(
+        MockAccountId("1"), date_from=datetime.date(2023, 1, 2), date_to=datetime.date(2023, 1, 4)
+    ) == Money(600)
+    assert transaction_repository.sum_by_account(MockAccountId("3")) == Money(0)
+    assert transaction_repository.sums_by_account(date_to=datetime.date(2023, 1, 2)) == {
+        MockAccountId("1"): Money(300),
+        MockAccountId("2"): Money(5),
+    }
+
+
+def test_sum_by_account_currency_mismatch(transaction_repository: ColumnarTransactionRepository):
+    transaction_repository.add(_transaction(1, "1", 1, Money(100)))
+    transaction_repository.add(_transaction(2, "1", 2, Money(100, "USD")))
+
+    with pytest.raises(CurrencyMismatch):
+        transaction_repository.sum_by_account(MockAccountId("1"))
+    with pytest.raises(CurrencyMismatch):
+        transaction_repository.sums_by_account()
+
+
+def test_compact(transaction_repository: ColumnarTransactionRepository):
+    transaction_repository.add_many(
+        _transaction(index, str(index % 3), index % 28 + 1, Money(index)) for index in range(100)
+    )
+    for index in range(0, 100, 2):
+        transaction_repository.delete(MockTransactionId(f"{index:05}"))
+    listed = [transaction.id for transaction in transaction_repository.list_by_account(MockAccountId("1"))]
+    sums = transaction_repository.sums_by_account()
+
+    transaction_repository.compact()
+
+    assert len(transaction_repository) == 50
+    assert [transaction.id for transaction in transaction_repository.list_by_account(MockAccountId("1"))] == listed
+    assert transaction_repository.sums_by_account() == sums
+    assert transaction_repository.retrieve(MockTransactionId("00099")).amount == Money(99)
+
+
+def test_compacts_once_tombstones_dominate(transaction_repository: ColumnarTransactionRepository):
+    transaction_repository.add_many(_transaction(index, "1", 1, Money(1)) for index in range(3000))
+    listed = transaction_repository.list_by_account(MockAccountId("1"))
+
+    assert next(listed).id == MockTransactionId("00000")
+    for index in range(1, 1600):
+        transaction_repository.delete(MockTransactionId(f"{index:05}"))
+
+    assert len(transaction_repository._live) < 3000
+    assert next(listed).id == MockTransactionId("01600")
+    assert transaction_repository.sum_by_account(MockAccountId("1")) == Money(1401)
+
+
+def test_save_and_load(transaction_repository: ColumnarTransactionRepository):
+    transaction_repository.add_many(
+        _transaction(index, str(index % 3), index % 28 + 1, Money(index)) for index in range(50)
+    )
+    transaction_repository.add(_transaction(50, "5", 1, Money(-3, "JPY"), "yen"))
+    transaction_repository.delete(MockTransactionId("00007"))
+    file = io.BytesIO()
+    transaction_repository.save(file, lambda id_: str(id_).encode())
+    snapshot = file.getvalue()
+
+    loaded = ColumnarTransactionRepository.load(
+        memoryview(snapshot),
+        lambda id_: str(id_).encode().ljust(8, b"\0"),
+        lambda raw: MockTransactionId(raw.rstrip(b"\0").decode()),
+        lambda raw: MockAccountId(raw.decode()),
+    )
+
+    assert len(loaded) == 50
+    assert loaded.retrieve(MockTransactionId("00050")).amount == Money(-3, "JPY")
+    assert list(loaded.list_by_account(MockAccountId("1"))) == list(
+        transaction_repository.list_by_account(MockAccountId("1"))
+    )
+    assert loaded.sums_by_account(date_to=datetime.date(2023, 1, 10)) == transaction_repository.sums_by_account(
+        date_to=datetime.date(2023, 1, 10)
+    )
+
+    loaded.delete(MockTransactionId("00008"))
+    loaded.add(_transaction(51, "4", 1, Money(1)))
+
+    assert file.getvalue() == snapshot
+    assert transaction_repository.retrieve(MockTransactionId("00008")).amount == Money(8)
+    assert [transaction.id for transaction in loaded.list_by_account(MockAccountId("4"))] == [
+        MockTransactionId("00051")
+    ]
+
+
+def test_load_invalid_snapshot():
+    with pytest.raises(InvalidSnapshot):
+        ColumnarTransactionRepository.load(
+            memoryview(b"not a snapshot at all"), str.encode, MockTransactionId, MockAccountId
+        )
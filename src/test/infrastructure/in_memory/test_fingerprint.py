@@ -0,0 +1,38 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from src.infrastructure.in_memory.fingerprint import InMemoryTransactionFingerprintIndex
+from src.test.domain.mocks import MockAccountId
+
+
+def test_known():
+    fingerprint_index = InMemoryTransactionFingerprintIndex()
+    fingerprint_index.add_many(MockAccountId("1"), [b"a", b"b"])
+    fingerprint_index.add_many(MockAccountId("1"), [b"b", b"c"])
+
+    assert fingerprint_index.known([b"a", b"c", b"d"]) == {b"a", b"c"}
+    assert fingerprint_index.known([]) == set()
+
+
+def test_delete_by_account():
+    fingerprint_index = InMemoryTransactionFingerprintIndex()
+    fingerprint_index.add_many(MockAccountId("1"), [b"a", b"b", b"c"])
+    fingerprint_index.add_many(MockAccountId("2"), [b"d"])
+
+    assert fingerprint_index.delete_by_account(MockAccountId("1"), limit=2) == 2
+    assert fingerprint_index.delete_by_account(MockAccountId("1")) == 1
+    assert fingerprint_index.delete_by_account(MockAccountId("1")) == 0
+    assert fingerprint_index.known([b"a", b"b", b"c", b"d"]) == {b"d"}
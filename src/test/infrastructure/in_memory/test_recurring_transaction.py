@@ -0,0 +1,122 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.application.reccurring_transaction.repository import (
+    RecurringTransactionAlreadyExists,
+    RecurringTransactionNotFound,
+)
+from src.domain.recurring_transaction import (
+    RecurringTransaction,
+    RecurringTransactionName,
+    DailyFrequency,
+    MonthlyFrequency,
+)
+from src.infrastructure.in_memory.recurring_transaction import InMemoryRecurringTransactionRepository
+from src.test.domain.mocks import MockAccountId, RecurringTransactionMockId
+from src.shared.domain.money import Money
+
+
+@pytest.fixture
+def recurring_transaction_repository():
+    return InMemoryRecurringTransactionRepository()
+
+
+@pytest.fixture
+def recurring_transactions(recurring_transaction_repository: InMemoryRecurringTransactionRepository):
+    recurring_transactions = [
+        RecurringTransaction(
+            RecurringTransactionMockId("1"),
+            MockAccountId("1"),
+            RecurringTransactionName("rent"),
+            Money(-80000),
+            MonthlyFrequency(5),
+        ),
+        RecurringTransaction(
+            RecurringTransactionMockId("2"),
+            MockAccountId("2"),
+            RecurringTransactionName("food"),
+            Money(-1000),
+            DailyFrequency(),
+        ),
+        RecurringTransaction(
+            RecurringTransactionMockId("3"),
+            MockAccountId("1"),
+            RecurringTransactionName("salary"),
+            Money(200000),
+            MonthlyFrequency(28),
+        ),
+    ]
+    for recurring_transaction in recurring_transactions:
+        recurring_transaction_repository.add(recurring_transaction)
+    return recurring_transactions
+
+
+def _ids(recurring_transactions) -> list[str]:
+    return [str(recurring_transaction.id) for recurring_transaction in recurring_transactions]
+
+
+def test_add_already_exists(
+    recurring_transaction_repository: InMemoryRecurringTransactionRepository,
+    recurring_transactions: list[RecurringTransaction],
+):
+    with pytest.raises(RecurringTransactionAlreadyExists):
+        recurring_transaction_repository.add(recurring_transactions[0])
+
+
+def test_retrieved_recurring_transaction_is_detached(
+    recurring_transaction_repository: InMemoryRecurringTransactionRepository,
+    recurring_transactions: list[RecurringTransaction],
+):
+    recurring_transaction = recurring_transaction_repository.retrieve(RecurringTransactionMockId("1"))
+    recurring_transaction.modify_amount(Money(-90000))
+
+    assert recurring_transaction_repository.retrieve(RecurringTransactionMockId("1")).amount == Money(-80000)
+
+
+def test_list_by_account(
+    recurring_transaction_repository: InMemoryRecurringTransactionRepository,
+    recurring_transactions: list[RecurringTransaction],
+):
+    assert _ids(recurring_transaction_repository.list_by_account(MockAccountId("1"))) == ["1", "3"]
+    assert _ids(recurring_transaction_repository.list_by_account(MockAccountId("3"))) == []
+
+
+def test_list_by_account_after_delete(
+    recurring_transaction_repository: InMemoryRecurringTransactionRepository,
+    recurring_transactions: list[RecurringTransaction],
+):
+    recurring_transaction_repository.delete(RecurringTransactionMockId("1"))
+
+    assert _ids(recurring_transaction_repository.list_by_account(MockAccountId("1"))) == ["3"]
+    with pytest.raises(RecurringTransactionNotFound):
+        recurring_transaction_repository.retrieve(RecurringTransactionMockId("1"))
+    with pytest.raises(RecurringTransactionNotFound):
+        recurring_transaction_repository.delete(RecurringTransactionMockId("1"))
+
+
+def test_delete_by_account(
+    recurring_transaction_repository: InMemoryRecurringTransactionRepository,
+    recurring_transactions: list[RecurringTransaction],
+):
+    assert recurring_transaction_repository.delete_by_account(MockAccountId("1")) == 2
+    assert recurring_transaction_repository.delete_by_account(MockAccountId("1")) == 0
+
+    assert _ids(recurring_transaction_repository.list_by_account(MockAccountId("1"))) == []
+    assert _ids(recurring_transaction_repository.list_by_account(MockAccountId("2"))) == ["2"]
+    with pytest.raises(RecurringTransactionNotFound):
+        recurring_transaction_repository.retrieve(RecurringTransactionMockId("3"))
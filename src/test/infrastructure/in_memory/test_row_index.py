@@ -0,0 +1,74 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.infrastructure.in_memory.row_index import RowIndex
+
+
+@pytest.fixture
+def keys():
+    return [f"{index:08}".encode() for index in range(5000)]
+
+
+def test_get(keys: list[bytes]):
+    index = RowIndex(keys.__getitem__)
+    for row, key in enumerate(keys):
+        index.add(key, row)
+
+    assert [index.get(key) for key in keys] == list(range(len(keys)))
+    assert index.get(b"missing!") is None
+    assert len(index.slots) >= 2 * len(keys)
+
+
+def test_remove(keys: list[bytes]):
+    index = RowIndex(keys.__getitem__)
+    for row, key in enumerate(keys[:100]):
+        index.add(key, row)
+
+    index.remove(keys[10])
+
+    assert index.get(keys[10]) is None
+    assert index.get(keys[11]) == 11
+    with pytest.raises(KeyError):
+        index.remove(keys[10])
+
+
+def test_compact(keys: list[bytes]):
+    index = RowIndex(keys.__getitem__)
+    for row, key in enumerate(keys[:100]):
+        index.add(key, row)
+    live = bytearray(row % 2 for row in range(100))
+    for row in range(0, 100, 2):
+        index.remove(keys[row])
+
+    index.compact(live)
+    del keys[:100:2]
+
+    assert [index.get(key) for key in keys[:50]] == list(range(50))
+
+
+def test_adopted_slots_are_copied_on_change(keys: list[bytes]):
+    index = RowIndex(keys.__getitem__)
+    index.add(keys[0], 0)
+    mapped = memoryview(index.slots.tobytes()).cast("q")
+
+    adopted = RowIndex(keys.__getitem__, mapped, index.used)
+    adopted.add(keys[1], 1)
+
+    assert adopted.get(keys[0]) == 0
+    assert adopted.get(keys[1]) == 1
+    assert 2 not in mapped
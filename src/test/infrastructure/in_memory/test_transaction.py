@@ -0,0 +1,197 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.application.transaction.repository import (
+    TransactionRepository,
+    TransactionAlreadyExists,
+    TransactionNotFound,
+    TransactionCursor,
+    TransactionAddition,
+    TransactionReplacement,
+    TransactionRemoval,
+)
+from src.domain.transaction import Transaction
+from src.infrastructure.in_memory.columnar_transaction import ColumnarTransactionRepository
+from src.infrastructure.in_memory.transaction import InMemoryTransactionRepository
+from src.test.domain.mocks import MockAccountId, MockTransactionId
+from src.shared.domain.money import Money
+
+
+def _columnar_transaction_repository() -> ColumnarTransactionRepository:
+    return ColumnarTransactionRepository(
+        lambda id_: str(id_).encode().ljust(8, b"\0"), lambda raw: MockTransactionId(raw.rstrip(b"\0").decode()), 8
+    )
+
+
+@pytest.fixture(params=[InMemoryTransactionRepository, _columnar_transaction_repository])
+def transaction_repository(request):
+    return request.param()
+
+
+@pytest.fixture
+def transactions(transaction_repository: TransactionRepository):
+    transactions = [
+        Transaction(MockTransactionId("3"), MockAccountId("1"), datetime.date(2023, 3, 1), "march", Money(300)),
+        Transaction(MockTransactionId("1"), MockAccountId("1"), datetime.date(2023, 1, 1), "january", Money(100)),
+        Transaction(MockTransactionId("2"), MockAccountId("1"), datetime.date(2023, 2, 1), "february", Money(200)),
+        Transaction(MockTransactionId("4"), MockAccountId("1"), datetime.date(2023, 2, 1), "february bis", Money(400)),
+        Transaction(MockTransactionId("5"), MockAccountId("2"), datetime.date(2023, 2, 1), "other account", Money(500)),
+    ]
+    for transaction in transactions:
+        transaction_repository.add(transaction)
+    return transactions
+
+
+def _ids(transactions) -> list[str]:
+    return [str(transaction.id) for transaction in transactions]
+
+
+def test_add_already_exists(transaction_repository: TransactionRepository, transactions: list[Transaction]):
+    with pytest.raises(TransactionAlreadyExists):
+        transaction_repository.add(transactions[0])
+
+
+def test_retrieved_transaction_is_detached(
+    transaction_repository: TransactionRepository, transactions: list[Transaction]
+):
+    transaction = transaction_repository.retrieve(MockTransactionId("1"))
+    transaction.rectify_date(datetime.date(2024, 1, 1))
+
+    assert _ids(transaction_repository.list_by_account(MockAccountId("1")))[0] == "1"
+
+
+def test_list_by_account(transaction_repository: TransactionRepository, transactions: list[Transaction]):
+    assert _ids(transaction_repository.list_by_account(MockAccountId("1"))) == ["1", "2", "4", "3"]
+    assert _ids(transaction_repository.list_by_account(MockAccountId("2"))) == ["5"]
+    assert _ids(transaction_repository.list_by_account(MockAccountId("3"))) == []
+
+
+def test_list_by_account_between_dates(transaction_repository: TransactionRepository, transactions: list[Transaction]):
+    listed = transaction_repository.list_by_account(
+        MockAccountId("1"), date_from=datetime.date(2023, 2, 1), date_to=datetime.date(2023, 2, 28)
+    )
+
+    assert _ids(listed) == ["2", "4"]
+
+
+def test_list_by_account_pages(transaction_repository: TransactionRepository, transactions: list[Transaction]):
+    first_page = list(transaction_repository.list_by_account(MockAccountId("1"), limit=2))
+    second_page = list(
+        transaction_repository.list_by_account(
+            MockAccountId("1"), limit=2, cursor=TransactionCursor.after(first_page[-1])
+        )
+    )
+
+    assert _ids(first_page) == ["1", "2"]
+    assert _ids(second_page) == ["4", "3"]
+
+
+def test_list_by_account_follows_updates(
+    transaction_repository: TransactionRepository, transactions: list[Transaction]
+):
+    transaction = transaction_repository.retrieve(MockTransactionId("1"))
+    transaction.rectify_date(datetime.date(2023, 4, 1))
+    transaction_repository.update(transaction)
+    transaction_repository.delete(MockTransactionId("2"))
+
+    assert _ids(transaction_repository.list_by_account(MockAccountId("1"))) == ["4", "3", "1"]
+
+
+def test_list_by_account_survives_deletion_while_iterating(
+    transaction_repository: TransactionRepository, transactions: list[Transaction]
+):
+    listed = transaction_repository.list_by_account(MockAccountId("1"))
+
+    assert str(next(listed).id) == "1"
+    transaction_repository.delete(MockTransactionId("2"))
+    assert _ids(listed) == ["4", "3"]
+
+
+def test_delete_unexisting(transaction_repository: TransactionRepository):
+    with pytest.raises(TransactionNotFound):
+        transaction_repository.delete(MockTransactionId("1"))
+
+
+def test_add_many(transaction_repository: TransactionRepository, transactions: list[Transaction]):
+    transaction_repository.add_many(
+        Transaction(
+            MockTransactionId(str(index)), MockAccountId("3"), datetime.date(2023, 1, index), "label", Money(100)
+        )
+        for index in range(10, 20)
+    )
+
+    assert _ids(transaction_repository.list_by_account(MockAccountId("3"))) == [str(index) for index in range(10, 20)]
+
+
+def test_add_many_is_atomic(transaction_repository: TransactionRepository, transactions: list[Transaction]):
+    with pytest.raises(TransactionAlreadyExists):
+        transaction_repository.add_many(
+            [
+                Transaction(
+                    MockTransactionId("10"), MockAccountId("3"), datetime.date(2023, 1, 1), "label", Money(100)
+                ),
+                Transaction(MockTransactionId("1"), MockAccountId("3"), datetime.date(2023, 1, 1), "label", Money(100)),
+            ]
+        )
+
+    assert _ids(transaction_repository.list_by_account(MockAccountId("3"))) == []
+
+
+def test_apply_batch(transaction_repository: TransactionRepository, transactions: list[Transaction]):
+    added = Transaction(MockTransactionId("10"), MockAccountId("1"), datetime.date(2023, 4, 1), "april", Money(1000))
+    replacement = Transaction(
+        MockTransactionId("1"), MockAccountId("1"), datetime.date(2023, 1, 2), "january", Money(200)
+    )
+
+    results = transaction_repository.apply_batch(
+        MockAccountId("1"),
+        [
+            TransactionAddition(added),
+            TransactionAddition(transactions[0]),
+            TransactionReplacement(replacement),
+            TransactionRemoval(MockTransactionId("3")),
+            TransactionRemoval(MockTransactionId("5")),
+            TransactionRemoval(MockTransactionId("3")),
+        ],
+    )
+
+    assert [result.previous for result in results] == [None, None, transactions[1], transactions[0], None, None]
+    assert [type(result.error) for result in results] == [
+        type(None),
+        TransactionAlreadyExists,
+        type(None),
+        type(None),
+        TransactionNotFound,
+        TransactionNotFound,
+    ]
+    assert transaction_repository.retrieve(MockTransactionId("1")).amount == Money(200)
+    assert _ids(transaction_repository.list_by_account(MockAccountId("1"))) == ["1", "2", "4", "10"]
+
+
+def test_delete_by_account(transaction_repository: TransactionRepository, transactions: list[Transaction]):
+    assert transaction_repository.delete_by_account(MockAccountId("1"), limit=3) == 3
+    assert _ids(transaction_repository.list_by_account(MockAccountId("1"))) == ["1"]
+
+    assert transaction_repository.delete_by_account(MockAccountId("1")) == 1
+    assert transaction_repository.delete_by_account(MockAccountId("1")) == 0
+    assert _ids(transaction_repository.list_by_account(MockAccountId("1"))) == []
+    assert _ids(transaction_repository.list_by_account(MockAccountId("2"))) == ["5"]
+    with pytest.raises(TransactionNotFound):
+        transaction_repository.retrieve(MockTransactionId("3"))
@@ -0,0 +1,97 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import asyncio
+
+import pytest
+
+from src.application.user.repository import (
+    UserAlreadyExists,
+    UserNotFound,
+    UserEmailAddressNotFound,
+    UserEmailAddressAlreadyUsed,
+)
+from src.domain.user import User, UserName
+from src.infrastructure.in_memory.user import InMemoryUserRepository
+from src.infrastructure.user.password.vault import InvalidPassword
+from src.shared.domain.email import EmailAddress
+from src.test.application.user.mock import UserPasswordVaultMock
+from src.test.domain.mocks import MockUserId
+
+
+@pytest.fixture
+def user_repository():
+    return InMemoryUserRepository()
+
+
+@pytest.fixture
+def user(user_repository: InMemoryUserRepository):
+    user = User(MockUserId("1"), EmailAddress("john@example.com"), UserName("john_doe"))
+    user_repository.add(user)
+    return user
+
+
+def test_add_already_exists(user_repository: InMemoryUserRepository, user: User):
+    with pytest.raises(UserAlreadyExists):
+        user_repository.add(user)
+
+
+def test_retrieve_by_email_address(user_repository: InMemoryUserRepository, user: User):
+    assert user_repository.retrieve_by_email_address(EmailAddress("john@example.com")).id == user.id
+    with pytest.raises(UserEmailAddressNotFound):
+        user_repository.retrieve_by_email_address(EmailAddress("jane@example.com"))
+
+
+def test_retrieve_by_email_address_after_change(user_repository: InMemoryUserRepository, user: User):
+    user.change_email_address(EmailAddress("johnny@example.com"))
+
+    user_repository.update(user)
+
+    assert user_repository.retrieve_by_email_address(EmailAddress("johnny@example.com")).id == user.id
+    with pytest.raises(UserEmailAddressNotFound):
+        user_repository.retrieve_by_email_address(EmailAddress("john@example.com"))
+
+
+def test_delete(user_repository: InMemoryUserRepository, user: User):
+    user_repository.delete(user.id)
+
+    with pytest.raises(UserNotFound):
+        user_repository.retrieve(user.id)
+    with pytest.raises(UserEmailAddressNotFound):
+        user_repository.retrieve_by_email_address(user.email_address)
+
+
+def test_email_address_belongs_to_one_user(user_repository: InMemoryUserRepository, user: User):
+    other_user = User(MockUserId("2"), EmailAddress("jane@example.com"), UserName("jane_doe"))
+    user_repository.add(other_user)
+
+    with pytest.raises(UserEmailAddressAlreadyUsed):
+        user_repository.add(User(MockUserId("3"), user.email_address, UserName("johnny")))
+    other_user.change_email_address(user.email_address)
+    with pytest.raises(UserEmailAddressAlreadyUsed):
+        user_repository.update(other_user)
+    assert user_repository.retrieve_by_email_address(user.email_address).id == user.id
+
+
+def test_delete_password():
+    vault = UserPasswordVaultMock()
+    vault.store(MockUserId("1"), "Secret1@")
+
+    vault.delete(MockUserId("1"))
+    vault.delete(MockUserId("1"))
+
+    with pytest.raises(InvalidPassword):
+        asyncio.run(vault.check(MockUserId("1"), "Secret1@"))
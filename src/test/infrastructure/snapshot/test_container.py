@@ -0,0 +1,53 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+from typing import Iterator
+
+import pytest
+
+from src.domain.transaction import Transaction
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.containers.snapshot import snapshot_container
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.shared.domain.money import Money
+
+
+@pytest.fixture
+def container(tmp_path) -> Iterator[SqliteContainer]:
+    container = snapshot_container(str(tmp_path / "transactions"))
+    container.config.database_path.from_value(":memory:")
+    yield container
+    container.shutdown_resources()
+
+
+def test_rolled_back_unit_of_work_keeps_transactions(container: SqliteContainer):
+    account_id = AccountUUIDFactory().generate_id()
+    transaction = Transaction(
+        TransactionUUIDFactory().generate_id(), account_id, datetime.date(2023, 1, 31), "label", Money(-1250)
+    )
+    transaction_repository = container.transaction_repository()
+    fingerprint_index = container.transaction_fingerprint_index()
+
+    with pytest.raises(OSError):
+        with container.unit_of_work().atomic():
+            transaction_repository.add_many([transaction])
+            fingerprint_index.add_many(account_id, [b"fingerprint"])
+            raise OSError("disk I/O error")
+
+    assert fingerprint_index.known([b"fingerprint"]) == set()
+    assert transaction_repository.retrieve(transaction.id) == transaction
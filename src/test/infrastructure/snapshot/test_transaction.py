@@ -0,0 +1,144 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import os
+
+import pytest
+
+from src.application.transaction.repository import TransactionNotFound, TransactionRemoval, TransactionReplacement
+from src.domain.transaction import Transaction
+from src.infrastructure.snapshot.transaction import SnapshotTransactionRepository
+from src.test.domain.mocks import MockAccountId, MockTransactionId
+from src.shared.domain.money import Money
+
+
+def _open(directory: str, compaction_log_size: int = 2**20) -> SnapshotTransactionRepository:
+    return SnapshotTransactionRepository(
+        directory,
+        lambda id_: str(id_).encode().ljust(8, b"\0"),
+        lambda raw: MockTransactionId(raw.rstrip(b"\0").decode()),
+        lambda account_id: str(account_id).encode(),
+        lambda raw: MockAccountId(raw.decode()),
+        id_size=8,
+        compaction_log_size=compaction_log_size,
+    )
+
+
+def _transaction(id_: int, amount: int = 100, label: str = "label") -> Transaction:
+    return Transaction(
+        MockTransactionId(str(id_)),
+        MockAccountId(str(id_ % 2)),
+        datetime.date(2023, 1, id_ % 28 + 1),
+        label,
+        Money(amount),
+    )
+
+
+def _amounts(repository: SnapshotTransactionRepository, account: str) -> list[int]:
+    return [transaction.amount.minor_units for transaction in repository.list_by_account(MockAccountId(account))]
+
+
+@pytest.fixture
+def directory(tmp_path) -> str:
+    return str(tmp_path / "transactions")
+
+
+def test_changes_survive_a_restart(directory: str):
+    repository = _open(directory)
+    repository.add_many(_transaction(index, index) for index in range(10))
+    transaction = repository.retrieve(MockTransactionId("2"))
+    transaction.rectify_amount(Money(-2))
+    repository.update(transaction)
+    repository.delete(MockTransactionId("4"))
+    repository.apply_batch(
+        MockAccountId("1"),
+        [TransactionRemoval(MockTransactionId("1")), TransactionReplacement(_transaction(3, 33, "três"))],
+    )
+    repository.close()
+
+    reopened = _open(directory)
+
+    assert _amounts(reopened, "0") == [0, -2, 6, 8]
+    assert _amounts(reopened, "1") == [33, 5, 7, 9]
+    assert reopened.retrieve(MockTransactionId("3")).label == "três"
+    with pytest.raises(TransactionNotFound):
+        reopened.retrieve(MockTransactionId("1"))
+    reopened.close()
+
+
+def test_snapshot_then_log(directory: str):
+    repository = _open(directory)
+    repository.add_many(_transaction(index) for index in range(10))
+    repository.write_snapshot()
+    repository.delete(MockTransactionId("0"))
+    repository.add(_transaction(10))
+    repository.close()
+
+    reopened = _open(directory)
+
+    assert len(list(reopened.list_by_account(MockAccountId("0")))) == 5
+    assert reopened.retrieve(MockTransactionId("10")).amount == Money(100)
+    assert sorted(os.listdir(directory)) == ["log-00000002.bin", "snapshot-00000002.bin"]
+    reopened.close()
+
+
+def test_torn_record_is_dropped(directory: str):
+    repository = _open(directory)
+    repository.add(_transaction(1))
+    repository.add(_transaction(2))
+    repository.close()
+    log = os.path.join(directory, "log-00000001.bin")
+    os.truncate(log, os.path.getsize(log) - 3)
+
+    reopened = _open(directory)
+
+    assert reopened.retrieve(MockTransactionId("1")).amount == Money(100)
+    with pytest.raises(TransactionNotFound):
+        reopened.retrieve(MockTransactionId("2"))
+    reopened.add(_transaction(2))
+    reopened.close()
+
+    reopened = _open(directory)
+    assert reopened.retrieve(MockTransactionId("2")).amount == Money(100)
+    reopened.close()
+
+
+def test_compacts_in_the_background(directory: str):
+    repository = _open(directory, compaction_log_size=4096)
+    for index in range(200):
+        repository.add(_transaction(index))
+    repository.close()
+
+    assert any(name.startswith("snapshot-") for name in os.listdir(directory))
+    reopened = _open(directory)
+    assert len(list(reopened.list_by_account(MockAccountId("1")))) == 100
+    reopened.close()
+
+
+def test_deletions_by_account_survive_a_restart(directory: str):
+    repository = _open(directory)
+    repository.add_many(_transaction(index, index) for index in range(10))
+    repository.write_snapshot()
+    assert repository.delete_by_account(MockAccountId("1"), limit=2) == 2
+    assert repository.delete_by_account(MockAccountId("0")) == 5
+    repository.close()
+
+    reopened = _open(directory)
+
+    assert _amounts(reopened, "0") == []
+    assert _amounts(reopened, "1") == [1, 3, 5]
+    reopened.close()
@@ -0,0 +1,90 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.domain.account import Account, AccountName
+from src.domain.recurring_transaction import RecurringTransaction, RecurringTransactionName, MonthlyFrequency
+from src.domain.transaction import Transaction
+from src.domain.user import User, UserName
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.recurring_transaction.id import RecurringTransactionUUIDFactory
+from src.infrastructure.sqlite.account import SqliteAccountRepository
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.recurring_transaction import SqliteRecurringTransactionRepository
+from src.infrastructure.sqlite.transaction import SqliteTransactionRepository
+from src.infrastructure.sqlite.user import SqliteUserRepository
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.email import EmailAddress
+from src.shared.domain.money import Money
+
+
+@pytest.fixture
+def database():
+    database = SqliteDatabase(":memory:")
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def user_repository(database: SqliteDatabase):
+    return SqliteUserRepository(database)
+
+
+@pytest.fixture
+def account_repository(database: SqliteDatabase):
+    return SqliteAccountRepository(database)
+
+
+@pytest.fixture
+def transaction_repository(database: SqliteDatabase):
+    return SqliteTransactionRepository(database)
+
+
+@pytest.fixture
+def recurring_transaction_repository(database: SqliteDatabase):
+    return SqliteRecurringTransactionRepository(database)
+
+
+@pytest.fixture
+def user():
+    return User(UserUUIDFactory().generate_id(), EmailAddress("john@example.com"), UserName("john_doe"))
+
+
+@pytest.fixture
+def account(user: User):
+    return Account(AccountUUIDFactory().generate_id(), user.id, AccountName("account_name"), Money(10000))
+
+
+@pytest.fixture
+def transaction(account: Account):
+    return Transaction(
+        TransactionUUIDFactory().generate_id(), account.id, datetime.date(2023, 1, 31), "label", Money(-1250)
+    )
+
+
+@pytest.fixture
+def recurring_transaction(account: Account):
+    return RecurringTransaction(
+        RecurringTransactionUUIDFactory().generate_id(),
+        account.id,
+        RecurringTransactionName("rent"),
+        Money(-80000),
+        MonthlyFrequency(day=5),
+    )
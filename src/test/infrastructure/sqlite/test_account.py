@@ -0,0 +1,88 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.application.account.repository import AccountAlreadyExists, AccountNotFound
+from src.domain.account import Account, AccountName
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.sqlite.account import SqliteAccountRepository
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.money import Money
+
+
+def test_add_and_retrieve(account_repository: SqliteAccountRepository, account: Account):
+    account_repository.add(account)
+
+    retrieved_account = account_repository.retrieve(account.id)
+
+    assert retrieved_account == account
+    assert retrieved_account.user_id == account.user_id
+    assert retrieved_account.name == account.name
+    assert retrieved_account.reference_balance == account.reference_balance
+
+
+def test_add_already_exists(account_repository: SqliteAccountRepository, account: Account):
+    account_repository.add(account)
+
+    with pytest.raises(AccountAlreadyExists):
+        account_repository.add(account)
+
+
+def test_update(account_repository: SqliteAccountRepository, account: Account):
+    account_repository.add(account)
+    account.rename(AccountName("savings"))
+    account.modify_reference_balance(Money(4200))
+
+    account_repository.update(account)
+
+    retrieved_account = account_repository.retrieve(account.id)
+    assert retrieved_account.name == AccountName("savings")
+    assert retrieved_account.reference_balance == Money(4200)
+
+
+def test_update_unexisting(account_repository: SqliteAccountRepository, account: Account):
+    with pytest.raises(AccountNotFound):
+        account_repository.update(account)
+
+
+def test_delete(account_repository: SqliteAccountRepository, account: Account):
+    account_repository.add(account)
+
+    account_repository.delete(account.id)
+
+    with pytest.raises(AccountNotFound):
+        account_repository.retrieve(account.id)
+
+
+def test_delete_unexisting(account_repository: SqliteAccountRepository, account: Account):
+    with pytest.raises(AccountNotFound):
+        account_repository.delete(account.id)
+
+
+def test_list_by_user(account_repository: SqliteAccountRepository, account: Account):
+    other_account = Account(AccountUUIDFactory().generate_id(), account.user_id, AccountName("savings"), Money(0))
+    foreign_account = Account(
+        AccountUUIDFactory().generate_id(), UserUUIDFactory().generate_id(), AccountName("cash"), Money(0)
+    )
+    for added_account in (account, other_account, foreign_account):
+        account_repository.add(added_account)
+
+    accounts = list(account_repository.list_by_user(account.user_id))
+
+    assert sorted(str(listed_account.id) for listed_account in accounts) == sorted(
+        [str(account.id), str(other_account.id)]
+    )
@@ -0,0 +1,40 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.sqlite.account_tombstone import SqliteAccountTombstoneRepository
+from src.infrastructure.sqlite.database import SqliteDatabase
+
+
+@pytest.fixture
+def account_tombstone_repository(database: SqliteDatabase):
+    return SqliteAccountTombstoneRepository(database)
+
+
+def test_add_exists_and_delete(account_tombstone_repository: SqliteAccountTombstoneRepository):
+    account_id = AccountUUIDFactory().generate_id()
+
+    account_tombstone_repository.add(account_id)
+    account_tombstone_repository.add(account_id)
+
+    assert account_tombstone_repository.exists(account_id)
+    assert account_tombstone_repository.list_account_ids() == [account_id]
+    account_tombstone_repository.delete(account_id)
+    account_tombstone_repository.delete(account_id)
+    assert not account_tombstone_repository.exists(account_id)
+    assert account_tombstone_repository.list_account_ids() == []
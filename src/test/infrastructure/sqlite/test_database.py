@@ -0,0 +1,67 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.infrastructure.sqlite.database import SqliteDatabase
+
+_INSERT = "INSERT INTO account_tombstone (account_id) VALUES (?)"
+_COUNT = "SELECT COUNT(*) FROM account_tombstone"
+
+
+@pytest.fixture
+def file_database(tmp_path: Path) -> Iterator[SqliteDatabase]:
+    database = SqliteDatabase(str(tmp_path / "keskireste.sqlite3"))
+    yield database
+    database.close()
+
+
+def _count(database: SqliteDatabase) -> int:
+    with database.read() as connection:
+        return connection.execute(_COUNT).fetchone()[0]
+
+
+def _count_in_thread(database: SqliteDatabase) -> int:
+    counts: list[int] = []
+    thread = threading.Thread(target=lambda: counts.append(_count(database)))
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "the reader waited for the writer"
+    return counts[0]
+
+
+def test_readers_do_not_wait_for_the_writer(file_database: SqliteDatabase):
+    with file_database.transaction() as connection:
+        connection.execute(_INSERT, (b"first",))
+
+        assert _count_in_thread(file_database) == 0
+        assert _count(file_database) == 1
+
+    assert _count_in_thread(file_database) == 1
+
+
+def test_rolled_back_changes_are_not_read(file_database: SqliteDatabase):
+    with pytest.raises(RuntimeError):
+        with file_database.transaction() as connection:
+            connection.execute(_INSERT, (b"first",))
+            raise RuntimeError()
+
+    assert _count(file_database) == 0
+    assert _count_in_thread(file_database) == 0
@@ -0,0 +1,58 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.infrastructure.email.transport import EmailMessage
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.email_outbox import SqliteEmailOutbox
+from src.shared.domain.email import EmailAddress
+
+
+@pytest.fixture
+def email_outbox(database: SqliteDatabase):
+    return SqliteEmailOutbox(database, clock=lambda: 100.0)
+
+
+def _message(index: int) -> EmailMessage:
+    return EmailMessage(EmailAddress(f"user{index}@example.com"), "subject", f"body {index}")
+
+
+def test_deliver_then_due(email_outbox: SqliteEmailOutbox):
+    for index in range(3):
+        email_outbox.deliver(_message(index))
+
+    assert email_outbox.next_attempt_at() == 100.0
+    assert email_outbox.due(limit=10, now=99.0) == []
+    emails = email_outbox.due(limit=2, now=100.0)
+    assert [email.message for email in emails] == [_message(0), _message(1)]
+    assert [email.attempts for email in emails] == [0, 0]
+
+
+def test_reschedule_and_acknowledge(email_outbox: SqliteEmailOutbox):
+    for index in range(2):
+        email_outbox.deliver(_message(index))
+    first, second = email_outbox.due(limit=10, now=100.0)
+
+    email_outbox.reschedule([(first.id, 150.0)])
+    email_outbox.acknowledge([second.id])
+
+    assert email_outbox.due(limit=10, now=100.0) == []
+    assert email_outbox.next_attempt_at() == 150.0
+    [email] = email_outbox.due(limit=10, now=150.0)
+    assert (email.message, email.attempts) == (_message(0), 1)
+    email_outbox.acknowledge([email.id])
+    assert email_outbox.next_attempt_at() is None
@@ -0,0 +1,90 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import io
+from typing import Iterable
+
+import pytest
+
+from src.application.transaction.fingerprint import Fingerprint
+from src.application.transaction.importer import TransactionImporter, TransactionImportRequest
+from src.application.transaction.statement import StatementEntry
+from src.domain.account import Account, AccountId
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.sqlite.fingerprint import SqliteTransactionFingerprintIndex
+from src.infrastructure.sqlite.transaction import SqliteTransactionRepository
+from src.infrastructure.sqlite.unit_of_work import SqliteUnitOfWork
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.shared.domain.money import Money
+from src.test.application.transaction.mock import StatementMockReader
+
+
+class _FailingFingerprintIndex(SqliteTransactionFingerprintIndex):
+    def add_many(self, account_id: AccountId, fingerprints: Iterable[Fingerprint]) -> None:
+        raise OSError("disk I/O error")
+
+
+def test_known(database: SqliteDatabase, account: Account):
+    fingerprint_index = SqliteTransactionFingerprintIndex(database)
+    fingerprint_index.add_many(account.id, [b"a", b"b"])
+    fingerprint_index.add_many(account.id, [b"b", b"c"])
+
+    assert fingerprint_index.known([b"a", b"c", b"d"]) == {b"a", b"c"}
+    assert fingerprint_index.known([]) == set()
+
+
+def test_known_by_several_queries(database: SqliteDatabase, account: Account):
+    fingerprint_index = SqliteTransactionFingerprintIndex(database)
+    fingerprints = [index.to_bytes(4, "big") for index in range(1200)]
+    fingerprint_index.add_many(account.id, fingerprints[::2])
+
+    assert fingerprint_index.known(fingerprints) == set(fingerprints[::2])
+
+
+def test_delete_by_account(database: SqliteDatabase, account: Account):
+    fingerprint_index = SqliteTransactionFingerprintIndex(database)
+    fingerprint_index.add_many(account.id, [b"a", b"b", b"c"])
+    fingerprint_index.add_many(AccountUUIDFactory().generate_id(), [b"d"])
+
+    assert fingerprint_index.delete_by_account(account.id, limit=2) == 2
+    assert fingerprint_index.delete_by_account(account.id) == 1
+    assert fingerprint_index.delete_by_account(account.id) == 0
+    assert fingerprint_index.known([b"a", b"b", b"c", b"d"]) == {b"d"}
+
+
+def test_import_is_stored_along_with_its_fingerprints(
+    database: SqliteDatabase, transaction_repository: SqliteTransactionRepository, account: Account
+):
+    statement_reader = StatementMockReader([StatementEntry(datetime.date(2023, 1, 1), "first", Money(-100), "1")])
+    request = TransactionImportRequest(account_id=account.id, statement=io.BytesIO())
+
+    def importer(fingerprint_index: SqliteTransactionFingerprintIndex) -> TransactionImporter:
+        return TransactionImporter(
+            repository=transaction_repository,
+            id_factory=TransactionUUIDFactory(),
+            statement_reader=statement_reader,
+            fingerprint_index=fingerprint_index,
+            unit_of_work=SqliteUnitOfWork(database),
+        )
+
+    with pytest.raises(OSError):
+        importer(_FailingFingerprintIndex(database)).import_statement(request)
+    assert list(transaction_repository.list_by_account(account.id)) == []
+
+    assert importer(SqliteTransactionFingerprintIndex(database)).import_statement(request).inserted == 1
+    assert importer(SqliteTransactionFingerprintIndex(database)).import_statement(request).inserted == 0
@@ -0,0 +1,141 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.application.reccurring_transaction.repository import (
+    RecurringTransactionAlreadyExists,
+    RecurringTransactionNotFound,
+)
+from src.domain.recurring_transaction import (
+    RecurringTransaction,
+    RecurringTransactionName,
+    DailyFrequency,
+    WeeklyFrequency,
+    YearlyFrequency,
+    Day,
+)
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.recurring_transaction.id import RecurringTransactionUUIDFactory
+from src.infrastructure.sqlite.recurring_transaction import SqliteRecurringTransactionRepository
+from src.shared.domain.money import Money
+
+
+def test_add_and_retrieve(
+    recurring_transaction_repository: SqliteRecurringTransactionRepository, recurring_transaction: RecurringTransaction
+):
+    recurring_transaction_repository.add(recurring_transaction)
+
+    retrieved_recurring_transaction = recurring_transaction_repository.retrieve(recurring_transaction.id)
+
+    assert retrieved_recurring_transaction == recurring_transaction
+    assert retrieved_recurring_transaction.account_id == recurring_transaction.account_id
+    assert retrieved_recurring_transaction.name == recurring_transaction.name
+    assert retrieved_recurring_transaction.amount == recurring_transaction.amount
+    assert retrieved_recurring_transaction.frequency == recurring_transaction.frequency
+
+
+def test_add_already_exists(
+    recurring_transaction_repository: SqliteRecurringTransactionRepository, recurring_transaction: RecurringTransaction
+):
+    recurring_transaction_repository.add(recurring_transaction)
+
+    with pytest.raises(RecurringTransactionAlreadyExists):
+        recurring_transaction_repository.add(recurring_transaction)
+
+
+@pytest.mark.parametrize("frequency", [DailyFrequency(), WeeklyFrequency(Day.FRIDAY), YearlyFrequency(day=29, month=2)])
+def test_update(
+    recurring_transaction_repository: SqliteRecurringTransactionRepository,
+    recurring_transaction: RecurringTransaction,
+    frequency,
+):
+    recurring_transaction_repository.add(recurring_transaction)
+    recurring_transaction.rename(RecurringTransactionName("insurance"))
+    recurring_transaction.modify_amount(Money(-3000))
+    recurring_transaction.modify_frequency(frequency)
+
+    recurring_transaction_repository.update(recurring_transaction)
+
+    retrieved_recurring_transaction = recurring_transaction_repository.retrieve(recurring_transaction.id)
+    assert retrieved_recurring_transaction.name == RecurringTransactionName("insurance")
+    assert retrieved_recurring_transaction.amount == Money(-3000)
+    assert retrieved_recurring_transaction.frequency == frequency
+
+
+def test_update_unexisting(
+    recurring_transaction_repository: SqliteRecurringTransactionRepository, recurring_transaction: RecurringTransaction
+):
+    with pytest.raises(RecurringTransactionNotFound):
+        recurring_transaction_repository.update(recurring_transaction)
+
+
+def test_delete(
+    recurring_transaction_repository: SqliteRecurringTransactionRepository, recurring_transaction: RecurringTransaction
+):
+    recurring_transaction_repository.add(recurring_transaction)
+
+    recurring_transaction_repository.delete(recurring_transaction.id)
+
+    with pytest.raises(RecurringTransactionNotFound):
+        recurring_transaction_repository.retrieve(recurring_transaction.id)
+
+
+def test_delete_unexisting(
+    recurring_transaction_repository: SqliteRecurringTransactionRepository, recurring_transaction: RecurringTransaction
+):
+    with pytest.raises(RecurringTransactionNotFound):
+        recurring_transaction_repository.delete(recurring_transaction.id)
+
+
+def test_list_by_account(
+    recurring_transaction_repository: SqliteRecurringTransactionRepository, recurring_transaction: RecurringTransaction
+):
+    recurring_transaction_repository.add(recurring_transaction)
+    recurring_transaction_repository.add(
+        RecurringTransaction(
+            RecurringTransactionUUIDFactory().generate_id(),
+            AccountUUIDFactory().generate_id(),
+            RecurringTransactionName("other"),
+            Money(1000),
+            DailyFrequency(),
+        )
+    )
+
+    assert list(recurring_transaction_repository.list_by_account(recurring_transaction.account_id)) == [
+        recurring_transaction
+    ]
+
+
+def test_delete_by_account(
+    recurring_transaction_repository: SqliteRecurringTransactionRepository, recurring_transaction: RecurringTransaction
+):
+    other_recurring_transaction = RecurringTransaction(
+        RecurringTransactionUUIDFactory().generate_id(),
+        AccountUUIDFactory().generate_id(),
+        RecurringTransactionName("other"),
+        Money(1000),
+        DailyFrequency(),
+    )
+    recurring_transaction_repository.add(recurring_transaction)
+    recurring_transaction_repository.add(other_recurring_transaction)
+
+    assert recurring_transaction_repository.delete_by_account(recurring_transaction.account_id) == 1
+
+    assert list(recurring_transaction_repository.list_by_account(recurring_transaction.account_id)) == []
+    assert list(recurring_transaction_repository.list_by_account(other_recurring_transaction.account_id)) == [
+        other_recurring_transaction
+    ]
@@ -0,0 +1,214 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+
+import pytest
+
+from src.application.transaction.repository import (
+    TransactionAlreadyExists,
+    TransactionNotFound,
+    TransactionCursor,
+    TransactionAddition,
+    TransactionReplacement,
+    TransactionRemoval,
+)
+from src.domain.transaction import Transaction
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.account.id import AccountUUIDFactory
+from src.infrastructure.sqlite.transaction import SqliteTransactionRepository
+from src.infrastructure.transaction.id import TransactionUUIDFactory
+from src.shared.domain.money import Money
+
+
+def test_add_and_retrieve(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    transaction_repository.add(transaction)
+
+    retrieved_transaction = transaction_repository.retrieve(transaction.id)
+
+    assert retrieved_transaction == transaction
+    assert retrieved_transaction.account_id == transaction.account_id
+    assert retrieved_transaction.date == transaction.date
+    assert retrieved_transaction.label == transaction.label
+    assert retrieved_transaction.amount == transaction.amount
+
+
+def test_add_already_exists(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    transaction_repository.add(transaction)
+
+    with pytest.raises(TransactionAlreadyExists):
+        transaction_repository.add(transaction)
+
+
+def test_add_many(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    transactions = [
+        Transaction(
+            TransactionUUIDFactory().generate_id(), transaction.account_id, datetime.date(2023, 1, day), "", Money(100)
+        )
+        for day in range(1, 11)
+    ]
+
+    transaction_repository.add_many(iter(transactions))
+
+    assert list(transaction_repository.list_by_account(transaction.account_id)) == transactions
+
+
+def test_add_many_is_atomic(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    transaction_repository.add(transaction)
+    new_transaction = Transaction(
+        TransactionUUIDFactory().generate_id(), transaction.account_id, datetime.date(2023, 1, 1), "", Money(100)
+    )
+
+    with pytest.raises(TransactionAlreadyExists) as error:
+        transaction_repository.add_many([new_transaction, transaction])
+
+    assert error.value.transaction_id == transaction.id
+    with pytest.raises(TransactionNotFound):
+        transaction_repository.retrieve(new_transaction.id)
+
+
+def test_update(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    transaction_repository.add(transaction)
+    transaction.rectify_date(datetime.date(2023, 2, 1))
+    transaction.rectify_amount(Money(-1300))
+    transaction.modify_label("updated")
+
+    transaction_repository.update(transaction)
+
+    retrieved_transaction = transaction_repository.retrieve(transaction.id)
+    assert retrieved_transaction.date == datetime.date(2023, 2, 1)
+    assert retrieved_transaction.amount == Money(-1300)
+    assert retrieved_transaction.label == "updated"
+
+
+def test_update_unexisting(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    with pytest.raises(TransactionNotFound):
+        transaction_repository.update(transaction)
+
+
+def test_delete(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    transaction_repository.add(transaction)
+
+    transaction_repository.delete(transaction.id)
+
+    with pytest.raises(TransactionNotFound):
+        transaction_repository.retrieve(transaction.id)
+
+
+def test_delete_unexisting(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    with pytest.raises(TransactionNotFound):
+        transaction_repository.delete(transaction.id)
+
+
+def test_failed_transaction_is_rolled_back(
+    database: SqliteDatabase, transaction_repository: SqliteTransactionRepository, transaction: Transaction
+):
+    with pytest.raises(TransactionAlreadyExists):
+        with database.transaction():
+            transaction_repository.add(transaction)
+            transaction_repository.add(transaction)
+
+    with pytest.raises(TransactionNotFound):
+        transaction_repository.retrieve(transaction.id)
+
+
+def test_list_by_account(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    other_account_id = AccountUUIDFactory().generate_id()
+    dates = [datetime.date(2023, 3, 1), datetime.date(2023, 1, 1), datetime.date(2023, 2, 1), datetime.date(2023, 2, 1)]
+    transactions = [
+        Transaction(TransactionUUIDFactory().generate_id(), transaction.account_id, date, "label", Money(100))
+        for date in dates
+    ]
+    other_transaction = Transaction(
+        TransactionUUIDFactory().generate_id(), other_account_id, dates[0], "other", Money(100)
+    )
+    for listed_transaction in [*transactions, other_transaction]:
+        transaction_repository.add(listed_transaction)
+    expected = sorted(transactions, key=lambda t: (t.date, str(t.id)))
+
+    listed = list(transaction_repository.list_by_account(transaction.account_id))
+    february = list(
+        transaction_repository.list_by_account(
+            transaction.account_id, date_from=datetime.date(2023, 2, 1), date_to=datetime.date(2023, 2, 28)
+        )
+    )
+    first_page = list(transaction_repository.list_by_account(transaction.account_id, limit=2))
+    second_page = list(
+        transaction_repository.list_by_account(transaction.account_id, cursor=TransactionCursor.after(first_page[-1]))
+    )
+
+    assert listed == expected
+    assert february == expected[1:3]
+    assert first_page + second_page == expected
+
+
+def test_apply_batch(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    transaction_repository.add(transaction)
+    other_account_transaction = Transaction(
+        TransactionUUIDFactory().generate_id(),
+        AccountUUIDFactory().generate_id(),
+        transaction.date,
+        "other",
+        Money(100),
+    )
+    transaction_repository.add(other_account_transaction)
+    added = Transaction(
+        TransactionUUIDFactory().generate_id(), transaction.account_id, transaction.date, "added", Money(100)
+    )
+    replacement = Transaction(transaction.id, transaction.account_id, transaction.date, "replaced", Money(200))
+
+    results = transaction_repository.apply_batch(
+        transaction.account_id,
+        [
+            TransactionAddition(added),
+            TransactionAddition(added),
+            TransactionReplacement(replacement),
+            TransactionRemoval(other_account_transaction.id),
+            TransactionRemoval(added.id),
+        ],
+    )
+
+    assert [result.previous for result in results] == [None, None, transaction, None, added]
+    assert results[2].previous is not None and results[2].previous.label == "label"
+    assert [type(result.error) for result in results] == [
+        type(None),
+        TransactionAlreadyExists,
+        type(None),
+        TransactionNotFound,
+        type(None),
+    ]
+    assert list(transaction_repository.list_by_account(transaction.account_id)) == [replacement]
+    assert transaction_repository.retrieve(transaction.id).label == "replaced"
+    assert transaction_repository.retrieve(other_account_transaction.id) == other_account_transaction
+
+
+def test_delete_by_account(transaction_repository: SqliteTransactionRepository, transaction: Transaction):
+    transactions = [
+        Transaction(
+            TransactionUUIDFactory().generate_id(), transaction.account_id, datetime.date(2023, 1, day), "", Money(100)
+        )
+        for day in range(1, 6)
+    ]
+    other_transaction = Transaction(
+        TransactionUUIDFactory().generate_id(), AccountUUIDFactory().generate_id(), transaction.date, "", Money(1)
+    )
+    transaction_repository.add_many([*transactions, other_transaction])
+
+    assert transaction_repository.delete_by_account(transaction.account_id, limit=3) == 3
+    assert list(transaction_repository.list_by_account(transaction.account_id)) == transactions[:2]
+    assert transaction_repository.delete_by_account(transaction.account_id) == 2
+    assert list(transaction_repository.list_by_account(transaction.account_id)) == []
+    assert list(transaction_repository.list_by_account(other_transaction.account_id)) == [other_transaction]
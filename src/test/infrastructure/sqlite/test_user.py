@@ -0,0 +1,97 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.application.user.repository import (
+    UserAlreadyExists,
+    UserNotFound,
+    UserEmailAddressNotFound,
+    UserEmailAddressAlreadyUsed,
+)
+from src.domain.user import User, UserName
+from src.infrastructure.sqlite.user import SqliteUserRepository
+from src.infrastructure.user.id import UserUUIDFactory
+from src.shared.domain.email import EmailAddress
+
+
+def test_add_and_retrieve(user_repository: SqliteUserRepository, user: User):
+    user_repository.add(user)
+
+    retrieved_user = user_repository.retrieve(user.id)
+
+    assert retrieved_user == user
+    assert retrieved_user.email_address == user.email_address
+    assert retrieved_user.username == user.username
+
+
+def test_add_already_exists(user_repository: SqliteUserRepository, user: User):
+    user_repository.add(user)
+
+    with pytest.raises(UserAlreadyExists):
+        user_repository.add(user)
+
+
+def test_retrieve_by_email_address(user_repository: SqliteUserRepository, user: User):
+    user_repository.add(user)
+
+    assert user_repository.retrieve_by_email_address(user.email_address) == user
+    with pytest.raises(UserEmailAddressNotFound):
+        user_repository.retrieve_by_email_address(EmailAddress("jane@example.com"))
+
+
+def test_update(user_repository: SqliteUserRepository, user: User):
+    user_repository.add(user)
+    user.rename(UserName("jane_doe"))
+    user.change_email_address(EmailAddress("jane@example.com"))
+
+    user_repository.update(user)
+
+    retrieved_user = user_repository.retrieve(user.id)
+    assert retrieved_user.username == UserName("jane_doe")
+    assert retrieved_user.email_address == EmailAddress("jane@example.com")
+
+
+def test_update_unexisting(user_repository: SqliteUserRepository, user: User):
+    with pytest.raises(UserNotFound):
+        user_repository.update(user)
+
+
+def test_delete(user_repository: SqliteUserRepository, user: User):
+    user_repository.add(user)
+
+    user_repository.delete(user.id)
+
+    with pytest.raises(UserNotFound):
+        user_repository.retrieve(user.id)
+
+
+def test_delete_unexisting(user_repository: SqliteUserRepository, user: User):
+    with pytest.raises(UserNotFound):
+        user_repository.delete(user.id)
+
+
+def test_email_address_belongs_to_one_user(user_repository: SqliteUserRepository, user: User):
+    user_repository.add(user)
+    other_user = User(UserUUIDFactory().generate_id(), EmailAddress("jane@example.com"), UserName("jane_doe"))
+    user_repository.add(other_user)
+
+    with pytest.raises(UserEmailAddressAlreadyUsed):
+        user_repository.add(User(UserUUIDFactory().generate_id(), user.email_address, UserName("johnny")))
+    other_user.change_email_address(user.email_address)
+    with pytest.raises(UserEmailAddressAlreadyUsed):
+        user_repository.update(other_user)
+    assert user_repository.retrieve_by_email_address(user.email_address) == user
@@ -0,0 +1,40 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import asyncio
+import threading
+
+import pytest
+
+from src.infrastructure.blocking import blocking_call_runner
+
+
+def test_run_off_the_event_loop_thread():
+    for runner in blocking_call_runner(max_workers=2):
+
+        async def thread_names() -> list[str]:
+            return await asyncio.gather(*(runner.run(lambda: threading.current_thread().name) for _ in range(4)))
+
+        names = asyncio.run(thread_names())
+
+        assert threading.current_thread().name not in names
+        assert len(set(names)) <= 2
+
+
+def test_run_raises_the_call_error():
+    for runner in blocking_call_runner(max_workers=1):
+        with pytest.raises(KeyError):
+            asyncio.run(runner.run({}.__getitem__, "missing"))
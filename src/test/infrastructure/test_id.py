@@ -0,0 +1,65 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import copy
+import gc
+import pickle
+import uuid
+
+import pytest
+
+from src.infrastructure.account.id import AccountUUID
+from src.infrastructure.id import InvalidUUID, uuid_bytes
+from src.infrastructure.user.id import UserUUID
+
+
+def test_equal_ids_are_interned():
+    value = str(uuid.uuid4())
+
+    assert AccountUUID(value) is AccountUUID(value)
+    assert AccountUUID.trusted(value) is AccountUUID(value)
+    assert AccountUUID(value) != UserUUID(value)
+
+
+def test_interned_ids_are_released():
+    value = str(uuid.uuid4())
+    account_id = AccountUUID(value)
+    assert value in AccountUUID._interned
+
+    del account_id
+    gc.collect()
+
+    assert value not in AccountUUID._interned
+
+
+@pytest.mark.parametrize("value", ["account", "", str(uuid.uuid4()).upper(), str(uuid.uuid4()) + "\n"])
+def test_invalid_uuid(value: str):
+    with pytest.raises(InvalidUUID):
+        AccountUUID(value)
+
+
+def test_bytes_round_trip():
+    account_id = AccountUUID(str(uuid.uuid4()))
+
+    assert len(uuid_bytes(account_id)) == 16
+    assert AccountUUID.from_bytes(uuid_bytes(account_id)) is account_id
+
+
+def test_copies_are_interned():
+    account_id = AccountUUID(str(uuid.uuid4()))
+
+    assert copy.deepcopy(account_id) is account_id
+    assert pickle.loads(pickle.dumps(account_id)) is account_id
@@ -0,0 +1,49 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+from src.infrastructure.rate_limit import TokenBucketLimiter
+from src.test.infrastructure.mock import ClockMock
+
+
+def test_burst_then_refill():
+    clock = ClockMock(0.0)
+    limiter = TokenBucketLimiter(rate=0.5, burst=2, clock=clock)
+
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == 2.0
+    assert limiter.acquire("b") == 0
+    clock.now += 1.5
+    assert limiter.acquire("a") == 0.5
+    clock.now += 0.5
+    assert limiter.acquire("a") == 0
+
+
+def test_idle_buckets_are_evicted():
+    clock = ClockMock(0.0)
+    limiter = TokenBucketLimiter(rate=1.0, burst=2, clock=clock)
+    limiter.acquire("a")
+    clock.now += 1
+    limiter.acquire("b")
+    assert len(limiter) == 2
+
+    clock.now += 1
+    limiter.acquire("c")
+
+    assert len(limiter) == 2
+    clock.now += 2
+    limiter.acquire("c")
+    assert len(limiter) == 1
@@ -0,0 +1,132 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import datetime
+import io
+
+import pytest
+
+from src.application.transaction.statement import StatementEntry, InvalidStatementEntry
+from src.infrastructure.transaction.ofx import OfxStatementReader
+from src.shared.domain.money import Money
+
+SGML_STATEMENT = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+ENCODING:USASCII
+CHARSET:1252
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS><CURDEF>EUR<BANKTRANLIST>
+<DTSTART>20230101<DTEND>20230131
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20230115120000[-5:EST]
+<TRNAMT>-12,50
+<FITID>0001
+<NAME>Caf\xe9 &amp; Co
+<MEMO>CARD 1234
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20230131
+<TRNAMT>1500.00
+<FITID>0002
+<MEMO>SALARY
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>2023013
+<TRNAMT>-1.00
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+""".encode(
+    "cp1252"
+)
+
+XML_STATEMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<?OFX OFXHEADER="200" VERSION="220"?>
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT</TRNTYPE><DTPOSTED>20230201</DTPOSTED><TRNAMT>-3.20</TRNAMT><FITID>A1</FITID>
+<NAME>Boulangerie à côté</NAME></STMTTRN>
+<STMTTRN><TRNTYPE>DEBIT</TRNTYPE><DTPOSTED>20230202</DTPOSTED><TRNAMT>abc</TRNAMT></STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+""".encode(
+    "utf-8"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1 << 16])
+def test_read_sgml_statement(chunk_size: int):
+    entries = list(OfxStatementReader(chunk_size=chunk_size).read(io.BytesIO(SGML_STATEMENT)))
+
+    assert entries[:2] == [
+        StatementEntry(datetime.date(2023, 1, 15), "Caf\xe9 & Co CARD 1234", Money(-1250), "0001"),
+        StatementEntry(datetime.date(2023, 1, 31), "SALARY", Money(150000), "0002"),
+    ]
+    assert isinstance(entries[2], InvalidStatementEntry)
+    assert len(entries) == 3
+
+
+@pytest.mark.parametrize("chunk_size", [5, 1 << 16])
+def test_read_xml_statement(chunk_size: int):
+    entries = list(OfxStatementReader(chunk_size=chunk_size).read(io.BytesIO(XML_STATEMENT)))
+
+    assert entries[0] == StatementEntry(datetime.date(2023, 2, 1), "Boulangerie à côté", Money(-320), "A1")
+    assert isinstance(entries[1], InvalidStatementEntry)
+    assert len(entries) == 2
+
+
+def test_read_unterminated_transaction():
+    statement = b"<OFX><STMTTRN><DTPOSTED>20230101<TRNAMT>1.00"
+
+    assert list(OfxStatementReader().read(io.BytesIO(statement))) == [InvalidStatementEntry("Unterminated transaction")]
+
+
+def test_read_empty_statement():
+    assert list(OfxStatementReader().read(io.BytesIO(b""))) == []
+
+
+def test_read_does_not_depend_on_chunk_size():
+    statement = SGML_STATEMENT * 100
+
+    entries = list(OfxStatementReader().read(io.BytesIO(statement)))
+
+    assert list(OfxStatementReader(chunk_size=7).read(io.BytesIO(statement))) == entries
+    assert len(entries) == 300
+
+
+@pytest.mark.parametrize("chunk_size", [3, 1 << 16])
+def test_read_statement_currency(chunk_size: int):
+    # Past the header read, so that small chunks split the currency tag
+    statement = (
+        b"<OFX>" + b" " * 2000 + b"<STMTRS><CURDEF>JPY<STMTTRN><DTPOSTED>20230101<TRNAMT>-1200</STMTTRN><STMTTRN>"
+    )
+    statement += b"<DTPOSTED>20230102<TRNAMT>-1.5</STMTTRN></STMTRS></OFX>"
+
+    entries = list(OfxStatementReader(chunk_size=chunk_size).read(io.BytesIO(statement)))
+
+    assert entries[0] == StatementEntry(datetime.date(2023, 1, 1), "", Money(-1200, "JPY"))
+    assert isinstance(entries[1], InvalidStatementEntry)
+
+
+def test_read_amount_beyond_the_bound():
+    statement = b"<OFX><STMTTRN><DTPOSTED>20230101<TRNAMT>92233720368547758</STMTTRN></OFX>"
+
+    [entry] = OfxStatementReader().read(io.BytesIO(statement))
+
+    assert isinstance(entry, InvalidStatementEntry)
@@ -0,0 +1,132 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+
+from src.domain.user import User
+from src.infrastructure.containers.sqlite import SqliteContainer
+from src.infrastructure.user.password.vault import InvalidPassword
+from src.shared.domain.email import EmailAddress
+from src.test.infrastructure.conftest import RouteClient
+
+
+@pytest.fixture
+def subscribed_user(client: RouteClient, sqlite_container: SqliteContainer) -> User:
+    email_address = EmailAddress("jane@example.com")
+    status, _ = client.request(
+        "POST",
+        "/user/subscription",
+        {
+            "username": "jane_doe",
+            "email_address": str(email_address),
+            "password": "Secret1@",
+            "validation_token": sqlite_container.validation_email_sender().token(email_address),
+        },
+        signed_in=False,
+    )
+    assert status == 201
+    return sqlite_container.user_repository().retrieve_by_email_address(email_address)
+
+
+def _sign_in(client: RouteClient, email_address: str, password: str) -> int:
+    status, _ = client.request(
+        "POST", "/user/session", {"email_address": email_address, "password": password}, signed_in=False
+    )
+    return status
+
+
+def _change_email_address(
+    app: FastAPI, sqlite_container: SqliteContainer, user: User, email_address: EmailAddress, token: str | None = None
+) -> int:
+    status, _ = RouteClient(app, sqlite_container, user).request(
+        "PUT",
+        f"/user/{user.id}/email_address",
+        {
+            "email_address": str(email_address),
+            "validation_token": token or sqlite_container.validation_email_sender().token(email_address),
+        },
+    )
+    return status
+
+
+def test_sign_in_after_changing_email_address(
+    app: FastAPI, client: RouteClient, sqlite_container: SqliteContainer, subscribed_user: User
+):
+    assert _sign_in(client, "jane@example.com", "Secret1@") == 201
+
+    assert _change_email_address(app, sqlite_container, subscribed_user, EmailAddress("janet@example.com")) == 200
+
+    assert _sign_in(client, "janet@example.com", "Secret1@") == 201
+    assert _sign_in(client, "janet@example.com", "Secret2@") == 401
+    assert _sign_in(client, "jane@example.com", "Secret1@") == 401
+
+
+def test_email_address_of_another_user_is_conflicting(
+    app: FastAPI, client: RouteClient, sqlite_container: SqliteContainer, signed_in_user: User, subscribed_user: User
+):
+    status, body = client.request(
+        "POST",
+        "/user/subscription",
+        {
+            "username": "johnny",
+            "email_address": str(signed_in_user.email_address),
+            "password": "Secret1@",
+            "validation_token": sqlite_container.validation_email_sender().token(signed_in_user.email_address),
+        },
+        signed_in=False,
+    )
+    assert status == 409
+    assert "already used" in json.loads(body)["detail"]
+
+    assert _change_email_address(app, sqlite_container, subscribed_user, signed_in_user.email_address) == 409
+    assert _sign_in(client, "jane@example.com", "Secret1@") == 201
+
+
+def test_validation_token_is_used_up_by_the_change_only(
+    app: FastAPI, client: RouteClient, sqlite_container: SqliteContainer, signed_in_user: User, subscribed_user: User
+):
+    email_address = signed_in_user.email_address
+    token = sqlite_container.validation_email_sender().token(email_address)
+
+    assert _change_email_address(app, sqlite_container, subscribed_user, email_address, token) == 409
+    status, _ = client.request("DELETE", f"/user/{signed_in_user.id}")
+    assert status == 200
+
+    assert _change_email_address(app, sqlite_container, subscribed_user, email_address, token) == 200
+    assert _change_email_address(app, sqlite_container, subscribed_user, email_address, token) == 400
+
+
+def test_sessions_of_a_deleted_user_are_revoked(client: RouteClient, signed_in_user: User):
+    status, _ = client.request("DELETE", f"/user/{signed_in_user.id}")
+    assert status == 200
+
+    account = {"user_id": str(signed_in_user.id), "name": "account_name", "reference_balance": "0"}
+    status, _ = client.request("POST", "/account/creation", account)
+    assert status == 401
+    status, _ = client.request("GET", f"/user/{signed_in_user.id}/accounts")
+    assert status == 401
+
+
+def test_password_of_a_deleted_user_is_deleted(app: FastAPI, sqlite_container: SqliteContainer, subscribed_user: User):
+    status, _ = RouteClient(app, sqlite_container, subscribed_user).request("DELETE", f"/user/{subscribed_user.id}")
+    assert status == 200
+
+    with pytest.raises(InvalidPassword):
+        asyncio.run(sqlite_container.user_password_vault().check(subscribed_user.id, "Secret1@"))
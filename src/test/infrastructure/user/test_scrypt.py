@@ -0,0 +1,84 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import asyncio
+from typing import Iterator
+
+import pytest
+
+from src.infrastructure.blocking import blocking_call_runner
+from src.infrastructure.sqlite.database import SqliteDatabase
+from src.infrastructure.user.password.scrypt import ScryptUserPasswordVault
+from src.infrastructure.user.id import UserUUIDFactory
+from src.infrastructure.user.password.vault import InvalidPassword, PasswordVaultOverloaded
+
+
+@pytest.fixture(scope="module")
+def vault() -> Iterator[ScryptUserPasswordVault]:
+    database = SqliteDatabase(":memory:")
+    for runner in blocking_call_runner(max_workers=2):
+        # Cheap cost parameters keep the test fast, the code path is the same
+        vault = ScryptUserPasswordVault(database, runner, max_workers=2, max_pending=2, n=2**10, r=8, p=1)
+        yield vault
+        vault.shutdown()
+    database.close()
+
+
+def test_store_then_check(vault: ScryptUserPasswordVault):
+    user_id = UserUUIDFactory().generate_id()
+    vault.store(user_id, asyncio.run(vault.hash("Secret1@")))
+
+    asyncio.run(vault.check(user_id, "Secret1@"))
+    with pytest.raises(InvalidPassword):
+        asyncio.run(vault.check(user_id, "Secret2@"))
+
+
+def test_check_unknown_user(vault: ScryptUserPasswordVault):
+    with pytest.raises(InvalidPassword):
+        asyncio.run(vault.check(UserUUIDFactory().generate_id(), "Secret1@"))
+    with pytest.raises(InvalidPassword):
+        asyncio.run(vault.check(None, "Secret1@"))
+
+
+def test_store_replaces_the_password(vault: ScryptUserPasswordVault):
+    user_id = UserUUIDFactory().generate_id()
+    vault.store(user_id, asyncio.run(vault.hash("Secret1@")))
+    vault.store(user_id, asyncio.run(vault.hash("Secret2@")))
+
+    asyncio.run(vault.check(user_id, "Secret2@"))
+    with pytest.raises(InvalidPassword):
+        asyncio.run(vault.check(user_id, "Secret1@"))
+
+
+def test_delete(vault: ScryptUserPasswordVault):
+    user_id = UserUUIDFactory().generate_id()
+    vault.store(user_id, asyncio.run(vault.hash("Secret1@")))
+
+    vault.delete(user_id)
+    vault.delete(user_id)
+
+    with pytest.raises(InvalidPassword):
+        asyncio.run(vault.check(user_id, "Secret1@"))
+
+
+def test_overload_is_rejected(vault: ScryptUserPasswordVault):
+    async def hash_many() -> list:
+        return await asyncio.gather(*(vault.hash("Secret1@") for _ in range(5)), return_exceptions=True)
+
+    results = asyncio.run(hash_many())
+
+    assert sum(isinstance(result, PasswordVaultOverloaded) for result in results) == 3
+    assert sum(isinstance(result, str) for result in results) == 2
@@ -0,0 +1,110 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.infrastructure.user.session.denylist import SessionDenylist
+from src.infrastructure.user.session.token import SessionTokenIssuer, InvalidSessionToken
+from src.test.domain.mocks import MockUserId
+from src.test.infrastructure.mock import ClockMock
+
+
+@pytest.fixture
+def denylist(clock: ClockMock) -> SessionDenylist:
+    return SessionDenylist(clock)
+
+
+@pytest.fixture
+def issuer(denylist: SessionDenylist, clock: ClockMock) -> SessionTokenIssuer:
+    return SessionTokenIssuer(MockUserId.trusted, denylist, secret="secret", ttl=60, clock=clock)
+
+
+def test_issue_then_verify(issuer: SessionTokenIssuer):
+    session = issuer.verify(issuer.issue(MockUserId("1")))
+
+    assert session.user_id == MockUserId("1")
+
+
+def test_tokens_are_unique(issuer: SessionTokenIssuer):
+    assert issuer.issue(MockUserId("1")) != issuer.issue(MockUserId("1"))
+
+
+@pytest.mark.parametrize("token", ["", "garbage", "a.b", "!!!.???"])
+def test_verify_malformed(issuer: SessionTokenIssuer, token: str):
+    with pytest.raises(InvalidSessionToken):
+        issuer.verify(token)
+
+
+def test_verify_tampered(issuer: SessionTokenIssuer):
+    _, signature = issuer.issue(MockUserId("1")).split(".")
+    other_payload, _ = issuer.issue(MockUserId("2")).split(".")
+
+    with pytest.raises(InvalidSessionToken):
+        issuer.verify(f"{other_payload}.{signature}")
+
+
+def test_verify_with_another_secret(issuer: SessionTokenIssuer, denylist: SessionDenylist):
+    token = SessionTokenIssuer(MockUserId.trusted, denylist, secret="other").issue(MockUserId("1"))
+
+    with pytest.raises(InvalidSessionToken):
+        issuer.verify(token)
+
+
+def test_verify_expired(issuer: SessionTokenIssuer, clock: ClockMock):
+    token = issuer.issue(MockUserId("1"))
+    clock.now += 60
+
+    with pytest.raises(InvalidSessionToken):
+        issuer.verify(token)
+
+
+def test_verify_revoked(issuer: SessionTokenIssuer):
+    token = issuer.issue(MockUserId("1"))
+    other_token = issuer.issue(MockUserId("1"))
+
+    issuer.revoke(issuer.verify(token))
+
+    with pytest.raises(InvalidSessionToken):
+        issuer.verify(token)
+    assert issuer.verify(other_token).user_id == MockUserId("1")
+
+
+def test_verify_revoked_user(issuer: SessionTokenIssuer, clock: ClockMock):
+    tokens = [issuer.issue(MockUserId("1")) for _ in range(2)]
+    other_token = issuer.issue(MockUserId("2"))
+
+    issuer.revoke_user(MockUserId("1"))
+
+    for token in tokens:
+        with pytest.raises(InvalidSessionToken):
+            issuer.verify(token)
+    assert issuer.verify(other_token).user_id == MockUserId("2")
+    clock.now += 59
+    with pytest.raises(InvalidSessionToken):
+        issuer.verify(tokens[0])
+
+
+def test_denylist_evicts_expired_tokens(denylist: SessionDenylist, clock: ClockMock):
+    denylist.revoke(b"first", clock.now + 10)
+    denylist.revoke(b"second", clock.now + 20)
+    clock.now += 10
+
+    denylist.revoke(b"third", clock.now + 20)
+
+    assert len(denylist) == 2
+    assert not denylist.is_revoked(b"first")
+    assert denylist.is_revoked(b"second")
+    assert denylist.is_revoked(b"third")
@@ -0,0 +1,116 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import asyncio
+from typing import Iterator
+
+import pytest
+
+from src.application.user.subscription.email_address.validator import EmailAddressValidator
+from src.infrastructure.blocking import BlockingCallRunner, blocking_call_runner
+from src.infrastructure.rate_limit import TokenBucketLimiter
+from src.infrastructure.user.validation.throttle import EmailAddressValidationThrottle, TooManyValidationRequests
+from src.shared.domain.email import EmailAddress
+from src.test.application.user.email_address.mock import ValidationEmailMockSender, EmailAddressCheckerMock
+
+EMAIL_ADDRESS = EmailAddress("john@example.com")
+
+
+class _FailingChecker(EmailAddressCheckerMock):
+    def check(self, email_address: EmailAddress) -> None:
+        super().check(email_address)
+        raise ValueError("Unreachable domain")
+
+
+@pytest.fixture
+def runner() -> Iterator[BlockingCallRunner]:
+    yield from blocking_call_runner(max_workers=2)
+
+
+@pytest.fixture
+def sender() -> ValidationEmailMockSender:
+    return ValidationEmailMockSender()
+
+
+def _throttle(
+    runner: BlockingCallRunner,
+    sender: ValidationEmailMockSender,
+    checker: EmailAddressCheckerMock | None = None,
+    address_burst: int = 3,
+    client_burst: int = 100,
+) -> EmailAddressValidationThrottle:
+    return EmailAddressValidationThrottle(
+        EmailAddressValidator(checker or EmailAddressCheckerMock(), sender),
+        runner,
+        address_limiter=TokenBucketLimiter(rate=1 / 60, burst=address_burst),
+        client_limiter=TokenBucketLimiter(rate=1.0, burst=client_burst),
+    )
+
+
+async def _query_concurrently(throttle: EmailAddressValidationThrottle, count: int) -> list[BaseException | None]:
+    return await asyncio.gather(
+        *(throttle.query(EMAIL_ADDRESS, f"10.0.0.{index}") for index in range(count)), return_exceptions=True
+    )
+
+
+def test_concurrent_requests_share_one_send(runner: BlockingCallRunner, sender: ValidationEmailMockSender):
+    throttle = _throttle(runner, sender, address_burst=1)
+
+    results = asyncio.run(_query_concurrently(throttle, 50))
+
+    assert results == [None] * 50
+    assert sender.email_sent_to == [EMAIL_ADDRESS]
+
+
+def test_address_limit(runner: BlockingCallRunner, sender: ValidationEmailMockSender):
+    throttle = _throttle(runner, sender, address_burst=2)
+
+    async def query_in_sequence() -> None:
+        for index in range(2):
+            await throttle.query(EMAIL_ADDRESS, f"10.0.0.{index}")
+        with pytest.raises(TooManyValidationRequests) as error:
+            await throttle.query(EMAIL_ADDRESS, "10.0.0.2")
+        assert error.value.retry_after == 60
+
+    asyncio.run(query_in_sequence())
+    assert sender.email_sent_to == [EMAIL_ADDRESS] * 2
+
+
+def test_client_limit(runner: BlockingCallRunner, sender: ValidationEmailMockSender):
+    throttle = _throttle(runner, sender, client_burst=2)
+
+    async def query_in_sequence() -> None:
+        await throttle.query(EmailAddress("john@example.com"), "10.0.0.1")
+        await throttle.query(EmailAddress("jane@example.com"), "10.0.0.1")
+        with pytest.raises(TooManyValidationRequests):
+            await throttle.query(EmailAddress("jack@example.com"), "10.0.0.1")
+        await throttle.query(EmailAddress("jack@example.com"), "10.0.0.2")
+
+    asyncio.run(query_in_sequence())
+    assert len(sender.email_sent_to) == 3
+
+
+def test_failure_is_shared_then_forgotten(runner: BlockingCallRunner, sender: ValidationEmailMockSender):
+    checker = _FailingChecker()
+    throttle = _throttle(runner, sender, checker=checker)
+
+    results = asyncio.run(_query_concurrently(throttle, 10))
+    assert all(isinstance(result, ValueError) for result in results)
+    assert checker.checked_email_addresses == [EMAIL_ADDRESS]
+
+    with pytest.raises(ValueError):
+        asyncio.run(throttle.query(EMAIL_ADDRESS, None))
+    assert checker.checked_email_addresses == [EMAIL_ADDRESS] * 2
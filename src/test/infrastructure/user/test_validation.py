@@ -0,0 +1,124 @@
+#  /*
+#   * Copyright (c) 2023 Gael Monachon
+#   *
+#   * This program is free software: you can redistribute it and/or modify
+#   * it under the terms of the GNU General Public License as published by
+#   * the Free Software Foundation, either version 3 of the License, or
+#   * (at your option) any later version.
+#   *
+#   * This program is distributed in the hope that it will be useful,
+#   * but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   * GNU General Public License for more details.
+#   *
+#   * You should have received a copy of the GNU General Public License
+#   * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#   */
+import pytest
+
+from src.application.user.subscription.emailer import InvalidToken
+from src.infrastructure.user.validation.replay import ValidationTokenReplayCache, ValidationTokenReplayCacheFull
+from src.infrastructure.user.validation.token import HmacValidationEmailSender
+from src.shared.domain.email import EmailAddress
+from src.test.infrastructure.email.mock import EmailTransportMock
+from src.test.infrastructure.mock import ClockMock
+
+EMAIL_ADDRESS = EmailAddress("john@example.com")
+
+
+@pytest.fixture
+def transport() -> EmailTransportMock:
+    return EmailTransportMock()
+
+
+@pytest.fixture
+def sender(transport: EmailTransportMock, clock: ClockMock) -> HmacValidationEmailSender:
+    return HmacValidationEmailSender(
+        transport, ValidationTokenReplayCache(clock=clock), secret="secret", ttl=60, clock=clock
+    )
+
+
+def test_send_then_check(sender: HmacValidationEmailSender, transport: EmailTransportMock):
+    sender.send(EMAIL_ADDRESS)
+
+    [message] = transport.messages
+    assert message.recipient == EMAIL_ADDRESS
+    sender.check_validation_token(EMAIL_ADDRESS, message.body.rsplit(" ", 1)[-1])
+
+
+def test_check_does_not_use_the_token(sender: HmacValidationEmailSender):
+    token = sender.token(EMAIL_ADDRESS)
+    sender.check_validation_token(EMAIL_ADDRESS, token)
+    sender.check_validation_token(EMAIL_ADDRESS, token)
+
+    sender.use_validation_token(EMAIL_ADDRESS, token)
+
+    with pytest.raises(InvalidToken):
+        sender.check_validation_token(EMAIL_ADDRESS, token)
+    with pytest.raises(InvalidToken):
+        sender.use_validation_token(EMAIL_ADDRESS, token)
+
+
+def test_use_checks_the_token(sender: HmacValidationEmailSender, clock: ClockMock):
+    token = sender.token(EMAIL_ADDRESS)
+
+    with pytest.raises(InvalidToken):
+        sender.use_validation_token(EmailAddress("jane@example.com"), token)
+    clock.now += 60
+    with pytest.raises(InvalidToken):
+        sender.use_validation_token(EMAIL_ADDRESS, token)
+
+
+def test_check_another_email_address(sender: HmacValidationEmailSender):
+    token = sender.token(EMAIL_ADDRESS)
+
+    with pytest.raises(InvalidToken):
+        sender.check_validation_token(EmailAddress("jane@example.com"), token)
+
+
+@pytest.mark.parametrize("token", ["", "garbage", "!!!", "john@example.com"])
+def test_check_malformed(sender: HmacValidationEmailSender, token: str):
+    with pytest.raises(InvalidToken):
+        sender.check_validation_token(EMAIL_ADDRESS, token)
+
+
+def test_check_with_another_secret(sender: HmacValidationEmailSender, transport: EmailTransportMock):
+    token = HmacValidationEmailSender(transport, ValidationTokenReplayCache(), secret="other").token(EMAIL_ADDRESS)
+
+    with pytest.raises(InvalidToken):
+        sender.check_validation_token(EMAIL_ADDRESS, token)
+
+
+def test_check_expired(sender: HmacValidationEmailSender, clock: ClockMock):
+    token = sender.token(EMAIL_ADDRESS)
+    clock.now += 60
+
+    with pytest.raises(InvalidToken):
+        sender.check_validation_token(EMAIL_ADDRESS, token)
+
+
+def test_replay_cache_evicts_expired_tokens(clock: ClockMock):
+    replay_cache = ValidationTokenReplayCache(clock=clock)
+    assert replay_cache.use(b"first", clock.now + 10)
+    assert replay_cache.use(b"second", clock.now + 20)
+    clock.now += 10
+
+    assert replay_cache.use(b"third", clock.now + 20)
+
+    assert len(replay_cache) == 2
+    assert not replay_cache.use(b"second", clock.now + 20)
+
+
+def test_replay_cache_full_rejects_tokens_until_one_expires(clock: ClockMock):
+    replay_cache = ValidationTokenReplayCache(max_size=2, clock=clock)
+    assert replay_cache.use(b"first", clock.now + 10)
+    assert replay_cache.use(b"second", clock.now + 20)
+
+    with pytest.raises(ValidationTokenReplayCacheFull) as error:
+        replay_cache.use(b"third", clock.now + 30)
+    assert error.value.retry_after == 10
+    assert not replay_cache.use(b"first", clock.now + 10)
+    assert not replay_cache.use(b"second", clock.now + 20)
+
+    clock.now += 10
+    assert replay_cache.use(b"third", clock.now + 20)